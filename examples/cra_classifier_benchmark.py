@@ -0,0 +1,145 @@
+"""Micro-benchmark of the CRA page classifier against the previous per-keyword regex matching.
+
+Usage:
+    python examples/cra_classifier_benchmark.py [--corpus DIR] [--rounds N]
+
+The corpus is a directory of saved CRA pages, either as HTML (`*.html`, `*.htm`) or as extracted text (`*.txt`).
+Without a corpus, a synthetic one is generated from typical CRA page sentences.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from parsel import Selector
+
+from crawlee.cra_scraper import CRADataValidator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+TAX_KEYWORDS = {
+    'general': ['tax', 'revenue', 'cra', 'income', 'deduction', 'credit'],
+    'forms': ['form', 't1', 't2', 't3', 't4', 't5'],
+    'business': ['business', 'self-employed', 'corporation', 'gst', 'hst'],
+    'personal': ['personal', 'individual', 'rrsp', 'tfsa', 'pension'],
+}
+
+SENTENCES = [
+    'File your income tax and benefit return by April 30, 2024.',
+    'Self-employed individuals have until June 15 to file their return.',
+    'Use form T2125 to report business and professional income.',
+    'Contributions to an RRSP are deductible from your income.',
+    'You can carry forward unused TFSA contribution room.',
+    'Businesses must register for a GST/HST account once they exceed the small supplier threshold.',
+    'Employers issue T4 slips by the end of February.',
+    'Non-residents may need to file form NR4 or apply using RC199.',
+    'Sign in to My Account to view your notice of assessment.',
+    'The Canada workers benefit is a refundable credit for low-income workers.',
+    'Corporations file a T2 return within six months of the end of the tax year.',
+    'Pension income splitting lets you allocate up to half of eligible pension income to your spouse.',
+    'Information on this page was last updated in 2023.',
+    'Contact us if you have questions about your account.',
+]
+
+
+def legacy_classify(title: str, content: str) -> tuple[str, bool, str | None, str | None]:
+    """Classify a page the way `CRADataValidator` did before the single-pass classifier."""
+    title_lower = title.lower()
+    content_lower = content.lower()
+    combined_text = f'{title_lower} {content_lower}'
+
+    page_type = 'general'
+    for category in ('forms', 'business', 'personal'):
+        if any(re.search(rf'\b{re.escape(keyword)}\b', combined_text) for keyword in TAX_KEYWORDS[category]):
+            page_type = category
+            break
+
+    all_keywords = [keyword for keywords in TAX_KEYWORDS.values() for keyword in keywords]
+    is_relevant = any(keyword in title_lower or keyword in content_lower for keyword in all_keywords)
+
+    years = re.findall(r'\b(20[2-3][0-9])\b', content)
+    tax_year = max(years) if years else None
+
+    form_number = None
+    for pattern in (r'\bT[1-5][A-Z]?\b', r'\bT[1-5]\d{3}\b', r'\bRC\d+\b', r'\bNR\d+\b'):
+        matches = re.findall(pattern, content, re.IGNORECASE)
+        if matches:
+            form_number = matches[0].upper()
+            break
+
+    return page_type, is_relevant, tax_year, form_number
+
+
+def load_corpus(corpus_dir: Path | None, size: int) -> list[tuple[str, str]]:
+    """Load saved pages as (title, content) pairs, or generate a synthetic corpus."""
+    if corpus_dir is None:
+        rng = random.Random(42)
+        return [
+            (rng.choice(SENTENCES)[:60], ' '.join(rng.choices(SENTENCES, k=rng.randint(20, 120)))) for _ in range(size)
+        ]
+
+    pages = list[tuple[str, str]]()
+    for path in sorted(corpus_dir.rglob('*')):
+        if path.suffix in {'.html', '.htm'}:
+            selector = Selector(text=path.read_text(encoding='utf-8', errors='replace'))
+            title = selector.css('title').xpath('string()').get('') or selector.css('h1').xpath('string()').get('')
+            main = selector.css('main') or selector.css('body')
+            content = main[0].xpath('string()').get('') if main else ''
+            pages.append((' '.join(title.split()), ' '.join(content.split())))
+        elif path.suffix == '.txt':
+            title, _, content = path.read_text(encoding='utf-8', errors='replace').partition('\n')
+            pages.append((title.strip(), ' '.join(content.split())))
+
+    return pages
+
+
+def benchmark(name: str, classify: Callable[[str, str], object], pages: list[tuple[str, str]], rounds: int) -> float:
+    """Run a classifier over the corpus and report the best time per page."""
+    best = float('inf')
+
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        for title, content in pages:
+            classify(title, content)
+        best = min(best, time.perf_counter() - started_at)
+
+    print(f'{name:>14}: {best * 1e6 / len(pages):8.1f} us/page')
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--corpus', type=Path, default=None, help='directory with saved CRA pages')
+    parser.add_argument('--size', type=int, default=500, help='number of pages of the synthetic corpus')
+    parser.add_argument('--rounds', type=int, default=5, help='number of timed rounds, the best one is reported')
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus, args.size)
+    if not pages:
+        raise SystemExit(f'No pages found in {args.corpus}')
+
+    validator = CRADataValidator()
+    print(f'Corpus: {len(pages)} pages, {sum(len(content) for _, content in pages) / len(pages):.0f} characters each')
+
+    mismatches = 0
+    for title, content in pages:
+        result = validator.classify(title, content)
+        if (result.page_type, result.is_relevant, result.tax_year, result.form_number) != legacy_classify(
+            title, content
+        ):
+            mismatches += 1
+    print(f'Mismatches against the previous implementation: {mismatches}')
+
+    legacy_time = benchmark('per-keyword', legacy_classify, pages, args.rounds)
+    classifier_time = benchmark('precompiled', validator.classify, pages, args.rounds)
+    print(f'Speedup: {legacy_time / classifier_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
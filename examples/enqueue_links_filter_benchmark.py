@@ -0,0 +1,173 @@
+"""Micro-benchmark of the enqueue links filter against the previous per-pattern matching.
+
+Usage:
+    python examples/enqueue_links_filter_benchmark.py [--links N] [--patterns N] [--strategy STRATEGY] [--rounds N]
+
+Links are generated across a few hosts and subdomains of them, and are filtered by the given enqueue strategy and
+by a mix of glob and regex include and exclude patterns, the way `enqueue_links` filters the links of a page.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import time
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+
+from tldextract import TLDExtract
+
+from crawlee import Glob
+from crawlee.crawlers import BasicCrawler
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from crawlee._types import EnqueueStrategy
+
+ORIGIN_URL = 'https://www.example.com/catalog/'
+
+HOSTS = ['www.example.com', 'shop.example.com', 'blog.example.com', 'www.example.org', 'cdn.other.net']
+
+SECTIONS = ['catalog', 'blog', 'help', 'account', 'static', 'search', 'news', 'careers']
+
+
+def generate_links(count: int, rng: random.Random) -> list[str]:
+    """Generate links spread over a few hosts and sections."""
+    return [
+        f'https://{rng.choice(HOSTS)}/{rng.choice(SECTIONS)}/{rng.randrange(10_000)}'
+        f'{rng.choice(["", ".html", ".pdf", "?page=2"])}'
+        for _ in range(count)
+    ]
+
+
+def generate_patterns(count: int) -> tuple[list[re.Pattern[Any] | Glob], list[re.Pattern[Any] | Glob]]:
+    """Generate include and exclude patterns, half of them globs and half regexes."""
+    include = list[re.Pattern[Any] | Glob]()
+    exclude = list[re.Pattern[Any] | Glob]()
+
+    for i in range(count):
+        host = HOSTS[i % len(HOSTS)]
+        section = SECTIONS[i % len(SECTIONS)]
+        if i % 4 == 0:
+            include.append(Glob(f'https://{host}/{section}/**'))
+        elif i % 4 == 1:
+            include.append(re.compile(rf'https://{re.escape(host)}/{section}/\d+(\.html)?$'))
+        elif i % 4 == 2:
+            exclude.append(Glob(f'https://{host}/{section}/*.pdf'))
+        else:
+            exclude.append(re.compile(rf'.*/{section}/\d+\?page=\d+$'))
+
+    return include, exclude
+
+
+def legacy_filter(
+    links: Sequence[str],
+    strategy: EnqueueStrategy,
+    include: Sequence[re.Pattern[Any] | Glob],
+    exclude: Sequence[re.Pattern[Any] | Glob],
+    tld_extractor: TLDExtract,
+) -> list[str]:
+    """Filter links the way `BasicCrawler` did before the compiled URL filter."""
+    origin = urlparse(ORIGIN_URL)
+    result = list[str]()
+
+    for link in links:
+        target = urlparse(link)
+
+        if strategy == 'same-hostname':
+            allowed = target.hostname == origin.hostname
+        elif strategy == 'same-domain':
+            allowed = (
+                tld_extractor.extract_str(origin.hostname or '').domain
+                == tld_extractor.extract_str(target.hostname or '').domain
+            )
+        elif strategy == 'same-origin':
+            allowed = (
+                target.hostname == origin.hostname and target.scheme == origin.scheme and target.port == origin.port
+            )
+        else:
+            allowed = True
+
+        if not allowed:
+            continue
+
+        patterns_allowed = True
+        for pattern in exclude:
+            regexp = pattern.regexp if isinstance(pattern, Glob) else pattern
+            if regexp.match(link) is not None:
+                patterns_allowed = False
+                break
+
+        if patterns_allowed:
+            patterns_allowed = False
+            for pattern in include:
+                regexp = pattern.regexp if isinstance(pattern, Glob) else pattern
+                if regexp.match(link) is not None:
+                    patterns_allowed = True
+                    break
+
+        if patterns_allowed:
+            result.append(link)
+
+    return result
+
+
+def benchmark(name: str, run: Callable[[], list[str]], links: int, rounds: int) -> tuple[float, list[str]]:
+    """Run a filter over the links and report the best time per link."""
+    best = float('inf')
+    result = list[str]()
+
+    for _ in range(rounds):
+        started_at = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - started_at)
+
+    print(f'{name:>10}: {best * 1e9 / links:8.0f} ns/link, {best * 1e3:8.1f} ms total')
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--links', type=int, default=100_000, help='number of links to filter')
+    parser.add_argument('--patterns', type=int, default=40, help='number of include and exclude patterns')
+    parser.add_argument(
+        '--strategy',
+        choices=['all', 'same-domain', 'same-hostname', 'same-origin'],
+        default='same-domain',
+        help='enqueue strategy',
+    )
+    parser.add_argument('--rounds', type=int, default=3, help='number of timed rounds, the best one is reported')
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    links = generate_links(args.links, rng)
+    include, exclude = generate_patterns(args.patterns)
+    print(f'{len(links)} links, {len(include)} include and {len(exclude)} exclude patterns, {args.strategy} strategy')
+
+    crawler = BasicCrawler(configure_logging=False)
+    tld_extractor = TLDExtract(suffix_list_urls=())
+
+    def run_legacy() -> list[str]:
+        return legacy_filter(links, args.strategy, include, exclude, tld_extractor)
+
+    def run_compiled() -> list[str]:
+        return list(
+            crawler._enqueue_links_filter_iterator(  # noqa: SLF001
+                iter(links), ORIGIN_URL, strategy=args.strategy, include=include, exclude=exclude
+            )
+        )
+
+    legacy_time, legacy_result = benchmark('legacy', run_legacy, len(links), args.rounds)
+    compiled_time, compiled_result = benchmark('compiled', run_compiled, len(links), args.rounds)
+
+    if compiled_result != legacy_result:
+        raise SystemExit('The filtered links differ from the previous implementation')
+
+    print(f'Accepted links: {len(compiled_result)}')
+    print(f'Speedup: {legacy_time / compiled_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,5 +1,13 @@
 from .autoscaled_pool import AutoscaledPool
+from .concurrency_controller import AimdConcurrencyController, ConcurrencyController, SystemStatusConcurrencyController
 from .snapshotter import Snapshotter
 from .system_status import SystemStatus
 
-__all__ = ['AutoscaledPool', 'Snapshotter', 'SystemStatus']
+__all__ = [
+    'AimdConcurrencyController',
+    'AutoscaledPool',
+    'ConcurrencyController',
+    'Snapshotter',
+    'SystemStatus',
+    'SystemStatusConcurrencyController',
+]
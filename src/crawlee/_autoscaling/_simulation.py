@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from crawlee._autoscaling._types import ConcurrencySample, LoadRatioInfo, SystemInfo
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping, Sequence
+
+    from crawlee._autoscaling.concurrency_controller import ConcurrencyController
+
+
+@dataclass
+class SyntheticWorkload:
+    """A synthetic workload used to replay the behavior of a crawl to concurrency controllers.
+
+    A task takes `base_latency` as long as the remote side serves fewer than `max_throughput` tasks per second.
+    Beyond that point, extra concurrency only makes the tasks wait longer. The local system reports an overload
+    when the concurrency exceeds `overload_concurrency`.
+    """
+
+    duration: timedelta
+    """How long the workload lasts."""
+
+    base_latency: timedelta
+    """The duration of a task without any queueing."""
+
+    max_throughput: float = float('inf')
+    """The maximum number of tasks per second the remote side can serve."""
+
+    overload_concurrency: int | None = None
+    """The concurrency above which the local system is overloaded, if any."""
+
+    latency_jitter: float = 0.0
+    """Maximum relative random deviation of the task duration."""
+
+    def get_latency(self, concurrency: int, rng: random.Random) -> float:
+        """Get the duration of a task in seconds, when running at the given concurrency."""
+        latency = max(self.base_latency.total_seconds(), concurrency / self.max_throughput)
+        return latency * (1 + rng.uniform(-self.latency_jitter, self.latency_jitter))
+
+
+@dataclass
+class SimulationStep:
+    """The state of a simulated pool after one adjustment of its desired concurrency."""
+
+    elapsed: timedelta
+    """The simulated time since the start."""
+
+    desired_concurrency: int
+    """The concurrency the pool ran at during the last interval."""
+
+    throughput: float
+    """The number of tasks finished per second during the last interval."""
+
+    latency: float
+    """The duration of a task in seconds during the last interval."""
+
+
+@dataclass
+class SimulationResult:
+    """The outcome of replaying workloads to a concurrency controller."""
+
+    interval: timedelta
+    """The simulated time between the adjustments of the concurrency."""
+
+    steps: list[SimulationStep] = field(default_factory=list)
+    """The state of the pool after each adjustment."""
+
+    @property
+    def finished_tasks(self) -> float:
+        """The total number of finished tasks."""
+        return sum(step.throughput for step in self.steps) * self.interval.total_seconds()
+
+    @property
+    def mean_concurrency(self) -> float:
+        """The average desired concurrency."""
+        return sum(step.desired_concurrency for step in self.steps) / len(self.steps) if self.steps else 0
+
+    @property
+    def mean_latency(self) -> float:
+        """The average duration of a task in seconds."""
+        return sum(step.latency for step in self.steps) / len(self.steps) if self.steps else 0
+
+
+def simulate(
+    controller: ConcurrencyController,
+    workloads: Sequence[SyntheticWorkload],
+    *,
+    min_concurrency: int = 1,
+    max_concurrency: int = 200,
+    desired_concurrency: int | None = None,
+    interval: timedelta = timedelta(seconds=10),
+    seed: int = 0,
+) -> SimulationResult:
+    """Replay the workloads one after another to a concurrency controller.
+
+    The simulated pool always has enough tasks to run at its desired concurrency. At every `interval`, the tasks
+    finished at the current concurrency are reported to the controller, like `AutoscaledPool` would do.
+
+    Args:
+        controller: The controller to evaluate.
+        workloads: The workloads to replay, in order.
+        min_concurrency: The minimum concurrency of the simulated pool.
+        max_concurrency: The maximum concurrency of the simulated pool.
+        desired_concurrency: The initial concurrency of the simulated pool. By default, it is `min_concurrency`.
+        interval: The simulated time between the adjustments of the concurrency.
+        seed: Seed of the random latency jitter.
+
+    Returns:
+        The state of the simulated pool over time.
+    """
+    rng = random.Random(seed)
+    result = SimulationResult(interval=interval)
+
+    concurrency = desired_concurrency if desired_concurrency is not None else min_concurrency
+    started_at = datetime.now(timezone.utc)
+    elapsed = timedelta()
+    finished_tasks = 0.0
+    finished_tasks_duration = timedelta()
+
+    for workload in workloads:
+        workload_end = elapsed + workload.duration
+
+        while elapsed < workload_end:
+            elapsed += interval
+
+            latency = workload.get_latency(concurrency, rng)
+            throughput = concurrency / latency
+            finished_in_interval = throughput * interval.total_seconds()
+            finished_tasks += finished_in_interval
+            finished_tasks_duration += timedelta(seconds=finished_in_interval * latency)
+
+            is_overloaded = workload.overload_concurrency is not None and concurrency > workload.overload_concurrency
+            load = LoadRatioInfo(limit_ratio=0.4, actual_ratio=1.0 if is_overloaded else 0.0)
+            idle = LoadRatioInfo(limit_ratio=0.4, actual_ratio=0.0)
+
+            sample = ConcurrencySample(
+                system_info=SystemInfo(cpu_info=load, memory_info=idle, event_loop_info=idle, client_info=idle),
+                desired_concurrency=concurrency,
+                current_concurrency=concurrency,
+                min_concurrency=min_concurrency,
+                max_concurrency=max_concurrency,
+                finished_tasks=int(finished_tasks),
+                finished_tasks_duration=finished_tasks_duration,
+                created_at=started_at + elapsed,
+            )
+
+            result.steps.append(
+                SimulationStep(elapsed=elapsed, desired_concurrency=concurrency, throughput=throughput, latency=latency)
+            )
+            concurrency = max(min_concurrency, min(max_concurrency, controller.get_desired_concurrency(sample)))
+
+    return result
+
+
+def compare_controllers(
+    controller_factories: Mapping[str, Callable[[], ConcurrencyController]],
+    workloads: Sequence[SyntheticWorkload],
+    **simulate_kwargs: Any,
+) -> dict[str, SimulationResult]:
+    """Replay the same workloads to fresh instances of several controllers.
+
+    Args:
+        controller_factories: Functions creating the controllers to compare, by name.
+        workloads: The workloads to replay, in order.
+        simulate_kwargs: Further arguments for `simulate`.
+
+    Returns:
+        The simulation results, by controller name.
+    """
+    return {
+        name: simulate(create_controller(), workloads, **simulate_kwargs)
+        for name, create_controller in controller_factories.items()
+    }
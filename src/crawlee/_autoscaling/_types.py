@@ -167,3 +167,32 @@ class ClientSnapshot:
 
 
 Snapshot = MemorySnapshot | CpuSnapshot | EventLoopSnapshot | ClientSnapshot
+
+
+@dataclass
+class ConcurrencySample:
+    """Represent the state of an `AutoscaledPool` at the moment its desired concurrency is adjusted."""
+
+    system_info: SystemInfo
+    """The historical system load information."""
+
+    desired_concurrency: int
+    """The desired concurrency of the pool before the adjustment."""
+
+    current_concurrency: int
+    """The number of tasks in progress."""
+
+    min_concurrency: int
+    """The minimum concurrency allowed by the pool."""
+
+    max_concurrency: int
+    """The maximum concurrency allowed by the pool."""
+
+    finished_tasks: int
+    """The total number of successfully finished tasks. It only grows, unless the source of the counts is reset."""
+
+    finished_tasks_duration: timedelta
+    """The total duration of the tasks counted in `finished_tasks`."""
+
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    """The time at which the sample was taken."""
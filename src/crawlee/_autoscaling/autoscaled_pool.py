@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import math
+import time
 from contextlib import suppress
 from datetime import timedelta
 from logging import getLogger
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from crawlee._autoscaling._types import ConcurrencySample
+from crawlee._autoscaling.concurrency_controller import SystemStatusConcurrencyController
 from crawlee._types import ConcurrencySettings
 from crawlee._utils.docs import docs_group
 from crawlee._utils.recurring_task import RecurringTask
@@ -17,6 +20,7 @@ if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from crawlee._autoscaling import SystemStatus
+    from crawlee.statistics import Statistics
 
 logger = getLogger(__name__)
 
@@ -40,7 +44,8 @@ class AutoscaledPool:
     """Manages a pool of asynchronous resource-intensive tasks that are executed in parallel.
 
     The pool only starts new tasks if there is enough free CPU and memory available. If an exception is thrown in
-    any of the tasks, it is propagated and the pool is stopped.
+    any of the tasks, it is propagated and the pool is stopped. The desired concurrency is periodically adjusted by
+    the `ConcurrencyController` from the concurrency settings.
     """
 
     _AUTOSCALE_INTERVAL = timedelta(seconds=10)
@@ -61,6 +66,12 @@ class AutoscaledPool:
     _TASK_TIMEOUT: timedelta | None = None
     """Timeout within which the `run_task_function` must complete."""
 
+    _TASK_READY_POLL_INTERVAL = timedelta(seconds=0.5)
+    """Interval at which an idle pool re-checks whether a task is ready or the pool is finished."""
+
+    _TASK_READY_NOTIFIED_POLL_INTERVAL = timedelta(seconds=2)
+    """Interval at which an idle pool re-checks its state when `wait_for_task_ready_function` is provided."""
+
     def __init__(
         self,
         *,
@@ -69,6 +80,8 @@ class AutoscaledPool:
         run_task_function: Callable[[], Awaitable],
         is_task_ready_function: Callable[[], Awaitable[bool]],
         is_finished_function: Callable[[], Awaitable[bool]],
+        wait_for_task_ready_function: Callable[[], Awaitable[None]] | None = None,
+        statistics: Statistics[Any] | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -84,6 +97,14 @@ class AutoscaledPool:
                 resolves to `True` then the pool's run finishes. Being called only when there are no tasks being
                 processed means that as long as `is_task_ready_function` keeps resolving to `True`,
                 `is_finished_function` will never be called. To abort a run, use the `abort` method.
+            wait_for_task_ready_function: A function that resolves when a task may have become ready or the pool
+                may have become finished, e.g. when requests are added to a queue or the last of them is handled.
+                If provided, an idle pool waits for it instead of polling `is_task_ready_function` and
+                `is_finished_function` in short intervals. The pool then also fills all of its free capacity at once
+                whenever a task is ready, so `run_task_function` should return right away if there is nothing to do.
+            statistics: Statistics of the processed requests, used as the source of the number and duration of
+                finished tasks reported to the concurrency controller. If not provided, the pool counts the tasks
+                that finished without an exception instead.
         """
         concurrency_settings = concurrency_settings or ConcurrencySettings()
 
@@ -91,10 +112,20 @@ class AutoscaledPool:
         self._run_task_function = run_task_function
         self._is_task_ready_function = is_task_ready_function
         self._is_finished_function = is_finished_function
+        self._wait_for_task_ready_function = wait_for_task_ready_function
         self._desired_concurrency = concurrency_settings.desired_concurrency
         self._max_concurrency = concurrency_settings.max_concurrency
         self._min_concurrency = concurrency_settings.min_concurrency
         self._max_tasks_per_minute = concurrency_settings.max_tasks_per_minute
+        self._concurrency_controller = concurrency_settings.concurrency_controller or SystemStatusConcurrencyController(
+            desired_concurrency_ratio=self._DESIRED_CONCURRENCY_RATIO,
+            scale_up_step_ratio=self._SCALE_UP_STEP_RATIO,
+            scale_down_step_ratio=self._SCALE_DOWN_STEP_RATIO,
+        )
+
+        self._statistics = statistics
+        self._finished_tasks = 0
+        self._finished_tasks_duration = timedelta()
 
         self._log_system_status_task = RecurringTask(self._log_system_status, self._LOGGING_INTERVAL)
         self._autoscale_task = RecurringTask(self._autoscale, self._AUTOSCALE_INTERVAL)
@@ -168,6 +199,9 @@ class AutoscaledPool:
         """Resume a paused autoscaled pool so that it continues starting new tasks."""
         self._is_paused = False
 
+        if self._current_run is not None:
+            self._current_run.worker_tasks_updated.set()
+
     @property
     def desired_concurrency(self) -> int:
         """The current desired concurrency, possibly updated by the pool according to system load."""
@@ -183,23 +217,31 @@ class AutoscaledPool:
 
     def _autoscale(self) -> None:
         """Inspect system load status and adjust desired concurrency if necessary. Do not call directly."""
-        status = self._system_status.get_historical_system_info()
-
-        min_current_concurrency = math.floor(self._DESIRED_CONCURRENCY_RATIO * self.desired_concurrency)
-        should_scale_up = (
-            status.is_system_idle
-            and self._desired_concurrency < self._max_concurrency
-            and self.current_concurrency >= min_current_concurrency
+        if self._statistics is not None:
+            finished_tasks = self._statistics.state.requests_finished
+            finished_tasks_duration = self._statistics.state.request_total_finished_duration
+        else:
+            finished_tasks = self._finished_tasks
+            finished_tasks_duration = self._finished_tasks_duration
+
+        sample = ConcurrencySample(
+            system_info=self._system_status.get_historical_system_info(),
+            desired_concurrency=self._desired_concurrency,
+            current_concurrency=self.current_concurrency,
+            min_concurrency=self._min_concurrency,
+            max_concurrency=self._max_concurrency,
+            finished_tasks=finished_tasks,
+            finished_tasks_duration=finished_tasks_duration,
         )
 
-        should_scale_down = not status.is_system_idle and self._desired_concurrency > self._min_concurrency
+        desired_concurrency = self._concurrency_controller.get_desired_concurrency(sample)
+        desired_concurrency = max(self._min_concurrency, min(self._max_concurrency, desired_concurrency))
+
+        # Let the orchestrator start the new workers right away.
+        if desired_concurrency > self._desired_concurrency and self._current_run is not None:
+            self._current_run.worker_tasks_updated.set()
 
-        if should_scale_up:
-            step = math.ceil(self._SCALE_UP_STEP_RATIO * self._desired_concurrency)
-            self._desired_concurrency = min(self._max_concurrency, self._desired_concurrency + step)
-        elif should_scale_down:
-            step = math.ceil(self._SCALE_DOWN_STEP_RATIO * self._desired_concurrency)
-            self._desired_concurrency = max(self._min_concurrency, self._desired_concurrency - step)
+        self._desired_concurrency = desired_concurrency
 
     def _log_system_status(self) -> None:
         system_status = self._system_status.get_historical_system_info()
@@ -213,6 +255,10 @@ class AutoscaledPool:
     async def _worker_task_orchestrator(self, run: _AutoscaledPoolRun) -> None:
         """Launch worker tasks whenever there is free capacity and a task is ready.
 
+        With `wait_for_task_ready_function`, all the free capacity is filled at once. Between the launches,
+        the orchestrator sleeps until a worker task finishes, `wait_for_task_ready_function` resolves, or the poll
+        interval passes.
+
         Exits when `is_finished_function` returns True.
         """
         finished = False
@@ -230,19 +276,22 @@ class AutoscaledPool:
                     logger.debug('Not scheduling new tasks - already running at desired concurrency')
                 elif not await self._is_task_ready_function():
                     logger.debug('Not scheduling new task - no task is ready')
-                else:
+                elif self._wait_for_task_ready_function is None or math.isfinite(self._max_tasks_per_minute):
                     logger.debug('Scheduling a new task')
-                    worker_task = asyncio.create_task(self._worker_task(), name='autoscaled pool worker task')
-                    worker_task.add_done_callback(lambda task: self._reap_worker_task(task, run))
-                    run.worker_tasks.append(worker_task)
+                    self._start_worker_task(run)
 
                     if math.isfinite(self._max_tasks_per_minute):
                         await asyncio.sleep(60 / self._max_tasks_per_minute)
 
                     continue
+                else:
+                    new_task_count = self.desired_concurrency - self.current_concurrency
+                    logger.debug(f'Scheduling {new_task_count} new tasks')
+                    for _ in range(new_task_count):
+                        self._start_worker_task(run)
+                    continue
 
-                with suppress(asyncio.TimeoutError):
-                    await asyncio.wait_for(run.worker_tasks_updated.wait(), timeout=0.5)
+                await self._wait_for_update(run)
         finally:
             if finished:
                 logger.debug('`is_finished_function` reports that we are finished')
@@ -259,6 +308,39 @@ class AutoscaledPool:
             if not run.result.done():
                 run.result.set_result(object())
 
+    async def _wait_for_update(self, run: _AutoscaledPoolRun) -> None:
+        """Wait until a worker task finishes, a task may be ready, or the poll interval passes."""
+        if self._wait_for_task_ready_function is None:
+            with suppress(asyncio.TimeoutError):
+                await asyncio.wait_for(
+                    run.worker_tasks_updated.wait(), timeout=self._TASK_READY_POLL_INTERVAL.total_seconds()
+                )
+            return
+
+        waiters = [
+            asyncio.create_task(run.worker_tasks_updated.wait()),
+            asyncio.ensure_future(self._wait_for_task_ready_function()),
+        ]
+
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self._TASK_READY_NOTIFIED_POLL_INTERVAL.total_seconds(),
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+        for waiter in waiters:
+            if waiter.done() and not waiter.cancelled() and (exception := waiter.exception()) is not None:
+                logger.warning('Waiting for a task to become ready failed', exc_info=exception)
+
+    def _start_worker_task(self, run: _AutoscaledPoolRun) -> None:
+        worker_task = asyncio.create_task(self._worker_task(), name='autoscaled pool worker task')
+        worker_task.add_done_callback(lambda task: self._reap_worker_task(task, run))
+        run.worker_tasks.append(worker_task)
+
     def _reap_worker_task(self, task: asyncio.Task, run: _AutoscaledPoolRun) -> None:
         """Handle cleanup and tracking of a completed worker task.
 
@@ -273,11 +355,15 @@ class AutoscaledPool:
             run.result.set_exception(exception)
 
     async def _worker_task(self) -> None:
+        started_at = time.perf_counter()
+
         try:
             await asyncio.wait_for(
                 self._run_task_function(),
                 timeout=self._TASK_TIMEOUT.total_seconds() if self._TASK_TIMEOUT is not None else None,
             )
+            self._finished_tasks += 1
+            self._finished_tasks_duration += timedelta(seconds=time.perf_counter() - started_at)
         except asyncio.TimeoutError:
             timeout_str = self._TASK_TIMEOUT.total_seconds() if self._TASK_TIMEOUT is not None else '*not set*'
             logger.warning(f'Task timed out after {timeout_str} seconds')
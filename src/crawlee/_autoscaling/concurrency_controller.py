@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from logging import getLogger
+from typing import TYPE_CHECKING
+
+from crawlee._utils.docs import docs_group
+
+if TYPE_CHECKING:
+    from crawlee._autoscaling._types import ConcurrencySample
+
+logger = getLogger(__name__)
+
+
+@docs_group('Autoscaling')
+class ConcurrencyController(ABC):
+    """An abstract base class for the strategies `AutoscaledPool` uses to adjust its desired concurrency.
+
+    The pool periodically passes a `ConcurrencySample` to `get_desired_concurrency` and uses the result, clamped
+    to its minimum and maximum concurrency, as the new desired concurrency. A controller instance keeps its own state
+    between the calls, so it must not be shared by multiple pools.
+    """
+
+    @abstractmethod
+    def get_desired_concurrency(self, sample: ConcurrencySample) -> int:
+        """Compute the new desired concurrency of the pool.
+
+        Args:
+            sample: The current state of the pool and of the system.
+
+        Returns:
+            The new desired concurrency.
+        """
+
+
+@docs_group('Autoscaling')
+class SystemStatusConcurrencyController(ConcurrencyController):
+    """Scale the concurrency in fixed steps, based only on the overload signals of `SystemStatus`.
+
+    The concurrency goes up while the system is idle and the pool runs close to its desired concurrency,
+    and goes down while the CPU, memory, event loop or client is overloaded. This is the default controller.
+    """
+
+    def __init__(
+        self,
+        *,
+        desired_concurrency_ratio: float = 0.9,
+        scale_up_step_ratio: float = 0.05,
+        scale_down_step_ratio: float = 0.05,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            desired_concurrency_ratio: Minimum ratio of desired concurrency that must be reached before allowing
+                further scale-up.
+            scale_up_step_ratio: Fraction of desired concurrency to add during each scale-up operation.
+            scale_down_step_ratio: Fraction of desired concurrency to remove during each scale-down operation.
+        """
+        self._desired_concurrency_ratio = desired_concurrency_ratio
+        self._scale_up_step_ratio = scale_up_step_ratio
+        self._scale_down_step_ratio = scale_down_step_ratio
+
+    def get_desired_concurrency(self, sample: ConcurrencySample) -> int:
+        desired_concurrency = sample.desired_concurrency
+
+        min_current_concurrency = math.floor(self._desired_concurrency_ratio * desired_concurrency)
+        should_scale_up = (
+            sample.system_info.is_system_idle
+            and desired_concurrency < sample.max_concurrency
+            and sample.current_concurrency >= min_current_concurrency
+        )
+
+        should_scale_down = not sample.system_info.is_system_idle and desired_concurrency > sample.min_concurrency
+
+        if should_scale_up:
+            step = math.ceil(self._scale_up_step_ratio * desired_concurrency)
+            return min(sample.max_concurrency, desired_concurrency + step)
+
+        if should_scale_down:
+            step = math.ceil(self._scale_down_step_ratio * desired_concurrency)
+            return max(sample.min_concurrency, desired_concurrency - step)
+
+        return desired_concurrency
+
+
+@dataclass
+class _Window:
+    """The throughput and latency measured over the tasks finished between two decisions."""
+
+    concurrency: int
+    throughput: float
+    latency: float
+
+
+@docs_group('Autoscaling')
+class AimdConcurrencyController(ConcurrencyController):
+    """Scale the concurrency by additive increase and multiplicative decrease, guided by the measured throughput.
+
+    Besides the overload signals of `SystemStatus`, the controller measures the number of finished tasks per second
+    and their average duration between its decisions. The concurrency is increased in small steps for as long as each
+    step increases the throughput. When a step does not pay off, e.g. because the target website or a remote service
+    is the bottleneck, the step is reverted and the concurrency is held for a while before the next attempt. When
+    the system is overloaded or the tasks take much longer than the fastest observed ones, the concurrency is cut by
+    a constant factor.
+
+    Until enough tasks have finished to measure the throughput, the concurrency grows like with
+    the `SystemStatusConcurrencyController`.
+    """
+
+    _BASELINE_LATENCY_DRIFT = 1.02
+    """Factor by which the baseline latency may grow per measurement, so that it follows a lasting slowdown."""
+
+    _PLATEAU_HOLD_MEASUREMENTS = 6
+    """Number of measurements to wait after a scale-up did not pay off, before trying to scale up again."""
+
+    def __init__(
+        self,
+        *,
+        desired_concurrency_ratio: float = 0.9,
+        scale_up_step_ratio: float = 0.05,
+        backoff_ratio: float = 0.75,
+        min_scale_up_efficiency: float = 0.5,
+        max_latency_ratio: float = 2.0,
+        min_finished_tasks: int = 5,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            desired_concurrency_ratio: Minimum ratio of desired concurrency that must be reached before allowing
+                further scale-up.
+            scale_up_step_ratio: Fraction of desired concurrency to add during each scale-up operation. At least one
+                task is always added.
+            backoff_ratio: Factor by which the desired concurrency is multiplied when the system is overloaded or
+                the tasks slow down.
+            min_scale_up_efficiency: Minimum ratio of the relative increase of throughput to the relative increase
+                of concurrency that a scale-up must bring to be kept. With `1`, the throughput would have to grow
+                proportionally to the concurrency.
+            max_latency_ratio: Maximum ratio of the average task duration to the baseline (lowest recently observed)
+                task duration. Above it, the desired concurrency is cut.
+            min_finished_tasks: Minimum number of tasks that must finish before the throughput is measured.
+        """
+        if not 0 < backoff_ratio < 1:
+            raise ValueError('backoff_ratio must be between 0 and 1')
+
+        if max_latency_ratio <= 1:
+            raise ValueError('max_latency_ratio must be greater than 1')
+
+        if min_finished_tasks < 1:
+            raise ValueError('min_finished_tasks must be 1 or larger')
+
+        self._desired_concurrency_ratio = desired_concurrency_ratio
+        self._scale_up_step_ratio = scale_up_step_ratio
+        self._backoff_ratio = backoff_ratio
+        self._min_scale_up_efficiency = min_scale_up_efficiency
+        self._max_latency_ratio = max_latency_ratio
+        self._min_finished_tasks = min_finished_tasks
+
+        self._window_start: ConcurrencySample | None = None
+        self._previous_window: _Window | None = None
+        self._baseline_latency: float | None = None
+        self._hold_measurements = 0
+
+    def get_desired_concurrency(self, sample: ConcurrencySample) -> int:
+        desired_concurrency = sample.desired_concurrency
+        window = self._close_window(sample)
+
+        if not sample.system_info.is_system_idle:
+            self._previous_window = None
+            return self._back_off(sample)
+
+        if window is None:
+            # Not enough finished tasks yet - grow until the first measurement, then wait for the window to fill up.
+            if self._baseline_latency is None and self._is_saturated(sample):
+                return self._scale_up(sample)
+            return desired_concurrency
+
+        previous_window, self._previous_window = self._previous_window, window
+
+        if self._baseline_latency is None:
+            self._baseline_latency = window.latency
+        else:
+            self._baseline_latency = min(window.latency, self._baseline_latency * self._BASELINE_LATENCY_DRIFT)
+
+        if window.latency > self._max_latency_ratio * self._baseline_latency:
+            logger.debug(
+                f'Task duration {window.latency:.3f}s exceeds the baseline {self._baseline_latency:.3f}s - backing off'
+            )
+            self._previous_window = None
+            return self._back_off(sample)
+
+        if not self._is_saturated(sample):
+            return desired_concurrency
+
+        if self._hold_measurements > 0:
+            self._hold_measurements -= 1
+            return desired_concurrency
+
+        if previous_window is not None and previous_window.concurrency < window.concurrency:
+            concurrency_gain = window.concurrency / previous_window.concurrency - 1
+            throughput_gain = window.throughput / previous_window.throughput - 1
+
+            if throughput_gain < self._min_scale_up_efficiency * concurrency_gain:
+                logger.debug(
+                    f'Throughput did not grow with concurrency {window.concurrency} - '
+                    f'returning to {previous_window.concurrency}'
+                )
+                self._hold_measurements = self._PLATEAU_HOLD_MEASUREMENTS
+                return previous_window.concurrency
+
+        return self._scale_up(sample)
+
+    def _close_window(self, sample: ConcurrencySample) -> _Window | None:
+        """Measure the tasks finished since the start of the current window, if there are enough of them."""
+        start = self._window_start
+
+        if start is None or sample.finished_tasks < start.finished_tasks:
+            # First sample, or the counts were reset - start measuring from scratch.
+            self._window_start = sample
+            return None
+
+        finished_tasks = sample.finished_tasks - start.finished_tasks
+        elapsed = (sample.created_at - start.created_at).total_seconds()
+
+        if finished_tasks < self._min_finished_tasks or elapsed <= 0:
+            return None
+
+        self._window_start = sample
+        return _Window(
+            concurrency=sample.desired_concurrency,
+            throughput=finished_tasks / elapsed,
+            latency=(sample.finished_tasks_duration - start.finished_tasks_duration).total_seconds() / finished_tasks,
+        )
+
+    def _is_saturated(self, sample: ConcurrencySample) -> bool:
+        return sample.current_concurrency >= math.floor(self._desired_concurrency_ratio * sample.desired_concurrency)
+
+    def _scale_up(self, sample: ConcurrencySample) -> int:
+        step = max(1, math.ceil(self._scale_up_step_ratio * sample.desired_concurrency))
+        return min(sample.max_concurrency, sample.desired_concurrency + step)
+
+    def _back_off(self, sample: ConcurrencySample) -> int:
+        self._window_start = sample
+        return max(sample.min_concurrency, math.floor(self._backoff_ratio * sample.desired_concurrency))
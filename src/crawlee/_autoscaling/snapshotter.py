@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import bisect
+from array import array
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
-from typing import TYPE_CHECKING, TypeVar, cast
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
 
 from crawlee import service_locator
 from crawlee._autoscaling._types import ClientSnapshot, CpuSnapshot, EventLoopSnapshot, MemorySnapshot, Snapshot
@@ -17,6 +18,7 @@ from crawlee._utils.system import MemoryInfo, get_memory_info
 from crawlee.events._types import Event, EventSystemInfoData
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
     from types import TracebackType
 
     from crawlee.configuration import Configuration
@@ -26,12 +28,189 @@ logger = getLogger(__name__)
 T = TypeVar('T', bound=Snapshot)
 
 
-class SortedSnapshotList(list[T]):
-    """A list that maintains sorted order by `created_at` attribute for snapshot objects."""
+class SortedSnapshotList(Generic[T]):
+    """A fixed-capacity ring buffer of snapshots, sorted by their `created_at` attribute.
+
+    Besides the snapshots themselves, the buffer keeps their timestamps and overload flags in `array` columns,
+    together with running sums of the overloaded and total time between consecutive snapshots. The overloaded ratio
+    of any window ending with the latest snapshot is then a difference of two running sums. When the buffer is full,
+    adding a snapshot drops the oldest one.
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        """Initialize a new instance.
+
+        Args:
+            capacity: The maximum number of snapshots kept in the buffer.
+        """
+        if capacity < 1:
+            raise ValueError('capacity must be 1 or larger')
+
+        self._capacity = capacity
+        self._items: list[T | None] = [None] * capacity
+
+        self._timestamps = array('q', bytes(8 * capacity))
+        """Creation times of the snapshots, in microseconds since the epoch."""
+
+        self._overloaded = array('b', bytes(capacity))
+        """Whether each snapshot is overloaded."""
+
+        self._total_time = array('q', bytes(8 * capacity))
+        """Running sum of the time between consecutive snapshots, in microseconds."""
+
+        self._overloaded_time = array('q', bytes(8 * capacity))
+        """Running sum of the time between consecutive snapshots that ends with an overloaded one, in microseconds."""
+
+        self._head = 0
+        """Physical index of the oldest snapshot."""
+
+        self._size = 0
+        self._first_sequence = 0
+        """Sequence number of the oldest snapshot. Sequence numbers are not affected by wrapping around the buffer."""
+
+        self._window_starts = dict[int, int]()
+        """Sequence number of the first snapshot in a window, by window duration in microseconds."""
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __getitem__(self, index: int) -> T:
+        if index < 0:
+            index += self._size
+
+        if not 0 <= index < self._size:
+            raise IndexError('snapshot index out of range')
+
+        return cast('T', self._items[self._physical_index(index)])
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(self._size):
+            yield cast('T', self._items[self._physical_index(index)])
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, SortedSnapshotList | list):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
 
     def add(self, item: T) -> None:
-        """Add an item to the list maintaining sorted order by `created_at` using binary search."""
-        bisect.insort(self, item, key=lambda item: item.created_at)
+        """Add an item to the buffer maintaining sorted order by `created_at`.
+
+        Snapshots usually arrive in order and are appended in constant time. A late snapshot is inserted at its place,
+        which requires rebuilding the buffer.
+        """
+        timestamp = _to_microseconds(item.created_at - _EPOCH)
+
+        if self._size and timestamp < self._timestamps[self._physical_index(self._size - 1)]:
+            items = list(self)
+            bisect.insort(items, item, key=lambda item: item.created_at)
+            self.clear()
+            for sorted_item in items:
+                self._append(sorted_item, _to_microseconds(sorted_item.created_at - _EPOCH))
+            return
+
+        self._append(item, timestamp)
+
+    def clear(self) -> None:
+        """Remove all snapshots from the buffer."""
+        self._items = [None] * self._capacity
+        self._head = 0
+        self._first_sequence += self._size
+        self._size = 0
+        self._window_starts.clear()
+
+    def prune(self, oldest_allowed: datetime) -> None:
+        """Remove the snapshots created before `oldest_allowed`."""
+        cutoff = _to_microseconds(oldest_allowed - _EPOCH)
+
+        while self._size and self._timestamps[self._head] < cutoff:
+            self._drop_oldest()
+
+    def get_sample(self, duration: timedelta | None = None) -> list[T]:
+        """Return the snapshots created at most `duration` before the latest one, or all of them."""
+        if duration is None:
+            return list(self)
+
+        start = self._get_window_start(duration)
+        return [self[index] for index in range(start, self._size)]
+
+    def get_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Compute the ratio of overloaded time in the snapshots created at most `duration` before the latest one.
+
+        The time between two consecutive snapshots counts as overloaded if the later snapshot is overloaded.
+        """
+        if not self._size:
+            return 0
+
+        start = self._get_window_start(duration) if duration is not None else 0
+        first = self._physical_index(start)
+        last = self._physical_index(self._size - 1)
+
+        if start == self._size - 1:
+            return float(self._overloaded[last])
+
+        total_time = self._total_time[last] - self._total_time[first]
+        if total_time == 0:
+            return 0.0
+
+        return (self._overloaded_time[last] - self._overloaded_time[first]) / total_time
+
+    def _append(self, item: T, timestamp: int) -> None:
+        if self._size == self._capacity:
+            self._drop_oldest()
+
+        index = self._physical_index(self._size)
+        is_overloaded = item.is_overloaded
+
+        if self._size:
+            previous = self._physical_index(self._size - 1)
+            elapsed = timestamp - self._timestamps[previous]
+            self._total_time[index] = self._total_time[previous] + elapsed
+            self._overloaded_time[index] = self._overloaded_time[previous] + (elapsed if is_overloaded else 0)
+        else:
+            self._total_time[index] = 0
+            self._overloaded_time[index] = 0
+
+        self._items[index] = item
+        self._timestamps[index] = timestamp
+        self._overloaded[index] = is_overloaded
+        self._size += 1
+
+    def _drop_oldest(self) -> None:
+        self._items[self._head] = None
+        self._head = (self._head + 1) % self._capacity
+        self._size -= 1
+        self._first_sequence += 1
+
+    def _physical_index(self, index: int) -> int:
+        return (self._head + index) % self._capacity
+
+    def _get_window_start(self, duration: timedelta) -> int:
+        """Get the index of the first snapshot created at most `duration` before the latest one.
+
+        The start of each window is remembered and only moves forward as snapshots are added, so the lookup takes
+        amortized constant time.
+        """
+        if not self._size:
+            return 0
+
+        window = _to_microseconds(duration)
+        cutoff = self._timestamps[self._physical_index(self._size - 1)] - window
+        start = max(self._window_starts.get(window, 0) - self._first_sequence, 0)
+
+        while self._timestamps[self._physical_index(start)] < cutoff:
+            start += 1
+
+        self._window_starts[window] = self._first_sequence + start
+        return start
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_microseconds(value: timedelta) -> int:
+    return value // timedelta(microseconds=1)
 
 
 @docs_group('Autoscaling')
@@ -136,10 +315,11 @@ class Snapshotter:
     def _get_sorted_list_by_created_at(input_list: list[T]) -> SortedSnapshotList[T]:
         """Create a sorted list from the input list.
 
-        Returns a custom list that maintains sorted order by created_at when items are added.
+        Returns a ring buffer that maintains sorted order by created_at when items are added.
         """
         result = SortedSnapshotList[T]()
-        result.extend(input_list)
+        for item in input_list:
+            result.add(item)
         return result
 
     @property
@@ -198,8 +378,19 @@ class Snapshotter:
         Returns:
             A sample of memory snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._memory_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._memory_snapshots.get_sample(duration))
+
+    @ensure_context
+    def get_memory_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the memory was overloaded, according to the latest snapshots.
+
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded ratio between 0 and 1.
+        """
+        return self._memory_snapshots.get_overloaded_ratio(duration)
 
     @ensure_context
     def get_event_loop_sample(self, duration: timedelta | None = None) -> list[Snapshot]:
@@ -211,8 +402,19 @@ class Snapshotter:
         Returns:
             A sample of event loop snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._event_loop_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._event_loop_snapshots.get_sample(duration))
+
+    @ensure_context
+    def get_event_loop_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the event loop was overloaded, according to the latest snapshots.
+
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded ratio between 0 and 1.
+        """
+        return self._event_loop_snapshots.get_overloaded_ratio(duration)
 
     @ensure_context
     def get_cpu_sample(self, duration: timedelta | None = None) -> list[Snapshot]:
@@ -224,8 +426,19 @@ class Snapshotter:
         Returns:
             A sample of CPU snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._cpu_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._cpu_snapshots.get_sample(duration))
+
+    @ensure_context
+    def get_cpu_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the CPU was overloaded, according to the latest snapshots.
+
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
+
+        Returns:
+            The overloaded ratio between 0 and 1.
+        """
+        return self._cpu_snapshots.get_overloaded_ratio(duration)
 
     @ensure_context
     def get_client_sample(self, duration: timedelta | None = None) -> list[Snapshot]:
@@ -237,20 +450,19 @@ class Snapshotter:
         Returns:
             A sample of client snapshots.
         """
-        snapshots = cast('list[Snapshot]', self._client_snapshots)
-        return self._get_sample(snapshots, duration)
+        return cast('list[Snapshot]', self._client_snapshots.get_sample(duration))
 
-    @staticmethod
-    def _get_sample(snapshots: list[Snapshot], duration: timedelta | None = None) -> list[Snapshot]:
-        """Return a time-limited sample from snapshots or full history if duration is None."""
-        if not duration:
-            return snapshots
+    @ensure_context
+    def get_client_overloaded_ratio(self, duration: timedelta | None = None) -> float:
+        """Return the ratio of time during which the client was overloaded, according to the latest snapshots.
 
-        if not snapshots:
-            return []
+        Args:
+            duration: The duration of the sample from the latest snapshot. If omitted, it uses a full history.
 
-        latest_time = snapshots[-1].created_at
-        return [snapshot for snapshot in snapshots if latest_time - snapshot.created_at <= duration]
+        Returns:
+            The overloaded ratio between 0 and 1.
+        """
+        return self._client_snapshots.get_overloaded_ratio(duration)
 
     def _snapshot_cpu(self, event_data: EventSystemInfoData) -> None:
         """Capture a snapshot of the current CPU usage.
@@ -267,8 +479,7 @@ class Snapshotter:
             created_at=event_data.cpu_info.created_at,
         )
 
-        snapshots = cast('list[Snapshot]', self._cpu_snapshots)
-        self._prune_snapshots(snapshots, event_data.cpu_info.created_at)
+        self._prune_snapshots(self._cpu_snapshots, event_data.cpu_info.created_at)
         self._cpu_snapshots.add(snapshot)
 
     def _snapshot_memory(self, event_data: EventSystemInfoData) -> None:
@@ -293,8 +504,7 @@ class Snapshotter:
             snapshot.system_wide_used_size = memory_info.system_wide_used_size
             snapshot.system_wide_memory_size = memory_info.total_size
 
-        snapshots = cast('list[Snapshot]', self._memory_snapshots)
-        self._prune_snapshots(snapshots, snapshot.created_at)
+        self._prune_snapshots(self._memory_snapshots, snapshot.created_at)
         self._memory_snapshots.add(snapshot)
         self._evaluate_memory_load(event_data.memory_info.current_size, event_data.memory_info.created_at)
 
@@ -313,8 +523,7 @@ class Snapshotter:
             event_loop_delay = snapshot.created_at - previous_snapshot.created_at - self._EVENT_LOOP_SNAPSHOT_INTERVAL
             snapshot.delay = event_loop_delay
 
-        snapshots = cast('list[Snapshot]', self._event_loop_snapshots)
-        self._prune_snapshots(snapshots, snapshot.created_at)
+        self._prune_snapshots(self._event_loop_snapshots, snapshot.created_at)
         self._event_loop_snapshots.add(snapshot)
 
     def _snapshot_client(self) -> None:
@@ -335,34 +544,20 @@ class Snapshotter:
             max_error_count=self._max_client_errors,
         )
 
-        snapshots = cast('list[Snapshot]', self._client_snapshots)
-        self._prune_snapshots(snapshots, snapshot.created_at)
+        self._prune_snapshots(self._client_snapshots, snapshot.created_at)
         self._client_snapshots.add(snapshot)
 
-    def _prune_snapshots(self, snapshots: list[Snapshot], now: datetime) -> None:
+    def _prune_snapshots(self, snapshots: SortedSnapshotList[T], now: datetime) -> None:
         """Remove snapshots that are older than the `self._snapshot_history`.
 
-        This method modifies the list of snapshots in place, removing all snapshots that are older than the defined
+        This method modifies the snapshots in place, removing all snapshots that are older than the defined
         snapshot history relative to the `now` parameter.
 
         Args:
-            snapshots: List of snapshots to be pruned in place.
+            snapshots: Snapshots to be pruned in place.
             now: The current date and time, used as the reference for pruning.
         """
-        # Find the index where snapshots start to be within the allowed history window.
-        # We'll keep snapshots from this index onwards.
-        keep_from_index = None
-        for i, snapshot in enumerate(snapshots):
-            if now - snapshot.created_at <= self._SNAPSHOT_HISTORY:
-                keep_from_index = i
-                break
-
-        # If all snapshots are old, keep_from_index will remain None, so we clear the list.
-        # Otherwise, we keep only the recent snapshots.
-        if keep_from_index is not None:
-            del snapshots[:keep_from_index]
-        else:
-            snapshots.clear()
+        snapshots.prune(now - self._SNAPSHOT_HISTORY)
 
     def _evaluate_memory_load(self, current_memory_usage_size: ByteSize, snapshot_timestamp: datetime) -> None:
         """Evaluate and logs critical memory load conditions based on the system information.
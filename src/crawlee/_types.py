@@ -28,6 +28,7 @@ if TYPE_CHECKING:
     from typing_extensions import NotRequired, Required, Unpack
 
     from crawlee import Glob, Request
+    from crawlee._autoscaling.concurrency_controller import ConcurrencyController
     from crawlee._request import RequestOptions
     from crawlee.configuration import Configuration
     from crawlee.http_clients import HttpResponse
@@ -113,6 +114,7 @@ class ConcurrencySettings:
         max_concurrency: int = 200,
         max_tasks_per_minute: float = float('inf'),
         desired_concurrency: int | None = None,
+        concurrency_controller: ConcurrencyController | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -124,6 +126,10 @@ class ConcurrencySettings:
                 to infinity, but you can pass any positive, non-zero number.
             desired_concurrency: The desired number of tasks that should be running parallel on the start of the pool,
                 if there is a large enough supply of them. By default, it is `min_concurrency`.
+            concurrency_controller: The strategy for adjusting the desired concurrency between `min_concurrency`
+                and `max_concurrency`. By default, a `SystemStatusConcurrencyController` is used, which reacts only
+                to system overload. Use `AimdConcurrencyController` to also stop scaling up once more parallel tasks
+                no longer increase the number of finished requests per second.
         """
         if desired_concurrency is not None and desired_concurrency < 1:
             raise ValueError('desired_concurrency must be 1 or larger')
@@ -141,6 +147,7 @@ class ConcurrencySettings:
         self.max_concurrency = max_concurrency
         self.desired_concurrency = desired_concurrency if desired_concurrency is not None else min_concurrency
         self.max_tasks_per_minute = max_tasks_per_minute
+        self.concurrency_controller = concurrency_controller
 
 
 class EnqueueLinksKwargs(TypedDict):
@@ -634,8 +641,11 @@ class ExportToKwargs(TypedDict):
     key: Required[str]
     """The key under which to save the data."""
 
-    content_type: NotRequired[Literal['json', 'csv']]
-    """The format in which to export the data. Either 'json' or 'csv'."""
+    content_type: NotRequired[Literal['json', 'jsonl', 'csv']]
+    """The format in which to export the data. Either 'json', 'jsonl' or 'csv'."""
+
+    compression: NotRequired[Literal['gzip', 'zstd']]
+    """The compression to apply to the exported file."""
 
     to_kvs_id: NotRequired[str]
     """ID of the key-value store to save the exported file."""
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import hashlib
+import math
+import struct
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+_HEADER = struct.Struct('<4sBdIdd')
+"""Magic, version, error rate, number of layers, growth factor and tightening ratio of a serialized filter."""
+
+_LAYER_HEADER = struct.Struct('<QIQQ')
+"""Capacity, number of hashes, number of bits and number of items of a serialized layer."""
+
+_MAGIC = b'CSBF'
+_VERSION = 1
+
+
+class _BloomLayer:
+    """A plain Bloom filter with a fixed capacity."""
+
+    __slots__ = ('bit_count', 'bits', 'capacity', 'count', 'hash_count')
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = capacity
+        self.bit_count = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / capacity * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)
+        self.count = 0
+
+    def contains(self, hash_1: int, hash_2: int) -> bool:
+        bits, bit_count = self.bits, self.bit_count
+        # Double hashing, see Kirsch and Mitzenmacher, "Less Hashing, Same Performance".
+        position, step = hash_1 % bit_count, hash_2 % bit_count
+
+        for _ in range(self.hash_count):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+            position = (position + step) % bit_count
+
+        return True
+
+    def add(self, hash_1: int, hash_2: int) -> None:
+        bits, bit_count = self.bits, self.bit_count
+        position, step = hash_1 % bit_count, hash_2 % bit_count
+
+        for _ in range(self.hash_count):
+            bits[position >> 3] |= 1 << (position & 7)
+            position = (position + step) % bit_count
+
+        self.count += 1
+
+
+class ScalableBloomFilter:
+    """A Bloom filter which grows with the number of added items, while keeping its false positive rate bounded.
+
+    The filter is a series of plain Bloom filters (layers). Items are added to the last layer, and once it reaches
+    its capacity, a new layer with `growth` times the capacity and `tightening` times the error rate is added.
+    An item is considered present if any layer contains it, so the overall false positive rate stays below
+    `error_rate`, see Almeida et al., "Scalable Bloom Filters".
+
+    A filter never reports an added item as missing, but it reports a missing item as present with a probability
+    of at most `error_rate`.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_capacity: int = 100_000,
+        error_rate: float = 1e-6,
+        growth: float = 2.0,
+        tightening: float = 0.5,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            initial_capacity: The number of items the first layer is sized for.
+            error_rate: The maximum false positive rate of the whole filter.
+            growth: How many times larger is the capacity of each new layer.
+            tightening: How many times smaller is the error rate of each new layer.
+        """
+        if initial_capacity < 1:
+            raise ValueError('The initial capacity must be at least 1')
+
+        if not 0 < error_rate < 1 or not 0 < tightening < 1 or growth < 1:
+            raise ValueError('The error rate and the tightening ratio must be between 0 and 1, the growth at least 1')
+
+        self._initial_capacity = initial_capacity
+        self._error_rate = error_rate
+        self._growth = growth
+        self._tightening = tightening
+        self._layers = list[_BloomLayer]()
+
+    def __len__(self) -> int:
+        """Return the number of distinct items added to the filter."""
+        return sum(layer.count for layer in self._layers)
+
+    def __contains__(self, item: str) -> bool:
+        return self._contains(*self._hash(item))
+
+    @property
+    def error_rate(self) -> float:
+        """The maximum false positive rate of the filter."""
+        return self._error_rate
+
+    @property
+    def size(self) -> int:
+        """The size of the filter in bytes."""
+        return sum(len(layer.bits) for layer in self._layers)
+
+    def add(self, item: str) -> bool:
+        """Add an item to the filter, returning `False` if it was (probably) present already."""
+        hash_1, hash_2 = self._hash(item)
+        if self._contains(hash_1, hash_2):
+            return False
+
+        if not self._layers or self._layers[-1].count >= self._layers[-1].capacity:
+            self._layers.append(self._new_layer(len(self._layers)))
+
+        self._layers[-1].add(hash_1, hash_2)
+        return True
+
+    def clear(self) -> None:
+        """Remove all items from the filter."""
+        self._layers.clear()
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter, so that it can be restored with `from_bytes`."""
+        parts = [
+            _HEADER.pack(_MAGIC, _VERSION, self._error_rate, len(self._layers), self._growth, self._tightening),
+            struct.pack('<Q', self._initial_capacity),
+        ]
+
+        for layer in self._layers:
+            parts.append(_LAYER_HEADER.pack(layer.capacity, layer.hash_count, layer.bit_count, layer.count))
+            parts.append(bytes(layer.bits))
+
+        return b''.join(parts)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """Restore a filter serialized by `to_bytes`, raising `ValueError` if the data is not a valid filter."""
+        try:
+            magic, version, error_rate, layer_count, growth, tightening = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError('Not a serialized Bloom filter')
+
+            offset = _HEADER.size
+            (initial_capacity,) = struct.unpack_from('<Q', data, offset)
+            offset += 8
+
+            bloom_filter = cls(
+                initial_capacity=initial_capacity, error_rate=error_rate, growth=growth, tightening=tightening
+            )
+
+            for index in range(layer_count):
+                capacity, hash_count, bit_count, count = _LAYER_HEADER.unpack_from(data, offset)
+                offset += _LAYER_HEADER.size
+
+                layer = bloom_filter._new_layer(index)
+                if (layer.capacity, layer.hash_count, layer.bit_count) != (capacity, hash_count, bit_count):
+                    raise ValueError('Inconsistent layer parameters')
+
+                layer.bits[:] = data[offset : offset + len(layer.bits)]
+                if len(layer.bits) != (bit_count + 7) // 8:
+                    raise ValueError('Truncated layer')
+
+                offset += len(layer.bits)
+                layer.count = count
+                bloom_filter._layers.append(layer)
+        except struct.error as exc:
+            raise ValueError('Truncated Bloom filter') from exc
+
+        return bloom_filter
+
+    def _contains(self, hash_1: int, hash_2: int) -> bool:
+        # The most recent layers are checked first, as they are the largest ones.
+        for layer in reversed(self._layers):  # noqa: SIM110
+            if layer.contains(hash_1, hash_2):
+                return True
+        return False
+
+    def _new_layer(self, index: int) -> _BloomLayer:
+        capacity = math.ceil(self._initial_capacity * self._growth**index)
+        # The error rates of the layers form a geometric series, which sums up to at most `error_rate`.
+        error_rate = self._error_rate * (1 - self._tightening) * self._tightening**index
+        return _BloomLayer(capacity, error_rate)
+
+    @staticmethod
+    def _hash(item: str) -> tuple[int, int]:
+        digest = int.from_bytes(hashlib.blake2b(item.encode(), digest_size=16).digest(), 'little')
+        # The second hash is made odd, so that it is never zero and the probed positions do not all coincide.
+        return digest & 0xFFFFFFFFFFFFFFFF, (digest >> 64) | 1
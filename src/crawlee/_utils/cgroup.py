@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from logging import getLogger
+from pathlib import Path
+from typing import Literal
+
+from crawlee._utils.byte_size import ByteSize
+
+logger = getLogger(__name__)
+
+CGROUP_ROOT = Path('/sys/fs/cgroup')
+"""The usual mount point of the cgroup filesystem."""
+
+_CGROUP_V1: Literal[1] = 1
+_CGROUP_V2: Literal[2] = 2
+
+
+@dataclass
+class CgroupCpuStats:
+    """CPU usage and limits of a cgroup, read at a single point in time."""
+
+    usage_seconds: float
+    """Total CPU time consumed by all tasks in the cgroup."""
+
+    quota_cpus: float | None
+    """The number of CPUs the cgroup may use per scheduling period, or `None` if there is no quota."""
+
+    periods: int
+    """The number of elapsed scheduling periods with runnable tasks."""
+
+    throttled_periods: int
+    """The number of scheduling periods in which the cgroup exhausted its quota and was throttled."""
+
+
+@dataclass
+class CgroupMemoryStats:
+    """Memory usage and limits of a cgroup, read at a single point in time."""
+
+    used_size: ByteSize
+    """The working set of the cgroup, i.e. its memory usage without inactive file cache that can be reclaimed."""
+
+    limit_size: ByteSize | None
+    """The memory limit of the cgroup, or `None` if there is no limit."""
+
+
+class CgroupProbe:
+    """Read CPU and memory usage from the cgroup (v1 or v2) filesystem of the current container.
+
+    Inside a container, `psutil` reports the numbers of the whole host, which looks idle even while the container
+    is throttled by its CPU quota or close to its memory limit. The probe reads the limits and usage counters of the
+    cgroup instead. All read methods return `None` when the needed files are missing or malformed, so that callers
+    can fall back to `psutil`.
+
+    The probe expects the cgroup of the container to be mounted at the root, as is the case with cgroup namespaces
+    and the usual container runtimes.
+    """
+
+    def __init__(self, root: Path, version: Literal[1, 2]) -> None:
+        """Initialize a new instance.
+
+        In most cases, you should use the `detect` constructor to find the cgroup filesystem.
+
+        Args:
+            root: The mount point of the cgroup filesystem.
+            version: The version of the cgroup filesystem.
+        """
+        self._root = root
+        self._version = version
+        self._previous_cpu_stats: tuple[float, CgroupCpuStats] | None = None
+
+    @classmethod
+    def detect(cls, root: Path = CGROUP_ROOT) -> CgroupProbe | None:
+        """Create a probe for the cgroup filesystem mounted at `root`, if there is one."""
+        if (root / 'cgroup.controllers').is_file():
+            return cls(root, version=_CGROUP_V2)
+
+        if any(cls._find_v1_controller(root, controller) for controller in ('cpu', 'cpuacct', 'memory')):
+            return cls(root, version=_CGROUP_V1)
+
+        return None
+
+    @property
+    def version(self) -> Literal[1, 2]:
+        """The version of the cgroup filesystem."""
+        return self._version
+
+    def read_cpu_stats(self) -> CgroupCpuStats | None:
+        """Read the current CPU usage counters and the CPU quota of the cgroup."""
+        try:
+            if self._version == _CGROUP_V2:
+                return self._read_cpu_stats_v2()
+            return self._read_cpu_stats_v1()
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug(f'Failed to read cgroup CPU stats: {exc!r}')
+            return None
+
+    def read_memory_stats(self) -> CgroupMemoryStats | None:
+        """Read the current memory usage and the memory limit of the cgroup."""
+        try:
+            if self._version == _CGROUP_V2:
+                return self._read_memory_stats_v2()
+            return self._read_memory_stats_v1()
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug(f'Failed to read cgroup memory stats: {exc!r}')
+            return None
+
+    def get_cpu_used_ratio(self) -> float | None:
+        """Compute the ratio of the CPU quota used since the previous call.
+
+        The first call only records the counters to compare the next call with and reports no usage, so that taking
+        a sample never blocks. Scheduling periods in which the cgroup was throttled count as fully used, since
+        the usage averaged over the interval may look low even when the tasks cannot get any more CPU time.
+
+        Returns:
+            A float between 0 and 1, or `None` if the cgroup has no CPU quota or the counters cannot be read.
+        """
+        stats = self.read_cpu_stats()
+        if stats is None or stats.quota_cpus is None:
+            self._previous_cpu_stats = None
+            return None
+
+        now = time.monotonic()
+
+        if self._previous_cpu_stats is None:
+            self._previous_cpu_stats = (now, stats)
+            return 0.0
+
+        previous_time, previous_stats = self._previous_cpu_stats
+        self._previous_cpu_stats = (now, stats)
+
+        elapsed = now - previous_time
+        if elapsed <= 0:
+            return None
+
+        used_ratio = (stats.usage_seconds - previous_stats.usage_seconds) / elapsed / stats.quota_cpus
+
+        if (periods := stats.periods - previous_stats.periods) > 0:
+            throttled_ratio = (stats.throttled_periods - previous_stats.throttled_periods) / periods
+            used_ratio = max(used_ratio, throttled_ratio)
+
+        return min(max(used_ratio, 0.0), 1.0)
+
+    def _read_cpu_stats_v2(self) -> CgroupCpuStats:
+        cpu_stat = _read_flat_keyed(self._root / 'cpu.stat')
+
+        # The `cpu` controller, which provides `cpu.max` and the throttling counters, may not be enabled.
+        quota_cpus = None
+        cpu_max = self._root / 'cpu.max'
+        if cpu_max.is_file():
+            quota, period = cpu_max.read_text().split()
+            if quota != 'max':
+                quota_cpus = int(quota) / int(period)
+
+        return CgroupCpuStats(
+            usage_seconds=cpu_stat['usage_usec'] / 1_000_000,
+            quota_cpus=quota_cpus,
+            periods=cpu_stat.get('nr_periods', 0),
+            throttled_periods=cpu_stat.get('nr_throttled', 0),
+        )
+
+    def _read_cpu_stats_v1(self) -> CgroupCpuStats:
+        cpu = self._find_v1_controller(self._root, 'cpu')
+        cpuacct = self._find_v1_controller(self._root, 'cpuacct')
+        if cpu is None or cpuacct is None:
+            raise FileNotFoundError('cgroup v1 cpu or cpuacct controller is not mounted')
+
+        quota = int((cpu / 'cpu.cfs_quota_us').read_text())
+        period = int((cpu / 'cpu.cfs_period_us').read_text())
+        cpu_stat = _read_flat_keyed(cpu / 'cpu.stat')
+
+        return CgroupCpuStats(
+            usage_seconds=int((cpuacct / 'cpuacct.usage').read_text()) / 1_000_000_000,
+            quota_cpus=quota / period if quota > 0 else None,
+            periods=cpu_stat.get('nr_periods', 0),
+            throttled_periods=cpu_stat.get('nr_throttled', 0),
+        )
+
+    def _read_memory_stats_v2(self) -> CgroupMemoryStats:
+        current = int((self._root / 'memory.current').read_text())
+        limit = (self._root / 'memory.max').read_text().strip()
+        memory_stat = _read_flat_keyed(self._root / 'memory.stat')
+
+        return CgroupMemoryStats(
+            used_size=ByteSize(max(current - memory_stat.get('inactive_file', 0), 0)),
+            limit_size=None if limit == 'max' else ByteSize(int(limit)),
+        )
+
+    def _read_memory_stats_v1(self) -> CgroupMemoryStats:
+        memory = self._find_v1_controller(self._root, 'memory')
+        if memory is None:
+            raise FileNotFoundError('cgroup v1 memory controller is not mounted')
+
+        usage = int((memory / 'memory.usage_in_bytes').read_text())
+        memory_stat = _read_flat_keyed(memory / 'memory.stat')
+
+        # Without a limit, cgroup v1 reports the largest page-aligned 64-bit value. Callers compare the limit with
+        # the total memory of the system anyway, so it is returned as is.
+        return CgroupMemoryStats(
+            used_size=ByteSize(max(usage - memory_stat.get('total_inactive_file', 0), 0)),
+            limit_size=ByteSize(int((memory / 'memory.limit_in_bytes').read_text())),
+        )
+
+    @staticmethod
+    def _find_v1_controller(root: Path, controller: str) -> Path | None:
+        """Find the directory of a cgroup v1 controller, which may be co-mounted with others, e.g. `cpu,cpuacct`."""
+        if (root / controller).is_dir():
+            return root / controller
+
+        if root.is_dir():
+            for path in root.iterdir():
+                if controller in path.name.split(',') and path.is_dir():
+                    return path
+
+        return None
+
+
+def _read_flat_keyed(path: Path) -> dict[str, int]:
+    """Read a cgroup file with one `key value` pair per line, such as `cpu.stat` or `memory.stat`."""
+    result = dict[str, int]()
+
+    for line in path.read_text().splitlines():
+        key, _, value = line.partition(' ')
+        if value:
+            result[key] = int(value)
+
+    return result
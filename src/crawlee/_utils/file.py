@@ -6,12 +6,14 @@ import json
 import os
 import sys
 import tempfile
+import zlib
+from io import StringIO
 from pathlib import Path
-from typing import TYPE_CHECKING, overload
+from typing import TYPE_CHECKING, Protocol, cast, overload
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
-    from typing import Any, TextIO
+    from collections.abc import AsyncIterable, AsyncIterator
+    from typing import Any, Literal, TextIO
 
     from typing_extensions import Unpack
 
@@ -149,24 +151,112 @@ async def atomic_write(
         raise
 
 
-async def export_json_to_stream(
+class _Compressor(Protocol):
+    def compress(self, data: bytes, /) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+
+EXPORT_CHUNK_SIZE = 64 * 1024
+"""The number of characters an export is encoded and written in at a time."""
+
+
+async def atomic_write_stream(path: Path, stream: AsyncIterable[bytes]) -> int:
+    """Write a stream of bytes to a file atomically, holding only a single chunk in memory at a time.
+
+    The chunks are written into a temporary file next to the destination, which then atomically replaces it. On
+    Windows the destination is written directly, for the same reasons as in `atomic_write`.
+
+    Args:
+        path: The path to the destination file.
+        stream: The chunks of data to write.
+
+    Returns:
+        The number of bytes written.
+    """
+    tmp_path: Path | None = None
+
+    if sys.platform == 'win32':
+        file = await asyncio.to_thread(path.open, 'wb')
+    else:
+        fd, tmp_name = await asyncio.to_thread(
+            tempfile.mkstemp,
+            suffix=f'{path.suffix}.tmp',
+            prefix=f'{path.name}.',
+            dir=str(path.parent),
+        )
+        tmp_path = Path(tmp_name)
+        file = os.fdopen(fd, 'wb')
+
+    size = 0
+
+    try:
+        try:
+            async for chunk in stream:
+                await asyncio.to_thread(file.write, chunk)
+                size += len(chunk)
+        finally:
+            await asyncio.to_thread(file.close)
+
+        if tmp_path is not None:
+            await asyncio.to_thread(tmp_path.replace, path)
+    except BaseException:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        raise
+
+    return size
+
+
+async def iterate_json_export(
     iterator: AsyncIterator[dict[str, Any]],
-    dst: TextIO,
     **kwargs: Unpack[ExportDataJsonKwargs],
-) -> None:
-    items = [item async for item in iterator]
-    json.dump(items, dst, **kwargs)
+) -> AsyncIterator[str]:
+    """Serialize items into a JSON array piece by piece.
 
+    The output is identical to `json.dump` of a list of the items, but only a single item is serialized at a time.
+    """
+    indent = kwargs.get('indent')
+    separators = kwargs.get('separators')
+    item_separator = separators[0] if separators else (', ' if indent is None else ',')
+    newline_indent = '' if indent is None else '\n' + (' ' * indent if isinstance(indent, int) else indent)
 
-async def export_csv_to_stream(
+    first = True
+    async for item in iterator:
+        text = json.dumps(item, **kwargs)
+        if newline_indent:
+            # Items are nested one level deeper in the array than when serialized on their own.
+            text = text.replace('\n', newline_indent)
+
+        yield ('[' if first else item_separator) + newline_indent + text
+        first = False
+
+    if first:
+        yield '[]'
+    else:
+        yield ('\n' if newline_indent else '') + ']'
+
+
+async def iterate_json_lines_export(
+    iterator: AsyncIterator[dict[str, Any]],
+    **kwargs: Unpack[ExportDataJsonKwargs],
+) -> AsyncIterator[str]:
+    """Serialize items into JSON Lines, one item per line. The `indent` option is ignored."""
+    kwargs.pop('indent', None)
+
+    async for item in iterator:
+        yield json.dumps(item, **kwargs) + '\n'
+
+
+async def iterate_csv_export(
     iterator: AsyncIterator[dict[str, Any]],
-    dst: TextIO,
     **kwargs: Unpack[ExportDataCsvKwargs],
-) -> None:
-    writer = csv.writer(dst, **kwargs)  # type: ignore[arg-type]
+) -> AsyncIterator[str]:
+    """Serialize items into CSV rows, with a header taken from the keys of the first non-empty item."""
+    buffer = StringIO()
+    writer = csv.writer(buffer, **kwargs)  # type: ignore[arg-type]
     write_header = True
 
-    # Iterate over the dataset and write to CSV.
     async for item in iterator:
         if not item:
             continue
@@ -176,3 +266,82 @@ async def export_csv_to_stream(
             write_header = False
 
         writer.writerow(item.values())
+
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+
+
+def _create_compressor(compression: Literal['gzip', 'zstd']) -> _Compressor:
+    if compression == 'gzip':
+        return zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+
+    if compression == 'zstd':
+        try:
+            import zstandard  # noqa: PLC0415
+        except ImportError as exc:
+            raise ImportError(
+                'zstandard is required for zstd compression. Install with: pip install crawlee[zstd]'
+            ) from exc
+
+        return cast('_Compressor', zstandard.ZstdCompressor().compressobj())
+
+    raise ValueError(f'Unsupported compression: {compression}, expecting gzip or zstd')
+
+
+async def encode_export_stream(
+    pieces: AsyncIterator[str],
+    *,
+    compression: Literal['gzip', 'zstd'] | None = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> AsyncIterator[bytes]:
+    """Encode serialized pieces of an export into UTF-8 chunks of roughly `chunk_size`, optionally compressed.
+
+    Args:
+        pieces: The serialized pieces of the export.
+        compression: The compression to apply, if any.
+        chunk_size: The number of characters to collect before a chunk is encoded and yielded.
+    """
+    compressor = _create_compressor(compression) if compression else None
+    buffer = list[str]()
+    buffered = 0
+
+    async def encode(*, final: bool) -> bytes:
+        data = ''.join(buffer).encode('utf-8')
+        buffer.clear()
+
+        if compressor is None:
+            return data
+
+        data = await asyncio.to_thread(compressor.compress, data)
+        return data + compressor.flush() if final else data
+
+    async for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+
+        if buffered >= chunk_size:
+            buffered = 0
+            if data := await encode(final=False):
+                yield data
+
+    if data := await encode(final=True):
+        yield data
+
+
+async def export_json_to_stream(
+    iterator: AsyncIterator[dict[str, Any]],
+    dst: TextIO,
+    **kwargs: Unpack[ExportDataJsonKwargs],
+) -> None:
+    async for piece in iterate_json_export(iterator, **kwargs):
+        dst.write(piece)
+
+
+async def export_csv_to_stream(
+    iterator: AsyncIterator[dict[str, Any]],
+    dst: TextIO,
+    **kwargs: Unpack[ExportDataCsvKwargs],
+) -> None:
+    async for piece in iterate_csv_export(iterator, **kwargs):
+        dst.write(piece)
@@ -0,0 +1,235 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from crawlee._utils.byte_size import ByteSize
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+PROC_ROOT = Path('/proc')
+"""The usual mount point of the proc filesystem."""
+
+
+@dataclass
+class _ProcessEntry:
+    """Cached memory measurement of a single process."""
+
+    pid: int
+    parent_pid: int
+    resident_pages: int = -1
+    size: int = 0
+    measured_at: float = float('-inf')
+
+
+class ProcessTreeSampler:
+    """Measure the memory used by a process and all its descendants, caching the process tree between samples.
+
+    Walking the whole process tree and reading the detailed memory maps of every process on each sample is expensive
+    when there are hundreds of browser renderer processes. The sampler keeps the known processes between samples and
+    only looks for new ones when the direct children of the root change, when `invalidate` is called (e.g. when
+    a browser is launched or closed), or after `rescan_interval`.
+
+    For every known process, it reads the cheap `/proc/<pid>/statm` on each sample. The proportional set size (PSS)
+    from `/proc/<pid>/smaps_rollup`, which divides shared memory between the processes sharing it, is read again only
+    when the resident size of the process changed or the cached value is older than `max_size_age`.
+
+    Subtrees of the process tree can be attributed to owners, such as browser controllers, with `track`.
+
+    Linux only.
+    """
+
+    def __init__(
+        self,
+        root_pid: int,
+        *,
+        proc_root: Path = PROC_ROOT,
+        rescan_interval: timedelta = timedelta(seconds=5),
+        max_size_age: timedelta = timedelta(seconds=5),
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            root_pid: The process whose tree is measured.
+            proc_root: The mount point of the proc filesystem.
+            rescan_interval: The maximum time between two scans for new processes.
+            max_size_age: The maximum age of a cached memory size of a process with unchanged resident size.
+        """
+        self._root_pid = root_pid
+        self._proc_root = proc_root
+        self._rescan_interval = rescan_interval.total_seconds()
+        self._max_size_age = max_size_age.total_seconds()
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+
+        self._processes = dict[int, _ProcessEntry]()
+        self._root_children: set[int] | None = None
+        self._rescanned_at = float('-inf')
+        self._is_stale = True
+
+        self._owner_pids = dict[object, int]()
+        self._owner_sizes = dict[object, ByteSize]()
+        self._lock = threading.Lock()
+
+    @property
+    def root_pid(self) -> int:
+        """The process whose tree is measured."""
+        return self._root_pid
+
+    def invalidate(self) -> None:
+        """Look for new processes in the next sample."""
+        self._is_stale = True
+
+    def track(self, owner: Hashable, pid: int) -> None:
+        """Attribute the memory of the process `pid` and its descendants to `owner`."""
+        with self._lock:
+            self._owner_pids[owner] = pid
+            self._is_stale = True
+
+    def untrack(self, owner: Hashable) -> None:
+        """Stop attributing memory to `owner`."""
+        with self._lock:
+            self._owner_pids.pop(owner, None)
+            self._owner_sizes.pop(owner, None)
+            self._is_stale = True
+
+    def get_owner_size(self, owner: Hashable) -> ByteSize | None:
+        """Get the memory attributed to `owner` in the latest sample, if it was measured."""
+        return self._owner_sizes.get(owner)
+
+    def sample(self) -> ByteSize:
+        """Measure the memory of the root process and all its descendants.
+
+        Returns:
+            The sum of the memory sizes of the processes in the tree.
+        """
+        with self._lock:
+            now = time.monotonic()
+            root_children = self._read_children(self._root_pid)
+
+            if (
+                self._is_stale
+                or now - self._rescanned_at >= self._rescan_interval
+                or (root_children is not None and root_children != self._root_children)
+            ):
+                self._rescan()
+                self._rescanned_at = now
+                self._is_stale = False
+
+            self._root_children = root_children
+            total_size = 0
+
+            for pid, entry in list(self._processes.items()):
+                if not self._measure(entry, now):
+                    # The process has ended, its children may have been re-parented.
+                    del self._processes[pid]
+                    self._is_stale = True
+                    continue
+
+                total_size += entry.size
+
+            self._update_owner_sizes()
+            return ByteSize(total_size)
+
+    def _rescan(self) -> None:
+        """Find all descendants of the root process, keeping the cached measurements of the known ones."""
+        parent_pids = dict[int, int]()
+        children_by_parent = dict[int, list[int]]()
+
+        for path in self._proc_root.iterdir():
+            if not path.name.isdigit():
+                continue
+
+            try:
+                stat = (path / 'stat').read_text()
+                # The process name in parentheses may contain spaces, the parent PID is the second field after it.
+                parent_pid = int(stat[stat.rindex(')') + 2 :].split()[1])
+            except (OSError, ValueError):
+                continue
+
+            parent_pids[int(path.name)] = parent_pid
+            children_by_parent.setdefault(parent_pid, []).append(int(path.name))
+
+        processes = dict[int, _ProcessEntry]()
+        pending = [(self._root_pid, parent_pids.get(self._root_pid, 0))]
+
+        while pending:
+            pid, parent_pid = pending.pop()
+            entry = self._processes.get(pid)
+
+            # A known PID with a different parent belongs to a new process that reused the PID.
+            if entry is None or entry.parent_pid != parent_pid:
+                entry = _ProcessEntry(pid=pid, parent_pid=parent_pid)
+
+            processes[pid] = entry
+            pending.extend((child_pid, pid) for child_pid in children_by_parent.get(pid, ()))
+
+        self._processes = processes
+
+    def _measure(self, entry: _ProcessEntry, now: float) -> bool:
+        """Update the memory size of a process. Return `False` if the process no longer exists."""
+        try:
+            resident_pages = int((self._proc_root / str(entry.pid) / 'statm').read_text().split()[1])
+        except (OSError, ValueError, IndexError):
+            return False
+
+        if resident_pages == entry.resident_pages and now - entry.measured_at < self._max_size_age:
+            return True
+
+        entry.resident_pages = resident_pages
+        entry.measured_at = now
+        pss = self._read_pss(entry.pid)
+        entry.size = pss if pss is not None else resident_pages * self._page_size
+        return True
+
+    def _read_pss(self, pid: int) -> int | None:
+        """Read the proportional set size of a process in bytes, if the kernel provides it."""
+        try:
+            with (self._proc_root / str(pid) / 'smaps_rollup').open() as file:
+                for line in file:
+                    if line.startswith('Pss:'):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError):
+            pass
+
+        return None
+
+    def _read_children(self, pid: int) -> set[int] | None:
+        """Read the direct children of a process, or `None` if the kernel does not provide them."""
+        children = set[int]()
+
+        try:
+            for task in (self._proc_root / str(pid) / 'task').iterdir():
+                children.update(int(child_pid) for child_pid in (task / 'children').read_text().split())
+        except (OSError, ValueError):
+            return None
+
+        return children
+
+    def _update_owner_sizes(self) -> None:
+        if not self._owner_pids:
+            return
+
+        children_by_parent = dict[int, list[int]]()
+        for entry in self._processes.values():
+            children_by_parent.setdefault(entry.parent_pid, []).append(entry.pid)
+
+        for owner, owner_pid in self._owner_pids.items():
+            if owner_pid not in self._processes:
+                self._owner_sizes.pop(owner, None)
+                continue
+
+            size = 0
+            pending = [owner_pid]
+
+            while pending:
+                pid = pending.pop()
+                size += self._processes[pid].size
+                pending.extend(children_by_parent.get(pid, ()))
+
+            self._owner_sizes[owner] = ByteSize(size)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Generic, Literal, TypeVar
+import asyncio
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from pydantic import BaseModel
 
@@ -13,6 +14,12 @@ if TYPE_CHECKING:
 
 TStateModel = TypeVar('TStateModel', bound=BaseModel)
 
+_JOURNAL_GENERATION_FIELD = '__journal_generation__'
+"""Field of the persisted snapshot holding the generation of the journal that continues it."""
+
+_JOURNAL_START_FIELD = '__journal_start__'
+"""Field of the persisted snapshot holding the index of the first journal record not included in it."""
+
 
 class RecoverableState(Generic[TStateModel]):
     """A class for managing persistent recoverable state using a Pydantic model.
@@ -24,6 +31,12 @@ class RecoverableState(Generic[TStateModel]):
     The state is represented by a Pydantic model that can be serialized to and deserialized from JSON.
     The class automatically hooks into the event system to persist state when needed.
 
+    In the `'journal'` persistence mode, the full state is written only as an occasional snapshot. Other persists
+    append just the changes since the previous persist (added and removed set members, updated dictionary entries
+    and replaced values of other fields) as separate records, which keeps persisting large states cheap. Once the
+    journal reaches `journal_max_length` records, it is compacted into a new snapshot in the background, while
+    further persists keep appending records after it.
+
     Type Parameters:
         TStateModel: A Pydantic BaseModel type that defines the structure of the state data.
                      Typically, it should be inferred from the `default_state` constructor parameter.
@@ -37,6 +50,8 @@ class RecoverableState(Generic[TStateModel]):
         persistence_enabled: Literal[True, False, 'explicit_only'] = False,
         persist_state_kvs_name: str | None = None,
         persist_state_kvs_id: str | None = None,
+        persistence_mode: Literal['snapshot', 'journal'] = 'snapshot',
+        journal_max_length: int = 100,
         logger: logging.Logger,
     ) -> None:
         """Initialize a new recoverable state object.
@@ -51,6 +66,10 @@ class RecoverableState(Generic[TStateModel]):
                 If neither a name nor and id are supplied, the default store will be used.
             persist_state_kvs_id: The identifier of the KeyValueStore to use for persistence.
                 If neither a name nor and id are supplied, the default store will be used.
+            persistence_mode: Use 'snapshot' to write the whole state on every persist, or 'journal' to write only
+                the changes since the previous persist, with a full snapshot written once in a while.
+            journal_max_length: The number of journal records after which a new snapshot is written. Only used
+                in the 'journal' persistence mode.
             logger: A logger instance for logging operations related to state persistence
         """
         self._default_state = default_state
@@ -63,6 +82,15 @@ class RecoverableState(Generic[TStateModel]):
         self._key_value_store: 'KeyValueStore | None' = None  # noqa: UP037
         self._log = logger
 
+        self._persistence_mode = persistence_mode
+        self._journal_max_length = journal_max_length
+        self._journal_generation = 0
+        self._journal_start = 0
+        self._journal_length = 0
+        self._compaction_task: asyncio.Task[None] | None = None
+        self._persisted_fields: dict[str, Any] | None = None
+        """Normalized fields of the last persisted state, used to compute the journal records."""
+
     async def initialize(self) -> TStateModel:
         """Initialize the recoverable state.
 
@@ -111,6 +139,8 @@ class RecoverableState(Generic[TStateModel]):
             event_manager.off(event=Event.PERSIST_STATE, listener=self.persist_state)
             await self.persist_state()
 
+        await self._wait_for_compaction()
+
     @property
     def current_value(self) -> TStateModel:
         """Get the current state."""
@@ -146,6 +176,12 @@ class RecoverableState(Generic[TStateModel]):
             if self._key_value_store is None:
                 raise RuntimeError('Recoverable state has not yet been initialized')
 
+            if self._persistence_mode == 'journal':
+                await self._wait_for_compaction()
+                await self._delete_journal(self._journal_generation, self._journal_start, self._journal_length)
+                self._journal_start = self._journal_length = 0
+                self._persisted_fields = None
+
             await self._key_value_store.set_value(self._persist_state_key, None)
 
     async def persist_state(self, event_data: EventPersistStateData | None = None) -> None:
@@ -165,6 +201,10 @@ class RecoverableState(Generic[TStateModel]):
             raise RuntimeError('Recoverable state has not yet been initialized')
 
         if self._persistence_enabled is True or self._persistence_enabled == 'explicit_only':
+            if self._persistence_mode == 'journal':
+                await self._persist_journal()
+                return
+
             await self._key_value_store.set_value(
                 self._persist_state_key,
                 self._state.model_dump(mode='json', by_alias=True),
@@ -180,5 +220,170 @@ class RecoverableState(Generic[TStateModel]):
         stored_state = await self._key_value_store.get_value(self._persist_state_key)
         if stored_state is None:
             self._state = self._default_state.model_copy(deep=True)
+        elif self._persistence_mode == 'journal':
+            self._state = self._state_type.model_validate(await self._replay_journal(stored_state))
         else:
             self._state = self._state_type.model_validate(stored_state)
+
+    def _get_journal_key(self, generation: int, index: int) -> str:
+        return f'{self._persist_state_key}__JOURNAL_{generation}_{index}'
+
+    def _normalize_fields(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert the serialized values of set fields back to sets, so that they can be diffed."""
+        if self._state is None:
+            raise RuntimeError('Recoverable state has not yet been loaded')
+
+        fields = dict(data)
+
+        for name, field in self._state_type.model_fields.items():
+            key = field.serialization_alias or field.alias or name
+            if key in fields and isinstance(getattr(self._state, name), (set, frozenset)):
+                try:
+                    fields[key] = set(fields[key])
+                except TypeError:
+                    # Unhashable members are journaled by replacing the whole value.
+                    continue
+
+        return fields
+
+    @staticmethod
+    def _diff_fields(previous: dict[str, Any], current: dict[str, Any]) -> dict[str, Any]:
+        """Compute a journal record transforming the `previous` fields into the `current` ones."""
+        changes = dict[str, Any]()
+
+        for key, value in current.items():
+            old_value = previous.get(key)
+
+            if isinstance(value, set) and isinstance(old_value, set):
+                added, removed = value - old_value, old_value - value
+                if added or removed:
+                    changes[key] = {'add': list(added), 'remove': list(removed)}
+
+            elif isinstance(value, dict) and isinstance(old_value, dict):
+                updated = {k: v for k, v in value.items() if k not in old_value or old_value[k] != v}
+                removed_keys = [k for k in old_value if k not in value]
+                if updated or removed_keys:
+                    changes[key] = {'update': updated, 'remove': removed_keys}
+
+            elif key not in previous or value != old_value:
+                changes[key] = {'set': list(value) if isinstance(value, set) else value}
+
+        return changes
+
+    @staticmethod
+    def _apply_changes(data: dict[str, Any], changes: dict[str, Any]) -> None:
+        """Apply a journal record to the serialized state in place, without mutating the contained values."""
+        for key, change in changes.items():
+            if 'set' in change:
+                data[key] = change['set']
+
+            elif 'update' in change:
+                updated = {**data.get(key, {}), **change['update']}
+                for removed_key in change['remove']:
+                    updated.pop(removed_key, None)
+                data[key] = updated
+
+            else:
+                members = set(data.get(key, []))
+                members.difference_update(change['remove'])
+                members.update(change['add'])
+                data[key] = list(members)
+
+    async def _replay_journal(self, stored_state: dict[str, Any]) -> dict[str, Any]:
+        """Apply the journal records of the stored snapshot's generation to it."""
+        if self._key_value_store is None:
+            raise RuntimeError('Recoverable state has not yet been initialized')
+
+        data = dict(stored_state)
+        self._journal_generation = data.pop(_JOURNAL_GENERATION_FIELD, 0)
+        self._journal_start = self._journal_length = data.pop(_JOURNAL_START_FIELD, 0)
+
+        while (
+            changes := await self._key_value_store.get_value(
+                self._get_journal_key(self._journal_generation, self._journal_length)
+            )
+        ) is not None:
+            self._apply_changes(data, changes)
+            self._journal_length += 1
+
+        # Start a fresh generation with the first persist, so that no stale journal record can ever be replayed.
+        self._persisted_fields = None
+        return data
+
+    async def _persist_journal(self) -> None:
+        """Persist either a journal record with the changes since the last persist or a snapshot of a new generation.
+
+        A full journal is compacted into a snapshot by a background task, so that the persist itself stays cheap.
+        """
+        if self._key_value_store is None or self._state is None:
+            raise RuntimeError('Recoverable state has not yet been initialized')
+
+        data = self._state.model_dump(mode='json', by_alias=True)
+        fields = self._normalize_fields(data)
+
+        if self._persisted_fields is None:
+            await self._wait_for_compaction()
+            previous_generation = self._journal_generation
+            previous_start, previous_length = self._journal_start, self._journal_length
+
+            # The snapshot carries its generation, so the old journal records are ignored even if deleting them fails.
+            self._journal_generation += 1
+            self._journal_start = self._journal_length = 0
+            await self._key_value_store.set_value(
+                self._persist_state_key,
+                {**data, _JOURNAL_GENERATION_FIELD: self._journal_generation},
+                'application/json',
+            )
+            await self._delete_journal(previous_generation, previous_start, previous_length)
+
+        else:
+            changes = self._diff_fields(self._persisted_fields, fields)
+            if changes:
+                await self._key_value_store.set_value(
+                    self._get_journal_key(self._journal_generation, self._journal_length),
+                    changes,
+                    'application/json',
+                )
+                self._journal_length += 1
+
+            if self._journal_length - self._journal_start >= self._journal_max_length and self._compaction_task is None:
+                self._compaction_task = asyncio.create_task(
+                    self._compact_journal(data, self._journal_generation, self._journal_length)
+                )
+
+        self._persisted_fields = fields
+
+    async def _compact_journal(self, data: dict[str, Any], generation: int, length: int) -> None:
+        """Write a snapshot including the first `length` journal records of the generation and delete the records.
+
+        The journal records written in the meantime follow the snapshot, which only moves the start of the journal.
+        The records are deleted only after the snapshot is written, so that a crash never loses any of them.
+        """
+        if self._key_value_store is None:
+            raise RuntimeError('Recoverable state has not yet been initialized')
+
+        try:
+            await self._key_value_store.set_value(
+                self._persist_state_key,
+                {**data, _JOURNAL_GENERATION_FIELD: generation, _JOURNAL_START_FIELD: length},
+                'application/json',
+            )
+            previous_start, self._journal_start = self._journal_start, length
+            await self._delete_journal(generation, previous_start, length)
+        except Exception:
+            self._log.exception('Failed to compact the journal of the recoverable state')
+        finally:
+            self._compaction_task = None
+
+    async def _wait_for_compaction(self) -> None:
+        """Wait until the running compaction of the journal, if any, is finished."""
+        if self._compaction_task is not None:
+            await asyncio.shield(self._compaction_task)
+
+    async def _delete_journal(self, generation: int, start: int, end: int) -> None:
+        """Delete the journal records of the given generation with indices from `start` up to `end`."""
+        if self._key_value_store is None:
+            raise RuntimeError('Recoverable state has not yet been initialized')
+
+        for index in range(start, end):
+            await self._key_value_store.delete_value(self._get_journal_key(generation, index))
@@ -1,28 +1,54 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from logging import getLogger
+from typing import TYPE_CHECKING, Literal
 
 from protego import Protego
+from pydantic import BaseModel, Field
 from yarl import URL
 
+from crawlee._utils.recoverable_state import RecoverableState
 from crawlee._utils.sitemap import Sitemap
 from crawlee._utils.web import is_status_code_client_error
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterable
+    from types import TracebackType
+
     from typing_extensions import Self
 
     from crawlee.http_clients import HttpClient
     from crawlee.proxy_configuration import ProxyInfo
 
+logger = getLogger(__name__)
+
+_ALLOW_ALL = 'User-agent: *\nAllow: /'
+
 
 class RobotsTxtFile:
     def __init__(
-        self, url: str, robots: Protego, http_client: HttpClient | None = None, proxy_info: ProxyInfo | None = None
+        self,
+        url: str,
+        robots: Protego,
+        http_client: HttpClient | None = None,
+        proxy_info: ProxyInfo | None = None,
+        *,
+        content: str | None = None,
     ) -> None:
         self._robots = robots
         self._original_url = URL(url).origin()
         self._http_client = http_client
         self._proxy_info = proxy_info
+        self._content = content
+
+    @property
+    def content(self) -> str | None:
+        """The raw content of the robots.txt file, `None` if the file does not exist and everything is allowed."""
+        return self._content
 
     @classmethod
     async def from_content(cls, url: str, content: str) -> Self:
@@ -33,7 +59,7 @@ class RobotsTxtFile:
             content: The raw string content of the robots.txt file to be parsed.
         """
         robots = Protego.parse(content)
-        return cls(url, robots)
+        return cls(url, robots, content=content)
 
     @classmethod
     async def find(cls, url: str, http_client: HttpClient, proxy_info: ProxyInfo | None = None) -> Self:
@@ -57,13 +83,11 @@ class RobotsTxtFile:
             proxy_info: Optional `ProxyInfo` to be used when fetching the robots.txt file. If None, no proxy is used.
         """
         response = await http_client.send_request(url, proxy_info=proxy_info)
-        body = (
-            b'User-agent: *\nAllow: /' if is_status_code_client_error(response.status_code) else await response.read()
-        )
+        content = None if is_status_code_client_error(response.status_code) else (await response.read()).decode('utf-8')
 
-        robots = Protego.parse(body.decode('utf-8'))
+        robots = Protego.parse(_ALLOW_ALL if content is None else content)
 
-        return cls(url, robots, http_client=http_client, proxy_info=proxy_info)
+        return cls(url, robots, http_client=http_client, proxy_info=proxy_info, content=content)
 
     def is_allowed(self, url: str, user_agent: str = '*') -> bool:
         """Check if the given URL is allowed for the given user agent.
@@ -103,3 +127,213 @@ class RobotsTxtFile:
         """Parse the sitemaps in the robots.txt file and return a list URLs."""
         sitemap = await self.parse_sitemaps()
         return sitemap.urls
+
+
+class _RobotsTxtCacheEntry(BaseModel):
+    content: str | None
+    """Content of the robots.txt file, `None` if there is no usable file and everything is allowed."""
+
+    expires_at: datetime
+
+
+class _RobotsTxtCacheState(BaseModel):
+    entries: dict[str, _RobotsTxtCacheEntry] = Field(default_factory=dict)
+    """Cached robots.txt files by origin, least recently used first."""
+
+
+class RobotsTxtCache:
+    """Cache of robots.txt files by origin, fetching each missing file at most once at a time.
+
+    Concurrent lookups of the same origin share a single fetch, while lookups of other origins proceed
+    independently, so a slow robots.txt only delays requests to its own origin. Origins without a robots.txt,
+    i.e. answering with a client error, are cached as allowing everything for the shorter `negative_ttl`. At most
+    `max_size` origins are cached, the least recently used ones are evicted first.
+
+    A robots.txt that cannot be fetched, e.g. because of a network error or a timeout, does not allow anything.
+    The error is raised to all lookups of the origin for `error_ttl`, so that the requests are retried later
+    rather than crawled against rules that could not be read, and the origin is not hammered meanwhile.
+
+    The content of the cached files can be persisted in a named key-value store, so that later runs reuse them
+    until they expire.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[RobotsTxtFile]],
+        *,
+        max_size: int = 1000,
+        ttl: timedelta = timedelta(hours=24),
+        negative_ttl: timedelta = timedelta(minutes=10),
+        error_ttl: timedelta = timedelta(seconds=30),
+        fetch_timeout: timedelta = timedelta(seconds=30),
+        persistence_enabled: Literal[True, False, 'explicit_only'] = False,
+        persist_state_kvs_name: str = 'robots-txt-cache',
+        persist_state_key: str = 'ROBOTS_TXT_CACHE',
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            fetch: Function fetching the robots.txt file of the origin of a URL.
+            max_size: The maximum number of cached origins.
+            ttl: How long a fetched robots.txt file is used before it is fetched again.
+            negative_ttl: How long an origin without a robots.txt allows everything before it is fetched again.
+            error_ttl: How long the error of a failed fetch is raised to lookups before the fetch is tried again.
+            fetch_timeout: The maximum time to wait for a robots.txt file.
+            persistence_enabled: Whether to persist the cached files in a key-value store.
+            persist_state_kvs_name: The name of the key-value store the cached files are persisted in.
+            persist_state_key: The key under which the cached files are persisted.
+        """
+        self._fetch = fetch
+        self._max_size = max_size
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._error_ttl = error_ttl
+        self._fetch_timeout = fetch_timeout
+
+        self._state = RecoverableState(
+            default_state=_RobotsTxtCacheState(),
+            persist_state_key=persist_state_key,
+            persistence_enabled=persistence_enabled,
+            persist_state_kvs_name=persist_state_kvs_name,
+            logger=logger,
+        )
+        self._initialize_lock = asyncio.Lock()
+
+        self._files = dict[str, RobotsTxtFile | None]()
+        """Parsed robots.txt files of the cached entries, filled lazily."""
+
+        self._fetches = dict[str, asyncio.Task[RobotsTxtFile | None]]()
+        """Fetches in progress by origin. Failed fetches are kept for `error_ttl`, so their error is raised again."""
+
+        self._active = False
+
+    @property
+    def active(self) -> bool:
+        """Indicate whether the context is active."""
+        return self._active
+
+    async def __aenter__(self) -> Self:
+        """Load the persisted robots.txt files and start persisting them."""
+        if self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is already active.')
+
+        self._active = True
+        await self._initialize()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Persist the cached robots.txt files and stop persisting them."""
+        if not self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is not active.')
+
+        await self._state.teardown()
+        self._active = False
+
+    async def get(self, url: str) -> RobotsTxtFile | None:
+        """Get the robots.txt file of the origin of a URL, `None` if there is none and everything is allowed."""
+        await self._initialize()
+
+        origin = str(URL(url).origin())
+        entries = self._state.current_value.entries
+        entry = entries.get(origin)
+
+        if entry is not None and entry.expires_at > datetime.now(timezone.utc):
+            # Mark the entry as the most recently used one.
+            entries[origin] = entries.pop(origin)
+
+            if origin not in self._files:
+                self._files[origin] = (
+                    RobotsTxtFile(origin, Protego.parse(entry.content), content=entry.content)
+                    if entry.content is not None
+                    else None
+                )
+            return self._files[origin]
+
+        fetch = self._fetches.get(origin)
+        if fetch is None:
+            fetch = self._fetches[origin] = asyncio.create_task(self._load(origin, url))
+            fetch.add_done_callback(partial(self._release_fetch, origin))
+
+        # Shield the shared fetch, so that a cancelled caller does not cancel it for the others.
+        return await asyncio.shield(fetch)
+
+    async def prefetch(self, urls: Iterable[str], *, max_concurrency: int = 20) -> None:
+        """Fetch the robots.txt files of the origins of the given URLs concurrently, skipping cached origins."""
+        await self._initialize()
+
+        now = datetime.now(timezone.utc)
+        entries = self._state.current_value.entries
+
+        # One URL of each origin which is not cached yet.
+        origins = dict[str, str]()
+        for url in urls:
+            origin = str(URL(url).origin())
+            entry = entries.get(origin)
+            if origin not in origins and (entry is None or entry.expires_at <= now):
+                origins[origin] = url
+
+        if not origins:
+            return
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def prefetch_one(url: str) -> None:
+            # A failed fetch is already logged, its error is raised again to the lookups of the origin.
+            async with semaphore:
+                with suppress(Exception):
+                    await self.get(url)
+
+        await asyncio.gather(*(prefetch_one(url) for url in origins.values()))
+
+    async def _initialize(self) -> None:
+        async with self._initialize_lock:
+            if not self._state.is_initialized:
+                await self._state.initialize()
+
+    def _release_fetch(self, origin: str, fetch: asyncio.Task[RobotsTxtFile | None]) -> None:
+        """Forget a finished fetch, after `error_ttl` if it failed."""
+
+        def release() -> None:
+            if self._fetches.get(origin) is fetch:
+                del self._fetches[origin]
+
+        if fetch.cancelled() or fetch.exception() is None:
+            release()
+        else:
+            asyncio.get_running_loop().call_later(self._error_ttl.total_seconds(), release)
+
+    async def _load(self, origin: str, url: str) -> RobotsTxtFile | None:
+        """Fetch the robots.txt file of an origin and cache it."""
+        robots_txt_file: RobotsTxtFile | None
+
+        try:
+            robots_txt_file = await asyncio.wait_for(self._fetch(url), self._fetch_timeout.total_seconds())
+        except Exception as exc:
+            logger.warning(
+                f'Failed to fetch robots.txt for {origin}, its URLs are retried later '
+                f'(next attempt in {self._error_ttl.total_seconds():.0f}s): {exc!r}'
+            )
+            raise
+
+        if robots_txt_file is not None and robots_txt_file.content is None:
+            robots_txt_file = None
+
+        content = robots_txt_file.content if robots_txt_file is not None else None
+        ttl = self._ttl if content is not None else self._negative_ttl
+
+        entries = self._state.current_value.entries
+        entries.pop(origin, None)
+        entries[origin] = _RobotsTxtCacheEntry(content=content, expires_at=datetime.now(timezone.utc) + ttl)
+        self._files[origin] = robots_txt_file
+
+        while len(entries) > self._max_size:
+            evicted = next(iter(entries))
+            del entries[evicted]
+            self._files.pop(evicted, None)
+
+        return robots_txt_file
@@ -4,6 +4,7 @@ import os
 import sys
 from contextlib import suppress
 from datetime import datetime, timezone
+from functools import cache
 from logging import getLogger
 from typing import Annotated
 
@@ -11,26 +12,27 @@ import psutil
 from pydantic import BaseModel, ConfigDict, Field, PlainSerializer, PlainValidator
 
 from crawlee._utils.byte_size import ByteSize
+from crawlee._utils.cgroup import CgroupProbe
+from crawlee._utils.process_tree import ProcessTreeSampler
 
 logger = getLogger(__name__)
 
-if sys.platform == 'linux':
-    """Get the most suitable available used memory metric.
+_process_tree_samplers = dict[int, ProcessTreeSampler]()
+"""Samplers of the memory of the process tree, by the PID of the root process."""
 
-    `Proportional Set Size (PSS)`, is the amount of own memory and memory shared with other processes, accounted in a
-    way that the shared amount is divided evenly between the processes that share it. Available on Linux. Suitable for
-    avoiding overestimation by counting the same shared memory used by children processes multiple times.
 
-    `Resident Set Size (RSS)` is the non-swapped physical memory a process has used; it includes shared memory. It
-    should be available everywhere.
+@cache
+def _get_cgroup_probe() -> CgroupProbe | None:
+    """Get the probe of the cgroup limits of the current container, if running in one.
+
+    The cgroup filesystem is looked up on the first call only, so that importing the module does not read it.
     """
+    return CgroupProbe.detect() if sys.platform == 'linux' else None
 
-    def _get_used_memory(process: psutil.Process) -> int:
-        return int(process.memory_full_info().pss)
-else:
 
-    def _get_used_memory(process: psutil.Process) -> int:
-        return int(process.memory_info().rss)
+def _get_used_memory(process: psutil.Process) -> int:
+    """Get the resident set size (RSS) of a process, which includes shared memory. It should be available everywhere."""
+    return int(process.memory_info().rss)
 
 
 class CpuInfo(BaseModel):
@@ -90,36 +92,77 @@ class MemoryInfo(MemoryUsageInfo):
 def get_cpu_info() -> CpuInfo:
     """Retrieve the current CPU usage.
 
-    It utilizes the `psutil` library. Function `psutil.cpu_percent()` returns a float representing the current
-    system-wide CPU utilization as a percentage.
+    When running in a cgroup with a CPU quota, e.g. in a container, it returns the used ratio of the quota, counting
+    throttled periods as fully used. Otherwise, it utilizes the `psutil` library. Function `psutil.cpu_percent()`
+    returns a float representing the current system-wide CPU utilization as a percentage.
     """
     logger.debug('Calling get_cpu_info()...')
+
+    cgroup_probe = _get_cgroup_probe()
+    if cgroup_probe is not None and (used_ratio := cgroup_probe.get_cpu_used_ratio()) is not None:
+        return CpuInfo(used_ratio=used_ratio)
+
     cpu_percent = psutil.cpu_percent(interval=0.1)
     return CpuInfo(used_ratio=cpu_percent / 100)
 
 
+def get_process_tree_sampler() -> ProcessTreeSampler | None:
+    """Get the sampler of the memory used by the current process and its children, if supported on this platform.
+
+    The sampler is created once per process, so that a forked process does not measure the tree of its parent.
+    """
+    if sys.platform != 'linux':
+        return None
+
+    pid = os.getpid()
+    if pid not in _process_tree_samplers:
+        _process_tree_samplers[pid] = ProcessTreeSampler(pid)
+
+    return _process_tree_samplers[pid]
+
+
 def get_memory_info() -> MemoryInfo:
     """Retrieve the current memory usage of the process and its children.
 
-    It utilizes the `psutil` library.
+    On Linux, the process tree is measured by a `ProcessTreeSampler`, which caches the known processes between calls
+    and uses the proportional set size (PSS) to avoid counting memory shared by the processes multiple times.
+    Elsewhere, it utilizes the `psutil` library and the resident set size (RSS). When running in a cgroup with
+    a memory limit lower than the system memory, e.g. in a container, the total and system-wide used memory are those
+    of the cgroup.
     """
     logger.debug('Calling get_memory_info()...')
-    current_process = psutil.Process(os.getpid())
 
-    # Retrieve estimated memory usage of the current process.
-    current_size_bytes = _get_used_memory(current_process)
+    if (process_tree_sampler := get_process_tree_sampler()) is not None:
+        current_size_bytes = process_tree_sampler.sample().bytes
+    else:
+        current_process = psutil.Process(os.getpid())
+
+        # Retrieve estimated memory usage of the current process.
+        current_size_bytes = _get_used_memory(current_process)
 
-    # Sum memory usage by all children processes, try to exclude shared memory from the sum if allowed by OS.
-    for child in current_process.children(recursive=True):
-        # Ignore any NoSuchProcess exception that might occur if a child process ends before we retrieve
-        # its memory usage.
-        with suppress(psutil.NoSuchProcess):
-            current_size_bytes += _get_used_memory(child)
+        # Sum memory usage by all children processes, try to exclude shared memory from the sum if allowed by OS.
+        for child in current_process.children(recursive=True):
+            # Ignore any NoSuchProcess exception that might occur if a child process ends before we retrieve
+            # its memory usage.
+            with suppress(psutil.NoSuchProcess):
+                current_size_bytes += _get_used_memory(child)
 
     vm = psutil.virtual_memory()
+    total_size = ByteSize(vm.total)
+    system_wide_used_size = ByteSize(vm.total - vm.available)
+
+    cgroup_probe = _get_cgroup_probe()
+    if (
+        cgroup_probe is not None
+        and (cgroup_memory := cgroup_probe.read_memory_stats()) is not None
+        and cgroup_memory.limit_size is not None
+        and cgroup_memory.limit_size < total_size
+    ):
+        total_size = cgroup_memory.limit_size
+        system_wide_used_size = cgroup_memory.used_size
 
     return MemoryInfo(
-        total_size=ByteSize(vm.total),
+        total_size=total_size,
         current_size=ByteSize(current_size_bytes),
-        system_wide_used_size=ByteSize(vm.total - vm.available),
+        system_wide_used_size=system_wide_used_size,
     )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import re
+from typing import TYPE_CHECKING, Any
+
+from crawlee._utils.globs import Glob
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+_SCOPED_FLAGS = {re.IGNORECASE: 'i', re.MULTILINE: 'm', re.DOTALL: 's'}
+"""Flags which can be applied to a part of a regex by the `(?flags:...)` syntax."""
+
+_UNMERGEABLE_SYNTAX = re.compile(r'\\[1-9]|\(\?P=|\(\?\(|\(\?[aiLmsux]+\)')
+"""Backreferences, conditional groups and global inline flags, which change meaning in a merged regex."""
+
+
+class UrlPatternFilter:
+    """Filter of URLs by include and exclude patterns, compiled once for matching many URLs.
+
+    A URL passes the filter if it matches none of the `exclude` patterns and, if `include` patterns are given,
+    at least one of them. Patterns are matched from the start of the URL, like `re.Pattern.match`.
+
+    The patterns of each list are merged into a single regex alternation, so that a URL is matched against all of
+    them in one pass of the regex engine instead of one Python call per pattern. Patterns which cannot be merged
+    without changing their meaning, e.g. those with backreferences, are matched separately.
+    """
+
+    def __init__(
+        self,
+        include: Sequence[re.Pattern[Any] | Glob] | None = None,
+        exclude: Sequence[re.Pattern[Any] | Glob] | None = None,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            include: Patterns of URLs to accept. `None` accepts all URLs that are not excluded, while an empty
+                sequence accepts none.
+            exclude: Patterns of URLs to reject.
+        """
+        self._include = _compile(include) if include is not None else None
+        self._exclude = _compile(exclude or ())
+
+    def matches(self, url: str) -> bool:
+        """Check whether a URL passes the filter."""
+        for regex in self._exclude:
+            if regex.match(url) is not None:
+                return False
+
+        if self._include is None:
+            return True
+
+        for regex in self._include:  # noqa: SIM110
+            if regex.match(url) is not None:
+                return True
+
+        return False
+
+
+def _compile(patterns: Sequence[re.Pattern[Any] | Glob]) -> list[re.Pattern[Any]]:
+    """Merge the patterns into as few regexes as possible, keeping the ones that cannot be merged on their own."""
+    regexes = [pattern.regexp if isinstance(pattern, Glob) else pattern for pattern in patterns]
+
+    mergeable = list[re.Pattern[str]]()
+    separate = list[re.Pattern[Any]]()
+    for regex in regexes:
+        (mergeable if _is_mergeable(regex) else separate).append(regex)
+
+    if len(mergeable) < 2:  # noqa: PLR2004
+        return regexes
+
+    try:
+        merged = re.compile('|'.join(_to_alternative(regex) for regex in mergeable))
+    except re.error:
+        # E.g. the same group name used in more patterns.
+        return regexes
+
+    return [merged, *separate]
+
+
+def _is_mergeable(regex: re.Pattern[Any]) -> bool:
+    if not isinstance(regex.pattern, str):
+        return False
+
+    flags = regex.flags & ~re.UNICODE
+    if flags & ~(re.IGNORECASE | re.MULTILINE | re.DOTALL):
+        return False
+
+    return _UNMERGEABLE_SYNTAX.search(regex.pattern) is None
+
+
+def _to_alternative(regex: re.Pattern[str]) -> str:
+    flags = ''.join(letter for flag, letter in _SCOPED_FLAGS.items() if regex.flags & flag)
+    return f'(?{flags}:{regex.pattern})'
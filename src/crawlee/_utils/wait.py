@@ -84,3 +84,23 @@ async def wait_for_all_tasks_for_finish(
                     pass
                 except Exception as e:
                     logger.warning(f'Task raised an exception: {e}')
+
+
+class ChangeNotifier:
+    """Wake up the coroutines waiting for a change of some state, so that they do not have to poll it."""
+
+    def __init__(self) -> None:
+        self._event: asyncio.Event | None = None
+
+    def notify(self) -> None:
+        """Wake up all coroutines currently waiting in `wait`."""
+        if self._event is not None:
+            self._event.set()
+            self._event = None
+
+    async def wait(self) -> None:
+        """Wait until the next call to `notify`."""
+        if self._event is None:
+            self._event = asyncio.Event()
+
+        await self._event.wait()
@@ -85,6 +85,13 @@ class BrowserController(ABC):
             ValueError: If the browser has reached the maximum number of open pages.
         """
 
+    async def get_process_id(self) -> int | None:
+        """Return the ID of the main browser process, if it can be determined.
+
+        It is used to attribute the memory of the browser and its child processes to the controller.
+        """
+        return None
+
     @abstractmethod
     async def close(self, *, force: bool = False) -> None:
         """Close the browser.
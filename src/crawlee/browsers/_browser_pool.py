@@ -10,13 +10,17 @@ from logging import getLogger
 from typing import TYPE_CHECKING, Any
 from weakref import WeakValueDictionary
 
+from crawlee import service_locator
+from crawlee._utils.byte_size import ByteSize
 from crawlee._utils.context import ensure_context
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.docs import docs_group
 from crawlee._utils.recurring_task import RecurringTask
+from crawlee._utils.system import MemoryInfo, get_process_tree_sampler
 from crawlee.browsers._browser_controller import BrowserController
 from crawlee.browsers._playwright_browser_plugin import PlaywrightBrowserPlugin
 from crawlee.browsers._types import BrowserType, CrawleePage
+from crawlee.events._types import Event
 
 if TYPE_CHECKING:
     from collections.abc import Mapping, Sequence
@@ -24,6 +28,7 @@ if TYPE_CHECKING:
     from types import TracebackType
 
     from crawlee.browsers._browser_plugin import BrowserPlugin
+    from crawlee.events._types import EventSystemInfoData
     from crawlee.fingerprint_suite import FingerprintGenerator
     from crawlee.proxy_configuration import ProxyInfo
 
@@ -54,6 +59,7 @@ class BrowserPool:
         identify_inactive_browsers_interval: timedelta = timedelta(seconds=20),
         close_inactive_browsers_interval: timedelta = timedelta(seconds=30),
         retire_browser_after_page_count: int = 100,
+        retire_browsers_on_memory_overload: bool = False,
     ) -> None:
         """Initialize a new instance.
 
@@ -72,6 +78,9 @@ class BrowserPool:
                 pages count greater than or equal to `retire_browser_after_page_count`.
             retire_browser_after_page_count: The maximum number of processed pages after which the browser is considered
                 as retired.
+            retire_browsers_on_memory_overload: Whether to retire the browser using the most memory when the memory
+                is overloaded, so that it is closed once its pages are done. One browser is retired at a time. The
+                memory of a browser and its child processes can be measured only for Chromium on Linux.
         """
         self._plugins = plugins or [PlaywrightBrowserPlugin()]
         self._operation_timeout = operation_timeout
@@ -99,6 +108,10 @@ class BrowserPool:
         self._pages = WeakValueDictionary[str, CrawleePage]()  # Track the pages in the pool
         self._plugins_cycle = itertools.cycle(self._plugins)  # Cycle through the plugins
 
+        self._retire_browsers_on_memory_overload = retire_browsers_on_memory_overload
+        self._process_tree_sampler = get_process_tree_sampler()
+        self._browser_retired_for_memory: BrowserController | None = None
+
         # Flag to indicate the context state.
         self._active = False
 
@@ -196,6 +209,13 @@ class BrowserPool:
             raise RuntimeError(f'The {self.__class__.__name__} is already active.')
 
         self._active = True
+
+        if self._retire_browsers_on_memory_overload:
+            service_locator.get_event_manager().on(
+                event=Event.SYSTEM_INFO,
+                listener=self._retire_browser_on_memory_overload,
+            )
+
         # Start the recurring tasks for identifying and closing inactive browsers
         self._identify_inactive_browsers_task.start()
         self._close_inactive_browsers_task.start()
@@ -224,11 +244,18 @@ class BrowserPool:
         if not self._active:
             raise RuntimeError(f'The {self.__class__.__name__} is not active.')
 
+        if self._retire_browsers_on_memory_overload:
+            service_locator.get_event_manager().off(
+                event=Event.SYSTEM_INFO,
+                listener=self._retire_browser_on_memory_overload,
+            )
+
         await self._identify_inactive_browsers_task.stop()
         await self._close_inactive_browsers_task.stop()
 
         for browser in self._active_browsers + self._inactive_browsers:
             await browser.close(force=True)
+            self._untrack_browser_memory(browser)
         self._active_browsers.clear()
         self._inactive_browsers.clear()
 
@@ -339,6 +366,7 @@ class BrowserPool:
         """Launch a new browser instance using the specified plugin."""
         browser = await plugin.new_browser()
         self._active_browsers.append(browser)
+        await self._track_browser_memory(browser)
         return browser
 
     def _identify_inactive_browsers(self) -> None:
@@ -354,3 +382,58 @@ class BrowserPool:
             if not browser.pages:
                 await browser.close()
                 self._inactive_browsers.remove(browser)
+                self._untrack_browser_memory(browser)
+
+    async def _track_browser_memory(self, browser: BrowserController) -> None:
+        """Let the process tree sampler know about a new browser and attribute its memory to the controller."""
+        if self._process_tree_sampler is None:
+            return
+
+        self._process_tree_sampler.invalidate()
+
+        if self._retire_browsers_on_memory_overload and (pid := await browser.get_process_id()) is not None:
+            self._process_tree_sampler.track(browser, pid)
+
+    def _untrack_browser_memory(self, browser: BrowserController) -> None:
+        """Let the process tree sampler know that a browser was closed."""
+        if self._process_tree_sampler is not None:
+            self._process_tree_sampler.untrack(browser)
+
+        if browser is self._browser_retired_for_memory:
+            self._browser_retired_for_memory = None
+
+    async def _retire_browser_on_memory_overload(self, event_data: EventSystemInfoData) -> None:
+        """Retire the active browser using the most memory if the memory is overloaded.
+
+        The memory is considered overloaded in the same way as by the `Snapshotter`. The memory of the browsers is
+        taken from the latest sample of the process tree, which is measured for the same system info event.
+        """
+        if self._process_tree_sampler is None or self._browser_retired_for_memory is not None:
+            return
+
+        config = service_locator.get_configuration()
+        memory_info = event_data.memory_info
+
+        if config.memory_mbytes:
+            max_memory_size = ByteSize.from_mb(config.memory_mbytes)
+        elif isinstance(memory_info, MemoryInfo):
+            max_memory_size = memory_info.total_size * config.available_memory_ratio
+        else:
+            return
+
+        if memory_info.current_size <= max_memory_size * config.max_used_memory_ratio:
+            return
+
+        browser_sizes = [
+            (size, browser)
+            for browser in self._active_browsers
+            if (size := self._process_tree_sampler.get_owner_size(browser)) is not None
+        ]
+
+        if not browser_sizes:
+            return
+
+        size, browser = max(browser_sizes, key=lambda item: item[0])
+        logger.info(f'Memory is overloaded, retiring the browser using the most memory ({size}).')
+        self._browser_retired_for_memory = browser
+        self._retire_browser(browser)
@@ -7,6 +7,7 @@ from typing import TYPE_CHECKING, Any, cast
 
 from browserforge.injectors.playwright import AsyncNewContext
 from playwright.async_api import Browser, BrowserContext, Page, ProxySettings
+from playwright.async_api import Error as PlaywrightError
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
@@ -76,6 +77,7 @@ class PlaywrightBrowserController(BrowserController):
         self._last_page_opened_at = datetime.now(timezone.utc)
 
         self._total_opened_pages = 0
+        self._process_id: int | None = None
 
     @property
     @override
@@ -172,6 +174,31 @@ class PlaywrightBrowserController(BrowserController):
 
         return page
 
+    @override
+    async def get_process_id(self) -> int | None:
+        """Return the ID of the main browser process, if it can be determined.
+
+        The ID is available only for Chromium, which reports it through the `SystemInfo.getProcessInfo` CDP command.
+        """
+        if self._process_id is not None or self.browser_type != 'chromium':
+            return self._process_id
+
+        try:
+            cdp_session = await self._browser.new_browser_cdp_session()
+            try:
+                result = await cdp_session.send('SystemInfo.getProcessInfo')
+            finally:
+                await cdp_session.detach()
+        except (PlaywrightError, NotImplementedError) as exc:
+            logger.debug(f'Failed to get the browser process ID: {exc!r}')
+            return None
+
+        self._process_id = next(
+            (int(process['id']) for process in result.get('processInfo', []) if process.get('type') == 'browser'),
+            None,
+        )
+        return self._process_id
+
     @override
     async def close(self, *, force: bool = False) -> None:
         """Close the browser.
@@ -2,7 +2,15 @@
 
 from ._config import CRAConfig
 from ._data_validator import CRADataValidator
+from ._embedding_cache import CRAEmbeddingCache
+from ._embedding_service import CRAEmbeddingService
+from ._fingerprint_store import CRAFingerprintStore
+from ._local_vector_index import CRALocalVectorIndex
+from ._page_classifier import CRAPageClassification, CRAPageClassifier
+from ._qdrant_writer import CRAQdrantWriter
 from ._rate_limiter import CRARateLimiter
+from ._request_scheduler import CRARequestScheduler
+from ._text_chunker import CRATextChunker
 
 # Optional imports that depend on extras
 try:
@@ -32,7 +40,16 @@ except ImportError:
 __all__ = [
     'CRAConfig',
     'CRADataValidator',
+    'CRAEmbeddingCache',
+    'CRAEmbeddingService',
+    'CRAFingerprintStore',
+    'CRALocalVectorIndex',
+    'CRAPageClassification',
+    'CRAPageClassifier',
+    'CRAQdrantWriter',
     'CRARateLimiter',
+    'CRARequestScheduler',
+    'CRATextChunker',
 ]
 
 if _crawler_available:
@@ -49,9 +49,13 @@ class CRAConfig(BaseSettings):
     # Text processing
     min_text_length: int = 50
     max_text_length: int = 10000
+    embedding_cache_size: int = 10000  # in-memory entries, 0 disables the embedding cache
+    skip_unchanged_pages: bool = True  # skip pages whose content did not change since the last crawl
 
     # Storage
     data_dir: str = './cra_data'
+    local_vector_index: bool = False  # store vectors in a local NumPy index under data_dir instead of Qdrant
+    local_vector_index_partitions: int = 0  # k-means partitions of the local index, 0 searches all points
 
     # Logging
     log_level: str = 'INFO'
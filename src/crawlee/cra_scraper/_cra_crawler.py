@@ -1,25 +1,44 @@
 """CRA-specific crawler for tax data collection."""
 
 import logging
-from datetime import datetime
+from contextlib import suppress
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
 from typing import Any
 from urllib.parse import urljoin
 
 from marshmallow import ValidationError
+from parsel import Selector
 
-from crawlee.crawlers import PlaywrightCrawler, PlaywrightCrawlingContext
+from crawlee.crawlers import (
+    AdaptivePlaywrightCrawler,
+    AdaptivePlaywrightCrawlingContext,
+    AdaptivePlaywrightPreNavCrawlingContext,
+    ParsedHttpCrawlingContext,
+)
+from crawlee.crawlers._adaptive_playwright._adaptive_playwright_crawling_context import AdaptiveContextError
+from crawlee.storages import RequestQueue
 
 from ._config import CRAConfig
 from ._data_validator import CRADataValidator
+from ._fingerprint_store import CRAFingerprintStore, compute_point_id
+from ._local_vector_index import CRALocalVectorIndex
 from ._qdrant_client import CRAQdrantClient
 from ._rate_limiter import CRARateLimiter
+from ._request_scheduler import CRARequestScheduler
 from ._vectorizer import CRAVectorizer
 
 logger = logging.getLogger(__name__)
 
 
 class CRACrawler:
-    """CRA-specific crawler with integrated data processing pipeline."""
+    """CRA-specific crawler with integrated data processing pipeline.
+
+    Pages are fetched over plain HTTP and parsed with Parsel whenever possible. A browser is used only for pages
+    which the rendering type predictor of the adaptive crawler considers client-rendered, or whose static HTML
+    does not contain enough content.
+    """
 
     def __init__(self, *, config: CRAConfig | None = None) -> None:
         self._config = config or CRAConfig()
@@ -30,21 +49,40 @@ class CRACrawler:
             max_requests_per_hour=self._config.limits.max_requests_per_hour,
             max_requests_per_day=self._config.limits.max_requests_per_day,
             request_delay=self._config.limits.request_delay,
+            persistence_enabled=True,
         )
 
         self._validator = CRADataValidator(allowed_domains=self._config.allowed_domains)
 
-        self._vectorizer = CRAVectorizer()
-
-        self._qdrant_client = CRAQdrantClient(
-            endpoint=self._config.qdrant.endpoint,
-            api_key=self._config.qdrant.api_key,
-            collection_name=self._config.qdrant.collection_name,
-            vector_size=self._config.qdrant.vector_size,
+        self._vectorizer = CRAVectorizer(
+            cache_size=self._config.embedding_cache_size,
+            cache_dir=Path(self._config.data_dir) / 'embedding_cache',
         )
 
+        self._vector_store: CRAQdrantClient | CRALocalVectorIndex
+        if self._config.local_vector_index:
+            self._vector_store = CRALocalVectorIndex(
+                directory=Path(self._config.data_dir) / 'vector_index',
+                collection_name=self._config.qdrant.collection_name,
+                vector_size=self._config.qdrant.vector_size,
+                n_partitions=self._config.local_vector_index_partitions,
+            )
+        else:
+            self._vector_store = CRAQdrantClient(
+                endpoint=self._config.qdrant.endpoint,
+                api_key=self._config.qdrant.api_key,
+                collection_name=self._config.qdrant.collection_name,
+                vector_size=self._config.qdrant.vector_size,
+            )
+
+        # Content fingerprints of stored pages, salted with the model so that changing it re-embeds everything
+        self._fingerprints = CRAFingerprintStore(salt=self._vectorizer.model_name)
+
         # Crawler instance
-        self._crawler: PlaywrightCrawler | None = None
+        self._crawler: AdaptivePlaywrightCrawler[ParsedHttpCrawlingContext[Selector], Selector, Selector] | None = None
+
+        # Requests processed in the current crawl, the adaptive crawler may run the handler twice for one request
+        self._processed_requests = set[str]()
 
         # Statistics
         self._stats = {
@@ -52,6 +90,8 @@ class CRACrawler:
             'pages_processed': 0,
             'pages_stored': 0,
             'chunks_created': 0,
+            'chunks_deleted': 0,
+            'pages_unchanged': 0,
             'validation_errors': 0,
             'processing_errors': 0,
         }
@@ -60,42 +100,81 @@ class CRACrawler:
         """Initialize all components."""
         logger.info('Initializing CRA crawler components...')
 
-        # Initialize vectorizer and Qdrant client
+        # Initialize vectorizer and vector store
         await self._vectorizer.initialize()
-        await self._qdrant_client.initialize()
+        await self._vector_store.initialize()
+        await self._fingerprints.initialize()
+        await self._rate_limiter.initialize()
 
         # Update vector size in config if different
         actual_vector_size = self._vectorizer.vector_size
         if actual_vector_size != self._config.qdrant.vector_size:
             logger.warning(f'Vector size mismatch. Using {actual_vector_size}')
 
-        # Create crawler
-        self._crawler = PlaywrightCrawler(
+        # Create crawler, which fetches static pages over HTTP and falls back to a browser only when needed
+        # The handler stores pages itself instead of pushing data, so a static run which did not fail is as good
+        # as the browser run.
+        request_scheduler = CRARequestScheduler(await RequestQueue.open(), self._rate_limiter)
+        self._crawler = AdaptivePlaywrightCrawler.with_parsel_static_parser(
+            result_comparator=lambda _static_result, _browser_result: True,
+            request_manager=request_scheduler,
             max_requests_per_crawl=self._config.limits.max_requests_per_day,
             max_request_retries=self._config.limits.max_retries,
-            request_handler_timeout=60,
+            request_handler_timeout=timedelta(seconds=60),
         )
 
+        # The first fetch of each request is rate limited by the scheduler, further fetches of the same request,
+        # such as the browser fallback of a page first fetched over HTTP, are rate limited here.
+        @self._crawler.pre_navigation_hook
+        async def rate_limit(context: AdaptivePlaywrightPreNavCrawlingContext) -> None:
+            if not request_scheduler.consume_reservation(context.request):
+                await self._rate_limiter.acquire(context.request.url)
+
         # Set up request handler
         @self._crawler.router.default_handler
-        async def handle_page(context: PlaywrightCrawlingContext) -> None:
+        async def handle_page(context: AdaptivePlaywrightCrawlingContext[Selector, Selector]) -> None:
             await self._handle_page(context)
 
         logger.info('CRA crawler initialized successfully')
 
-    async def _handle_page(self, context: PlaywrightCrawlingContext) -> None:
+    async def _handle_page(self, context: AdaptivePlaywrightCrawlingContext[Selector, Selector]) -> None:
         """Handle a single page crawl."""
-        # Rate limiting
-        await self._rate_limiter.acquire()
+        # Extract page data
+        data = await self._extract_page_data(context)
+
+        # Static HTML without enough content is likely rendered on the client, failing the static run makes the
+        # adaptive crawler retry the page in a browser, and teaches the rendering type predictor about it.
+        if not data and not self._is_rendered_in_browser(context):
+            raise AdaptiveContextError(f'Not enough content in the static HTML of {context.request.url}')
+
+        # During rendering type detection, the page is crawled over HTTP once more after the browser run. Its
+        # extraction above decides the detected rendering type, but the page must not be processed twice.
+        if context.request.unique_key in self._processed_requests:
+            return
 
         self._stats['pages_crawled'] += 1
 
-        try:
-            # Extract page data
-            data = await self._extract_page_data(context)
+        if not data:
+            logger.warning(f'No data extracted from {context.request.url}')
+            return
 
-            if not data:
-                logger.warning(f'No data extracted from {context.request.url}')
+        self._processed_requests.add(context.request.unique_key)
+
+        try:
+            # Skip pages whose content did not change since they were stored
+            content_hash = self._fingerprints.compute_hash(data)
+            fingerprint = self._fingerprints.get(context.request.url)
+
+            if (
+                self._config.skip_unchanged_pages
+                and fingerprint is not None
+                and fingerprint.content_hash == content_hash
+            ):
+                logger.info(f'Content of {context.request.url} did not change, skipping')
+                self._stats['pages_unchanged'] += 1
+
+                if context.request.url == self._config.base_url:
+                    await self._discover_links(context)
                 return
 
             # Validate data
@@ -112,17 +191,34 @@ class CRACrawler:
             # Vectorize data (now returns list of chunks)
             vectorized_chunks = await self._vectorizer.vectorize_tax_data(validated_data)
 
-            # Store all chunks in Qdrant using batch operation
+            # The fingerprint is only recorded once the chunks are actually stored, see `_record_fingerprint`
+            on_stored = partial(
+                self._record_fingerprint,
+                context.request.url,
+                content_hash=content_hash,
+                chunk_count=len(vectorized_chunks),
+            )
+
+            # Store all chunks in the vector store using batch operation
             if len(vectorized_chunks) > 1:
-                point_ids = await self._qdrant_client.store_batch(vectorized_chunks)
+                point_ids = await self._vector_store.store_batch(vectorized_chunks, on_stored=on_stored)
                 logger.info(
                     f'Successfully processed and stored {context.request.url} as {len(point_ids)} chunks: {point_ids}'
                 )
             else:
                 # Single chunk - use individual storage
-                point_id = await self._qdrant_client.store_data(vectorized_chunks[0])
+                point_id = await self._vector_store.store_data(vectorized_chunks[0], on_stored=on_stored)
                 logger.info(f'Successfully processed and stored {context.request.url} as {point_id}')
 
+            # Chunks are overwritten in place thanks to deterministic point IDs, only surplus old chunks are deleted
+            if fingerprint is not None and fingerprint.chunk_count > len(vectorized_chunks):
+                stale_point_ids = [
+                    compute_point_id(validated_data['url'], chunk_index)
+                    for chunk_index in range(len(vectorized_chunks), fingerprint.chunk_count)
+                ]
+                await self._vector_store.delete_points(stale_point_ids)
+                self._stats['chunks_deleted'] += len(stale_point_ids)
+
             self._stats['pages_stored'] += len(vectorized_chunks)
             self._stats['chunks_created'] += len(vectorized_chunks)
 
@@ -134,20 +230,35 @@ class CRACrawler:
             logger.error(f'Processing error for {context.request.url}: {e}')
             self._stats['processing_errors'] += 1
 
-    async def _extract_page_data(self, context: PlaywrightCrawlingContext) -> dict[str, Any] | None:
-        """Extract relevant data from the page."""
+    def _record_fingerprint(self, url: str, stored: bool, *, content_hash: str, chunk_count: int) -> None:  # noqa: FBT001
+        """Record the fingerprint of a page once its chunks are stored, or forget it if they were dropped.
+
+        Without a fingerprint, the page is vectorized and stored again on the next crawl, even if it did not change.
+        """
+        if stored:
+            self._fingerprints.set(url, content_hash=content_hash, chunk_count=chunk_count)
+        else:
+            logger.warning(f'Chunks of {url} were not stored, it will be processed again on the next crawl')
+            self._fingerprints.discard(url)
+            self._stats['pages_stored'] -= chunk_count
+
+    async def _extract_page_data(
+        self, context: AdaptivePlaywrightCrawlingContext[Selector, Selector]
+    ) -> dict[str, Any] | None:
+        """Extract relevant data from the page, either from static HTML or from the page rendered in a browser."""
         try:
-            # Wait for page to load
-            await context.page.wait_for_load_state('networkidle', timeout=10000)
+            # Wait for page to load, only pages rendered in a browser can still be loading
+            with suppress(AdaptiveContextError):
+                await context.page.wait_for_load_state('networkidle', timeout=10000)
+
+            selector = await context.parse_with_static_parser()
 
             # Extract title
-            title_element = await context.page.query_selector('title')
-            title = await title_element.text_content() if title_element else ''
+            title = self._get_text_content(selector, 'title') or ''
 
             if not title:
                 # Try h1 as fallback
-                h1_element = await context.page.query_selector('h1')
-                title = await h1_element.text_content() if h1_element else 'No title'
+                title = self._get_text_content(selector, 'h1') or 'No title'
 
             # Extract main content
             content_selectors = [
@@ -162,10 +273,10 @@ class CRACrawler:
             ]
 
             content = ''
-            for selector in content_selectors:
-                element = await context.page.query_selector(selector)
-                if element:
-                    content = await element.text_content()
+            for content_selector in content_selectors:
+                element_content = self._get_text_content(selector, content_selector)
+                if element_content is not None:
+                    content = element_content
                     if content and len(content.strip()) > self._config.min_text_length:
                         break
 
@@ -191,7 +302,22 @@ class CRACrawler:
             logger.error(f'Data extraction error: {e}')
             return None
 
-    async def _discover_links(self, context: PlaywrightCrawlingContext) -> None:
+    @staticmethod
+    def _get_text_content(selector: Selector, css: str) -> str | None:
+        """Get the text content of the first element matching a CSS selector, or `None` if there is no such element."""
+        elements = selector.css(css)
+        return elements[0].xpath('string()').get() if elements else None
+
+    @staticmethod
+    def _is_rendered_in_browser(context: AdaptivePlaywrightCrawlingContext[Selector, Selector]) -> bool:
+        """Check whether the page of the context was rendered in a browser rather than fetched over HTTP."""
+        try:
+            _ = context.page
+        except AdaptiveContextError:
+            return False
+        return True
+
+    async def _discover_links(self, context: AdaptivePlaywrightCrawlingContext[Selector, Selector]) -> None:
         """Discover and queue relevant links from the main page."""
         try:
             # Find links that might contain tax information
@@ -206,12 +332,10 @@ class CRACrawler:
             ]
 
             discovered_links = set()
+            selector = await context.parse_with_static_parser()
 
             for pattern in tax_link_patterns:
-                links = await context.page.query_selector_all(f'a[{pattern}]')
-
-                for link in links:
-                    href = await link.get_attribute('href')
+                for href in selector.css(f'a[{pattern}]::attr(href)').getall():
                     if href:
                         # Convert to absolute URL
                         absolute_url = urljoin(context.request.url, href)
@@ -221,7 +345,7 @@ class CRACrawler:
                             discovered_links.add(absolute_url)
 
             # Queue discovered links
-            requests = [{'url': url} for url in discovered_links]
+            requests = sorted(discovered_links)
 
             if requests:
                 logger.info(f'Discovered {len(requests)} potential tax-related links')
@@ -239,30 +363,49 @@ class CRACrawler:
 
         logger.info(f'Starting CRA crawl from {url}')
 
+        self._processed_requests.clear()
+
         # Reset stats
         self._stats = {
             'pages_crawled': 0,
             'pages_processed': 0,
             'pages_stored': 0,
             'chunks_created': 0,
+            'chunks_deleted': 0,
+            'pages_unchanged': 0,
             'validation_errors': 0,
             'processing_errors': 0,
         }
 
-        # Start crawling
-        await self._crawler.run([url])
+        # Start crawling, making sure all queued points are written even if the crawl fails
+        try:
+            await self._crawler.run([url])
+        finally:
+            await self._vector_store.flush()
+            await self._fingerprints.persist()
+            await self._rate_limiter.persist()
 
         # Get final stats
         final_stats = {
             **self._stats,
             'rate_limiter_stats': self._rate_limiter.get_stats(),
-            'collection_stats': await self._qdrant_client.get_collection_info(),
+            'embedding_stats': self._vectorizer.get_stats(),
+            'embedding_cache_stats': self._vectorizer.get_cache_stats(),
+            'write_stats': self._vector_store.get_write_stats(),
+            'collection_stats': await self._vector_store.get_collection_info(),
         }
 
         logger.info(f'Crawl completed. Results: {final_stats}')
 
         return final_stats
 
+    async def close(self) -> None:
+        """Write all queued points and release the resources of the processing pipeline."""
+        await self._vector_store.close()
+        await self._vectorizer.close()
+        await self._fingerprints.teardown()
+        await self._rate_limiter.teardown()
+
     async def search_similar_content(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
         """Search for similar content in the stored data."""
         if self._vectorizer._model is None:
@@ -271,8 +414,8 @@ class CRACrawler:
         # Vectorize the query
         query_vector = await self._vectorizer.vectorize_text(query)
 
-        # Search in Qdrant
-        results = await self._qdrant_client.search_similar(
+        # Search in the vector store
+        results = await self._vector_store.search_similar(
             query_vector=query_vector,
             limit=limit,
         )
@@ -284,6 +427,9 @@ class CRACrawler:
         return {
             **self._stats,
             'rate_limiter_stats': self._rate_limiter.get_stats(),
+            'embedding_stats': self._vectorizer.get_stats(),
+            'embedding_cache_stats': self._vectorizer.get_cache_stats(),
+            'write_stats': self._vector_store.get_write_stats(),
             'config': {
                 'base_url': self._config.base_url,
                 'allowed_domains': self._config.allowed_domains,
@@ -1,11 +1,12 @@
 """Data validation for CRA tax information."""
 
-import re
 from typing import Any
 from urllib.parse import urlparse
 
 from marshmallow import Schema, ValidationError, fields, post_load, validate
 
+from ._page_classifier import CRAPageClassification, CRAPageClassifier
+
 
 class CRADataSchema(Schema):
     """Schema for validating CRA tax data."""
@@ -45,6 +46,7 @@ class CRADataValidator:
             'business': ['business', 'self-employed', 'corporation', 'gst', 'hst'],
             'personal': ['personal', 'individual', 'rrsp', 'tfsa', 'pension'],
         }
+        self._classifier = CRAPageClassifier(self._tax_keywords)
 
     def validate_url(self, url: str) -> bool:
         """Check if URL is from allowed domains."""
@@ -57,68 +59,25 @@ class CRADataValidator:
         except Exception:
             return False
 
+    def classify(self, title: str, content: str) -> CRAPageClassification:
+        """Find the page type, relevance, tax year and form number of a page in a single scan."""
+        return self._classifier.classify(title, content)
+
     def extract_tax_year(self, content: str) -> str | None:
         """Extract tax year from content."""
-        # Look for 4-digit years (2020-2030)
-        year_pattern = r'\b(20[2-3][0-9])\b'
-        matches = re.findall(year_pattern, content)
-
-        if matches:
-            # Return the most recent year found
-            return max(matches)
-
-        return None
+        return self._classifier.classify('', content).tax_year
 
     def extract_form_number(self, content: str) -> str | None:
         """Extract CRA form number from content."""
-        # Common CRA form patterns
-        form_patterns = [
-            r'\bT[1-5][A-Z]?\b',  # T1, T2, etc.
-            r'\bT[1-5]\d{3}\b',  # T1234
-            r'\bRC\d+\b',  # RC123
-            r'\bNR\d+\b',  # NR123
-        ]
-
-        for pattern in form_patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                return matches[0].upper()
-
-        return None
+        return self._classifier.classify('', content).form_number
 
     def determine_page_type(self, title: str, content: str) -> str:
         """Determine the type of tax page based on content."""
-        title_lower = title.lower()
-        content_lower = content.lower()
-
-        # Use word boundaries to match whole words only
-        combined_text = f'{title_lower} {content_lower}'
-
-        # Check for form-related content
-        if any(re.search(rf'\b{re.escape(keyword)}\b', combined_text) for keyword in self._tax_keywords['forms']):
-            return 'forms'
-
-        # Check for business content
-        if any(re.search(rf'\b{re.escape(keyword)}\b', combined_text) for keyword in self._tax_keywords['business']):
-            return 'business'
-
-        # Check for personal tax content
-        if any(re.search(rf'\b{re.escape(keyword)}\b', combined_text) for keyword in self._tax_keywords['personal']):
-            return 'personal'
-
-        return 'general'
+        return self._classifier.classify(title, content).page_type
 
     def is_relevant_content(self, title: str, content: str) -> bool:
         """Check if content is relevant to tax information."""
-        title_lower = title.lower()
-        content_lower = content.lower()
-
-        # Must contain at least one tax-related keyword
-        all_keywords = []
-        for keywords in self._tax_keywords.values():
-            all_keywords.extend(keywords)
-
-        return any(keyword in title_lower or keyword in content_lower for keyword in all_keywords)
+        return self._classifier.classify(title, content).is_relevant
 
     def validate_data(self, data: dict[str, Any]) -> dict[str, Any]:
         """Validate and enrich extracted data."""
@@ -130,14 +89,16 @@ class CRADataValidator:
             if not self.validate_url(validated_data['url']):
                 raise ValidationError(f'URL not from allowed domains: {validated_data["url"]}')
 
+            classification = self.classify(validated_data['title'], validated_data['content'])
+
             # Content relevance check
-            if not self.is_relevant_content(validated_data['title'], validated_data['content']):
+            if not classification.is_relevant:
                 raise ValidationError('Content not relevant to tax information')
 
             # Extract additional metadata
-            validated_data['tax_year'] = self.extract_tax_year(validated_data['content'])
-            validated_data['form_number'] = self.extract_form_number(validated_data['content'])
-            validated_data['page_type'] = self.determine_page_type(validated_data['title'], validated_data['content'])
+            validated_data['tax_year'] = classification.tax_year
+            validated_data['form_number'] = classification.form_number
+            validated_data['page_type'] = classification.page_type
 
             return validated_data
 
@@ -0,0 +1,217 @@
+"""Content-hash embedding cache for CRA tax data."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import threading
+from array import array
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from cachetools import LRUCache
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class CRAEmbeddingCache:
+    """Cache of text embeddings keyed by a hash of the model name and the exact text.
+
+    Recently used embeddings are kept in an in-memory LRU. When `path` is set, every embedding is also appended
+    to an on-disk store, so texts which did not change are not encoded again in later runs. The store consists of
+    a file of float32 rows, which is memory-mapped for reads, and a file with the fixed-size key of each row.
+    """
+
+    _VECTORS_FILENAME = 'vectors.f32'
+    _KEYS_FILENAME = 'keys.bin'
+    _METADATA_FILENAME = 'metadata.json'
+    _KEY_SIZE = 16
+
+    def __init__(self, *, model_name: str, max_size: int = 10_000, path: Path | None = None) -> None:
+        self._model_name = model_name
+        self._path = path
+        self._memory = LRUCache[bytes, list[float]](maxsize=max_size)
+        self._lock = threading.Lock()
+
+        # On-disk store
+        self._dimension: int | None = None
+        self._rows = dict[bytes, int]()
+        self._row_count = 0
+        self._vectors_file: BinaryIO | None = None
+        self._keys_file: BinaryIO | None = None
+        self._mmap: mmap.mmap | None = None
+        self._mapped_rows = 0
+        self._opened = False
+
+        # Statistics
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    def compute_key(self, text: str) -> bytes:
+        """Compute the cache key of a text."""
+        return hashlib.blake2b(f'{self._model_name}\0{text}'.encode(), digest_size=self._KEY_SIZE).digest()
+
+    def get_many(self, texts: Sequence[str]) -> list[list[float] | None]:
+        """Get the cached embeddings of texts, with `None` for texts which are not cached."""
+        with self._lock:
+            self._open()
+            return [self._get(self.compute_key(text)) for text in texts]
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """Cache the embeddings of texts."""
+        with self._lock:
+            self._open()
+            new_rows = dict[bytes, list[float]]()
+
+            for text, vector in zip(texts, vectors, strict=True):
+                key = self.compute_key(text)
+                self._memory[key] = list(vector)
+                if self._path is not None and key not in self._rows:
+                    new_rows[key] = list(vector)
+
+            if new_rows:
+                self._append_rows(list(new_rows.items()))
+
+    def close(self) -> None:
+        """Close the files of the on-disk store."""
+        with self._lock:
+            for resource in (self._mmap, self._vectors_file, self._keys_file):
+                if resource is not None:
+                    resource.close()
+
+            self._mmap = None
+            self._vectors_file = None
+            self._keys_file = None
+            self._mapped_rows = 0
+            self._opened = False
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache hit and miss statistics."""
+        lookups = self._hits + self._disk_hits + self._misses
+
+        return {
+            'hits': self._hits + self._disk_hits,
+            'memory_hits': self._hits,
+            'disk_hits': self._disk_hits,
+            'misses': self._misses,
+            'hit_rate': (self._hits + self._disk_hits) / lookups if lookups else 0.0,
+            'memory_entries': len(self._memory),
+            'disk_entries': len(self._rows),
+        }
+
+    def _get(self, key: bytes) -> list[float] | None:
+        vector = self._memory.get(key)
+        if vector is not None:
+            self._hits += 1
+            return vector
+
+        row = self._rows.get(key)
+        if row is not None:
+            vector = self._read_row(row)
+            self._memory[key] = vector
+            self._disk_hits += 1
+            return vector
+
+        self._misses += 1
+        return None
+
+    def _open(self) -> None:
+        if self._opened or self._path is None:
+            return
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        metadata_path = self._path / self._METADATA_FILENAME
+
+        if metadata_path.exists():
+            try:
+                metadata = json.loads(metadata_path.read_text(encoding='utf-8'))
+                if metadata['model_name'] == self._model_name:
+                    self._dimension = metadata['dimension']
+                else:
+                    logger.warning(f'Embedding cache at {self._path} belongs to another model, resetting it')
+                    self._reset_files()
+            except (json.JSONDecodeError, KeyError, TypeError) as exc:
+                logger.warning(f'Invalid embedding cache metadata at {self._path}, resetting it: {exc!s}')
+                self._reset_files()
+        else:
+            self._reset_files()
+
+        self._load_rows()
+        self._vectors_file = (self._path / self._VECTORS_FILENAME).open('ab')
+        self._keys_file = (self._path / self._KEYS_FILENAME).open('ab')
+        self._opened = True
+
+    def _reset_files(self) -> None:
+        if self._path is None:
+            return
+
+        for filename in (self._VECTORS_FILENAME, self._KEYS_FILENAME, self._METADATA_FILENAME):
+            (self._path / filename).unlink(missing_ok=True)
+
+        self._dimension = None
+
+    def _load_rows(self) -> None:
+        if self._path is None or self._dimension is None:
+            return
+
+        vectors_path = self._path / self._VECTORS_FILENAME
+        keys_path = self._path / self._KEYS_FILENAME
+        if not vectors_path.exists() or not keys_path.exists():
+            self._reset_files()
+            return
+
+        keys = keys_path.read_bytes()
+        row_size = self._dimension * 4
+        row_count = min(len(keys) // self._KEY_SIZE, vectors_path.stat().st_size // row_size)
+
+        # Rows interrupted by a crash are at the very end of either file, drop them.
+        for file_path, size in ((keys_path, row_count * self._KEY_SIZE), (vectors_path, row_count * row_size)):
+            if file_path.stat().st_size > size:
+                with file_path.open('r+b') as file:
+                    file.truncate(size)
+
+        self._rows = {keys[row * self._KEY_SIZE : (row + 1) * self._KEY_SIZE]: row for row in range(row_count)}
+        self._row_count = row_count
+
+    def _append_rows(self, rows: Sequence[tuple[bytes, list[float]]]) -> None:
+        if self._path is None or self._vectors_file is None or self._keys_file is None:
+            return
+
+        if self._dimension is None:
+            self._dimension = len(rows[0][1])
+            metadata = {'model_name': self._model_name, 'dimension': self._dimension}
+            (self._path / self._METADATA_FILENAME).write_text(json.dumps(metadata), encoding='utf-8')
+
+        rows = [(key, vector) for key, vector in rows if len(vector) == self._dimension]
+
+        # Vectors are written before keys, so a key on disk always has its vector.
+        self._vectors_file.write(b''.join(array('f', vector).tobytes() for _, vector in rows))
+        self._vectors_file.flush()
+        self._keys_file.write(b''.join(key for key, _ in rows))
+        self._keys_file.flush()
+
+        for key, _ in rows:
+            self._rows[key] = self._row_count
+            self._row_count += 1
+
+    def _read_row(self, row: int) -> list[float]:
+        if self._path is None or self._dimension is None:
+            raise RuntimeError('The embedding cache has no on-disk store')
+
+        # Rows appended after the file was mapped require a new mapping.
+        if self._mmap is None or row >= self._mapped_rows:
+            if self._mmap is not None:
+                self._mmap.close()
+
+            with (self._path / self._VECTORS_FILENAME).open('rb') as file:
+                self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._mapped_rows = len(self._mmap) // (self._dimension * 4)
+
+        row_size = self._dimension * 4
+        return array('f', self._mmap[row * row_size : (row + 1) * row_size]).tolist()
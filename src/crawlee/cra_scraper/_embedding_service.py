@@ -0,0 +1,225 @@
+"""Micro-batching embedding service for CRA tax data."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _EmbeddingJob:
+    """Texts submitted by a single caller, resolved once all of them are embedded."""
+
+    future: asyncio.Future[list[list[float]]]
+    vectors: list[list[float] | None]
+    remaining: int
+
+
+@dataclass
+class _EmbeddingItem:
+    """A single text waiting in the queue, together with its position in the job."""
+
+    text: str
+    job: _EmbeddingJob
+    index: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class CRAEmbeddingService:
+    """Embedding service that collects texts from all in-flight pages into micro-batches.
+
+    Texts are queued and grouped into batches of up to `max_batch_size` texts, waiting at most `max_batch_delay`
+    seconds for a batch to fill up. Batches are encoded on a dedicated executor, so the model runs few large batches
+    instead of many tiny ones and does not compete with other work on the default executor.
+
+    The queue is bounded by `max_queue_size` texts. Once it is full, `embed` waits for free space, which slows the
+    crawler down to the pace of the model.
+    """
+
+    def __init__(
+        self,
+        encode: Callable[[list[str]], Sequence[Sequence[float]]],
+        *,
+        max_batch_size: int = 32,
+        max_batch_delay: float = 0.05,
+        max_queue_size: int = 1024,
+        max_workers: int = 1,
+    ) -> None:
+        self._encode = encode
+        self._max_batch_size = max_batch_size
+        self._max_batch_delay = max_batch_delay
+        self._max_queue_size = max_queue_size
+        self._max_workers = max_workers
+
+        self._queue: asyncio.Queue[_EmbeddingItem] | None = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._batcher_task: asyncio.Task[None] | None = None
+        self._encode_tasks = set[asyncio.Task[None]]()
+        self._workers_semaphore = asyncio.Semaphore(max_workers)
+
+        # Statistics
+        self._texts_embedded = 0
+        self._batches_encoded = 0
+        self._failed_batches = 0
+        self._encode_time = 0.0
+        self._total_wait_time = 0.0
+        self._max_queue_depth = 0
+        self._started_at: float | None = None
+
+    async def embed(self, texts: Sequence[str]) -> list[list[float]]:
+        """Embed texts, returning their vectors in the order of the texts.
+
+        The texts may be encoded across several batches, together with texts of other callers.
+        """
+        if not texts:
+            return []
+
+        queue = self._ensure_started()
+        job = _EmbeddingJob(
+            future=asyncio.get_running_loop().create_future(),
+            vectors=[None] * len(texts),
+            remaining=len(texts),
+        )
+
+        for index, text in enumerate(texts):
+            # Blocks while the queue is full, providing backpressure to the caller.
+            await queue.put(_EmbeddingItem(text=text, job=job, index=index))
+            self._max_queue_depth = max(self._max_queue_depth, queue.qsize())
+
+        return await job.future
+
+    async def close(self) -> None:
+        """Stop the service once all queued texts are embedded and shut down its executor."""
+        if self._queue is not None:
+            await self._queue.join()
+
+        if self._batcher_task is not None:
+            self._batcher_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._batcher_task
+            self._batcher_task = None
+
+        if self._encode_tasks:
+            await asyncio.gather(*self._encode_tasks, return_exceptions=True)
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        self._queue = None
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get embedding throughput and queue statistics."""
+        elapsed = time.monotonic() - self._started_at if self._started_at is not None else 0.0
+
+        return {
+            'texts_embedded': self._texts_embedded,
+            'batches_encoded': self._batches_encoded,
+            'failed_batches': self._failed_batches,
+            'average_batch_size': self._texts_embedded / self._batches_encoded if self._batches_encoded else 0.0,
+            'texts_per_second': self._texts_embedded / elapsed if elapsed > 0 else 0.0,
+            'encode_texts_per_second': self._texts_embedded / self._encode_time if self._encode_time > 0 else 0.0,
+            'average_wait_time': self._total_wait_time / self._texts_embedded if self._texts_embedded else 0.0,
+            'queue_depth': self._queue.qsize() if self._queue is not None else 0,
+            'max_queue_depth': self._max_queue_depth,
+            'max_queue_size': self._max_queue_size,
+            'max_batch_size': self._max_batch_size,
+        }
+
+    def _ensure_started(self) -> asyncio.Queue[_EmbeddingItem]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix='cra-embedding')
+
+        if self._batcher_task is None or self._batcher_task.done():
+            self._batcher_task = asyncio.create_task(self._run_batcher(self._queue), name='cra-embedding-batcher')
+            self._started_at = self._started_at or time.monotonic()
+
+        return self._queue
+
+    async def _run_batcher(self, queue: asyncio.Queue[_EmbeddingItem]) -> None:
+        while True:
+            # Wait for a free worker first, so that texts queued in the meantime end up in a single larger batch.
+            await self._workers_semaphore.acquire()
+
+            try:
+                batch = await self._collect_batch(queue)
+            except asyncio.CancelledError:
+                self._workers_semaphore.release()
+                raise
+
+            task = asyncio.create_task(self._encode_batch(queue, batch))
+            self._encode_tasks.add(task)
+            task.add_done_callback(self._encode_tasks.discard)
+
+    async def _collect_batch(self, queue: asyncio.Queue[_EmbeddingItem]) -> list[_EmbeddingItem]:
+        batch = [await queue.get()]
+        deadline = time.monotonic() + self._max_batch_delay
+
+        while len(batch) < self._max_batch_size:
+            if not queue.empty():
+                batch.append(queue.get_nowait())
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _encode_batch(self, queue: asyncio.Queue[_EmbeddingItem], batch: list[_EmbeddingItem]) -> None:
+        started_at = time.monotonic()
+
+        try:
+            vectors = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._encode, [item.text for item in batch]
+            )
+            if len(vectors) != len(batch):
+                raise ValueError(f'Encoder returned {len(vectors)} vectors for {len(batch)} texts')  # noqa: TRY301
+        except Exception as exc:
+            logger.exception(f'Failed to encode a batch of {len(batch)} texts')
+            self._failed_batches += 1
+            for item in batch:
+                if not item.job.future.done():
+                    item.job.future.set_exception(exc)
+        else:
+            self._encode_time += time.monotonic() - started_at
+            self._batches_encoded += 1
+            self._texts_embedded += len(batch)
+
+            for item, vector in zip(batch, vectors, strict=True):
+                self._total_wait_time += started_at - item.enqueued_at
+                self._resolve(item, vector)
+        finally:
+            self._workers_semaphore.release()
+            for _ in batch:
+                queue.task_done()
+
+    @staticmethod
+    def _resolve(item: _EmbeddingItem, vector: Sequence[float]) -> None:
+        job = item.job
+        if job.future.done():
+            return
+
+        job.vectors[item.index] = vector.tolist() if hasattr(vector, 'tolist') else list(vector)
+        job.remaining -= 1
+
+        if job.remaining == 0:
+            job.future.set_result([vector for vector in job.vectors if vector is not None])
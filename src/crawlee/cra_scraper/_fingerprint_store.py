@@ -0,0 +1,97 @@
+"""Persisted content fingerprints of crawled CRA pages."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import uuid
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+from crawlee._utils.recoverable_state import RecoverableState
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+
+_POINT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, 'crawlee.cra_scraper')
+"""Namespace of the deterministic Qdrant point IDs."""
+
+
+def compute_point_id(url: str, chunk_index: int) -> str:
+    """Compute the deterministic Qdrant point ID of a page chunk, so re-crawls overwrite their previous points."""
+    return str(uuid.uuid5(_POINT_ID_NAMESPACE, f'{url}#{chunk_index}'))
+
+
+class PageFingerprint(BaseModel):
+    """Fingerprint of the content of a page as it was last stored."""
+
+    content_hash: str
+    chunk_count: int
+
+
+class _FingerprintState(BaseModel):
+    pages: dict[str, PageFingerprint] = Field(default_factory=dict)
+
+
+class CRAFingerprintStore:
+    """Store of per-URL content fingerprints, used to skip pages which did not change since the last crawl.
+
+    The fingerprints are persisted in a named key-value store, which is not purged on start. Only the changes are
+    written on each persist, so keeping fingerprints of many pages is cheap.
+    """
+
+    def __init__(
+        self,
+        *,
+        kvs_name: str = 'cra-fingerprints',
+        persistence_enabled: Literal[True, False, 'explicit_only'] = True,
+        salt: str = '',
+    ) -> None:
+        self._salt = salt
+        self._state = RecoverableState(
+            default_state=_FingerprintState(),
+            persist_state_key='CRA_PAGE_FINGERPRINTS',
+            persistence_enabled=persistence_enabled,
+            persist_state_kvs_name=kvs_name,
+            persistence_mode='journal',
+            logger=logger,
+        )
+
+    async def initialize(self) -> None:
+        """Load the persisted fingerprints."""
+        if not self._state.is_initialized:
+            await self._state.initialize()
+
+    async def persist(self) -> None:
+        """Persist the fingerprints."""
+        if self._state.is_initialized:
+            await self._state.persist_state()
+
+    async def teardown(self) -> None:
+        """Persist the fingerprints and stop persisting them automatically."""
+        if self._state.is_initialized:
+            await self._state.teardown()
+
+    def compute_hash(self, data: dict[str, Any]) -> str:
+        """Compute the content hash of page data, ignoring differences in whitespace."""
+        title = _WHITESPACE_PATTERN.sub(' ', str(data.get('title', ''))).strip()
+        content = _WHITESPACE_PATTERN.sub(' ', str(data.get('content', ''))).strip()
+        return hashlib.sha256(f'{self._salt}\0{title}\0{content}'.encode()).hexdigest()
+
+    def get(self, url: str) -> PageFingerprint | None:
+        """Get the fingerprint of a page, if it was stored before."""
+        return self._state.current_value.pages.get(url)
+
+    def set(self, url: str, *, content_hash: str, chunk_count: int) -> None:
+        """Record the fingerprint of a stored page."""
+        self._state.current_value.pages[url] = PageFingerprint(content_hash=content_hash, chunk_count=chunk_count)
+
+    def discard(self, url: str) -> None:
+        """Forget the fingerprint of a page, so that it is stored again on the next crawl."""
+        self._state.current_value.pages.pop(url, None)
+
+    def __len__(self) -> int:
+        return len(self._state.current_value.pages)
@@ -0,0 +1,443 @@
+"""Local in-process vector index for CRA tax data."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import uuid
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._fingerprint_store import compute_point_id
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:
+    np = None  # type: ignore[assignment]
+
+_VECTORS_FILE = 'vectors.npy'
+_PAYLOADS_FILE = 'payloads.json'
+
+
+class CRALocalVectorIndex:
+    """Vector index backed by a NumPy matrix, with the same interface as `CRAQdrantClient`.
+
+    Vectors are normalized when stored, so cosine similarity is a single matrix-vector product over all points.
+    With `n_partitions` set, points are clustered by k-means once the index has at least `n_partitions * 39`
+    points (an IVF index), and searches only score the points of the `n_probe` non-empty partitions closest to the
+    query, probing further ones until there are at least `limit` candidates, trading some recall for speed.
+
+    With a directory, the index is stored as a versioned `vectors.<version>.npy` file with a `payloads.json` sidecar
+    on `flush` and `close`, and loaded memory-mapped, so large indexes are paged in by the OS rather than read up
+    front. The sidecar names the version of its vectors and is written last, so a crash while writing the index
+    leaves the previous pair in place.
+    """
+
+    def __init__(
+        self,
+        *,
+        directory: str | Path | None = None,
+        collection_name: str = 'cra_tax_data',
+        vector_size: int = 384,
+        n_partitions: int = 0,
+        n_probe: int = 8,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            directory: Directory the index is stored in, the index is kept only in memory without it.
+            collection_name: Name of the index, reported in the collection info.
+            vector_size: Dimension of the vectors.
+            n_partitions: Number of k-means partitions to search in, 0 searches all points.
+            n_probe: Number of partitions closest to the query that are searched.
+        """
+        if np is None:
+            raise ImportError('numpy is required for the local vector index. Install with: pip install numpy')
+
+        self._directory = Path(directory) if directory is not None else None
+        self._collection_name = collection_name
+        self._vector_size = vector_size
+        self._n_partitions = n_partitions
+        self._n_probe = n_probe
+
+        # Rows beyond `_size` are spare capacity, the matrix is a read-only memory map until first modified
+        self._vectors: np.ndarray = np.empty((0, vector_size), dtype=np.float32)
+        self._size = 0
+        self._ids = list[str]()
+        self._payloads = list[dict[str, Any]]()
+        self._rows = dict[str, int]()
+
+        # Partitions, built lazily on search and kept up to date as points are added
+        self._centroids: np.ndarray | None = None
+        self._assignments: np.ndarray = np.empty(0, dtype=np.int32)
+        self._trained_size = 0
+
+        self._initialized = False
+        self._dirty = False
+        self._version = 0
+
+        # Statistics
+        self._points_written = 0
+        self._batches_written = 0
+
+    async def initialize(self) -> None:
+        """Load the stored index, if there is one."""
+        if self._initialized:
+            return
+
+        if self._directory is not None and (self._directory / _PAYLOADS_FILE).exists():
+            await asyncio.to_thread(self._load)
+            logger.info(f'Loaded local vector index {self._collection_name} with {self._size} points')
+
+        self._initialized = True
+
+    async def store_data(self, data: dict[str, Any], *, on_stored: Callable[[bool], None] | None = None) -> str:
+        """Store vectorized tax data in the index."""
+        if 'vector' not in data:
+            raise ValueError("Data must contain a 'vector' field")
+
+        point_ids = await self.store_batch([data], on_stored=on_stored)
+        return point_ids[0]
+
+    async def store_batch(
+        self, data_list: list[dict[str, Any]], *, on_stored: Callable[[bool], None] | None = None
+    ) -> list[str]:
+        """Store multiple vectorized tax data points in the index, overwriting points with the same IDs.
+
+        The points are stored right away, so `on_stored` is called with `True` before returning.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        items = [data for data in data_list if 'vector' in data]
+        if not items:
+            if on_stored is not None:
+                on_stored(True)  # noqa: FBT003
+            return []
+
+        vectors = self._normalize(np.asarray([data['vector'] for data in items], dtype=np.float32))
+        if vectors.shape[1] != self._vector_size:
+            raise ValueError(f'Expected vectors of size {self._vector_size}, got {vectors.shape[1]}')
+
+        self._ensure_writable(self._size + len(items))
+
+        point_ids = list[str]()
+        for data, vector in zip(items, vectors, strict=True):
+            point_id = self._get_point_id(data)
+            point_ids.append(point_id)
+
+            payload = {k: v for k, v in data.items() if k != 'vector'}
+            if 'extracted_at' in payload:
+                payload['extracted_at'] = payload['extracted_at'].isoformat()
+
+            row = self._rows.get(point_id)
+            if row is None:
+                row = self._size
+                self._size += 1
+                self._rows[point_id] = row
+                self._ids.append(point_id)
+                self._payloads.append(payload)
+            else:
+                self._payloads[row] = payload
+
+            self._vectors[row] = vector
+            if self._centroids is not None:
+                self._assignments[row] = int(np.argmax(self._centroids @ vector))
+
+        self._dirty = True
+        self._points_written += len(point_ids)
+        self._batches_written += 1
+        logger.debug(f'Stored {len(point_ids)} data points in the local vector index')
+
+        if on_stored is not None:
+            on_stored(True)  # noqa: FBT003
+
+        return point_ids
+
+    async def delete_points(self, point_ids: list[str]) -> None:
+        """Delete points by their IDs, e.g. chunks a changed page no longer has."""
+        if not point_ids:
+            return
+
+        if not self._initialized:
+            await self.initialize()
+
+        self._ensure_writable(self._size)
+
+        deleted = 0
+        for point_id in point_ids:
+            row = self._rows.pop(point_id, None)
+            if row is None:
+                continue
+
+            # Move the last point into the freed row, so the points stay contiguous
+            last = self._size - 1
+            if row != last:
+                self._vectors[row] = self._vectors[last]
+                self._assignments[row] = self._assignments[last]
+                self._ids[row] = self._ids[last]
+                self._payloads[row] = self._payloads[last]
+                self._rows[self._ids[row]] = row
+
+            self._ids.pop()
+            self._payloads.pop()
+            self._size -= 1
+            deleted += 1
+
+        if deleted:
+            self._dirty = True
+            logger.debug(f'Deleted {deleted} points from the local vector index')
+
+    @staticmethod
+    def _get_point_id(data: dict[str, Any]) -> str:
+        """Get a deterministic point ID for page chunks, so re-crawls overwrite them, or a random one otherwise."""
+        if data.get('url'):
+            return compute_point_id(data['url'], data.get('chunk_index', 0))
+
+        return str(uuid.uuid4())
+
+    async def flush(self) -> None:
+        """Write the index to its directory, if it changed since it was last written."""
+        if self._directory is None or not self._dirty:
+            return
+
+        # Snapshot the points, so that they can be written off the event loop while the index is modified
+        vectors = self._vectors[: self._size].copy()
+        self._version += 1
+        sidecar = {
+            'collection_name': self._collection_name,
+            'vector_size': self._vector_size,
+            'version': self._version,
+            'ids': list(self._ids),
+            'payloads': list(self._payloads),
+        }
+        self._dirty = False
+
+        await asyncio.to_thread(self._save, vectors, sidecar)
+        logger.debug(f'Wrote local vector index {self._collection_name} with {len(vectors)} points')
+
+    async def close(self) -> None:
+        """Write the index to its directory."""
+        await self.flush()
+
+    def get_write_stats(self) -> dict[str, Any]:
+        """Get write statistics, in the format of `CRAQdrantClient.get_write_stats`."""
+        return {
+            'points_written': self._points_written,
+            'points_failed': 0,
+            'points_pending': 0,
+            'batches_written': self._batches_written,
+            'retries': 0,
+            'points_per_second': 0.0,
+        }
+
+    async def search_similar(
+        self,
+        query_vector: list[float],
+        limit: int = 10,
+        score_threshold: float = 0.7,
+    ) -> list[dict[str, Any]]:
+        """Search for similar tax data using cosine similarity."""
+        if not self._initialized:
+            await self.initialize()
+
+        if self._size == 0 or limit <= 0:
+            return []
+
+        query = self._normalize(np.asarray(query_vector, dtype=np.float32)[np.newaxis])[0]
+        rows = self._get_candidate_rows(query, limit)
+        scores = self._vectors[rows] @ query if rows is not None else self._vectors[: self._size] @ query
+
+        # Select the top points in linear time, then sort only those
+        count = min(limit, len(scores))
+        top = np.argpartition(-scores, count - 1)[:count]
+        top = top[np.argsort(-scores[top], kind='stable')]
+
+        results = list[dict[str, Any]]()
+        for index in top:
+            score = float(scores[index])
+            if score < score_threshold:
+                break
+
+            row = int(rows[index]) if rows is not None else int(index)
+            results.append({'id': self._ids[row], 'score': score, **self._payloads[row]})
+
+        return results
+
+    async def get_collection_info(self) -> dict[str, Any]:
+        """Get information about the index."""
+        if not self._initialized:
+            await self.initialize()
+
+        return {
+            'name': self._collection_name,
+            'points_count': self._size,
+            'vector_size': self._vector_size,
+            'distance_metric': 'Cosine',
+        }
+
+    async def delete_collection(self) -> None:
+        """Delete all points of the index and its stored files (use with caution)."""
+        self._vectors = np.empty((0, self._vector_size), dtype=np.float32)
+        self._size = 0
+        self._ids.clear()
+        self._payloads.clear()
+        self._rows.clear()
+        self._reset_partitions()
+        self._dirty = False
+
+        if self._directory is not None:
+            (self._directory / _PAYLOADS_FILE).unlink(missing_ok=True)
+            self._delete_stale_vectors(keep=None)
+
+        logger.warning(f'Deleted local vector index: {self._collection_name}')
+
+    async def count_points(self) -> int:
+        """Get the total number of points in the index."""
+        if not self._initialized:
+            await self.initialize()
+
+        return self._size
+
+    def _get_candidate_rows(self, query: np.ndarray, limit: int) -> np.ndarray | None:
+        """Get the rows of the partitions closest to the query, or `None` if all points should be searched.
+
+        Empty partitions are skipped, and partitions are probed beyond `n_probe` until there are `limit` candidates.
+        """
+        if self._n_partitions <= 0 or self._n_probe >= self._n_partitions:
+            return None
+
+        # Train on enough points per partition, and retrain once the index doubled or halved since the last training
+        if self._size < self._n_partitions * 39:
+            return None
+
+        if self._centroids is None or self._size >= 2 * self._trained_size or 2 * self._size <= self._trained_size:
+            self._train_partitions()
+
+        if self._centroids is None:
+            return None
+
+        assignments = self._assignments[: self._size]
+        sizes = np.bincount(assignments, minlength=self._n_partitions)
+
+        order = np.argsort(-(self._centroids @ query), kind='stable')
+        order = order[sizes[order] > 0]
+        covered = np.cumsum(sizes[order])
+
+        count = max(self._n_probe, int(np.searchsorted(covered, limit)) + 1)
+        if count >= len(order):
+            return None
+
+        return np.flatnonzero(np.isin(assignments, order[:count]))
+
+    def _train_partitions(self, iterations: int = 10) -> None:
+        """Cluster the points into partitions with spherical k-means."""
+        vectors = self._vectors[: self._size]
+        rng = np.random.default_rng(0)
+        centroids = vectors[rng.choice(self._size, self._n_partitions, replace=False)].copy()
+
+        for _ in range(iterations):
+            assignments = np.argmax(vectors @ centroids.T, axis=1)
+            for partition in range(self._n_partitions):
+                members = vectors[assignments == partition]
+                if len(members):
+                    centroids[partition] = members.sum(axis=0)
+            centroids = self._normalize(centroids)
+
+        self._centroids = centroids
+        self._assignments = np.zeros(len(self._vectors), dtype=np.int32)
+        self._assignments[: self._size] = np.argmax(vectors @ centroids.T, axis=1)
+        self._trained_size = self._size
+        logger.debug(f'Built {self._n_partitions} partitions of the local vector index over {self._size} points')
+
+    def _reset_partitions(self) -> None:
+        self._centroids = None
+        self._assignments = np.zeros(len(self._vectors), dtype=np.int32)
+        self._trained_size = 0
+
+    def _ensure_writable(self, size: int) -> None:
+        """Make sure the matrix is writable and has room for `size` points, growing it geometrically."""
+        if self._vectors.flags.writeable and len(self._vectors) >= size:
+            return
+
+        capacity = max(size, 2 * len(self._vectors), 64)
+        vectors = np.empty((capacity, self._vector_size), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        self._vectors = vectors
+
+        assignments = np.zeros(capacity, dtype=np.int32)
+        assignments[: min(len(self._assignments), self._size)] = self._assignments[: self._size]
+        self._assignments = assignments
+
+    def _load(self) -> None:
+        if self._directory is None:
+            return
+
+        sidecar = json.loads((self._directory / _PAYLOADS_FILE).read_text(encoding='utf-8'))
+        version = sidecar.get('version', 0)
+        vectors = np.load(self._get_vectors_path(version), mmap_mode='r')
+
+        if vectors.shape[1] != self._vector_size or len(vectors) != len(sidecar['ids']):
+            raise ValueError(f'Local vector index in {self._directory} does not match its vector size or payloads')
+
+        self._vectors = vectors
+        self._size = len(vectors)
+        self._ids = sidecar['ids']
+        self._payloads = sidecar['payloads']
+        self._rows = {point_id: row for row, point_id in enumerate(self._ids)}
+        self._version = version
+        self._reset_partitions()
+
+    def _save(self, vectors: np.ndarray, sidecar: dict[str, Any]) -> None:
+        if self._directory is None:
+            return
+
+        self._directory.mkdir(parents=True, exist_ok=True)
+
+        # Write the vectors of the new version first, then swap in the sidecar naming them, so that a crash never
+        # leaves a partially written file or a sidecar with vectors of another version. An index still mapping
+        # the previous vectors keeps seeing them until it is loaded again.
+        vectors_path = self._get_vectors_path(sidecar['version'])
+        payloads_path = self._directory / _PAYLOADS_FILE
+        with (self._directory / f'{vectors_path.name}.tmp').open('wb') as file:
+            np.save(file, vectors)
+        (self._directory / f'{vectors_path.name}.tmp').replace(vectors_path)
+
+        (self._directory / f'{_PAYLOADS_FILE}.tmp').write_text(json.dumps(sidecar, default=str), encoding='utf-8')
+        (self._directory / f'{_PAYLOADS_FILE}.tmp').replace(payloads_path)
+
+        self._delete_stale_vectors(keep=vectors_path)
+
+    def _get_vectors_path(self, version: int) -> Path:
+        """Get the path of the vectors of the given version, version 0 being the unversioned file."""
+        if self._directory is None:
+            raise ValueError('The local vector index has no directory')
+
+        if version == 0:
+            return self._directory / _VECTORS_FILE
+
+        return self._directory / f'{Path(_VECTORS_FILE).stem}.{version}{Path(_VECTORS_FILE).suffix}'
+
+    def _delete_stale_vectors(self, keep: Path | None) -> None:
+        """Delete the vectors of versions other than `keep`, e.g. left behind by a crash before the swap."""
+        if self._directory is None:
+            return
+
+        for path in self._directory.glob(f'{Path(_VECTORS_FILE).stem}*{Path(_VECTORS_FILE).suffix}*'):
+            if path != keep:
+                # A file still mapped by another index may not be deletable on some platforms, skip it until later
+                with suppress(OSError):
+                    path.unlink()
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        normalized: np.ndarray = vectors / np.maximum(norms, np.finfo(np.float32).tiny)
+        return normalized
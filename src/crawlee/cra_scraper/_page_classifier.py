@@ -0,0 +1,111 @@
+"""Precompiled classifier of CRA tax pages."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+_YEAR_PATTERN = re.compile(r'20[2-3][0-9]\b')
+"""Tax years from 2020 to 2039, the word boundary before the year is checked separately."""
+
+_FORM_PATTERNS = (
+    re.compile(r'\bT[1-5][A-Z]?\b', re.IGNORECASE),  # T1, T2, etc.
+    re.compile(r'\bT[1-5]\d{3}\b', re.IGNORECASE),  # T1234
+    re.compile(r'\bRC\d+\b', re.IGNORECASE),  # RC123
+    re.compile(r'\bNR\d+\b', re.IGNORECASE),  # NR123
+)
+"""Patterns of CRA form numbers, in the order of their priority."""
+
+
+@dataclass(frozen=True)
+class CRAPageClassification:
+    """Metadata of a page found by `CRAPageClassifier`."""
+
+    page_type: str
+    """Type of the page, the highest priority category with a keyword in the title or the content."""
+
+    is_relevant: bool
+    """Whether the title or the content contains any tax-related keyword, even as a part of a word."""
+
+    tax_year: str | None
+    """The most recent tax year mentioned in the content."""
+
+    form_number: str | None
+    """The first form number in the content, matching the highest priority form pattern."""
+
+
+class CRAPageClassifier:
+    """Classifier which finds the type, relevance, tax year and form number of a page in one call.
+
+    The text is lowercased once and all patterns are precompiled. Keywords of each page type are matched as whole
+    words by a single alternation regex, tried in the order of priority until one matches. Form numbers are only
+    searched for until the first match, and years are found through their literal prefix, so no pattern has to be
+    tried at every position of the content.
+    """
+
+    def __init__(self, keywords: Mapping[str, Sequence[str]], *, default_page_type: str = 'general') -> None:
+        """Initialize a new instance.
+
+        Args:
+            keywords: Keywords of each page type. Page types are prioritized in the order of the mapping, keywords
+                of the default page type only count towards relevance.
+            default_page_type: Page type of pages without keywords of any other page type.
+        """
+        self._default_page_type = default_page_type
+
+        self._page_type_patterns = {
+            page_type: re.compile(rf'\b(?:{"|".join(re.escape(keyword.lower()) for keyword in page_keywords)})\b')
+            for page_type, page_keywords in keywords.items()
+            if page_type != default_page_type and page_keywords
+        }
+
+        self._keywords = tuple(dict.fromkeys(keyword.lower() for values in keywords.values() for keyword in values))
+
+    def classify(self, title: str, content: str) -> CRAPageClassification:
+        """Classify a page by its title and content."""
+        combined_text = f'{title.lower()} {content.lower()}'
+
+        page_type = next(
+            (page_type for page_type, pattern in self._page_type_patterns.items() if pattern.search(combined_text)),
+            self._default_page_type,
+        )
+
+        # Any whole-word keyword is also a keyword inside the text, which saves the substring checks.
+        is_relevant = page_type != self._default_page_type or any(
+            keyword in combined_text for keyword in self._keywords
+        )
+
+        return CRAPageClassification(
+            page_type=page_type,
+            is_relevant=is_relevant,
+            tax_year=self._find_tax_year(content),
+            form_number=self._find_form_number(content),
+        )
+
+    @staticmethod
+    def _find_tax_year(content: str) -> str | None:
+        tax_year: str | None = None
+
+        for match in _YEAR_PATTERN.finditer(content):
+            start = match.start()
+            if start > 0 and (content[start - 1].isalnum() or content[start - 1] == '_'):
+                continue
+
+            year = match.group()
+            if tax_year is None or year > tax_year:
+                tax_year = year
+
+        return tax_year
+
+    @staticmethod
+    def _find_form_number(content: str) -> str | None:
+        for pattern in _FORM_PATTERNS:
+            match = pattern.search(content)
+            if match:
+                return match.group().upper()
+
+        return None
@@ -1,9 +1,15 @@
 """Qdrant vector database client for CRA tax data."""
 
+import asyncio
+import logging
 import uuid
+from collections.abc import Callable
 from typing import Any
 
-from crawlee._utils import console
+from ._fingerprint_store import compute_point_id
+from ._qdrant_writer import CRAQdrantWriter
+
+logger = logging.getLogger(__name__)
 
 try:
     from qdrant_client import QdrantClient
@@ -27,6 +33,9 @@ class CRAQdrantClient:
         api_key: str | None = None,
         collection_name: str = 'cra_tax_data',
         vector_size: int = 384,
+        write_batch_size: int = 256,
+        write_flush_interval: float = 1.0,
+        write_max_retries: int = 3,
     ) -> None:
         if QdrantClient is None:
             raise ImportError(
@@ -39,12 +48,20 @@ class CRAQdrantClient:
         self._vector_size = vector_size
         self._client: QdrantClient | None = None
 
+        # Points are upserted in batches by a background writer, off the event loop
+        self._writer = CRAQdrantWriter(
+            self._upsert_points,
+            batch_size=write_batch_size,
+            flush_interval=write_flush_interval,
+            max_retries=write_max_retries,
+        )
+
     async def initialize(self) -> None:
         """Initialize the Qdrant client and create collection if needed."""
         if self._client is not None:
             return
 
-        console.print(f'[blue]Connecting to Qdrant at {self._endpoint}[/blue]')
+        logger.info(f'Connecting to Qdrant at {self._endpoint}')
 
         # Initialize client
         self._client = QdrantClient(
@@ -55,9 +72,9 @@ class CRAQdrantClient:
         # Check if collection exists, create if not
         try:
             collection_info = self._client.get_collection(self._collection_name)
-            console.print(f'[green]Connected to existing collection: {self._collection_name}[/green]')
+            logger.info(f'Connected to existing collection: {self._collection_name}')
         except Exception:
-            console.print(f'[yellow]Creating new collection: {self._collection_name}[/yellow]')
+            logger.info(f'Creating new collection: {self._collection_name}')
             await self._create_collection()
 
     async def _create_collection(self) -> None:
@@ -72,18 +89,31 @@ class CRAQdrantClient:
                 distance=Distance.COSINE,
             ),
         )
-        console.print(f'[green]Collection {self._collection_name} created successfully[/green]')
+        logger.info(f'Collection {self._collection_name} created successfully')
 
-    async def store_data(self, data: dict[str, Any]) -> str:
-        """Store vectorized tax data in Qdrant."""
+    def _upsert_points(self, points: list[Any]) -> None:
+        """Upsert points synchronously, called from the writer thread."""
+        if self._client is None:
+            raise RuntimeError('Client not initialized')
+
+        self._client.upsert(
+            collection_name=self._collection_name,
+            points=points,
+        )
+
+    async def store_data(self, data: dict[str, Any], *, on_stored: Callable[[bool], None] | None = None) -> str:
+        """Queue vectorized tax data for storing in Qdrant.
+
+        The point is written by the background writer, call `flush` to wait until it is stored. `on_stored` is called
+        with `True` once the point is stored, or with `False` if it is dropped after failed retries.
+        """
         if self._client is None:
             await self.initialize()
 
         if 'vector' not in data:
             raise ValueError("Data must contain a 'vector' field")
 
-        # Generate unique ID
-        point_id = str(uuid.uuid4())
+        point_id = self._get_point_id(data)
 
         # Prepare payload (exclude vector)
         payload = {k: v for k, v in data.items() if k != 'vector'}
@@ -99,17 +129,20 @@ class CRAQdrantClient:
             payload=payload,
         )
 
-        # Upload point
-        self._client.upsert(
-            collection_name=self._collection_name,
-            points=[point],
-        )
+        # Queue point for upload
+        self._notify_when_stored(await self._writer.write([point]), on_stored)
 
-        console.print(f'[green]Stored data point {point_id} in Qdrant[/green]')
+        logger.debug(f'Queued data point {point_id} for Qdrant')
         return point_id
 
-    async def store_batch(self, data_list: list[dict[str, Any]]) -> list[str]:
-        """Store multiple vectorized tax data points efficiently."""
+    async def store_batch(
+        self, data_list: list[dict[str, Any]], *, on_stored: Callable[[bool], None] | None = None
+    ) -> list[str]:
+        """Queue multiple vectorized tax data points for storing in Qdrant.
+
+        The points are written by the background writer, together with points of other pages. `on_stored` is called
+        with `True` once all the points are stored, or with `False` as soon as any of them is dropped.
+        """
         if self._client is None:
             await self.initialize()
 
@@ -120,7 +153,7 @@ class CRAQdrantClient:
             if 'vector' not in data:
                 continue
 
-            point_id = str(uuid.uuid4())
+            point_id = self._get_point_id(data)
             point_ids.append(point_id)
 
             # Prepare payload
@@ -138,15 +171,52 @@ class CRAQdrantClient:
                 )
             )
 
+        self._notify_when_stored(await self._writer.write(points), on_stored)
         if points:
-            self._client.upsert(
-                collection_name=self._collection_name,
-                points=points,
-            )
-            console.print(f'[green]Stored {len(points)} data points in Qdrant[/green]')
+            logger.debug(f'Queued {len(points)} data points for Qdrant')
 
         return point_ids
 
+    @staticmethod
+    def _notify_when_stored(future: asyncio.Future[bool], on_stored: Callable[[bool], None] | None) -> None:
+        if on_stored is not None:
+            future.add_done_callback(lambda future: on_stored(not future.cancelled() and future.result()))
+
+    async def delete_points(self, point_ids: list[str]) -> None:
+        """Delete points by their IDs, e.g. chunks a changed page no longer has."""
+        if not point_ids:
+            return
+
+        if self._client is None:
+            await self.initialize()
+
+        await asyncio.to_thread(
+            self._client.delete,
+            collection_name=self._collection_name,
+            points_selector=models.PointIdsList(points=point_ids),
+        )
+        logger.debug(f'Deleted {len(point_ids)} points from Qdrant')
+
+    @staticmethod
+    def _get_point_id(data: dict[str, Any]) -> str:
+        """Get a deterministic point ID for page chunks, so re-crawls overwrite them, or a random one otherwise."""
+        if data.get('url'):
+            return compute_point_id(data['url'], data.get('chunk_index', 0))
+
+        return str(uuid.uuid4())
+
+    async def flush(self) -> None:
+        """Wait until all queued points are written to Qdrant."""
+        await self._writer.flush()
+
+    async def close(self) -> None:
+        """Write all queued points and stop the background writer."""
+        await self._writer.close()
+
+    def get_write_stats(self) -> dict[str, Any]:
+        """Get statistics of the background writer."""
+        return self._writer.get_stats()
+
     async def search_similar(
         self,
         query_vector: list[float],
@@ -195,7 +265,7 @@ class CRAQdrantClient:
             await self.initialize()
 
         self._client.delete_collection(self._collection_name)
-        console.print(f'[red]Deleted collection: {self._collection_name}[/red]')
+        logger.warning(f'Deleted collection: {self._collection_name}')
 
     async def count_points(self) -> int:
         """Get the total number of points in the collection."""
@@ -0,0 +1,205 @@
+"""Background batched writer for Qdrant points."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PendingWrite:
+    """Points of a single `write` call which are not stored yet."""
+
+    remaining: int
+    future: asyncio.Future[bool]
+
+
+class CRAQdrantWriter:
+    """Writer that accumulates points from all pages and upserts them in batches in the background.
+
+    Points are flushed once `batch_size` of them are pending, or at the latest `flush_interval` seconds after they
+    were written. The blocking `upsert` call runs on a dedicated thread, so the network round trip never blocks the
+    event loop. Failed upserts are retried with exponential backoff, batches failing `max_retries` times are dropped
+    and counted in the statistics.
+
+    At most `max_pending` points are held in memory, `write` waits for the writer to catch up beyond that.
+
+    Every `write` returns a future, which tells whether all its points were stored or some of them were dropped.
+    """
+
+    def __init__(
+        self,
+        upsert: Callable[[list[Any]], Any],
+        *,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self._upsert = upsert
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+
+        self._pending = list[tuple[Any, _PendingWrite]]()
+        self._wakeup = asyncio.Event()
+        self._space_available = asyncio.Event()
+        self._space_available.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._flush_requested = False
+
+        self._executor: ThreadPoolExecutor | None = None
+        self._writer_task: asyncio.Task[None] | None = None
+
+        # Statistics
+        self._points_written = 0
+        self._points_failed = 0
+        self._batches_written = 0
+        self._retries = 0
+        self._write_time = 0.0
+
+    async def write(self, points: Sequence[Any]) -> asyncio.Future[bool]:
+        """Queue points for writing, waiting while too many points are pending.
+
+        Returns:
+            A future resolved to `True` once all the points are stored, or to `False` as soon as any of them is
+            dropped after failing `max_retries` times.
+        """
+        future = asyncio.get_running_loop().create_future()
+        if not points:
+            future.set_result(True)
+            return future
+
+        self._ensure_started()
+        await self._space_available.wait()
+
+        pending_write = _PendingWrite(remaining=len(points), future=future)
+        self._pending.extend((point, pending_write) for point in points)
+        self._idle.clear()
+
+        if len(self._pending) >= self._max_pending:
+            self._space_available.clear()
+
+        if len(self._pending) >= self._batch_size:
+            self._wakeup.set()
+
+        return future
+
+    async def flush(self) -> None:
+        """Write all pending points and wait until they are stored."""
+        if self._writer_task is None or self._idle.is_set():
+            return
+
+        self._flush_requested = True
+        self._wakeup.set()
+        await self._idle.wait()
+
+    async def close(self) -> None:
+        """Flush pending points and stop the writer."""
+        await self.flush()
+
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._writer_task
+            self._writer_task = None
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+        # Points left behind by a cancelled writer were never stored.
+        for _, pending_write in self._pending:
+            if not pending_write.future.done():
+                pending_write.future.set_result(False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get write throughput and queue statistics."""
+        return {
+            'points_written': self._points_written,
+            'points_failed': self._points_failed,
+            'points_pending': len(self._pending),
+            'batches_written': self._batches_written,
+            'retries': self._retries,
+            'points_per_second': self._points_written / self._write_time if self._write_time > 0 else 0.0,
+        }
+
+    def _ensure_started(self) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='cra-qdrant-writer')
+
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = asyncio.create_task(self._run_writer(), name='cra-qdrant-writer')
+
+    async def _run_writer(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self._flush_interval)
+                flush_all = self._flush_requested
+            except asyncio.TimeoutError:
+                flush_all = True
+
+            self._wakeup.clear()
+            self._flush_requested = False
+
+            # Woken up by the batch size, only full batches are written and the rest keeps accumulating.
+            while self._pending and (flush_all or len(self._pending) >= self._batch_size):
+                entries = self._pending[: self._batch_size]
+                del self._pending[: self._batch_size]
+
+                if len(self._pending) < self._max_pending:
+                    self._space_available.set()
+
+                await self._write_batch(entries)
+
+            if not self._pending:
+                self._idle.set()
+
+    async def _write_batch(self, entries: list[tuple[Any, _PendingWrite]]) -> None:
+        loop = asyncio.get_running_loop()
+        batch = [point for point, _ in entries]
+
+        for attempt in range(self._max_retries + 1):
+            started_at = time.monotonic()
+
+            try:
+                await loop.run_in_executor(self._executor, self._upsert, batch)
+            except Exception as exc:
+                if attempt == self._max_retries:
+                    logger.exception(f'Failed to write {len(batch)} points to Qdrant, dropping them')
+                    self._points_failed += len(batch)
+                    self._resolve_writes(entries, stored=False)
+                    return
+
+                delay = self._retry_delay * 2**attempt
+                logger.warning(f'Failed to write {len(batch)} points to Qdrant, retrying in {delay:.1f}s: {exc!s}')
+                self._retries += 1
+                await asyncio.sleep(delay)
+            else:
+                self._write_time += time.monotonic() - started_at
+                self._points_written += len(batch)
+                self._batches_written += 1
+                self._resolve_writes(entries, stored=True)
+                return
+
+    @staticmethod
+    def _resolve_writes(entries: list[tuple[Any, _PendingWrite]], *, stored: bool) -> None:
+        for _, pending_write in entries:
+            pending_write.remaining -= 1
+
+            if not pending_write.future.done() and (not stored or pending_write.remaining == 0):
+                pending_write.future.set_result(stored)
@@ -1,15 +1,42 @@
 """Rate limiter for respectful CRA scraping."""
 
 import asyncio
+import logging
+import math
 import time
-from collections import defaultdict
-from typing import Any
+from typing import Any, Literal
+from urllib.parse import urlparse
 
-from crawlee._utils import console
+from pydantic import BaseModel, Field
+
+from crawlee._utils.recoverable_state import RecoverableState
+
+logger = logging.getLogger(__name__)
+
+_WINDOWS = {'minute': 60.0, 'hour': 3600.0, 'day': 86400.0}
+"""Length of the window of each limit in seconds."""
+
+_PRUNE_INTERVAL = 60.0
+"""Time in seconds between two evictions of the buckets of idle hosts."""
+
+
+class _RateLimiterState(BaseModel):
+    buckets: dict[str, dict[str, float]] = Field(default_factory=dict)
+    """Theoretical arrival times of the next request per host and per limit, as Unix timestamps."""
 
 
 class CRARateLimiter:
-    """Rate limiter with per-minute, per-hour, and per-day tracking."""
+    """Rate limiter with per-minute, per-hour, and per-day limits and a minimum delay between requests.
+
+    Each limit is enforced with the generic cell rate algorithm (GCRA), which keeps a single timestamp per limit
+    instead of the timestamps of all recent requests, so acquiring a slot is O(1). Limits are tracked separately
+    for each host.
+
+    A slot is reserved without waiting, and only then the caller sleeps until its slot, so callers do not block
+    each other. With persistence enabled, the state is stored in a key-value store and limits survive restarts.
+    Buckets of hosts whose theoretical arrival times are all in the past are evicted now and then, since they
+    allow a full burst just like a missing bucket, so the state does not grow with the number of hosts crawled.
+    """
 
     def __init__(
         self,
@@ -18,96 +45,145 @@ class CRARateLimiter:
         max_requests_per_hour: int = 500,
         max_requests_per_day: int = 5000,
         request_delay: float = 2.0,
+        persistence_enabled: Literal[True, False, 'explicit_only'] = False,
+        kvs_name: str = 'cra-rate-limiter',
     ) -> None:
         self._max_per_minute = max_requests_per_minute
         self._max_per_hour = max_requests_per_hour
         self._max_per_day = max_requests_per_day
         self._request_delay = request_delay
 
-        # Track request timestamps for different time windows
-        self._requests: defaultdict[str, list[float]] = defaultdict(list)
-        self._last_request_time = 0.0
-        self._lock = asyncio.Lock()
-
-    async def acquire(self) -> None:
-        """Acquire permission to make a request, blocking if necessary."""
-        async with self._lock:
-            current_time = time.time()
-
-            # Clean old requests from tracking
-            self._cleanup_old_requests(current_time)
-
-            # Check if we're within limits
-            await self._wait_if_rate_limited(current_time)
-
-            # Ensure minimum delay between requests
-            if self._last_request_time > 0:
-                time_since_last = current_time - self._last_request_time
-                if time_since_last < self._request_delay:
-                    wait_time = self._request_delay - time_since_last
-                    console.print(f'[yellow]Rate limiting: waiting {wait_time:.1f}s[/yellow]')
-                    await asyncio.sleep(wait_time)
-                    current_time = time.time()
-
-            # Record this request
-            self._requests['minute'].append(current_time)
-            self._requests['hour'].append(current_time)
-            self._requests['day'].append(current_time)
-            self._last_request_time = current_time
-
-    def _cleanup_old_requests(self, current_time: float) -> None:
-        """Remove old request timestamps outside the tracking windows."""
-        # Remove requests older than 1 minute
-        minute_cutoff = current_time - 60
-        self._requests['minute'] = [t for t in self._requests['minute'] if t > minute_cutoff]
-
-        # Remove requests older than 1 hour
-        hour_cutoff = current_time - 3600
-        self._requests['hour'] = [t for t in self._requests['hour'] if t > hour_cutoff]
-
-        # Remove requests older than 1 day
-        day_cutoff = current_time - 86400
-        self._requests['day'] = [t for t in self._requests['day'] if t > day_cutoff]
-
-    async def _wait_if_rate_limited(self, current_time: float) -> None:
-        """Wait if any rate limits would be exceeded."""
-        # Check per-minute limit
-        if len(self._requests['minute']) >= self._max_per_minute:
-            oldest_request = min(self._requests['minute'])
-            wait_time = 60 - (current_time - oldest_request) + 1
-            if wait_time > 0:
-                console.print(f'[red]Per-minute limit reached: waiting {wait_time:.1f}s[/red]')
-                await asyncio.sleep(wait_time)
-                return
-
-        # Check per-hour limit
-        if len(self._requests['hour']) >= self._max_per_hour:
-            oldest_request = min(self._requests['hour'])
-            wait_time = 3600 - (current_time - oldest_request) + 1
-            if wait_time > 0:
-                console.print(f'[red]Per-hour limit reached: waiting {wait_time:.1f}s[/red]')
-                await asyncio.sleep(wait_time)
-                return
-
-        # Check per-day limit
-        if len(self._requests['day']) >= self._max_per_day:
-            oldest_request = min(self._requests['day'])
-            wait_time = 86400 - (current_time - oldest_request) + 1
-            if wait_time > 0:
-                console.print(f'[red]Per-day limit reached: waiting {wait_time:.1f}s[/red]')
-                await asyncio.sleep(wait_time)
-                return
+        # Emission interval and burst tolerance of each limit
+        self._limits = dict[str, tuple[float, float]]()
+        for name, max_requests in (
+            ('minute', max_requests_per_minute),
+            ('hour', max_requests_per_hour),
+            ('day', max_requests_per_day),
+        ):
+            if max_requests > 0:
+                interval = _WINDOWS[name] / max_requests
+                self._limits[name] = (interval, _WINDOWS[name] - interval)
+
+        if request_delay > 0:
+            self._limits['delay'] = (request_delay, 0.0)
+
+        self._state = RecoverableState(
+            default_state=_RateLimiterState(),
+            persist_state_key='CRA_RATE_LIMITER_STATE',
+            persistence_enabled=persistence_enabled,
+            persist_state_kvs_name=kvs_name,
+            logger=logger,
+        )
+        self._initialize_lock = asyncio.Lock()
+        self._pruned_at = 0.0
+
+        # Statistics
+        self._requests = 0
+        self._delayed_requests = 0
+        self._total_wait_time = 0.0
+
+    async def initialize(self) -> None:
+        """Load the persisted state of the limits."""
+        async with self._initialize_lock:
+            if not self._state.is_initialized:
+                await self._state.initialize()
+
+    async def persist(self) -> None:
+        """Persist the state of the limits."""
+        if self._state.is_initialized:
+            await self._state.persist_state()
+
+    async def teardown(self) -> None:
+        """Persist the state of the limits and stop persisting it automatically."""
+        if self._state.is_initialized:
+            await self._state.teardown()
+
+    async def acquire(self, url: str | None = None) -> None:
+        """Acquire permission to make a request, blocking if necessary.
+
+        Args:
+            url: URL of the request, its host selects the limits that apply. Without it, a shared set of limits
+                is used.
+        """
+        if not self._state.is_initialized:
+            await self.initialize()
+
+        wait_time = self._reserve(self._get_bucket_key(url), time.time())
+
+        self._requests += 1
+        if wait_time > 0:
+            self._delayed_requests += 1
+            self._total_wait_time += wait_time
+            logger.debug(f'Rate limiting {url or "request"}: waiting {wait_time:.1f}s')
+            await asyncio.sleep(wait_time)
+
+    async def get_wait_time(self, url: str | None = None) -> float:
+        """Get the time in seconds a request would have to wait for its slot, without reserving it."""
+        if not self._state.is_initialized:
+            await self.initialize()
+
+        bucket = self._state.current_value.buckets.get(self._get_bucket_key(url), {})
+        now = time.time()
+        return self._get_start_time(bucket, now) - now
 
     def get_stats(self) -> dict[str, Any]:
         """Get current rate limiting statistics."""
-        current_time = time.time()
-        self._cleanup_old_requests(current_time)
+        now = time.time()
 
         return {
-            'requests_last_minute': len(self._requests['minute']),
-            'requests_last_hour': len(self._requests['hour']),
-            'requests_last_day': len(self._requests['day']),
+            'requests_last_minute': self._count_recent_requests('minute', now),
+            'requests_last_hour': self._count_recent_requests('hour', now),
+            'requests_last_day': self._count_recent_requests('day', now),
             'max_per_minute': self._max_per_minute,
             'max_per_hour': self._max_per_hour,
             'max_per_day': self._max_per_day,
+            'hosts': len(self._state.current_value.buckets) if self._state.is_initialized else 0,
+            'requests': self._requests,
+            'delayed_requests': self._delayed_requests,
+            'total_wait_time': self._total_wait_time,
         }
+
+    def _reserve(self, key: str, now: float) -> float:
+        """Reserve the earliest slot allowed by all limits of a bucket and return the time to wait for it."""
+        if now - self._pruned_at >= _PRUNE_INTERVAL:
+            self._prune_buckets(now)
+
+        bucket = self._state.current_value.buckets.setdefault(key, {})
+        start = self._get_start_time(bucket, now)
+
+        for name, (interval, _) in self._limits.items():
+            bucket[name] = max(bucket.get(name, start), start) + interval
+
+        return start - now
+
+    def _prune_buckets(self, now: float) -> None:
+        """Evict the buckets of idle hosts, whose theoretical arrival times are all in the past."""
+        buckets = self._state.current_value.buckets
+        for key in [key for key, bucket in buckets.items() if all(value <= now for value in bucket.values())]:
+            del buckets[key]
+
+        self._pruned_at = now
+
+    def _get_start_time(self, bucket: dict[str, float], now: float) -> float:
+        """Get the earliest time allowed by all limits of a bucket."""
+        # A request is allowed once the theoretical arrival time is within the burst tolerance of each limit.
+        start = now
+        for name, (_, tolerance) in self._limits.items():
+            start = max(start, bucket.get(name, now) - tolerance)
+
+        return start
+
+    @staticmethod
+    def _get_bucket_key(url: str | None) -> str:
+        return urlparse(url).netloc.lower() if url else ''
+
+    def _count_recent_requests(self, name: str, now: float) -> int:
+        """Estimate the number of requests counted against a limit across all hosts."""
+        if name not in self._limits or not self._state.is_initialized:
+            return 0
+
+        interval = self._limits[name][0]
+        return sum(
+            max(math.ceil((bucket.get(name, now) - now) / interval - 1e-9), 0)
+            for bucket in self._state.current_value.buckets.values()
+        )
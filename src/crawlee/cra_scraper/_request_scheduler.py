@@ -0,0 +1,185 @@
+"""Rate-limited request scheduling for CRA crawls."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
+from crawlee.request_loaders import RequestManager
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from crawlee import Request
+    from crawlee.storage_clients.models import ProcessedRequest
+
+    from ._rate_limiter import CRARateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+class CRARequestScheduler(RequestManager):
+    """Request manager which hands out requests only once the rate limiter allows fetching them.
+
+    The wait happens before the crawler takes the request, so no browser page or HTTP session sits idle while
+    a request waits for its slot. Requests whose slot is more than `max_wait` seconds away are returned to the
+    wrapped request manager right away, and `has_next_request` reports no request until the earliest slot of
+    the returned requests, so that the crawler does not hold a task slot for the whole wait. `wait_for_change`
+    wakes the crawler up once that slot comes.
+
+    Fetches of a request beyond the first one, such as the browser fallback of an adaptive crawler, are not covered
+    by the scheduler and have to be rate limited by the caller, see `consume_reservation`.
+
+    If a fetch is cancelled while it waits, e.g. by a timeout of the crawler or because the crawler shuts down,
+    the request is returned to the front of the wrapped request manager, so it does not stay in progress forever.
+    """
+
+    def __init__(
+        self,
+        request_manager: RequestManager,
+        rate_limiter: CRARateLimiter,
+        *,
+        max_wait: float = 1.0,
+    ) -> None:
+        self._request_manager = request_manager
+        self._rate_limiter = rate_limiter
+        self._max_wait = max_wait
+
+        self._postponed_until = 0.0
+        """Unix time of the earliest slot of the requests returned to the wrapped request manager."""
+
+        self._reserved = set[str]()
+        """Unique keys of requests handed out with a reserved slot that was not used for a fetch yet."""
+
+    def consume_reservation(self, request: Request) -> bool:
+        """Use the slot reserved for a request, returning `False` if it has no unused slot."""
+        if request.unique_key in self._reserved:
+            self._reserved.discard(request.unique_key)
+            return True
+
+        return False
+
+    @override
+    async def get_handled_count(self) -> int:
+        return await self._request_manager.get_handled_count()
+
+    @override
+    async def get_total_count(self) -> int:
+        return await self._request_manager.get_total_count()
+
+    @override
+    async def is_empty(self) -> bool:
+        return await self._request_manager.is_empty()
+
+    @override
+    async def is_finished(self) -> bool:
+        return await self._request_manager.is_finished()
+
+    @override
+    async def has_next_request(self) -> bool:
+        if self._get_postponed_delay() > 0:
+            return False
+
+        return await self._request_manager.has_next_request()
+
+    @property
+    @override
+    def notifies_changes(self) -> bool:
+        return self._request_manager.notifies_changes
+
+    @override
+    async def wait_for_change(self) -> None:
+        delay = self._get_postponed_delay()
+        if delay <= 0:
+            await self._request_manager.wait_for_change()
+            return
+
+        waiters = [
+            asyncio.create_task(self._request_manager.wait_for_change()),
+            asyncio.create_task(asyncio.sleep(delay)),
+        ]
+
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
+    @override
+    async def add_request(self, request: str | Request, *, forefront: bool = False) -> ProcessedRequest:
+        return await self._request_manager.add_request(request, forefront=forefront)
+
+    @override
+    async def add_requests(
+        self,
+        requests: Sequence[str | Request],
+        *,
+        forefront: bool = False,
+        batch_size: int = 1000,
+        wait_time_between_batches: timedelta = timedelta(seconds=1),
+        wait_for_all_requests_to_be_added: bool = False,
+        wait_for_all_requests_to_be_added_timeout: timedelta | None = None,
+    ) -> None:
+        return await self._request_manager.add_requests(
+            requests,
+            forefront=forefront,
+            batch_size=batch_size,
+            wait_time_between_batches=wait_time_between_batches,
+            wait_for_all_requests_to_be_added=wait_for_all_requests_to_be_added,
+            wait_for_all_requests_to_be_added_timeout=wait_for_all_requests_to_be_added_timeout,
+        )
+
+    @override
+    async def fetch_next_request(self) -> Request | None:
+        request = await self._request_manager.fetch_next_request()
+        if request is None:
+            return None
+
+        try:
+            wait_time = await self._rate_limiter.get_wait_time(request.url)
+            if wait_time > self._max_wait:
+                logger.debug(f'Rate limit of {request.url} resets in {wait_time:.1f}s, postponing the request')
+                ready_at = time.time() + wait_time
+                if self._get_postponed_delay() <= 0 or ready_at < self._postponed_until:
+                    self._postponed_until = ready_at
+                await self._request_manager.reclaim_request(request)
+                return None
+
+            await self._rate_limiter.acquire(request.url)
+        except BaseException:
+            # Shielded, so that a repeated cancellation cannot interrupt the reclaim.
+            await asyncio.shield(self._request_manager.reclaim_request(request, forefront=True))
+            raise
+
+        self._reserved.add(request.unique_key)
+        return request
+
+    @override
+    async def reclaim_request(self, request: Request, *, forefront: bool = False) -> ProcessedRequest | None:
+        self._reserved.discard(request.unique_key)
+        return await self._request_manager.reclaim_request(request, forefront=forefront)
+
+    @override
+    async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
+        self._reserved.discard(request.unique_key)
+        return await self._request_manager.mark_request_as_handled(request)
+
+    @override
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        for request in requests:
+            self._reserved.discard(request.unique_key)
+        return await self._request_manager.mark_requests_as_handled(requests)
+
+    @override
+    async def drop(self) -> None:
+        self._reserved.clear()
+        await self._request_manager.drop()
+
+    def _get_postponed_delay(self) -> float:
+        """Get the time in seconds until the earliest slot of the postponed requests, if it is still ahead."""
+        return self._postponed_until - time.time()
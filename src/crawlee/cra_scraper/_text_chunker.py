@@ -0,0 +1,91 @@
+"""Token-aware text chunking for CRA tax data."""
+
+from __future__ import annotations
+
+import re
+from bisect import bisect_left, bisect_right
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+_SENTENCE_END_PATTERN = re.compile(r'[.!?]\s+')
+
+_TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+def tokenize_words(text: str) -> list[tuple[int, int]]:
+    """Get the offsets of words and punctuation, an approximation of tokens for when no tokenizer is available."""
+    return [match.span() for match in _TOKEN_PATTERN.finditer(text)]
+
+
+class CRATextChunker:
+    """Chunker which splits text into overlapping chunks of at most a given number of tokens.
+
+    The text is tokenized and scanned for sentence boundaries once, after which chunks are found by bisecting
+    the token and sentence offsets. Chunks end at the last sentence boundary that fits, unless that would make
+    them shorter than half of the token limit. Chunks are yielded lazily as `(start, end)` character offsets into
+    the original text, so no substrings are created until the caller slices them.
+    """
+
+    def __init__(
+        self,
+        tokenize: Callable[[str], Sequence[tuple[int, int]]] = tokenize_words,
+        *,
+        max_tokens: int = 256,
+        overlap_tokens: int = 32,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            tokenize: Function returning the `(start, end)` character offsets of the tokens of a text, without
+                special tokens, e.g. the offset mapping of a fast Hugging Face tokenizer.
+            max_tokens: The default maximum number of tokens of a chunk.
+            overlap_tokens: The number of tokens shared by consecutive chunks.
+        """
+        self._tokenize = tokenize
+        self._max_tokens = max_tokens
+        self._overlap_tokens = overlap_tokens
+
+    @property
+    def max_tokens(self) -> int:
+        """The default maximum number of tokens of a chunk."""
+        return self._max_tokens
+
+    def count_tokens(self, text: str) -> int:
+        """Count the tokens of a text."""
+        return len(self._tokenize(text))
+
+    def iter_spans(self, text: str, *, max_tokens: int | None = None) -> Iterator[tuple[int, int]]:
+        """Yield the `(start, end)` character offsets of the chunks of a text.
+
+        Args:
+            text: The text to split.
+            max_tokens: The maximum number of tokens of a chunk, overriding the default one.
+        """
+        max_tokens = max(max_tokens or self._max_tokens, 1)
+        overlap_tokens = min(self._overlap_tokens, max_tokens // 2)
+
+        # Tokens with empty offsets are special tokens, which do not belong to any chunk.
+        tokens = [(start, end) for start, end in self._tokenize(text) if end > start]
+        if not tokens:
+            return
+
+        token_starts = [start for start, _ in tokens]
+        sentence_ends = [match.end() for match in _SENTENCE_END_PATTERN.finditer(text)]
+        first = 0
+
+        while True:
+            last = first + max_tokens
+            if last >= len(tokens):
+                yield tokens[first][0], tokens[-1][1]
+                return
+
+            # Break after the last sentence ending in the second half of the chunk, if there is one.
+            min_end = tokens[first + max_tokens // 2][0]
+            sentence_index = bisect_right(sentence_ends, tokens[last][0]) - 1
+            if sentence_index >= 0 and sentence_ends[sentence_index] > min_end:
+                last = bisect_left(token_starts, sentence_ends[sentence_index])
+
+            yield tokens[first][0], tokens[last - 1][1]
+            first = max(last - overlap_tokens, first + 1)
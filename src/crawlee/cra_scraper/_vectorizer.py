@@ -2,8 +2,18 @@
 
 import asyncio
 import logging
-import re
-from typing import Any
+import warnings
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._embedding_cache import CRAEmbeddingCache
+from ._embedding_service import CRAEmbeddingService
+from ._text_chunker import CRATextChunker, tokenize_words
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +22,15 @@ try:
 except ImportError:
     SentenceTransformer = None  # type: ignore
 
+_CHARS_PER_TOKEN = 4
+"""Rough number of characters per model token in English text, used to convert the deprecated character sizes."""
+
+
+def _tokenize_with_offsets(tokenizer: Any, text: str) -> list[tuple[int, int]]:
+    """Get the character offsets of the tokens of a text with a fast Hugging Face tokenizer."""
+    encoding = tokenizer(text, add_special_tokens=False, return_offsets_mapping=True)
+    return [(start, end) for start, end in encoding['offset_mapping']]
+
 
 class CRAVectorizer:
     """Text vectorizer using sentence transformers for semantic search."""
@@ -20,10 +39,29 @@ class CRAVectorizer:
         self,
         *,
         model_name: str = 'all-MiniLM-L6-v2',
-        chunk_size: int = 3000,
-        overlap_size: int = 500,
+        chunk_tokens: int | None = None,
+        overlap_tokens: int = 32,
         max_chunks_per_page: int = 10,
+        batch_size: int = 32,
+        max_batch_delay: float = 0.05,
+        max_queue_size: int = 1024,
+        cache_size: int = 10_000,
+        cache_dir: str | Path | None = None,
+        chunk_size: int | None = None,
+        overlap_size: int | None = None,
     ) -> None:
+        if chunk_size is not None or overlap_size is not None:
+            warnings.warn(
+                'The `chunk_size` and `overlap_size` arguments in characters are deprecated, use `chunk_tokens` and '
+                '`overlap_tokens` in model tokens instead.',
+                category=DeprecationWarning,
+                stacklevel=2,
+            )
+            if chunk_size is not None and chunk_tokens is None:
+                chunk_tokens = max(chunk_size // _CHARS_PER_TOKEN, 1)
+            if overlap_size is not None:
+                overlap_tokens = overlap_size // _CHARS_PER_TOKEN
+
         if SentenceTransformer is None:
             raise ImportError(
                 'sentence-transformers is required for vectorization. Install with: pip install crawlee[cra-scraper]'
@@ -33,10 +71,28 @@ class CRAVectorizer:
         self._model: SentenceTransformer | None = None
         self._vector_size = 384  # Default for all-MiniLM-L6-v2
 
-        # Chunking configuration
-        self._chunk_size = chunk_size
-        self._overlap_size = overlap_size
+        # Chunking configuration, chunks are sized in tokens of the model (its maximum sequence length by default)
+        self._chunk_tokens = chunk_tokens
+        self._overlap_tokens = overlap_tokens
         self._max_chunks_per_page = max_chunks_per_page
+        self._chunker: CRATextChunker | None = None
+
+        # Embedding service configuration, texts of all in-flight pages are encoded in shared batches
+        self._batch_size = batch_size
+        self._max_batch_delay = max_batch_delay
+        self._max_queue_size = max_queue_size
+        self._embedding_service: CRAEmbeddingService | None = None
+
+        # Embeddings of texts seen before are reused, across runs if a cache directory is given
+        self._embedding_cache = (
+            CRAEmbeddingCache(
+                model_name=model_name,
+                max_size=cache_size,
+                path=Path(cache_dir) if cache_dir is not None else None,
+            )
+            if cache_size > 0
+            else None
+        )
 
     async def initialize(self) -> None:
         """Initialize the sentence transformer model."""
@@ -56,79 +112,131 @@ class CRAVectorizer:
 
     async def vectorize_text(self, text: str) -> list[float]:
         """Convert text to vector representation."""
-        if self._model is None:
-            await self.initialize()
-
-        # Truncate text if too long (model has token limits)
-        if len(text) > 8000:  # Conservative limit
-            text = text[:8000] + '...'
-
-        # Generate embedding in executor to avoid blocking
-        loop = asyncio.get_event_loop()
-        embedding = await loop.run_in_executor(None, self._model.encode, text)
-
-        return embedding.tolist()
+        vectors = await self.vectorize_batch([text])
+        return vectors[0]
 
     async def vectorize_batch(self, texts: list[str]) -> list[list[float]]:
-        """Vectorize multiple texts efficiently."""
-        if self._model is None:
-            await self.initialize()
+        """Vectorize multiple texts efficiently.
 
-        # Truncate texts if needed
+        Cached embeddings are reused, the remaining texts are encoded by the embedding service together with texts
+        of other concurrent calls.
+        """
+        # Truncate texts if too long (model has token limits)
         processed_texts = []
         for text in texts:
-            if len(text) > 8000:
+            if len(text) > 8000:  # Conservative limit
                 text = text[:8000] + '...'
             processed_texts.append(text)
 
-        # Generate embeddings in executor
-        loop = asyncio.get_event_loop()
-        embeddings = await loop.run_in_executor(None, self._model.encode, processed_texts)
+        if self._embedding_cache is None:
+            embedding_service = await self._get_embedding_service()
+            return await embedding_service.embed(processed_texts)
+
+        vectors = await asyncio.to_thread(self._embedding_cache.get_many, processed_texts)
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
 
-        return [emb.tolist() for emb in embeddings]
+        # The model is only needed (and loaded) if some of the texts are not cached
+        if missing:
+            embedding_service = await self._get_embedding_service()
+            missing_texts = [processed_texts[index] for index in missing]
+            missing_vectors = await embedding_service.embed(missing_texts)
+            await asyncio.to_thread(self._embedding_cache.put_many, missing_texts, missing_vectors)
 
-    def _split_text_into_chunks(self, text: str) -> list[str]:
-        """Split text into overlapping chunks for comprehensive vectorization."""
-        if len(text) <= self._chunk_size:
-            return [text]
+            for index, vector in zip(missing, missing_vectors, strict=True):
+                vectors[index] = vector
 
-        chunks = []
-        start = 0
+        return [vector for vector in vectors if vector is not None]
 
-        while start < len(text) and len(chunks) < self._max_chunks_per_page:
-            # Calculate end position
-            end = start + self._chunk_size
+    async def close(self) -> None:
+        """Wait for pending embeddings and release the embedding executor."""
+        if self._embedding_service is not None:
+            await self._embedding_service.close()
+            self._embedding_service = None
 
-            # If this is not the last chunk, try to break at sentence boundary
-            if end < len(text):
-                # Look for sentence endings within the last 200 characters
-                search_start = max(start + self._chunk_size - 200, start)
-                sentence_endings = [m.end() for m in re.finditer(r'[.!?]\s+', text[search_start:end])]
+        if self._embedding_cache is not None:
+            await asyncio.to_thread(self._embedding_cache.close)
 
-                if sentence_endings:
-                    # Use the last sentence ending as the chunk boundary
-                    end = search_start + sentence_endings[-1]
+    def get_stats(self) -> dict[str, Any]:
+        """Get embedding throughput and queue statistics."""
+        if self._embedding_service is None:
+            return {}
 
-                # Ensure we don't create chunks smaller than overlap size
-                if end - start < self._overlap_size:
-                    end = start + self._chunk_size
+        return self._embedding_service.get_stats()
 
-            # Extract chunk
-            chunk = text[start:end].strip()
-            if chunk:
-                chunks.append(chunk)
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get embedding cache hit and miss statistics."""
+        if self._embedding_cache is None:
+            return {}
 
-            # Move start position with overlap
-            if end >= len(text):
-                break
+        return self._embedding_cache.get_stats()
 
-            start = end - self._overlap_size
+    async def _get_embedding_service(self) -> CRAEmbeddingService:
+        """Get the embedding service, loading the model first if needed."""
+        if self._model is None:
+            await self.initialize()
+
+        if self._embedding_service is None:
+            self._embedding_service = CRAEmbeddingService(
+                partial(self._model.encode, batch_size=self._batch_size, show_progress_bar=False),
+                max_batch_size=self._batch_size,
+                max_batch_delay=self._max_batch_delay,
+                max_queue_size=self._max_queue_size,
+            )
+
+        return self._embedding_service
 
-            # Ensure we make progress even with overlap
-            if len(chunks) > 1 and start <= end - self._chunk_size + self._overlap_size:
-                start = end - (self._overlap_size // 2)
+    def _get_chunker(self) -> CRATextChunker:
+        """Get the text chunker, which uses the fast tokenizer of the model once it is loaded."""
+        if self._chunker is not None:
+            return self._chunker
 
-        return chunks
+        tokenize: Callable[[str], list[tuple[int, int]]] = tokenize_words
+        max_tokens = self._chunk_tokens or 256
+
+        if self._model is not None:
+            tokenizer = getattr(self._model, 'tokenizer', None)
+            if getattr(tokenizer, 'is_fast', False) is True:
+                tokenize = partial(_tokenize_with_offsets, tokenizer)
+            else:
+                logger.warning(f'Model {self._model_name} has no fast tokenizer, chunks are sized approximately')
+
+            max_seq_length = getattr(self._model, 'max_seq_length', None)
+            if self._chunk_tokens is None and isinstance(max_seq_length, int):
+                max_tokens = max_seq_length
+
+        chunker = CRATextChunker(tokenize, max_tokens=max_tokens, overlap_tokens=self._overlap_tokens)
+
+        # The chunker is only kept once it uses the tokenizer of the model, so that chunks do not change later
+        if self._model is not None:
+            self._chunker = chunker
+
+        return chunker
+
+    def _get_content_token_budget(self, chunker: CRATextChunker, data: dict[str, Any]) -> int:
+        """Get the number of tokens left for the content of a chunk after the other parts of its combined text."""
+        # The part numbers are not known yet, a two-digit placeholder is never shorter than the actual ones
+        prefix = self.create_combined_text(
+            {**data, 'title': f'{data.get("title", "")} (Part 10/10)', 'content': '', 'chunk_text': ''}
+        )
+        prefix_tokens = chunker.count_tokens(f'{prefix} | Content: ')
+
+        # Two special tokens are added by the model, at least a quarter of the limit is always left for the content
+        max_tokens = chunker.max_tokens
+        return max(max_tokens - prefix_tokens - 2, max_tokens // 4)
+
+    def _split_text_into_chunks(self, text: str, *, max_tokens: int | None = None) -> list[str]:
+        """Split text into overlapping chunks which fit into the model without truncation."""
+        chunker = self._get_chunker()
+        spans = list(islice(chunker.iter_spans(text, max_tokens=max_tokens), self._max_chunks_per_page + 1))
+
+        if len(spans) > self._max_chunks_per_page:
+            spans = spans[: self._max_chunks_per_page]
+            logger.warning(
+                f'Text exceeds {self._max_chunks_per_page} chunks, '
+                f'dropping the last {len(text) - spans[-1][1]} characters'
+            )
+
+        return [text[start:end] for start, end in spans]
 
     def _create_chunk_metadata(
         self, base_data: dict[str, Any], chunk_text: str, chunk_index: int, total_chunks: int
@@ -184,8 +292,14 @@ class CRAVectorizer:
         """Vectorize tax data using chunking approach and return list of vectorized chunks."""
         content = data.get('content', '')
 
+        # Chunks are sized by the tokenizer of the model
+        if self._model is None:
+            await self.initialize()
+
         # Split content into chunks
-        chunks = self._split_text_into_chunks(content)
+        chunker = self._get_chunker()
+        max_tokens = self._get_content_token_budget(chunker, data)
+        chunks = await asyncio.to_thread(self._split_text_into_chunks, content, max_tokens=max_tokens)
         logger.info(f'Split content into {len(chunks)} chunks for vectorization')
 
         # Create chunk data
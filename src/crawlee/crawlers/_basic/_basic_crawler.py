@@ -9,21 +9,20 @@ import tempfile
 import threading
 import traceback
 from asyncio import CancelledError
+from collections import defaultdict
 from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable, Sequence
 from contextlib import AsyncExitStack, suppress
 from datetime import timedelta
-from functools import partial
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Generic, Literal, cast
-from urllib.parse import ParseResult, urlparse
+from urllib.parse import SplitResult, urlsplit
 from weakref import WeakKeyDictionary
 
-from cachetools import LRUCache
 from tldextract import TLDExtract
 from typing_extensions import NotRequired, TypedDict, TypeVar, Unpack, assert_never
-from yarl import URL
 
-from crawlee import EnqueueStrategy, Glob, RequestTransformAction, service_locator
+from crawlee import EnqueueStrategy, RequestTransformAction, service_locator
 from crawlee._autoscaling import AutoscaledPool, Snapshotter, SystemStatus
 from crawlee._log_config import configure_logger, get_configured_log_level, string_to_log_level
 from crawlee._request import Request, RequestOptions, RequestState
@@ -41,7 +40,8 @@ from crawlee._types import (
 from crawlee._utils.docs import docs_group
 from crawlee._utils.file import export_csv_to_stream, export_json_to_stream
 from crawlee._utils.recurring_task import RecurringTask
-from crawlee._utils.robots import RobotsTxtFile
+from crawlee._utils.robots import RobotsTxtCache, RobotsTxtFile
+from crawlee._utils.url_patterns import UrlPatternFilter
 from crawlee._utils.urls import convert_to_absolute_url, is_url_absolute
 from crawlee._utils.wait import wait_for
 from crawlee._utils.web import is_status_code_client_error, is_status_code_server_error
@@ -62,18 +62,20 @@ from crawlee.sessions import SessionPool
 from crawlee.statistics import Statistics, StatisticsState
 from crawlee.storages import Dataset, KeyValueStore, RequestQueue
 
+from ._commit_batcher import CommitBatcher
 from ._context_pipeline import ContextPipeline
 from ._logging_utils import (
     get_one_line_error_summary_if_possible,
     reduce_asyncio_timeout_error_to_relevant_traceback_parts,
 )
+from ._request_prefetcher import PrefetchedRequest, RequestPrefetcher
 
 if TYPE_CHECKING:
-    import re
     from collections.abc import Iterator
     from contextlib import AbstractAsyncContextManager
 
     from crawlee._types import (
+        AddRequestsKwargs,
         ConcurrencySettings,
         EnqueueLinksFunction,
         ExtractLinksFunction,
@@ -162,6 +164,18 @@ class _BasicCrawlerOptions(TypedDict):
     request_handler_timeout: NotRequired[timedelta]
     """Maximum duration allowed for a single request handler to run."""
 
+    request_prefetch_size: NotRequired[int]
+    """Number of requests fetched ahead of the workers, together with their sessions and proxies, so that workers
+    do not wait for the request manager. Buffered requests are reclaimed when the crawler stops. `0` disables
+    the prefetching."""
+
+    commit_batch_size: NotRequired[int]
+    """Maximum number of successfully handled requests whose results are committed and which are marked as handled
+    together, in a single operation on each storage. `1` commits each request on its own."""
+
+    commit_batch_max_latency: NotRequired[timedelta]
+    """Maximum time a handled request waits for its batch to be committed, if `commit_batch_size` is above 1."""
+
     abort_on_error: NotRequired[bool]
     """If True, the crawler stops immediately when any request handler error occurs."""
 
@@ -194,6 +208,10 @@ class _BasicCrawlerOptions(TypedDict):
     """If set to `True`, the crawler will automatically try to fetch the robots.txt file for each domain,
     and skip those that are not allowed. This also prevents disallowed URLs to be added via `EnqueueLinksFunction`."""
 
+    persist_robots_txt_cache: NotRequired[bool]
+    """If set to `True`, fetched robots.txt files are persisted in a named key-value store and reused by later runs
+    until they expire."""
+
     status_message_logging_interval: NotRequired[timedelta]
     """Interval for logging the crawler status messages."""
 
@@ -255,6 +273,7 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
     """
 
     _CRAWLEE_STATE_KEY = 'CRAWLEE_STATE'
+    _REQUEST_MANAGER_POLL_INTERVAL = timedelta(seconds=0.5)
     _request_handler_timeout_text = 'Request handler timed out after'
 
     def __init__(
@@ -278,12 +297,16 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         ignore_http_error_status_codes: Iterable[int] | None = None,
         concurrency_settings: ConcurrencySettings | None = None,
         request_handler_timeout: timedelta = timedelta(minutes=1),
+        request_prefetch_size: int = 0,
+        commit_batch_size: int = 1,
+        commit_batch_max_latency: timedelta = timedelta(milliseconds=100),
         statistics: Statistics[TStatisticsState] | None = None,
         abort_on_error: bool = False,
         keep_alive: bool = False,
         configure_logging: bool = True,
         statistics_log_format: Literal['table', 'inline'] = 'table',
         respect_robots_txt_file: bool = False,
+        persist_robots_txt_cache: bool = False,
         status_message_logging_interval: timedelta = timedelta(seconds=10),
         status_message_callback: Callable[[StatisticsState, StatisticsState | None, str], Awaitable[str | None]]
         | None = None,
@@ -326,6 +349,14 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
                 as successful responses.
             concurrency_settings: Settings to fine-tune concurrency levels.
             request_handler_timeout: Maximum duration allowed for a single request handler to run.
+            request_prefetch_size: Number of requests fetched ahead of the workers, together with their sessions and
+                proxies, so that workers do not wait for the request manager. Buffered requests are reclaimed when
+                the crawler stops. `0` disables the prefetching.
+            commit_batch_size: Maximum number of successfully handled requests whose results are committed and which
+                are marked as handled together, in a single operation on each storage. `1` commits each request
+                on its own.
+            commit_batch_max_latency: Maximum time a handled request waits for its batch to be committed,
+                if `commit_batch_size` is above 1.
             statistics: A custom `Statistics` instance, allowing the use of non-default configuration.
             abort_on_error: If True, the crawler stops immediately when any request handler error occurs.
             keep_alive: If True, it will keep crawler alive even if there are no requests in queue.
@@ -336,6 +367,8 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             respect_robots_txt_file: If set to `True`, the crawler will automatically try to fetch the robots.txt file
                 for each domain, and skip those that are not allowed. This also prevents disallowed URLs to be added
                 via `EnqueueLinksFunction`
+            persist_robots_txt_cache: If set to `True`, fetched robots.txt files are persisted in a named key-value
+                store and reused by later runs until they expire.
             status_message_logging_interval: Interval for logging the crawler status messages.
             status_message_callback: Allows overriding the default status message. The default status message is
                 provided in the parameters. Returning `None` suppresses the status message.
@@ -435,16 +468,36 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         self._additional_context_managers = _additional_context_managers or []
 
         # Internal, not explicitly configurable components
-        self._robots_txt_file_cache: LRUCache[str, RobotsTxtFile] = LRUCache(maxsize=1000)
-        self._robots_txt_lock = asyncio.Lock()
+        self._robots_txt_cache = RobotsTxtCache(
+            self._find_txt_file_for_url,
+            persistence_enabled=persist_robots_txt_cache,
+        )
+        self._request_prefetcher = (
+            RequestPrefetcher(self._prefetch_next_request, self._reclaim_prefetched_request, size=request_prefetch_size)
+            if request_prefetch_size > 0
+            else None
+        )
+        self._commit_batcher = (
+            CommitBatcher[BasicCrawlingContext](
+                self._commit_request_handler_results,
+                self._commit_and_mark_request_as_handled,
+                max_size=commit_batch_size,
+                max_latency=commit_batch_max_latency,
+            )
+            if commit_batch_size > 1
+            else None
+        )
         self._tld_extractor = TLDExtract(cache_dir=tempfile.TemporaryDirectory().name)
+        self._get_domain = lru_cache(maxsize=10_000)(self._extract_domain)
         self._snapshotter = Snapshotter.from_config(config)
         self._autoscaled_pool = AutoscaledPool(
             system_status=SystemStatus(self._snapshotter),
             concurrency_settings=concurrency_settings,
             is_finished_function=self.__is_finished_function,
             is_task_ready_function=self.__is_task_ready_function,
+            wait_for_task_ready_function=self.__wait_for_task_ready_function,
             run_task_function=self.__run_task_function,
+            statistics=self._statistics,
         )
         self._crawler_state_rec_task = RecurringTask(
             func=self._crawler_state_task, delay=status_message_logging_interval
@@ -545,6 +598,43 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             proxy_tier=None,
         )
 
+    async def _get_session_for_request(self, request: Request) -> Session | None:
+        """Get the session bound to the request, or any session from the pool if the request is not bound to one."""
+        if request.session_id:
+            return await self._get_session_by_id(request.session_id)
+
+        return await self._get_session()
+
+    async def _prefetch_next_request(self) -> PrefetchedRequest | None:
+        """Fetch the next request and resolve its session and proxy, for the request prefetcher."""
+        request_manager = await self.get_request_manager()
+
+        request = await wait_for(
+            lambda: request_manager.fetch_next_request(),
+            timeout=self._internal_timeout,
+            timeout_message=f'Fetching next request failed after {self._internal_timeout.total_seconds()} seconds',
+            logger=self._logger,
+            max_retries=3,
+        )
+
+        if request is None:
+            return None
+
+        try:
+            session = await self._get_session_for_request(request)
+            proxy_info = await self._get_proxy_info(request, session)
+            # Warm up the robots.txt cache, so that the worker does not wait for it.
+            await self._get_robots_txt_file_for_url(request.url)
+        except Exception:
+            await self._reclaim_prefetched_request(request)
+            raise
+
+        return PrefetchedRequest(request=request, session=session, proxy_info=proxy_info)
+
+    async def _reclaim_prefetched_request(self, request: Request) -> None:
+        request_manager = await self.get_request_manager()
+        await request_manager.reclaim_request(request, forefront=True)
+
     async def get_request_manager(self) -> RequestManager:
         """Return the configured request manager. If none is configured, open and return the default request queue."""
         if not self._request_manager:
@@ -698,7 +788,10 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
                 self._statistics,
                 self._session_pool if self._use_session_pool else None,
                 self._http_client,
+                self._robots_txt_cache if self._respect_robots_txt_file else None,
                 *self._additional_context_managers,
+                # Entered last, so that buffered requests are reclaimed before the other components are exited.
+                self._request_prefetcher,
             )
             if cm and getattr(cm, 'active', False) is False
         ]
@@ -732,6 +825,11 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         allowed_requests = []
         skipped = []
 
+        # Fetch the robots.txt files of all origins at once instead of one by one below.
+        await self.prefetch_robots_txt_files(
+            [request.url if isinstance(request, Request) else request for request in requests]
+        )
+
         for request in requests:
             check_url = request.url if isinstance(request, Request) else request
             if await self._is_allowed_based_on_robots_txt_file(check_url):
@@ -757,6 +855,21 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             wait_for_all_requests_to_be_added_timeout=wait_for_all_requests_to_be_added_timeout,
         )
 
+    async def prefetch_robots_txt_files(self, urls: Iterable[str], *, max_concurrency: int = 20) -> None:
+        """Fetch the robots.txt files for the origins of the given URLs concurrently.
+
+        Robots.txt files that are already cached are not fetched again. Does nothing unless the crawler respects
+        robots.txt files.
+
+        Args:
+            urls: URLs whose origins' robots.txt files should be fetched.
+            max_concurrency: The maximum number of robots.txt files fetched at the same time.
+        """
+        if not self._respect_robots_txt_file:
+            return
+
+        await self._robots_txt_cache.prefetch(urls, max_concurrency=max_concurrency)
+
     async def _use_state(
         self,
         default_value: dict[str, JsonSerializable] | None = None,
@@ -864,8 +977,8 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         """
         if context.request.loaded_url is not None and not self._check_enqueue_strategy(
             context.request.enqueue_strategy,
-            origin_url=urlparse(context.request.url),
-            target_url=urlparse(context.request.loaded_url),
+            origin_url=urlsplit(context.request.url),
+            target_url=urlsplit(context.request.loaded_url),
         ):
             raise ContextPipelineInterruptedError(
                 f'Skipping URL {context.request.loaded_url} (redirected from {context.request.url})'
@@ -925,8 +1038,9 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
     ) -> Iterator[TRequestIterator]:
         """Filter requests based on the enqueue strategy and URL patterns."""
         limit = kwargs.get('limit')
-        parsed_origin_url = urlparse(origin_url)
+        parsed_origin_url = urlsplit(origin_url)
         strategy = kwargs.get('strategy', 'all')
+        url_pattern_filter = UrlPatternFilter(kwargs.get('include'), kwargs.get('exclude'))
 
         if strategy == 'all' and not parsed_origin_url.hostname:
             self.log.warning(f'Skipping enqueue: Missing hostname in origin_url = {origin_url}.')
@@ -937,15 +1051,20 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
 
         for request in request_iterator:
             target_url = request.url if isinstance(request, Request) else request
-            parsed_target_url = urlparse(target_url)
 
-            if warning_flag and strategy != 'all' and not parsed_target_url.hostname:
-                self.log.warning(f'Skipping enqueue url: Missing hostname in target_url = {target_url}.')
-                warning_flag = False
+            # The `all` strategy accepts any target, so the URL does not need to be parsed.
+            if strategy != 'all':
+                parsed_target_url = urlsplit(target_url)
 
-            if self._check_enqueue_strategy(
-                strategy, target_url=parsed_target_url, origin_url=parsed_origin_url
-            ) and self._check_url_patterns(target_url, kwargs.get('include'), kwargs.get('exclude')):
+                if not self._check_enqueue_strategy(
+                    strategy, target_url=parsed_target_url, origin_url=parsed_origin_url
+                ):
+                    if warning_flag and not parsed_target_url.hostname:
+                        self.log.warning(f'Skipping enqueue url: Missing hostname in target_url = {target_url}.')
+                        warning_flag = False
+                    continue
+
+            if url_pattern_filter.matches(target_url):
                 yield request
 
                 limit = limit - 1 if limit is not None else None
@@ -956,14 +1075,18 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         self,
         strategy: EnqueueStrategy,
         *,
-        target_url: ParseResult,
-        origin_url: ParseResult,
+        target_url: SplitResult,
+        origin_url: SplitResult,
     ) -> bool:
         """Check if a URL matches the enqueue_strategy."""
         if strategy == 'all':
             return True
 
-        if origin_url.hostname is None or target_url.hostname is None:
+        # Parsing the hostname is not free, so it is read only once per URL.
+        origin_hostname = origin_url.hostname
+        target_hostname = target_url.hostname
+
+        if origin_hostname is None or target_hostname is None:
             self.log.debug(
                 f'Skipping enqueue: Missing hostname in origin_url = {origin_url.geturl()} or '
                 f'target_url = {target_url.geturl()}'
@@ -971,51 +1094,23 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             return False
 
         if strategy == 'same-hostname':
-            return target_url.hostname == origin_url.hostname
+            return target_hostname == origin_hostname
 
         if strategy == 'same-domain':
-            origin_domain = self._tld_extractor.extract_str(origin_url.hostname).domain
-            target_domain = self._tld_extractor.extract_str(target_url.hostname).domain
-            return origin_domain == target_domain
+            return self._get_domain(origin_hostname) == self._get_domain(target_hostname)
 
         if strategy == 'same-origin':
             return (
-                target_url.hostname == origin_url.hostname
+                target_hostname == origin_hostname
                 and target_url.scheme == origin_url.scheme
                 and target_url.port == origin_url.port
             )
 
         assert_never(strategy)
 
-    def _check_url_patterns(
-        self,
-        target_url: str,
-        include: Sequence[re.Pattern[Any] | Glob] | None,
-        exclude: Sequence[re.Pattern[Any] | Glob] | None,
-    ) -> bool:
-        """Check if a URL matches configured include/exclude patterns."""
-        # If the URL matches any `exclude` pattern, reject it
-        for pattern in exclude or ():
-            if isinstance(pattern, Glob):
-                pattern = pattern.regexp  # noqa: PLW2901
-
-            if pattern.match(target_url) is not None:
-                return False
-
-        # If there are no `include` patterns and the URL passed all `exclude` patterns, accept the URL
-        if include is None:
-            return True
-
-        # If the URL matches any `include` pattern, accept it
-        for pattern in include:
-            if isinstance(pattern, Glob):
-                pattern = pattern.regexp  # noqa: PLW2901
-
-            if pattern.match(target_url) is not None:
-                return True
-
-        # The URL does not match any `include` pattern - reject it
-        return False
+    def _extract_domain(self, hostname: str) -> str:
+        """Get the domain of a hostname, without its subdomains and public suffix. Memoized as `_get_domain`."""
+        return self._tld_extractor.extract_str(hostname).domain
 
     async def _handle_request_retries(
         self,
@@ -1192,34 +1287,111 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         result = self._context_result_map[context]
 
         request_manager = await self.get_request_manager()
-        origin = context.request.loaded_url or context.request.url
 
         for add_requests_call in result.add_requests_calls:
-            requests = list[Request]()
+            await request_manager.add_requests(self._get_requests_to_enqueue(context, add_requests_call))
 
-            base_url = url if (url := add_requests_call.get('base_url')) else origin
+        for push_data_call in result.push_data_calls:
+            await self._push_data(**push_data_call)
 
-            requests_iterator = self._convert_url_to_request_iterator(add_requests_call['requests'], base_url)
+        await self._commit_key_value_store_changes(result, get_kvs=self.get_key_value_store)
 
-            enqueue_links_kwargs: EnqueueLinksKwargs = {k: v for k, v in add_requests_call.items() if k != 'requests'}  # type: ignore[assignment]
+    async def _commit_and_mark_request_as_handled(self, context: BasicCrawlingContext) -> None:
+        """Commit request handler result for the input `context` and mark its request as handled."""
+        await self._commit_request_handler_result(context)
 
-            filter_requests_iterator = self._enqueue_links_filter_iterator(
-                requests_iterator, context.request.url, **enqueue_links_kwargs
-            )
+        request_manager = await self.get_request_manager()
+        await wait_for(
+            lambda: request_manager.mark_request_as_handled(context.request),
+            timeout=self._internal_timeout,
+            timeout_message='Marking request as handled timed out after '
+            f'{self._internal_timeout.total_seconds()} seconds',
+            logger=self._logger,
+            max_retries=3,
+        )
 
-            for dst_request in filter_requests_iterator:
-                # Update the crawl depth of the request.
-                dst_request.crawl_depth = context.request.crawl_depth + 1
+    async def _commit_request_handler_results(self, contexts: Sequence[BasicCrawlingContext]) -> None:
+        """Commit request handler results for multiple contexts at once and mark their requests as handled.
 
-                if self._max_crawl_depth is None or dst_request.crawl_depth <= self._max_crawl_depth:
-                    requests.append(dst_request)
+        The added requests of all contexts are added in one call and their data is pushed in one call per dataset.
+        All results are committed before any request is marked as handled, so if the crawler crashes in between,
+        the requests are processed again rather than their results getting lost.
 
+        Each step clears the parts of the results it committed. If a later step fails, the batcher commits the
+        contexts one by one, and only the remaining parts are committed again. In particular, data is never pushed
+        twice.
+        """
+        request_manager = await self.get_request_manager()
+        results = [self._context_result_map[context] for context in contexts]
+
+        requests = [
+            request
+            for context, result in zip(contexts, results, strict=True)
+            for add_requests_call in result.add_requests_calls
+            for request in self._get_requests_to_enqueue(context, add_requests_call)
+        ]
+        if requests:
             await request_manager.add_requests(requests)
 
-        for push_data_call in result.push_data_calls:
-            await self._push_data(**push_data_call)
+        for result in results:
+            result.add_requests_calls.clear()
 
-        await self._commit_key_value_store_changes(result, get_kvs=self.get_key_value_store)
+        data_by_dataset = defaultdict[tuple[str | None, str | None], list[dict[str, Any]]](list)
+        for result in results:
+            for push_data_call in result.push_data_calls:
+                data = push_data_call['data']
+                data_by_dataset[push_data_call['dataset_id'], push_data_call['dataset_name']].extend(
+                    data if isinstance(data, list) else [data]
+                )
+
+        for (dataset_id, dataset_name), data in data_by_dataset.items():
+            await self._push_data(data, dataset_id=dataset_id, dataset_name=dataset_name)
+
+            for result in results:
+                result.push_data_calls[:] = [
+                    call
+                    for call in result.push_data_calls
+                    if (call['dataset_id'], call['dataset_name']) != (dataset_id, dataset_name)
+                ]
+
+        for result in results:
+            await self._commit_key_value_store_changes(result, get_kvs=self.get_key_value_store)
+            result.key_value_store_changes.clear()
+
+        await wait_for(
+            lambda: request_manager.mark_requests_as_handled([context.request for context in contexts]),
+            timeout=self._internal_timeout,
+            timeout_message='Marking requests as handled timed out after '
+            f'{self._internal_timeout.total_seconds()} seconds',
+            logger=self._logger,
+            max_retries=3,
+        )
+
+    def _get_requests_to_enqueue(
+        self, context: BasicCrawlingContext, add_requests_call: AddRequestsKwargs
+    ) -> list[Request]:
+        """Resolve and filter the requests of an `add_requests` call made by the request handler of `context`."""
+        requests = list[Request]()
+
+        origin = context.request.loaded_url or context.request.url
+        base_url = url if (url := add_requests_call.get('base_url')) else origin
+
+        requests_iterator = self._convert_url_to_request_iterator(add_requests_call['requests'], base_url)
+
+        enqueue_links_kwargs: EnqueueLinksKwargs = {k: v for k, v in add_requests_call.items() if k != 'requests'}  # type: ignore[assignment]
+
+        filter_requests_iterator = self._enqueue_links_filter_iterator(
+            requests_iterator, context.request.url, **enqueue_links_kwargs
+        )
+
+        for dst_request in filter_requests_iterator:
+            # Update the crawl depth of the request.
+            dst_request.crawl_depth = context.request.crawl_depth + 1
+
+            if self._max_crawl_depth is None or dst_request.crawl_depth <= self._max_crawl_depth:
+                requests.append(dst_request)
+
+        return requests
 
     @staticmethod
     async def _commit_key_value_store_changes(
@@ -1256,19 +1428,54 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             )
             return False
 
+        if self._request_prefetcher is not None and len(self._request_prefetcher) > 0:
+            return True
+
+        # Requests held back by the request manager, e.g. by a per-host limit, do not make a task ready. Otherwise
+        # the pool would keep starting tasks that find nothing to fetch.
         request_manager = await self.get_request_manager()
-        return not await request_manager.is_empty()
+        return await request_manager.has_next_request()
+
+    async def __wait_for_task_ready_function(self) -> None:
+        request_manager = await self.get_request_manager()
+
+        if request_manager.notifies_changes:
+            wait_for_manager = request_manager.wait_for_change()
+        else:
+            wait_for_manager = asyncio.sleep(self._REQUEST_MANAGER_POLL_INTERVAL.total_seconds())
+
+        if self._request_prefetcher is None:
+            await wait_for_manager
+            return
+
+        # The prefetcher takes the requests out of the request manager, so requests it buffers make a task ready
+        # without any change of the request manager.
+        waiters = [
+            asyncio.create_task(wait_for_manager),
+            asyncio.create_task(self._request_prefetcher.wait_for_change()),
+        ]
+
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
 
     async def __run_task_function(self) -> None:
         request_manager = await self.get_request_manager()
 
-        request = await wait_for(
-            lambda: request_manager.fetch_next_request(),
-            timeout=self._internal_timeout,
-            timeout_message=f'Fetching next request failed after {self._internal_timeout.total_seconds()} seconds',
-            logger=self._logger,
-            max_retries=3,
-        )
+        prefetched = self._request_prefetcher.take() if self._request_prefetcher else None
+        request: Request | None
+        if prefetched is not None:
+            request = prefetched.request
+        else:
+            request = await wait_for(
+                lambda: request_manager.fetch_next_request(),
+                timeout=self._internal_timeout,
+                timeout_message=f'Fetching next request failed after {self._internal_timeout.total_seconds()} seconds',
+                logger=self._logger,
+                max_retries=3,
+            )
 
         if request is None:
             return
@@ -1281,11 +1488,13 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             await self._handle_skipped_request(request, 'robots_txt', need_mark=True)
             return
 
-        if request.session_id:
-            session = await self._get_session_by_id(request.session_id)
+        # The prefetched session may have been retired while the request waited in the buffer.
+        if prefetched is not None and (prefetched.session is None or prefetched.session.is_usable):
+            session, proxy_info = prefetched.session, prefetched.proxy_info
         else:
-            session = await self._get_session()
-        proxy_info = await self._get_proxy_info(request, session)
+            session = await self._get_session_for_request(request)
+            proxy_info = await self._get_proxy_info(request, session)
+
         result = RequestHandlerRunResult(key_value_store_getter=self.get_key_value_store)
 
         context = BasicCrawlingContext(
@@ -1313,15 +1522,10 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
             except asyncio.TimeoutError as e:
                 raise RequestHandlerError(e, context) from e
 
-            await self._commit_request_handler_result(context)
-            await wait_for(
-                lambda: request_manager.mark_request_as_handled(context.request),
-                timeout=self._internal_timeout,
-                timeout_message='Marking request as handled timed out after '
-                f'{self._internal_timeout.total_seconds()} seconds',
-                logger=self._logger,
-                max_retries=3,
-            )
+            if self._commit_batcher is not None:
+                await self._commit_batcher.submit(context)
+            else:
+                await self._commit_and_mark_request_as_handled(context)
 
             request.state = RequestState.DONE
 
@@ -1484,21 +1688,9 @@ class BasicCrawler(Generic[TCrawlingContext, TStatisticsState]):
         """
         if not self._respect_robots_txt_file:
             return None
-        origin_url = str(URL(url).origin())
-        robots_txt_file = self._robots_txt_file_cache.get(origin_url)
-        if robots_txt_file:
-            return robots_txt_file
-
-        async with self._robots_txt_lock:
-            # Check again if the robots.txt file is already cached after acquiring the lock
-            robots_txt_file = self._robots_txt_file_cache.get(origin_url)
-            if robots_txt_file:
-                return robots_txt_file
-
-            # If not cached, fetch the robots.txt file
-            robots_txt_file = await self._find_txt_file_for_url(url)
-            self._robots_txt_file_cache[origin_url] = robots_txt_file
-            return robots_txt_file
+
+        # Concurrent calls for the same origin share a single fetch, other origins are not blocked by it.
+        return await self._robots_txt_cache.get(url)
 
     async def _find_txt_file_for_url(self, url: str) -> RobotsTxtFile:
         """Find the robots.txt file for a given URL.
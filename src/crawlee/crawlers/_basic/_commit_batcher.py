@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Sequence
+    from datetime import timedelta
+
+T = TypeVar('T')
+
+logger = logging.getLogger(__name__)
+
+
+class CommitBatcher(Generic[T]):
+    """Groups the commits of many concurrent workers into batches, which are committed in a single operation.
+
+    A worker submits its item and waits until the batch containing it is committed. A batch is committed once it
+    reaches `max_size` items or once its first item has waited for `max_latency`, whichever comes first. Batches are
+    committed one at a time in the order they were formed, and items submitted meanwhile form the next batch.
+
+    If committing a batch fails, its items are committed one by one, so that an error is only raised to the worker
+    whose item caused it. Parts of the failed batch may have been committed already, so `commit_batch` must keep
+    track of what it committed and `commit_one` must only commit the rest.
+    """
+
+    def __init__(
+        self,
+        commit_batch: Callable[[Sequence[T]], Awaitable[None]],
+        commit_one: Callable[[T], Awaitable[None]],
+        *,
+        max_size: int,
+        max_latency: timedelta,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            commit_batch: Function committing a batch of items in a single operation.
+            commit_one: Function committing a single item, used when committing a batch fails.
+            max_size: The maximum number of items in a batch.
+            max_latency: The maximum time an item waits for its batch to be committed.
+        """
+        if max_size < 1:
+            raise ValueError('The commit batch size must be at least 1')
+
+        self._commit_batch = commit_batch
+        self._commit_one = commit_one
+        self._max_size = max_size
+        self._max_latency = max_latency
+
+        self._pending = list[tuple[T, asyncio.Future[None]]]()
+        """Items of the batch being formed, with the futures resolved once they are committed."""
+
+        self._timer: asyncio.TimerHandle | None = None
+        self._commit_lock = asyncio.Lock()
+        self._commit_tasks = set[asyncio.Task[None]]()
+
+    async def submit(self, item: T) -> None:
+        """Add an item to the current batch and wait until it is committed, raising the error of its commit if any."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self._max_size:
+            self._start_commit()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self._max_latency.total_seconds(), self._start_commit)
+
+        # Shield the future, so that a cancelled worker does not leave its item half-committed within the batch.
+        await asyncio.shield(future)
+
+    def _start_commit(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._commit(batch), name='commit_batch')
+        self._commit_tasks.add(task)
+        task.add_done_callback(self._commit_tasks.discard)
+
+    async def _commit(self, batch: list[tuple[T, asyncio.Future[None]]]) -> None:
+        async with self._commit_lock:
+            try:
+                await self._commit_batch([item for item, _ in batch])
+            except Exception:
+                logger.warning(f'Failed to commit a batch of {len(batch)} items, committing them one by one')
+                await self._commit_each(batch)
+            else:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(None)
+            finally:
+                # Never leave a worker waiting, e.g. if the commit was cancelled.
+                for _, future in batch:
+                    if not future.done():
+                        future.cancel()
+
+    async def _commit_each(self, batch: list[tuple[T, asyncio.Future[None]]]) -> None:
+        for item, future in batch:
+            try:
+                await self._commit_one(item)
+            except Exception as exc:  # noqa: PERF203
+                if not future.done():
+                    future.set_exception(exc)
+            else:
+                if not future.done():
+                    future.set_result(None)
@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+from crawlee._utils.wait import ChangeNotifier
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from crawlee import Request
+    from crawlee.proxy_configuration import ProxyInfo
+    from crawlee.sessions import Session
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PrefetchedRequest:
+    """A request fetched ahead of time, together with the session and proxy resolved for it."""
+
+    request: Request
+    """The fetched request."""
+
+    session: Session | None
+    """The session to process the request with, `None` if sessions are not used."""
+
+    proxy_info: ProxyInfo | None
+    """The proxy to process the request with, `None` if proxies are not used."""
+
+
+class RequestPrefetcher:
+    """Buffer of requests fetched ahead of the workers that process them.
+
+    While active, a background task keeps up to `size` requests fetched from the request manager, so that workers
+    take their next request from memory instead of waiting for the request manager, its locks and its cache refills.
+    When no request is available, the task polls for new ones with an exponential backoff. Since the buffered
+    requests are no longer pending in the request manager, waiters are woken up through `wait_for_change` whenever
+    a request is buffered.
+
+    Buffered requests are in progress in the request manager, so the buffer never makes the crawl look finished.
+    When the context is exited, e.g. because the crawler stops or aborts, the buffered requests are reclaimed
+    to the forefront of the request manager, keeping their order.
+    """
+
+    _MIN_IDLE_DELAY = timedelta(milliseconds=50)
+    _MAX_IDLE_DELAY = timedelta(seconds=1)
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[PrefetchedRequest | None]],
+        reclaim: Callable[[Request], Awaitable[object]],
+        *,
+        size: int,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            fetch: Function fetching the next request and resolving its session and proxy, `None` if there is no
+                request to fetch.
+            reclaim: Function returning an unprocessed request to the forefront of the request manager.
+            size: The maximum number of requests fetched ahead.
+        """
+        if size < 1:
+            raise ValueError('The prefetch buffer size must be at least 1')
+
+        self._fetch = fetch
+        self._reclaim = reclaim
+        self._size = size
+
+        self._buffer = deque[PrefetchedRequest]()
+        self._free_slots = asyncio.Semaphore(size)
+        self._task: asyncio.Task[None] | None = None
+        self._active = False
+        self._change_notifier = ChangeNotifier()
+
+    @property
+    def active(self) -> bool:
+        """Indicate whether the context is active."""
+        return self._active
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    async def __aenter__(self) -> Self:
+        """Start fetching requests ahead."""
+        if self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is already active.')
+
+        self._active = True
+        self._buffer.clear()
+        self._free_slots = asyncio.Semaphore(self._size)
+        self._task = asyncio.create_task(self._fill(), name='request_prefetcher')
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        """Stop fetching requests ahead and reclaim the buffered ones."""
+        if not self._active:
+            raise RuntimeError(f'The {self.__class__.__name__} is not active.')
+
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+        # Reclaim in reverse order, so that the first buffered request ends up first in the forefront.
+        while self._buffer:
+            prefetched = self._buffer.pop()
+            try:
+                await self._reclaim(prefetched.request)
+            except Exception:
+                logger.exception(f'Failed to reclaim prefetched request {prefetched.request.url}')
+
+        self._active = False
+
+    def take(self) -> PrefetchedRequest | None:
+        """Take the next buffered request, `None` if the buffer is empty."""
+        if not self._buffer:
+            return None
+
+        self._free_slots.release()
+        return self._buffer.popleft()
+
+    async def wait_for_change(self) -> None:
+        """Wait until a request is added to the buffer."""
+        await self._change_notifier.wait()
+
+    async def _fill(self) -> None:
+        idle_delay = self._MIN_IDLE_DELAY
+
+        while True:
+            await self._free_slots.acquire()
+
+            try:
+                prefetched = await self._fetch_shielded()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception('Failed to prefetch the next request')
+                prefetched = None
+
+            if prefetched is None:
+                self._free_slots.release()
+                await asyncio.sleep(idle_delay.total_seconds())
+                idle_delay = min(idle_delay * 2, self._MAX_IDLE_DELAY)
+                continue
+
+            idle_delay = self._MIN_IDLE_DELAY
+            self._buffer.append(prefetched)
+            self._change_notifier.notify()
+
+    async def _fetch_shielded(self) -> PrefetchedRequest | None:
+        """Fetch the next request, buffering it even if the task is cancelled meanwhile, so it gets reclaimed."""
+        fetch = asyncio.ensure_future(self._fetch())
+
+        try:
+            return await asyncio.shield(fetch)
+        except asyncio.CancelledError:
+            prefetched = await asyncio.gather(fetch, return_exceptions=True)
+            if isinstance(prefetched[0], PrefetchedRequest):
+                self._buffer.append(prefetched[0])
+            raise
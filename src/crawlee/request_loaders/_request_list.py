@@ -11,6 +11,7 @@ from typing_extensions import override
 
 from crawlee._request import Request
 from crawlee._utils.docs import docs_group
+from crawlee._utils.wait import ChangeNotifier
 from crawlee.request_loaders._request_loader import RequestLoader
 
 logger = getLogger(__name__)
@@ -87,6 +88,7 @@ class RequestList(RequestLoader):
             self._requests = self._iterate_in_threadpool(requests)
 
         self._requests_lock: asyncio.Lock | None = None
+        self._change_notifier = ChangeNotifier()
 
     async def _get_state(self) -> RequestListState:
         # If state is already initialized, we are done
@@ -157,6 +159,16 @@ class RequestList(RequestLoader):
         state = await self._get_state()
         return len(state.in_progress) == 0 and await self.is_empty()
 
+    @property
+    @override
+    def notifies_changes(self) -> bool:
+        return True
+
+    @override
+    async def wait_for_change(self) -> None:
+        # Requests only become available by iterating the source, so the only change to wait for is a handled request.
+        await self._change_notifier.wait()
+
     @override
     async def fetch_next_request(self) -> Request | None:
         await self._get_state()
@@ -184,6 +196,7 @@ class RequestList(RequestLoader):
         self._handled_count += 1
         state = await self._get_state()
         state.in_progress.remove(request.unique_key)
+        self._change_notifier.notify()
 
     async def _ensure_next_request(self) -> None:
         await self._get_state()
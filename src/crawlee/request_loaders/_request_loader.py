@@ -41,6 +41,15 @@ class RequestLoader(ABC):
     async def is_finished(self) -> bool:
         """Return True if all requests have been handled."""
 
+    async def has_next_request(self) -> bool:
+        """Return True if `fetch_next_request` would currently return a request.
+
+        Unlike `is_empty`, this is False while the remaining requests are held back, e.g. by a limit on the requests
+        of a single host in progress, so consumers can wait instead of fetching in a loop. The default implementation
+        returns the opposite of `is_empty`.
+        """
+        return not await self.is_empty()
+
     @abstractmethod
     async def fetch_next_request(self) -> Request | None:
         """Return the next request to be processed, or `None` if there are no more pending requests.
@@ -53,6 +62,34 @@ class RequestLoader(ABC):
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
         """Mark a request as handled after a successful processing (or after giving up retrying)."""
 
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        """Mark multiple requests as handled, in a single storage operation if the loader supports it."""
+        processed_requests: list[ProcessedRequest] = []
+
+        for request in requests:
+            processed_request = await self.mark_request_as_handled(request)
+            if processed_request is not None:
+                processed_requests.append(processed_request)
+
+        return processed_requests
+
+    @property
+    def notifies_changes(self) -> bool:
+        """Whether the loader supports `wait_for_change`, so that its state does not have to be polled."""
+        return False
+
+    async def wait_for_change(self) -> None:
+        """Wait until requests become available in the loader or the loader may have become finished.
+
+        The loader notifies the waiters whenever requests are added to it or reclaimed ("work available"),
+        and whenever requests are marked as handled ("drained"). A return from this method is only a hint,
+        the state of the loader has to be checked with `is_empty` and `is_finished`.
+
+        Raises:
+            NotImplementedError: If the loader does not support notifications, see `notifies_changes`.
+        """
+        raise NotImplementedError(f'{type(self).__name__} does not notify about changes of its state')
+
     async def to_tandem(self, request_manager: RequestManager | None = None) -> RequestManagerTandem:
         """Combine the loader with a request manager to support adding and reclaiming requests.
 
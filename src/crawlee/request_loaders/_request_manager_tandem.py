@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import timedelta
 from logging import getLogger
 from typing import TYPE_CHECKING
@@ -44,10 +45,32 @@ class RequestManagerTandem(RequestManager):
     async def is_empty(self) -> bool:
         return (await self._read_only_loader.is_empty()) and (await self._read_write_manager.is_empty())
 
+    @override
+    async def has_next_request(self) -> bool:
+        return (await self._read_only_loader.has_next_request()) or (await self._read_write_manager.has_next_request())
+
     @override
     async def is_finished(self) -> bool:
         return (await self._read_only_loader.is_finished()) and (await self._read_write_manager.is_finished())
 
+    @property
+    @override
+    def notifies_changes(self) -> bool:
+        return self._read_only_loader.notifies_changes and self._read_write_manager.notifies_changes
+
+    @override
+    async def wait_for_change(self) -> None:
+        waiters = [
+            asyncio.create_task(self._read_only_loader.wait_for_change()),
+            asyncio.create_task(self._read_write_manager.wait_for_change()),
+        ]
+
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+
     @override
     async def add_request(self, request: str | Request, *, forefront: bool = False) -> ProcessedRequest:
         return await self._read_write_manager.add_request(request, forefront=forefront)
@@ -103,6 +126,10 @@ class RequestManagerTandem(RequestManager):
     async def mark_request_as_handled(self, request: Request) -> None:
         await self._read_write_manager.mark_request_as_handled(request)
 
+    @override
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        return await self._read_write_manager.mark_requests_as_handled(requests)
+
     @override
     async def drop(self) -> None:
         await self._read_write_manager.drop()
@@ -11,16 +11,16 @@ from typing_extensions import override
 
 from crawlee import Request
 from crawlee._utils.docs import docs_group
-from crawlee._utils.globs import Glob
 from crawlee._utils.recoverable_state import RecoverableState
 from crawlee._utils.sitemap import NestedSitemap, ParseSitemapOptions, SitemapSource, SitemapUrl, parse_sitemap
+from crawlee._utils.url_patterns import UrlPatternFilter
 from crawlee.request_loaders._request_loader import RequestLoader
 
 if TYPE_CHECKING:
     import re
-    from collections.abc import Sequence
     from types import TracebackType
 
+    from crawlee._utils.globs import Glob
     from crawlee.http_clients import HttpClient
     from crawlee.proxy_configuration import ProxyInfo
     from crawlee.storage_clients.models import ProcessedRequest
@@ -123,8 +123,7 @@ class SitemapRequestLoader(RequestLoader):
         """
         self._http_client = http_client
         self._sitemap_urls = sitemap_urls
-        self._include = include
-        self._exclude = exclude
+        self._url_pattern_filter = UrlPatternFilter(include, exclude)
         self._proxy_info = proxy_info
         self._max_buffer_size = max_buffer_size
 
@@ -175,36 +174,6 @@ class SitemapRequestLoader(RequestLoader):
 
             return self._state.current_value
 
-    def _check_url_patterns(
-        self,
-        target_url: str,
-        include: Sequence[re.Pattern[Any] | Glob] | None,
-        exclude: Sequence[re.Pattern[Any] | Glob] | None,
-    ) -> bool:
-        """Check if a URL matches configured include/exclude patterns."""
-        # If the URL matches any `exclude` pattern, reject it
-        for pattern in exclude or ():
-            if isinstance(pattern, Glob):
-                pattern = pattern.regexp  # noqa: PLW2901
-
-            if pattern.match(target_url) is not None:
-                return False
-
-        # If there are no `include` patterns and the URL passed all `exclude` patterns, accept the URL
-        if include is None:
-            return True
-
-        # If the URL matches any `include` pattern, accept it
-        for pattern in include:
-            if isinstance(pattern, Glob):
-                pattern = pattern.regexp  # noqa: PLW2901
-
-            if pattern.match(target_url) is not None:
-                return True
-
-        # The URL does not match any `include` pattern - reject it
-        return False
-
     async def _load_sitemaps(self) -> None:
         """Load URLs from sitemaps in the background."""
         try:
@@ -243,7 +212,7 @@ class SitemapRequestLoader(RequestLoader):
                             continue
 
                         # Check if URL should be included
-                        if not self._check_url_patterns(url, self._include, self._exclude):
+                        if not self._url_pattern_filter.matches(url):
                             continue
 
                         # Check if we have capacity in the queue
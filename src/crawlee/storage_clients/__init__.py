@@ -1,8 +1,10 @@
 from ._base import StorageClient
+from ._fair_queue import FairSchedulingPolicy
 from ._file_system import FileSystemStorageClient
 from ._memory import MemoryStorageClient
 
 __all__ = [
+    'FairSchedulingPolicy',
     'FileSystemStorageClient',
     'MemoryStorageClient',
     'StorageClient',
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterable, AsyncIterator
 
     from crawlee.storage_clients.models import KeyValueStoreMetadata, KeyValueStoreRecord, KeyValueStoreRecordMetadata
 
@@ -54,6 +55,35 @@ class KeyValueStoreClient(ABC):
         The backend method for the `KeyValueStore.set_value` call.
         """
 
+    async def set_value_stream(
+        self,
+        *,
+        key: str,
+        stream: AsyncIterable[bytes],
+        content_type: str | None = None,
+    ) -> None:
+        """Set a value in the key-value store from a stream of its serialized bytes.
+
+        The backend method for the `KeyValueStore.set_value_stream` call. The stored record is the same as if the
+        concatenated bytes had been read back from a file with the given content type, i.e. JSON is parsed and
+        text is decoded.
+
+        This default implementation collects the whole stream and stores it with `set_value`. Clients able to
+        persist the value chunk by chunk should override it.
+        """
+        content_type = content_type or 'application/octet-stream'
+        value_bytes = b''.join([chunk async for chunk in stream])
+
+        value: Any
+        if 'application/json' in content_type:
+            value = json.loads(value_bytes)
+        elif content_type.startswith('text/'):
+            value = value_bytes.decode('utf-8')
+        else:
+            value = value_bytes
+
+        await self.set_value(key=key, value=value, content_type=content_type)
+
     @abstractmethod
     async def delete_value(self, *, key: str) -> None:
         """Delete a value from the key-value store by its key.
@@ -103,6 +103,38 @@ class RequestQueueClient(ABC):
             Information about the queue operation. `None` if the given request was not in progress.
         """
 
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        """Mark multiple requests as handled after successful processing.
+
+        Clients should override this method to persist all the requests in a single storage operation. The default
+        implementation marks the requests one by one.
+
+        Args:
+            requests: The requests to mark as handled.
+
+        Returns:
+            Information about the queue operation for each request that was in progress.
+        """
+        processed_requests: list[ProcessedRequest] = []
+
+        for request in requests:
+            processed_request = await self.mark_request_as_handled(request)
+            if processed_request is not None:
+                processed_requests.append(processed_request)
+
+        return processed_requests
+
+    async def get_unique_keys(self) -> list[str]:
+        """Get the unique keys of all requests in the queue, whether pending, in progress or handled.
+
+        Used to rebuild the duplicate filter of a `RequestQueue`. Clients which can list the unique keys of their
+        requests should override this method.
+
+        Raises:
+            NotImplementedError: If the client cannot list the unique keys.
+        """
+        raise NotImplementedError(f'{type(self).__name__} cannot list the unique keys of its requests.')
+
     @abstractmethod
     async def reclaim_request(
         self,
@@ -122,6 +154,17 @@ class RequestQueueClient(ABC):
             Information about the queue operation. `None` if the given request was not in progress.
         """
 
+    async def has_next_request(self) -> bool:
+        """Check if `fetch_next_request` would currently return a request.
+
+        Clients which hold pending requests back, e.g. because of a limit on the requests of a single host
+        in progress, should override this method. The default implementation returns the opposite of `is_empty`.
+
+        Returns:
+            True if a request can be fetched right now, False otherwise.
+        """
+        return not await self.is_empty()
+
     @abstractmethod
     async def is_empty(self) -> bool:
         """Check if the request queue is empty.
@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+import heapq
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import chain, count
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
+from crawlee import Request
+from crawlee._utils.docs import docs_group
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+
+@docs_group('Storage data')
+@dataclass(frozen=True)
+class FairSchedulingPolicy:
+    """Policy for serving the requests of a request queue fairly across hosts.
+
+    Without a policy, request queues serve requests in the order they were added, so a host with many enqueued
+    requests gets all the fetches until its requests run out. With a policy, the queue takes turns between the
+    hosts of its pending requests, weighted by `host_weights`, and keeps the order of the requests of each host.
+    Forefront requests go before the other requests of their host, but not before requests of other hosts.
+    """
+
+    host_weights: Mapping[str, float] = field(default_factory=dict)
+    """Relative share of fetches of each host. A host with weight 2 is served twice as often as a host with
+    weight 1 while both have pending requests."""
+
+    default_weight: float = 1.0
+    """Weight of hosts not listed in `host_weights`."""
+
+    max_in_progress_per_host: int | None = None
+    """Maximum number of requests of a single host that are fetched and not yet handled or reclaimed. Requests of
+    a host at the limit are skipped until one of its requests is finished. `None` means no limit."""
+
+    def __post_init__(self) -> None:
+        if self.default_weight <= 0 or any(weight <= 0 for weight in self.host_weights.values()):
+            raise ValueError('Host weights must be positive')
+
+        if self.max_in_progress_per_host is not None and self.max_in_progress_per_host < 1:
+            raise ValueError('max_in_progress_per_host must be at least 1')
+
+
+class _Host:
+    __slots__ = ('in_progress', 'pending', 'scheduled', 'tag', 'weight')
+
+    def __init__(self, weight: float) -> None:
+        self.pending = deque[Request]()
+        self.in_progress = 0
+        self.weight = weight
+        self.tag = 0.0
+        self.scheduled = False
+
+
+class FairRequestQueue:
+    """Pending requests of a request queue, grouped by host and served by weighted fair queuing.
+
+    Each host has a virtual time tag, which advances by `1 / weight` whenever one of its requests is served, and
+    the host with the lowest tag goes next. Hosts with pending requests and free capacity are kept in a heap, so
+    finding the next request takes `O(log hosts)` time regardless of the number of pending requests. Hosts at
+    their in-progress limit are dropped from the heap and put back once one of their requests finishes.
+
+    Without a policy, all requests share a single host and are served in the order they were added.
+    """
+
+    def __init__(self, policy: FairSchedulingPolicy | None = None) -> None:
+        self._policy = policy
+
+        self._hosts = dict[str, _Host]()
+        """Hosts with pending or in-progress requests."""
+
+        self._ready = list[tuple[float, int, str]]()
+        """Heap of `(tag, tie_breaker, host)` of the hosts which may have a request to serve."""
+
+        self._tie_breaker = count()
+        self._virtual_time = 0.0
+        self._size = 0
+
+        self._in_progress = dict[str, str]()
+        """Hosts of the in-progress requests by their unique keys."""
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Request]:
+        return chain.from_iterable(host.pending for host in self._hosts.values())
+
+    def append(self, request: Request) -> None:
+        """Add a request after the other pending requests of its host."""
+        host_key = self._get_host_key(request)
+        host = self._get_host(host_key)
+        host.pending.append(request)
+        self._size += 1
+        self._schedule(host_key, host)
+
+    def appendleft(self, request: Request) -> None:
+        """Add a request before the other pending requests of its host."""
+        host_key = self._get_host_key(request)
+        host = self._get_host(host_key)
+        host.pending.appendleft(request)
+        self._size += 1
+        self._schedule(host_key, host)
+
+    def extend(self, requests: Iterable[Request]) -> None:
+        """Add requests after the other pending requests of their hosts."""
+        for request in requests:
+            self.append(request)
+
+    def remove(self, request: Request) -> None:
+        """Remove a pending request, raising `ValueError` if it is not pending."""
+        host = self._hosts.get(self._get_host_key(request))
+        if host is None:
+            raise ValueError('Request is not pending')
+
+        host.pending.remove(request)
+        self._size -= 1
+        self._discard_if_idle(self._get_host_key(request), host)
+
+    def pop(self) -> Request | None:
+        """Take the next pending request of the host whose turn it is, skipping hosts at their in-progress limit.
+
+        Returns `None` if there is no pending request, or if all hosts with pending requests are at their limit.
+        """
+        while self._ready:
+            tag, _, host_key = heapq.heappop(self._ready)
+            host = self._hosts.get(host_key)
+            if host is None:
+                continue
+
+            if not host.pending or self._is_at_limit(host):
+                host.scheduled = False
+                self._discard_if_idle(host_key, host)
+                continue
+
+            request = host.pending.popleft()
+            self._size -= 1
+
+            self._virtual_time = tag
+            host.tag = tag + 1 / host.weight
+            heapq.heappush(self._ready, (host.tag, next(self._tie_breaker), host_key))
+
+            return request
+
+        return None
+
+    def has_available(self) -> bool:
+        """Check whether `pop` would return a request, i.e. whether a host with pending requests has free capacity."""
+        if self._policy is None or self._policy.max_in_progress_per_host is None:
+            return self._size > 0
+
+        for _, _, host_key in self._ready:
+            host = self._hosts.get(host_key)
+            if host is not None and host.pending and not self._is_at_limit(host):
+                return True
+
+        return False
+
+    def pop_last(self) -> Request:
+        """Take the last pending request of the host with the most pending requests, e.g. to shrink a cache.
+
+        There must be at least one pending request.
+        """
+        host_key, host = max(self._hosts.items(), key=lambda item: len(item[1].pending))
+        request = host.pending.pop()
+        self._size -= 1
+        self._discard_if_idle(host_key, host)
+        return request
+
+    def start(self, request: Request) -> None:
+        """Count a request taken by `pop` against the in-progress limit of its host."""
+        host_key = self._get_host_key(request)
+        self._get_host(host_key).in_progress += 1
+        self._in_progress[request.unique_key] = host_key
+
+    def finish(self, request: Request) -> None:
+        """Release the in-progress slot of a request, once it is handled or reclaimed."""
+        host_key = self._in_progress.pop(request.unique_key, None)
+        host = self._hosts.get(host_key) if host_key is not None else None
+        if host_key is None or host is None:
+            return
+
+        host.in_progress -= 1
+        self._schedule(host_key, host)
+        self._discard_if_idle(host_key, host)
+
+    def clear(self) -> None:
+        """Remove all pending requests and forget the in-progress ones."""
+        self._hosts.clear()
+        self._ready.clear()
+        self._in_progress.clear()
+        self._size = 0
+
+    def _get_host_key(self, request: Request) -> str:
+        if self._policy is None:
+            return ''
+
+        return urlsplit(request.url).hostname or ''
+
+    def _get_host(self, host_key: str) -> _Host:
+        host = self._hosts.get(host_key)
+        if host is None:
+            weight = self._policy.host_weights.get(host_key, self._policy.default_weight) if self._policy else 1.0
+            host = self._hosts[host_key] = _Host(weight)
+
+        return host
+
+    def _schedule(self, host_key: str, host: _Host) -> None:
+        """Put a host to the heap if it has a request to serve, without letting it claim turns it missed."""
+        if host.scheduled or not host.pending or self._is_at_limit(host):
+            return
+
+        host.tag = max(host.tag, self._virtual_time)
+        host.scheduled = True
+        heapq.heappush(self._ready, (host.tag, next(self._tie_breaker), host_key))
+
+    def _is_at_limit(self, host: _Host) -> bool:
+        limit = self._policy.max_in_progress_per_host if self._policy else None
+        return limit is not None and host.in_progress >= limit
+
+    def _discard_if_idle(self, host_key: str, host: _Host) -> None:
+        if not host.pending and not host.in_progress and not host.scheduled:
+            del self._hosts[host_key]
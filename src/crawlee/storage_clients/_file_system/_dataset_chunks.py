@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from itertools import islice
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+from crawlee._utils.file import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from pathlib import Path
+
+logger = getLogger(__name__)
+
+
+@dataclass
+class DatasetChunk:
+    """Description of a single chunk file in the offset index."""
+
+    number: int
+    """Number of the chunk, used in its file name."""
+
+    first_item: int
+    """Index of the first item stored in the chunk."""
+
+    item_count: int = 0
+    """Number of items stored in the chunk."""
+
+    size: int = 0
+    """Size of the chunk file in bytes."""
+
+    checkpoints: list[int] = field(default_factory=list)
+    """Byte offsets of every `checkpoint_interval`-th item of the chunk, starting with the first one."""
+
+
+@dataclass
+class DatasetImportProgress:
+    """Progress of importing item files into the chunks, recorded in the offset index."""
+
+    last_file: int
+    """Number of the last item file whose items are stored in the chunks, -1 when none are."""
+
+    item_count: int
+    """Number of items stored in the chunks when the progress was recorded."""
+
+
+class DatasetChunks:
+    """Storage of dataset items in size-capped JSON Lines chunk files.
+
+    Items are appended as single lines to the last chunk until it grows over `max_chunk_size` bytes, after which
+    a new chunk is started. A small offset index records the first item and the byte offset of every
+    `checkpoint_interval`-th item of each chunk, so a page of items starting at any position is read by seeking
+    to the nearest checkpoint and skipping at most `checkpoint_interval - 1` lines.
+
+    The index is rewritten after every append. Lines appended after the last index write (e.g. because of a crash)
+    are recovered from the last chunk when the storage is opened.
+
+    While item files are being imported into the chunks, the index also records the import progress together with
+    the appended items, so that an interrupted import can be resumed without importing any file twice.
+    """
+
+    _INDEX_FILENAME = '__index__.json'
+    """The name of the file holding the offset index."""
+
+    _CHUNK_SUFFIX = '.jsonl'
+    """The suffix of the chunk files."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_chunk_size: int = 16 * 1024 * 1024,
+        checkpoint_interval: int = 1000,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            path: The directory where the chunks and the index are stored.
+            max_chunk_size: The size in bytes after which a new chunk is started.
+            checkpoint_interval: The number of items between two byte offsets recorded in the index.
+        """
+        self._path = path
+        self._max_chunk_size = max_chunk_size
+        self._checkpoint_interval = checkpoint_interval
+
+        self._chunks = list[DatasetChunk]()
+        """The chunks ordered by their first item."""
+
+        self._import_progress: DatasetImportProgress | None = None
+        """Progress of an unfinished import of item files, `None` when no import is in progress."""
+
+    @property
+    def item_count(self) -> int:
+        """The number of items stored in the chunks."""
+        if not self._chunks:
+            return 0
+
+        last_chunk = self._chunks[-1]
+        return last_chunk.first_item + last_chunk.item_count
+
+    @property
+    def import_progress(self) -> DatasetImportProgress | None:
+        """Progress of an unfinished import of item files, `None` when no import is in progress."""
+        return self._import_progress
+
+    @property
+    def path_to_index(self) -> Path:
+        """The full path to the offset index file."""
+        return self._path / self._INDEX_FILENAME
+
+    async def open(self) -> None:
+        """Load the offset index and recover the items appended after it was written."""
+        await asyncio.to_thread(self._path.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(self._load)
+
+    async def append(self, items: Sequence[dict[str, Any]], *, imported_file: int | None = None) -> None:
+        """Append items to the chunks in a single buffered write per chunk.
+
+        Args:
+            items: The items to append.
+            imported_file: Number of the last item file the items were imported from. When set, it is recorded
+                as the import progress in the same index write as the items.
+        """
+        if items:
+            lines = await asyncio.to_thread(self._encode_items, items)
+            await asyncio.to_thread(self._write_lines, lines)
+        elif imported_file is None:
+            return
+
+        if imported_file is not None:
+            self._import_progress = DatasetImportProgress(last_file=imported_file, item_count=self.item_count)
+
+        await self._persist_index()
+
+    async def start_import(self) -> DatasetImportProgress:
+        """Record the start of an import of item files, unless an interrupted import is being resumed.
+
+        Returns:
+            The progress of the import, from which it should be continued.
+        """
+        if self._import_progress is None:
+            self._import_progress = DatasetImportProgress(last_file=-1, item_count=self.item_count)
+            await self._persist_index()
+
+        return self._import_progress
+
+    async def finish_import(self) -> None:
+        """Remove the import progress from the index once all imported item files are removed."""
+        if self._import_progress is not None:
+            self._import_progress = None
+            await self._persist_index()
+
+    async def read(self, start: int, end: int) -> list[dict[str, Any]]:
+        """Read the items with indexes in the range `[start, end)`.
+
+        Args:
+            start: Index of the first item to read.
+            end: Index after the last item to read.
+
+        Returns:
+            The items in the order in which they were added. Corrupt lines are skipped.
+        """
+        start, end = max(start, 0), min(end, self.item_count)
+        if start >= end:
+            return []
+
+        return await asyncio.to_thread(self._read_range, start, end)
+
+    async def purge(self) -> None:
+        """Remove all chunks and the index."""
+        if self._path.exists():
+            await asyncio.to_thread(shutil.rmtree, self._path)
+
+        await asyncio.to_thread(self._path.mkdir, parents=True, exist_ok=True)
+        self._chunks.clear()
+        self._import_progress = None
+
+    def _get_chunk_path(self, chunk: DatasetChunk) -> Path:
+        return self._path / f'{chunk.number:09d}{self._CHUNK_SUFFIX}'
+
+    async def _persist_index(self) -> None:
+        index: dict[str, Any] = {
+            'checkpoint_interval': self._checkpoint_interval,
+            'chunks': [
+                [chunk.number, chunk.first_item, chunk.item_count, chunk.size, chunk.checkpoints]
+                for chunk in self._chunks
+            ],
+        }
+        if self._import_progress is not None:
+            index['import_progress'] = [self._import_progress.last_file, self._import_progress.item_count]
+        await atomic_write(self.path_to_index, json.dumps(index, separators=(',', ':')))
+
+    @staticmethod
+    def _encode_items(items: Sequence[dict[str, Any]]) -> list[bytes]:
+        return [
+            json.dumps(item, ensure_ascii=False, separators=(',', ':'), default=str).encode('utf-8') + b'\n'
+            for item in items
+        ]
+
+    def _start_chunk(self) -> DatasetChunk:
+        number = self._chunks[-1].number + 1 if self._chunks else 1
+        chunk = DatasetChunk(number=number, first_item=self.item_count)
+        self._chunks.append(chunk)
+        return chunk
+
+    def _write_lines(self, lines: Sequence[bytes]) -> None:
+        position = 0
+
+        while position < len(lines):
+            chunk = self._chunks[-1] if self._chunks else self._start_chunk()
+            if chunk.size >= self._max_chunk_size:
+                chunk = self._start_chunk()
+
+            # Collect the lines that fit into the current chunk, at least one so that oversized items make progress.
+            buffer = list[bytes]()
+            size = chunk.size
+            while position < len(lines) and (not buffer or size < self._max_chunk_size):
+                if (chunk.item_count + len(buffer)) % self._checkpoint_interval == 0:
+                    chunk.checkpoints.append(size)
+                buffer.append(lines[position])
+                size += len(lines[position])
+                position += 1
+
+            with self._get_chunk_path(chunk).open('ab') as file:
+                file.write(b''.join(buffer))
+
+            chunk.item_count += len(buffer)
+            chunk.size = size
+
+    def _read_range(self, start: int, end: int) -> list[dict[str, Any]]:
+        items = list[dict[str, Any]]()
+        chunk_index = bisect_right([chunk.first_item for chunk in self._chunks], start) - 1
+
+        for chunk in self._chunks[chunk_index:]:
+            if chunk.first_item >= end:
+                break
+
+            local_start = max(start - chunk.first_item, 0)
+            local_end = min(end - chunk.first_item, chunk.item_count)
+            checkpoint = local_start // self._checkpoint_interval
+
+            try:
+                with self._get_chunk_path(chunk).open('rb') as file:
+                    file.seek(chunk.checkpoints[checkpoint])
+                    first_line = checkpoint * self._checkpoint_interval
+                    lines = islice(file, local_start - first_line, local_end - first_line)
+                    items.extend(self._decode_lines(lines, chunk))
+            except FileNotFoundError:
+                logger.warning(f'Dataset chunk disappeared: {self._get_chunk_path(chunk)}, skipping')
+
+        return items
+
+    def _decode_lines(self, lines: Iterable[bytes], chunk: DatasetChunk) -> list[dict[str, Any]]:
+        items = list[dict[str, Any]]()
+
+        for line in lines:
+            try:
+                items.append(json.loads(line))
+            except json.JSONDecodeError:  # noqa: PERF203
+                logger.exception(f'Corrupt JSON line in {self._get_chunk_path(chunk)}, skipping')
+
+        return items
+
+    def _load(self) -> None:
+        if self.path_to_index.exists():
+            try:
+                index = json.loads(self.path_to_index.read_text(encoding='utf-8'))
+                # The checkpoints of existing chunks are only valid with the interval they were written with.
+                self._checkpoint_interval = index['checkpoint_interval']
+                self._chunks = [
+                    DatasetChunk(number, first_item, item_count, size, checkpoints)
+                    for number, first_item, item_count, size, checkpoints in index['chunks']
+                ]
+                if (import_progress := index.get('import_progress')) is not None:
+                    self._import_progress = DatasetImportProgress(*import_progress)
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+                logger.warning(f'Failed to load the dataset chunk index, rebuilding it from the chunks: {exc!s}')
+                self._chunks = []
+
+        indexed_numbers = {chunk.number for chunk in self._chunks}
+        chunk_numbers = sorted(
+            int(file.stem) for file in self._path.glob(f'*{self._CHUNK_SUFFIX}') if file.stem.isdigit()
+        )
+
+        # Recover lines written after the last index write, both in the last indexed chunk and in unknown chunks.
+        if self._chunks:
+            self._recover_chunk(self._chunks[-1])
+
+        for number in chunk_numbers:
+            if number not in indexed_numbers and (not self._chunks or number > self._chunks[-1].number):
+                chunk = DatasetChunk(number=number, first_item=self.item_count)
+                self._chunks.append(chunk)
+                self._recover_chunk(chunk)
+
+    def _recover_chunk(self, chunk: DatasetChunk) -> None:
+        chunk_path = self._get_chunk_path(chunk)
+        if not chunk_path.exists():
+            return
+
+        actual_size = chunk_path.stat().st_size
+        if actual_size <= chunk.size:
+            return
+
+        with chunk_path.open('r+b') as file:
+            self._scan_tail(file, chunk)
+
+            # Drop a partially written line, so that further appends start on a clean line.
+            if chunk.size < actual_size:
+                logger.warning(f'Truncating {actual_size - chunk.size} bytes of incomplete items from {chunk_path}.')
+                file.truncate(chunk.size)
+
+    def _scan_tail(self, file: BinaryIO, chunk: DatasetChunk) -> None:
+        file.seek(chunk.size)
+
+        for line in file:
+            if not line.endswith(b'\n'):
+                break
+
+            if chunk.item_count % self._checkpoint_interval == 0:
+                chunk.checkpoints.append(chunk.size)
+            chunk.item_count += 1
+            chunk.size += len(line)
@@ -6,7 +6,7 @@ import shutil
 from datetime import datetime, timezone
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 from pydantic import ValidationError
 from typing_extensions import override
@@ -17,6 +17,8 @@ from crawlee._utils.file import atomic_write, json_dumps
 from crawlee.storage_clients._base import DatasetClient
 from crawlee.storage_clients.models import DatasetItemsListPage, DatasetMetadata
 
+from ._dataset_chunks import DatasetChunks
+
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
@@ -41,6 +43,11 @@ class FileSystemDatasetClient(DatasetClient):
 
     This implementation is ideal for long-running crawlers where data persistence is important,
     and for development environments where you want to easily inspect the collected data between runs.
+
+    For large datasets, the `'chunks'` layout can be used instead. Items are then appended to size-capped
+    JSON Lines files in the `{STORAGE_DIR}/datasets/{DATASET_ID}/__chunks__` directory, and a small offset index
+    allows reading any page of items without listing or sorting the whole dataset. Item files of the default
+    `'files'` layout found in the dataset directory are imported into the chunks when the dataset is opened.
     """
 
     _STORAGE_SUBDIR = 'datasets'
@@ -52,12 +59,19 @@ class FileSystemDatasetClient(DatasetClient):
     _ITEM_FILENAME_DIGITS = 9
     """Number of digits used for the dataset item file names (e.g., 000000019.json)."""
 
+    _CHUNKS_SUBDIR = '__chunks__'
+    """The name of the subdirectory where the chunks are stored when using the `'chunks'` layout."""
+
+    _ITERATION_PAGE_SIZE = 1000
+    """Number of items read from the chunks at once when iterating over the dataset."""
+
     def __init__(
         self,
         *,
         metadata: DatasetMetadata,
         storage_dir: Path,
         lock: asyncio.Lock,
+        layout: Literal['files', 'chunks'] = 'files',
     ) -> None:
         """Initialize a new instance.
 
@@ -71,6 +85,9 @@ class FileSystemDatasetClient(DatasetClient):
         self._lock = lock
         """A lock to ensure that only one operation is performed at a time."""
 
+        self._chunks = DatasetChunks(self.path_to_dataset / self._CHUNKS_SUBDIR) if layout == 'chunks' else None
+        """Chunked JSON Lines storage of the items, `None` when each item is stored in its own file."""
+
     @override
     async def get_metadata(self) -> DatasetMetadata:
         return self._metadata
@@ -95,6 +112,7 @@ class FileSystemDatasetClient(DatasetClient):
         id: str | None,
         name: str | None,
         configuration: Configuration,
+        layout: Literal['files', 'chunks'] = 'files',
     ) -> FileSystemDatasetClient:
         """Open or create a file system dataset client.
 
@@ -106,6 +124,8 @@ class FileSystemDatasetClient(DatasetClient):
             id: The ID of the dataset to open. If provided, searches for existing dataset by ID.
             name: The name of the dataset to open. If not provided, uses the default dataset.
             configuration: The configuration object containing storage directory settings.
+            layout: How the items are stored, either as one file per item (`'files'`) or in size-capped JSON Lines
+                chunk files (`'chunks'`).
 
         Returns:
             An instance for the opened or created storage client.
@@ -140,7 +160,9 @@ class FileSystemDatasetClient(DatasetClient):
                                 metadata=metadata,
                                 storage_dir=storage_dir,
                                 lock=asyncio.Lock(),
+                                layout=layout,
                             )
+                            await client._open_chunks()
                             await client._update_metadata(update_accessed_at=True)
                             found = True
                             break
@@ -175,8 +197,10 @@ class FileSystemDatasetClient(DatasetClient):
                     metadata=metadata,
                     storage_dir=storage_dir,
                     lock=asyncio.Lock(),
+                    layout=layout,
                 )
 
+                await client._open_chunks()
                 await client._update_metadata(update_accessed_at=True)
 
             # Otherwise, create a new dataset client.
@@ -194,7 +218,9 @@ class FileSystemDatasetClient(DatasetClient):
                     metadata=metadata,
                     storage_dir=storage_dir,
                     lock=asyncio.Lock(),
+                    layout=layout,
                 )
+                await client._open_chunks()
                 await client._update_metadata()
 
         return client
@@ -211,6 +237,9 @@ class FileSystemDatasetClient(DatasetClient):
             for file_path in await self._get_sorted_data_files():
                 await asyncio.to_thread(file_path.unlink, missing_ok=True)
 
+            if self._chunks is not None:
+                await self._chunks.purge()
+
             await self._update_metadata(
                 update_accessed_at=True,
                 update_modified_at=True,
@@ -220,6 +249,15 @@ class FileSystemDatasetClient(DatasetClient):
     @override
     async def push_data(self, data: list[dict[str, Any]] | dict[str, Any]) -> None:
         async with self._lock:
+            if self._chunks is not None:
+                await self._chunks.append(data if isinstance(data, list) else [data])
+                await self._update_metadata(
+                    update_accessed_at=True,
+                    update_modified_at=True,
+                    new_item_count=self._chunks.item_count,
+                )
+                return
+
             new_item_count = self._metadata.item_count
             if isinstance(data, list):
                 for item in data:
@@ -282,6 +320,24 @@ class FileSystemDatasetClient(DatasetClient):
                 items=[],
             )
 
+        if self._chunks is not None:
+            async with self._lock:
+                total = self._chunks.item_count
+                items = await self._read_chunks(offset=offset, limit=limit, desc=desc, total=total)
+                await self._update_metadata(update_accessed_at=True)
+
+            if skip_empty:
+                items = [item for item in items if item]
+
+            return DatasetItemsListPage(
+                count=len(items),
+                offset=offset,
+                limit=limit or total - offset,
+                total=total,
+                desc=desc,
+                items=items,
+            )
+
         # Get the list of sorted data files.
         async with self._lock:
             try:
@@ -370,6 +426,31 @@ class FileSystemDatasetClient(DatasetClient):
             logger.warning(f'Dataset directory not found: {self.path_to_dataset}')
             return
 
+        if self._chunks is not None:
+            # The items are append-only, so the iteration is limited to the ones present when it started.
+            total = self._chunks.item_count
+            end = total if limit is None else min(total, offset + limit)
+
+            for page_offset in range(offset, end, self._ITERATION_PAGE_SIZE):
+                async with self._lock:
+                    page = await self._read_chunks(
+                        offset=page_offset,
+                        limit=min(self._ITERATION_PAGE_SIZE, end - page_offset),
+                        desc=desc,
+                        total=total,
+                    )
+
+                for item in page:
+                    # Skip empty items if requested.
+                    if skip_empty and not item:
+                        continue
+
+                    yield item
+
+            async with self._lock:
+                await self._update_metadata(update_accessed_at=True)
+            return
+
         # Get the list of sorted data files.
         async with self._lock:
             try:
@@ -439,6 +520,76 @@ class FileSystemDatasetClient(DatasetClient):
         data = await json_dumps(self._metadata.model_dump())
         await atomic_write(self.path_to_metadata, data)
 
+    async def _open_chunks(self) -> None:
+        """Open the chunked storage, importing the item files of the `'files'` layout if there are any."""
+        if self._chunks is None:
+            return
+
+        await self._chunks.open()
+
+        data_files = await self._get_sorted_data_files()
+        if data_files:
+            progress = await self._chunks.start_import()
+
+            # Files up to the last recorded one are already in the chunks, only their removal may have been interrupted.
+            imported_files = [file for file in data_files if self._get_item_file_number(file) <= progress.last_file]
+            data_files = data_files[len(imported_files) :]
+            for file_path in imported_files:
+                await asyncio.to_thread(file_path.unlink, missing_ok=True)
+
+            # Items recovered from the chunks beyond the recorded progress were appended from the following files.
+            skipped_count = self._chunks.item_count - progress.item_count
+
+            if data_files:
+                logger.info(f'Importing {len(data_files)} item files into dataset chunks at {self.path_to_dataset}.')
+
+            for start in range(0, len(data_files), self._ITERATION_PAGE_SIZE):
+                page_files = data_files[start : start + self._ITERATION_PAGE_SIZE]
+                items = list[dict[str, Any]]()
+                for file_path in page_files:
+                    file_content = await asyncio.to_thread(file_path.read_text, encoding='utf-8')
+                    try:
+                        items.append(json.loads(file_content))
+                    except json.JSONDecodeError:
+                        logger.exception(f'Corrupt JSON in {file_path}, skipping')
+
+                items, skipped_count = items[skipped_count:], max(skipped_count - len(items), 0)
+                await self._chunks.append(items, imported_file=self._get_item_file_number(page_files[-1]))
+
+                # The progress is recorded in the index together with the items, so the files can be removed now.
+                for file_path in page_files:
+                    await asyncio.to_thread(file_path.unlink, missing_ok=True)
+
+            await self._chunks.finish_import()
+
+        self._metadata.item_count = self._chunks.item_count
+
+    async def _read_chunks(self, *, offset: int, limit: int | None, desc: bool, total: int) -> list[dict[str, Any]]:
+        """Read a page of items from the chunks.
+
+        Args:
+            offset: Number of items to skip from the start, or from the end if `desc` is set.
+            limit: Maximum number of items to read, `None` for no limit.
+            desc: Whether to read the items in the reverse order.
+            total: Number of items in the dataset the page is computed against.
+
+        Returns:
+            The items of the page.
+        """
+        if self._chunks is None:
+            raise RuntimeError('Dataset chunks are not enabled')
+
+        size = total - offset if limit is None else min(limit, total - offset)
+        if size <= 0:
+            return []
+
+        if desc:
+            items = await self._chunks.read(total - offset - size, total - offset)
+            items.reverse()
+            return items
+
+        return await self._chunks.read(offset, offset + size)
+
     async def _push_item(self, item: dict[str, Any], item_id: int) -> None:
         """Push a single item to the dataset.
 
@@ -470,14 +621,15 @@ class FileSystemDatasetClient(DatasetClient):
             A list of `Path` objects pointing to data files, sorted by numeric filename.
         """
         # Retrieve and sort all JSON files in the dataset directory numerically.
-        files = await asyncio.to_thread(
-            sorted,
-            self.path_to_dataset.glob('*.json'),
-            key=lambda f: int(f.stem) if f.stem.isdigit() else 0,
-        )
+        files = await asyncio.to_thread(sorted, self.path_to_dataset.glob('*.json'), key=self._get_item_file_number)
 
         # Remove the metadata file from the list if present.
         if self.path_to_metadata in files:
             files.remove(self.path_to_metadata)
 
         return files
+
+    @staticmethod
+    def _get_item_file_number(file_path: Path) -> int:
+        """Return the number of a data file based on its filename, 0 for non-numeric filenames."""
+        return int(file_path.stem) if file_path.stem.isdigit() else 0
@@ -14,12 +14,12 @@ from typing_extensions import override
 
 from crawlee._consts import METADATA_FILENAME
 from crawlee._utils.crypto import crypto_random_object_id
-from crawlee._utils.file import atomic_write, infer_mime_type, json_dumps
+from crawlee._utils.file import atomic_write, atomic_write_stream, infer_mime_type, json_dumps
 from crawlee.storage_clients._base import KeyValueStoreClient
 from crawlee.storage_clients.models import KeyValueStoreMetadata, KeyValueStoreRecord, KeyValueStoreRecordMetadata
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterable, AsyncIterator
 
     from crawlee.configuration import Configuration
 
@@ -333,6 +333,34 @@ class FileSystemKeyValueStoreClient(KeyValueStoreClient):
             # Update the KVS metadata to record the access and modification.
             await self._update_metadata(update_accessed_at=True, update_modified_at=True)
 
+    @override
+    async def set_value_stream(
+        self,
+        *,
+        key: str,
+        stream: AsyncIterable[bytes],
+        content_type: str | None = None,
+    ) -> None:
+        content_type = content_type or 'application/octet-stream'
+        record_path = self.path_to_kvs / self._encode_key(key)
+        record_metadata_filepath = record_path.with_name(f'{record_path.name}.{METADATA_FILENAME}')
+
+        # Ensure the key-value store directory exists.
+        await asyncio.to_thread(self.path_to_kvs.mkdir, parents=True, exist_ok=True)
+
+        # Write the value chunk by chunk outside of the lock, the stream may take long to produce.
+        size = await atomic_write_stream(record_path, stream)
+
+        record_metadata = KeyValueStoreRecordMetadata(key=key, content_type=content_type, size=size)
+        record_metadata_content = await json_dumps(record_metadata.model_dump())
+
+        async with self._lock:
+            # Write the record metadata to the file.
+            await atomic_write(record_metadata_filepath, record_metadata_content)
+
+            # Update the KVS metadata to record the access and modification.
+            await self._update_metadata(update_accessed_at=True, update_modified_at=True)
+
     @override
     async def delete_value(self, *, key: str) -> None:
         record_path = self.path_to_kvs / self._encode_key(key)
@@ -0,0 +1,373 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+from logging import getLogger
+from typing import TYPE_CHECKING, BinaryIO, Literal, NamedTuple
+
+from pydantic import ValidationError
+
+from crawlee import Request
+from crawlee._utils.file import atomic_write
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
+logger = getLogger(__name__)
+
+RequestLogOperation = Literal['add', 'reclaim', 'handled']
+"""Kind of a transition recorded in the request log."""
+
+
+class RequestLogEntry(NamedTuple):
+    """Location of the latest record of a request in the log."""
+
+    segment: int
+    """Number of the segment file containing the record."""
+
+    offset: int
+    """Byte offset of the record within the segment file."""
+
+    length: int
+    """Length of the record in bytes, including the trailing newline."""
+
+    handled: bool
+    """Whether the latest record marks the request as handled."""
+
+
+class RequestLog:
+    """Append-only, segmented storage for request records.
+
+    Every change of a request (adding it, reclaiming it or marking it as handled) is appended as a single JSON line
+    to the active segment file. Once the active segment grows over `max_segment_size` bytes, it is sealed and a new
+    one is started. An in-memory index maps each unique key to the location of its latest record, so a request can
+    be read back with a single seek.
+
+    The index is persisted every time a segment is sealed or the log is compacted, hence on open only the records
+    appended after the last persisted position need to be replayed. Superseded records are dropped by compaction,
+    which runs automatically once they make up more than `compaction_threshold` of the log.
+
+    The log is not safe for concurrent use, callers are expected to serialize access to it.
+    """
+
+    _INDEX_FILENAME = '__index__.json'
+    """The name of the file holding the persisted index."""
+
+    _SEGMENT_SUFFIX = '.log'
+    """The suffix of the segment files."""
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_segment_size: int = 64 * 1024 * 1024,
+        compaction_threshold: float = 0.5,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            path: The directory where the segments and the index are stored.
+            max_segment_size: The size in bytes after which the active segment is sealed and a new one is started.
+            compaction_threshold: The ratio of superseded bytes to the total log size that triggers compaction.
+        """
+        self._path = path
+        self._max_segment_size = max_segment_size
+        self._compaction_threshold = compaction_threshold
+
+        self._entries = dict[str, RequestLogEntry]()
+        """The location of the latest record for each unique key, in the order of first insertion."""
+
+        self._active_segment = 0
+        """The number of the segment the records are currently appended to."""
+
+        self._active_segment_size = 0
+        """The current size of the active segment in bytes."""
+
+        self._total_size = 0
+        """The total size of all segments in bytes."""
+
+        self._live_size = 0
+        """The size of the records referenced by the index in bytes."""
+
+        self._write_file: BinaryIO | None = None
+        """The file handle of the active segment, opened lazily."""
+
+    def __contains__(self, unique_key: object) -> bool:
+        return unique_key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def path_to_index(self) -> Path:
+        """The full path to the persisted index file."""
+        return self._path / self._INDEX_FILENAME
+
+    def get_entry(self, unique_key: str) -> RequestLogEntry | None:
+        """Get the location of the latest record of a request, if any."""
+        return self._entries.get(unique_key)
+
+    def iter_entries(self) -> Iterator[tuple[str, RequestLogEntry]]:
+        """Iterate over the unique keys and their entries in the order in which they were first added."""
+        return iter(self._entries.items())
+
+    async def open(self) -> None:
+        """Load the persisted index and replay the records appended after it was written."""
+        await asyncio.to_thread(self._path.mkdir, parents=True, exist_ok=True)
+        await asyncio.to_thread(self._load)
+
+    async def close(self) -> None:
+        """Close the active segment file handle."""
+        if self._write_file is not None:
+            await asyncio.to_thread(self._write_file.close)
+            self._write_file = None
+
+    async def append(self, operation: RequestLogOperation, requests: Sequence[Request]) -> None:
+        """Append records for the given requests in a single write.
+
+        Args:
+            operation: The transition to record.
+            requests: The requests to record, in their current form.
+        """
+        if not requests:
+            return
+
+        lines = [self._encode_record(operation, request) for request in requests]
+        offset = await asyncio.to_thread(self._write_lines, lines)
+
+        for request, line in zip(requests, lines, strict=True):
+            self._set_entry(
+                request.unique_key,
+                RequestLogEntry(self._active_segment, offset, len(line), handled=operation == 'handled'),
+            )
+            offset += len(line)
+
+        if self._active_segment_size >= self._max_segment_size:
+            await self._seal_active_segment()
+
+        garbage_size = self._total_size - self._live_size
+        if self._total_size > self._max_segment_size and garbage_size > self._total_size * self._compaction_threshold:
+            await self.compact()
+
+    async def read(self, unique_key: str) -> Request | None:
+        """Read the latest version of a request from the log.
+
+        Args:
+            unique_key: Unique key of the request.
+
+        Returns:
+            The request or `None` if it is not in the log or its record could not be read.
+        """
+        requests = await self.read_many([unique_key])
+        return requests[0] if requests else None
+
+    async def read_many(self, unique_keys: Sequence[str]) -> list[Request]:
+        """Read the latest versions of multiple requests, keeping the order of the given keys.
+
+        Keys which are not in the log or whose records could not be read are skipped.
+        """
+        entries = [(key, self._entries[key]) for key in unique_keys if key in self._entries]
+        if not entries:
+            return []
+
+        return await asyncio.to_thread(self._read_records, entries)
+
+    async def compact(self) -> None:
+        """Rewrite the log so that it only contains the latest record of each request.
+
+        The live records are copied into fresh segments in their insertion order, the index is persisted and only
+        then are the old segments removed, so a crash at any point leaves a readable log behind.
+        """
+        await self.close()
+        old_segments = await asyncio.to_thread(self._list_segments)
+
+        self._active_segment = (old_segments[-1] if old_segments else self._active_segment) + 1
+        self._active_segment_size = 0
+        self._total_size = 0
+
+        entries = list(self._entries.items())
+        batch_size = 1000
+
+        for start in range(0, len(entries), batch_size):
+            batch = entries[start : start + batch_size]
+            records = await asyncio.to_thread(self._read_raw_records, batch)
+            offset = await asyncio.to_thread(self._write_lines, records)
+
+            for (unique_key, entry), record in zip(batch, records, strict=True):
+                self._entries[unique_key] = RequestLogEntry(self._active_segment, offset, len(record), entry.handled)
+                offset += len(record)
+
+            if self._active_segment_size >= self._max_segment_size:
+                await self.close()
+                self._active_segment += 1
+                self._active_segment_size = 0
+
+        self._live_size = self._total_size
+        await self._persist_index()
+
+        for segment in old_segments:
+            await asyncio.to_thread(self._get_segment_path(segment).unlink, missing_ok=True)
+
+        logger.debug(f'Compacted request log at {self._path} into {len(self._entries)} records.')
+
+    async def purge(self) -> None:
+        """Remove all segments and the index."""
+        await self.close()
+
+        if self._path.exists():
+            await asyncio.to_thread(shutil.rmtree, self._path)
+
+        await asyncio.to_thread(self._path.mkdir, parents=True, exist_ok=True)
+
+        self._entries.clear()
+        self._active_segment = 0
+        self._active_segment_size = 0
+        self._total_size = 0
+        self._live_size = 0
+
+    def _set_entry(self, unique_key: str, entry: RequestLogEntry) -> None:
+        previous = self._entries.get(unique_key)
+        if previous is not None:
+            self._live_size -= previous.length
+
+        self._entries[unique_key] = entry
+        self._live_size += entry.length
+
+    def _get_segment_path(self, segment: int) -> Path:
+        return self._path / f'{segment:09d}{self._SEGMENT_SUFFIX}'
+
+    def _list_segments(self) -> list[int]:
+        segments = [int(file.stem) for file in self._path.glob(f'*{self._SEGMENT_SUFFIX}') if file.stem.isdigit()]
+        return sorted(segments)
+
+    async def _seal_active_segment(self) -> None:
+        await self.close()
+        self._active_segment += 1
+        self._active_segment_size = 0
+        await self._persist_index()
+
+    async def _persist_index(self) -> None:
+        index = {
+            'segment': self._active_segment,
+            'offset': self._active_segment_size,
+            'entries': {key: list(entry) for key, entry in self._entries.items()},
+        }
+        await atomic_write(self.path_to_index, json.dumps(index, ensure_ascii=False, separators=(',', ':')))
+
+    @staticmethod
+    def _encode_record(operation: RequestLogOperation, request: Request) -> bytes:
+        record = {'op': operation, 'request': request.model_dump(mode='json')}
+        return json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+    @staticmethod
+    def _parse_record_header(line: bytes) -> tuple[str, bool] | None:
+        """Parse the unique key and the handled flag of a record, or return `None` if the record is incomplete."""
+        if not line.endswith(b'\n'):
+            return None
+
+        try:
+            record = json.loads(line)
+            return record['request']['unique_key'], record.get('op') == 'handled'
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def _write_lines(self, lines: Sequence[bytes]) -> int:
+        """Append lines to the active segment and return the offset at which they start."""
+        if self._write_file is None:
+            self._write_file = self._get_segment_path(self._active_segment).open('ab')
+
+        offset = self._active_segment_size
+        data = b''.join(lines)
+        self._write_file.write(data)
+        self._write_file.flush()
+
+        self._active_segment_size += len(data)
+        self._total_size += len(data)
+        return offset
+
+    def _read_raw_records(self, entries: Sequence[tuple[str, RequestLogEntry]]) -> list[bytes]:
+        records = list[bytes]()
+        handles = dict[int, BinaryIO]()
+
+        try:
+            for _, entry in entries:
+                if entry.segment not in handles:
+                    handles[entry.segment] = self._get_segment_path(entry.segment).open('rb')
+                file = handles[entry.segment]
+                file.seek(entry.offset)
+                records.append(file.read(entry.length))
+        finally:
+            for file in handles.values():
+                file.close()
+
+        return records
+
+    def _read_records(self, entries: Sequence[tuple[str, RequestLogEntry]]) -> list[Request]:
+        requests = list[Request]()
+
+        try:
+            records = self._read_raw_records(entries)
+        except FileNotFoundError as exc:
+            logger.warning(f'Request log segment not found: {exc!s}')
+            return requests
+
+        for (unique_key, _), record in zip(entries, records, strict=True):
+            try:
+                requests.append(Request.model_validate(json.loads(record)['request']))
+            except (json.JSONDecodeError, KeyError, ValidationError) as exc:  # noqa: PERF203
+                logger.warning(f'Failed to read record of request {unique_key} from the request log: {exc!s}')
+
+        return requests
+
+    def _load(self) -> None:
+        segments = self._list_segments()
+        start_segment, start_offset = 0, 0
+
+        if self.path_to_index.exists():
+            try:
+                index = json.loads(self.path_to_index.read_text(encoding='utf-8'))
+                start_segment, start_offset = index['segment'], index['offset']
+                self._entries = {
+                    key: RequestLogEntry(segment, offset, length, bool(handled))
+                    for key, (segment, offset, length, handled) in index['entries'].items()
+                }
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as exc:
+                logger.warning(f'Failed to load request log index, rebuilding it from segments: {exc!s}')
+                self._entries = {}
+                start_segment, start_offset = 0, 0
+
+        self._live_size = sum(entry.length for entry in self._entries.values())
+        self._total_size = sum(self._get_segment_path(segment).stat().st_size for segment in segments)
+
+        for segment in segments:
+            if segment < start_segment:
+                continue
+            self._replay_segment(segment, start_offset if segment == start_segment else 0)
+
+        self._active_segment = max(segments[-1] if segments else 0, start_segment)
+        segment_path = self._get_segment_path(self._active_segment)
+        self._active_segment_size = segment_path.stat().st_size if segment_path.exists() else 0
+
+    def _replay_segment(self, segment: int, offset: int) -> None:
+        segment_path = self._get_segment_path(segment)
+
+        with segment_path.open('rb') as file:
+            file.seek(offset)
+            for line in file:
+                parsed = self._parse_record_header(line)
+                if parsed is None:
+                    break
+
+                unique_key, handled = parsed
+                self._set_entry(unique_key, RequestLogEntry(segment, offset, len(line), handled=handled))
+                offset += len(line)
+
+        # A record interrupted by a crash can only be at the very end, drop it so that appends start on a clean line.
+        size = segment_path.stat().st_size
+        if offset < size:
+            logger.warning(f'Truncating {size - offset} bytes of incomplete records from {segment_path}.')
+            with segment_path.open('r+b') as file:
+                file.truncate(offset)
+            self._total_size -= size - offset
@@ -3,12 +3,14 @@ from __future__ import annotations
 import asyncio
 import json
 import shutil
+import time
 from collections import deque
-from datetime import datetime, timezone
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
 from hashlib import sha256
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import BaseModel, ValidationError
 from typing_extensions import override
@@ -18,7 +20,9 @@ from crawlee._consts import METADATA_FILENAME
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee._utils.file import atomic_write, json_dumps
 from crawlee._utils.recoverable_state import RecoverableState
+from crawlee.events._types import Event
 from crawlee.storage_clients._base import RequestQueueClient
+from crawlee.storage_clients._fair_queue import FairRequestQueue
 from crawlee.storage_clients.models import (
     AddRequestsResponse,
     ProcessedRequest,
@@ -26,10 +30,14 @@ from crawlee.storage_clients.models import (
     UnprocessedRequest,
 )
 
+from ._request_log import RequestLog
+
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
     from crawlee.configuration import Configuration
+    from crawlee.events._types import EventPersistStateData
+    from crawlee.storage_clients._fair_queue import FairSchedulingPolicy
 
 logger = getLogger(__name__)
 
@@ -74,6 +82,16 @@ class FileSystemRequestQueueClient(RequestQueueClient):
 
     This implementation is ideal for long-running crawlers where persistence is important and for situations
     where you need to resume crawling after process termination.
+
+    For very large queues, the `'log'` layout can be used instead. Requests are then appended to rolling segment
+    files in the `{STORAGE_DIR}/request_queues/{QUEUE_ID}/__log__` directory together with their handled and
+    reclaimed transitions, and they are looked up through a compact index instead of one file per request.
+    Request files of the default `'files'` layout found in the queue directory are imported into the log when
+    the queue is opened.
+
+    With a `FairSchedulingPolicy`, the requests loaded in the cache are served in turns across their hosts instead
+    of in the order they were added. When all hosts in the cache are at their in-progress limit, further requests
+    are loaded until a host with free capacity is found or the cache is full.
     """
 
     _STORAGE_SUBDIR = 'request_queues'
@@ -85,12 +103,21 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     _MAX_REQUESTS_IN_CACHE = 100_000
     """Maximum number of requests to keep in cache for faster access."""
 
+    _CACHE_REFILL_BATCH_SIZE = 1_000
+    """Number of request bodies loaded from the storage when the cache runs dry."""
+
+    _LOG_SUBDIR = '__log__'
+    """The name of the subdirectory where the request log is stored when using the `'log'` layout."""
+
     def __init__(
         self,
         *,
         metadata: RequestQueueMetadata,
         storage_dir: Path,
         lock: asyncio.Lock,
+        layout: Literal['files', 'log'] = 'files',
+        metadata_write_delay: timedelta = timedelta(0),
+        scheduling_policy: FairSchedulingPolicy | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -104,11 +131,20 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         self._lock = lock
         """A lock to ensure that only one operation is performed at a time."""
 
-        self._request_cache = deque[Request]()
-        """Cache for requests: forefront requests at the beginning, regular requests at the end."""
+        self._request_cache = FairRequestQueue(scheduling_policy)
+        """Cache for requests: forefront requests at the beginning, regular requests at the end, per host."""
+
+        self._cached_positions = dict[str, tuple[bool, int]]()
+        """Positions `(is_forefront, sequence)` of the cached requests in the state when they were cached."""
+
+        self._forefront_index = list[tuple[int, str]]()
+        """Pending forefront requests which are not in the cache as `(sequence, unique_key)`, newest at the end."""
+
+        self._regular_index = deque[tuple[int, str]]()
+        """Pending regular requests which are not in the cache as `(sequence, unique_key)`, oldest at the beginning."""
 
         self._request_cache_needs_refresh = True
-        """Flag indicating whether the cache needs to be refreshed from filesystem."""
+        """Flag indicating whether the cache and the pending request index need to be rebuilt from the state."""
 
         self._is_empty_cache: bool | None = None
         """Cache for is_empty result: None means unknown, True/False is cached state."""
@@ -118,10 +154,23 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             persist_state_key='request_queue_state',
             persistence_enabled=True,
             persist_state_kvs_name=f'__RQ_STATE_{self._metadata.id}',
+            persistence_mode='journal',
             logger=logger,
         )
         """Recoverable state to maintain request ordering, in-progress status, and handled status."""
 
+        self._request_log = RequestLog(self.path_to_rq / self._LOG_SUBDIR) if layout == 'log' else None
+        """Segmented log holding the request bodies, `None` when each request is stored in its own file."""
+
+        self._metadata_write_delay = metadata_write_delay
+        """Minimum time between two writes of the metadata file, updates in between are committed together."""
+
+        self._metadata_write_task: asyncio.Task[None] | None = None
+        """A pending delayed write of the metadata file, if any."""
+
+        self._last_metadata_write_at = 0.0
+        """Monotonic time of the last write of the metadata file."""
+
     @override
     async def get_metadata(self) -> RequestQueueMetadata:
         return self._metadata
@@ -146,6 +195,9 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         id: str | None,
         name: str | None,
         configuration: Configuration,
+        layout: Literal['files', 'log'] = 'files',
+        metadata_write_delay: timedelta = timedelta(0),
+        scheduling_policy: FairSchedulingPolicy | None = None,
     ) -> FileSystemRequestQueueClient:
         """Open or create a file system request queue client.
 
@@ -157,6 +209,13 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             id: The ID of the request queue to open. If provided, searches for existing queue by ID.
             name: The name of the request queue to open. If not provided, uses the default queue.
             configuration: The configuration object containing storage directory settings.
+            layout: How the requests are stored, either as one file per request (`'files'`) or in an append-only
+                segmented log (`'log'`).
+            metadata_write_delay: The minimum time between two writes of the metadata file. Metadata updates made
+                in the meantime are committed together in a single write, at the cost of the metadata file lagging
+                behind by up to this long.
+            scheduling_policy: The policy for serving requests fairly across hosts. If not provided, requests
+                are served in the order they were added.
 
         Returns:
             An instance for the opened or created storage client.
@@ -192,8 +251,11 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                                 metadata=metadata,
                                 storage_dir=storage_dir,
                                 lock=asyncio.Lock(),
+                                layout=layout,
+                                metadata_write_delay=metadata_write_delay,
+                                scheduling_policy=scheduling_policy,
                             )
-                            await client._state.initialize()
+                            await client._initialize()
                             await client._discover_existing_requests()
                             await client._update_metadata(update_accessed_at=True)
                             found = True
@@ -229,9 +291,12 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                     metadata=metadata,
                     storage_dir=storage_dir,
                     lock=asyncio.Lock(),
+                    layout=layout,
+                    metadata_write_delay=metadata_write_delay,
+                    scheduling_policy=scheduling_policy,
                 )
 
-                await client._state.initialize()
+                await client._initialize()
                 await client._discover_existing_requests()
                 await client._update_metadata(update_accessed_at=True)
 
@@ -253,8 +318,11 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                     metadata=metadata,
                     storage_dir=storage_dir,
                     lock=asyncio.Lock(),
+                    layout=layout,
+                    metadata_write_delay=metadata_write_delay,
+                    scheduling_policy=scheduling_policy,
                 )
-                await client._state.initialize()
+                await client._initialize()
                 await client._update_metadata()
 
         return client
@@ -262,6 +330,12 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     @override
     async def drop(self) -> None:
         async with self._lock:
+            if self._request_log is not None:
+                await self._request_log.close()
+
+            await self._cancel_metadata_write()
+            self._unsubscribe_metadata_flush()
+
             # Remove the RQ dir recursively if it exists.
             if self.path_to_rq.exists():
                 await asyncio.to_thread(shutil.rmtree, self.path_to_rq)
@@ -270,6 +344,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             await self._state.reset()
             await self._state.teardown()
             self._request_cache.clear()
+            self._cached_positions.clear()
             self._request_cache_needs_refresh = True
 
             # Invalidate is_empty cache.
@@ -283,9 +358,13 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             for file_path in request_files:
                 await asyncio.to_thread(file_path.unlink, missing_ok=True)
 
+            if self._request_log is not None:
+                await self._request_log.purge()
+
             # Clear recoverable state
             await self._state.reset()
             self._request_cache.clear()
+            self._cached_positions.clear()
             self._request_cache_needs_refresh = True
 
             await self._update_metadata(
@@ -293,6 +372,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 update_accessed_at=True,
                 new_pending_request_count=0,
             )
+            await self._flush_metadata_write()
 
             # Invalidate is_empty cache.
             self._is_empty_cache = None
@@ -315,6 +395,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             all_requests = state.forefront_requests | state.regular_requests
 
             requests_to_enqueue = {}
+            requests_to_write = list[Request]()
+            requests_to_splice = list[Request]()
 
             # Determine which requests can be added or are modified.
             for request in requests:
@@ -348,20 +430,19 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             for request in requests_to_enqueue.values():
                 # If the request is not already in the RQ, this is a new request.
                 if request.unique_key not in all_requests:
-                    request_path = self._get_request_path(request.unique_key)
                     # Add sequence number to ensure FIFO ordering using state.
                     if forefront:
                         sequence_number = state.forefront_sequence_counter
                         state.forefront_sequence_counter += 1
                         state.forefront_requests[request.unique_key] = sequence_number
+                        requests_to_splice.append(request)
                     else:
                         sequence_number = state.sequence_counter
                         state.sequence_counter += 1
                         state.regular_requests[request.unique_key] = sequence_number
+                        self._regular_index.append((sequence_number, request.unique_key))
 
-                    # Save the clean request without extra fields
-                    request_data = await json_dumps(request.model_dump())
-                    await atomic_write(request_path, request_data)
+                    requests_to_write.append(request)
 
                     # Update the metadata counts.
                     new_total_request_count += 1
@@ -382,8 +463,16 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                         state.regular_requests.pop(request.unique_key)
 
                     # If the request is already in `forefront`, we just need to update its position.
-                    state.forefront_requests[request.unique_key] = state.forefront_sequence_counter
+                    sequence_number = state.forefront_sequence_counter
                     state.forefront_sequence_counter += 1
+                    state.forefront_requests[request.unique_key] = sequence_number
+
+                    # Move the stored version of the request to the front, its old position becomes stale.
+                    stored_request = await self._read_request(request.unique_key)
+                    if stored_request is not None:
+                        requests_to_splice.append(stored_request)
+                    else:
+                        self._forefront_index.append((sequence_number, request.unique_key))
 
                     processed_requests.append(
                         ProcessedRequest(
@@ -403,6 +492,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                         )
                     )
 
+            await self._write_requests('add', requests_to_write)
+
             await self._update_metadata(
                 update_modified_at=True,
                 update_accessed_at=True,
@@ -410,9 +501,8 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 new_pending_request_count=new_pending_request_count,
             )
 
-            # Invalidate the cache if we added forefront requests.
-            if forefront:
-                self._request_cache_needs_refresh = True
+            # Put the forefront requests directly to the front of the cache, so that it does not need to be reloaded.
+            self._splice_into_cache(requests_to_splice)
 
             # Invalidate is_empty cache.
             self._is_empty_cache = None
@@ -425,8 +515,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
     @override
     async def get_request(self, unique_key: str) -> Request | None:
         async with self._lock:
-            request_path = self._get_request_path(unique_key)
-            request = await self._parse_request_file(request_path)
+            request = await self._read_request(unique_key)
 
             if request is None:
                 logger.warning(f'Request with unique key "{unique_key}" not found in the queue.')
@@ -437,29 +526,60 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             await self._update_metadata(update_accessed_at=True)
             return request
 
+    @override
+    async def get_unique_keys(self) -> list[str]:
+        async with self._lock:
+            state = self._state.current_value
+            return list(
+                state.forefront_requests.keys()
+                | state.regular_requests.keys()
+                | state.in_progress_requests
+                | state.handled_requests
+            )
+
     @override
     async def fetch_next_request(self) -> Request | None:
         async with self._lock:
-            # Refresh cache if needed or if it's empty.
-            if self._request_cache_needs_refresh or not self._request_cache:
-                await self._refresh_cache()
+            if self._request_cache_needs_refresh:
+                self._rebuild_pending_index()
 
             next_request: Request | None = None
             state = self._state.current_value
 
-            # Fetch from the front of the deque (forefront requests are at the beginning).
-            while self._request_cache and next_request is None:
-                candidate = self._request_cache.popleft()
+            # Fetch from the front of the cache (forefront requests are at the beginning).
+            while next_request is None:
+                candidate = self._request_cache.pop()
+
+                # Load more requests if the cache has none that can be served now.
+                if candidate is None:
+                    if len(self._request_cache) >= self._MAX_REQUESTS_IN_CACHE or not self._has_pending_in_index():
+                        break
 
-                # Skip requests that are already in progress, however this should not happen.
-                if candidate.unique_key not in state.in_progress_requests:
+                    await self._refill_cache()
+                    continue
+
+                # Skip stale entries of requests that were moved, handled or are already in progress.
+                if self._is_cached_request_current(candidate):
                     next_request = candidate
+                self._cached_positions.pop(candidate.unique_key, None)
 
             if next_request is not None:
                 state.in_progress_requests.add(next_request.unique_key)
+                self._request_cache.start(next_request)
 
             return next_request
 
+    @override
+    async def has_next_request(self) -> bool:
+        async with self._lock:
+            if self._request_cache_needs_refresh:
+                self._rebuild_pending_index()
+
+            # Mirrors `fetch_next_request`, which loads more requests only while the cache has room for them.
+            return self._request_cache.has_available() or (
+                len(self._request_cache) < self._MAX_REQUESTS_IN_CACHE and self._has_pending_in_index()
+            )
+
     @override
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
         async with self._lock:
@@ -475,19 +595,17 @@ class FileSystemRequestQueueClient(RequestQueueClient):
             if request.handled_at is None:
                 request.handled_at = datetime.now(timezone.utc)
 
-            # Dump the updated request to the file.
-            request_path = self._get_request_path(request.unique_key)
-
-            if not await asyncio.to_thread(request_path.exists):
+            if not await self._request_exists(request.unique_key):
                 logger.warning(f'Request file for {request.unique_key} does not exist, cannot mark as handled.')
                 return None
 
-            request_data = await json_dumps(request.model_dump())
-            await atomic_write(request_path, request_data)
+            # Dump the updated request to the storage.
+            await self._write_requests('handled', [request])
 
             # Update state: remove from in-progress and add to handled.
             state.in_progress_requests.discard(request.unique_key)
             state.handled_requests.add(request.unique_key)
+            self._request_cache.finish(request)
 
             # Update RQ metadata.
             await self._update_metadata(
@@ -503,6 +621,52 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 was_already_handled=True,
             )
 
+    @override
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        async with self._lock:
+            self._is_empty_cache = None
+            state = self._state.current_value
+            handled_at = datetime.now(timezone.utc)
+
+            to_handle = list[Request]()
+            for request in {request.unique_key: request for request in requests}.values():
+                if request.unique_key not in state.in_progress_requests:
+                    logger.warning(f'Marking request {request.unique_key} as handled that is not in progress.')
+                    continue
+
+                if not await self._request_exists(request.unique_key):
+                    logger.warning(f'Request file for {request.unique_key} does not exist, cannot mark as handled.')
+                    continue
+
+                if request.handled_at is None:
+                    request.handled_at = handled_at
+
+                to_handle.append(request)
+
+            if not to_handle:
+                return []
+
+            # Dump all the updated requests to the storage at once.
+            await self._write_requests('handled', to_handle)
+
+            for request in to_handle:
+                state.in_progress_requests.discard(request.unique_key)
+                state.handled_requests.add(request.unique_key)
+                self._request_cache.finish(request)
+
+            # Update RQ metadata once for the whole batch.
+            await self._update_metadata(
+                update_modified_at=True,
+                update_accessed_at=True,
+                new_handled_request_count=self._metadata.handled_request_count + len(to_handle),
+                new_pending_request_count=self._metadata.pending_request_count - len(to_handle),
+            )
+
+            return [
+                ProcessedRequest(unique_key=request.unique_key, was_already_present=True, was_already_handled=True)
+                for request in to_handle
+            ]
+
     @override
     async def reclaim_request(
         self,
@@ -519,9 +683,7 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 logger.info(f'Reclaiming request {request.unique_key} that is not in progress.')
                 return None
 
-            request_path = self._get_request_path(request.unique_key)
-
-            if not await asyncio.to_thread(request_path.exists):
+            if not await self._request_exists(request.unique_key):
                 logger.warning(f'Request file for {request.unique_key} does not exist, cannot reclaim.')
                 return None
 
@@ -539,12 +701,11 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 state.sequence_counter += 1
                 state.regular_requests[request.unique_key] = sequence_number
 
-            # Save the clean request without extra fields
-            request_data = await json_dumps(request.model_dump())
-            await atomic_write(request_path, request_data)
+            await self._write_requests('reclaim', [request])
 
             # Remove from in-progress.
             state.in_progress_requests.discard(request.unique_key)
+            self._request_cache.finish(request)
 
             # Update RQ metadata.
             await self._update_metadata(
@@ -552,11 +713,11 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 update_accessed_at=True,
             )
 
-            # Add the request back to the cache.
+            # Add the request back to the cache, or to the end of the pending index if it goes to the back.
             if forefront:
-                self._request_cache.appendleft(request)
+                self._splice_into_cache([request])
             else:
-                self._request_cache.append(request)
+                self._regular_index.append((sequence_number, request.unique_key))
 
             return ProcessedRequest(
                 unique_key=request.unique_key,
@@ -578,23 +739,19 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 self._is_empty_cache = False
                 return False
 
+            if self._request_cache_needs_refresh:
+                self._rebuild_pending_index()
+
             # If we have a cached requests, check them first (fast path).
-            if self._request_cache:
-                for req in self._request_cache:
-                    if req.unique_key not in state.handled_requests:
-                        self._is_empty_cache = False
-                        return False
-                self._is_empty_cache = True
-                return len(state.in_progress_requests) == 0
-
-            # Fallback: check state for unhandled requests.
-            await self._update_metadata(update_accessed_at=True)
+            for req in self._request_cache:
+                if self._is_cached_request_current(req):
+                    self._is_empty_cache = False
+                    return False
 
-            # Check if there are any requests that are not handled
-            all_requests = set(state.forefront_requests.keys()) | set(state.regular_requests.keys())
-            unhandled_requests = all_requests - state.handled_requests
+            # Fallback: check the index of pending requests which are not loaded yet.
+            await self._update_metadata(update_accessed_at=True)
 
-            if unhandled_requests:
+            if self._has_pending_in_index():
                 self._is_empty_cache = False
                 return False
 
@@ -612,6 +769,83 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         """
         return self.path_to_rq / f'{self._get_file_base_name_from_unique_key(unique_key)}.json'
 
+    async def _write_requests(
+        self,
+        operation: Literal['add', 'reclaim', 'handled'],
+        requests: Sequence[Request],
+    ) -> None:
+        """Persist the current form of the given requests.
+
+        Args:
+            operation: The transition which caused the write, recorded when using the log layout.
+            requests: The requests to persist.
+        """
+        if self._request_log is not None:
+            await self._request_log.append(operation, requests)
+            return
+
+        for request in requests:
+            # Save the clean request without extra fields
+            request_data = await json_dumps(request.model_dump())
+            await atomic_write(self._get_request_path(request.unique_key), request_data)
+
+    async def _read_request(self, unique_key: str) -> Request | None:
+        """Read a request from the storage.
+
+        Args:
+            unique_key: Unique key of the request.
+
+        Returns:
+            The request or `None` if it could not be found or parsed.
+        """
+        if self._request_log is not None:
+            return await self._request_log.read(unique_key)
+
+        return await self._parse_request_file(self._get_request_path(unique_key))
+
+    async def _read_requests(self, unique_keys: Sequence[str]) -> list[Request]:
+        """Read multiple requests from the storage, skipping those that could not be found or parsed."""
+        if self._request_log is not None:
+            return await self._request_log.read_many(unique_keys)
+
+        requests = list[Request]()
+        for unique_key in unique_keys:
+            request = await self._parse_request_file(self._get_request_path(unique_key))
+            if request is not None:
+                requests.append(request)
+
+        return requests
+
+    async def _initialize(self) -> None:
+        """Load the recoverable state and open the request log of a newly created client."""
+        await self._state.initialize()
+
+        if self._request_log is not None:
+            await self._request_log.open()
+
+        # A delayed metadata write would be lost if the process ended before it runs, so it is committed right away
+        # whenever the state is persisted.
+        if self._metadata_write_delay > timedelta(0):
+            # Import here to avoid circular imports.
+            from crawlee import service_locator  # noqa: PLC0415
+
+            service_locator.get_event_manager().on(event=Event.PERSIST_STATE, listener=self._flush_metadata_write)
+
+    def _unsubscribe_metadata_flush(self) -> None:
+        """Stop committing delayed metadata writes on PERSIST_STATE events."""
+        if self._metadata_write_delay > timedelta(0):
+            # Import here to avoid circular imports.
+            from crawlee import service_locator  # noqa: PLC0415
+
+            service_locator.get_event_manager().off(event=Event.PERSIST_STATE, listener=self._flush_metadata_write)
+
+    async def _request_exists(self, unique_key: str) -> bool:
+        """Check whether a request is present in the storage."""
+        if self._request_log is not None:
+            return unique_key in self._request_log
+
+        return await asyncio.to_thread(self._get_request_path(unique_key).exists)
+
     async def _update_metadata(
         self,
         *,
@@ -655,6 +889,21 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         if update_had_multiple_clients:
             self._metadata.had_multiple_clients = True
 
+        # A delayed write is already scheduled, it will commit this update as well.
+        if self._metadata_write_task is not None:
+            return
+
+        remaining_delay = self._last_metadata_write_at + self._metadata_write_delay.total_seconds() - time.monotonic()
+
+        if remaining_delay <= 0:
+            await self._write_metadata()
+        else:
+            self._metadata_write_task = asyncio.create_task(self._write_metadata_after(remaining_delay))
+
+    async def _write_metadata(self) -> None:
+        """Write the current metadata to the metadata file."""
+        self._last_metadata_write_at = time.monotonic()
+
         # Ensure the parent directory for the metadata file exists.
         await asyncio.to_thread(self.path_to_metadata.parent.mkdir, parents=True, exist_ok=True)
 
@@ -662,67 +911,162 @@ class FileSystemRequestQueueClient(RequestQueueClient):
         data = await json_dumps(self._metadata.model_dump())
         await atomic_write(self.path_to_metadata, data)
 
-    async def _refresh_cache(self) -> None:
-        """Refresh the request cache from filesystem.
+    async def _write_metadata_after(self, delay: float) -> None:
+        """Write the metadata file once the delay passes, committing all updates made in the meantime."""
+        await asyncio.sleep(delay)
+        self._metadata_write_task = None
+        await self._write_metadata()
+
+    async def _flush_metadata_write(self, event_data: EventPersistStateData | None = None) -> None:  # noqa: ARG002
+        """Commit the pending delayed write of the metadata file right away, if there is one."""
+        if self._metadata_write_task is not None:
+            await self._cancel_metadata_write()
+            await self._write_metadata()
+
+    async def _cancel_metadata_write(self) -> None:
+        """Cancel the pending delayed write of the metadata file, if any."""
+        if self._metadata_write_task is not None:
+            self._metadata_write_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._metadata_write_task
+            self._metadata_write_task = None
+
+    def _is_pending(self, unique_key: str) -> bool:
+        """Check whether a request is waiting in the queue, i.e. it is neither handled nor in progress."""
+        state = self._state.current_value
+        return (
+            unique_key not in state.handled_requests
+            and unique_key not in state.in_progress_requests
+            and (unique_key in state.forefront_requests or unique_key in state.regular_requests)
+        )
 
-        This method loads up to _MAX_REQUESTS_IN_CACHE requests from the filesystem,
-        prioritizing forefront requests and maintaining proper ordering.
-        """
-        self._request_cache.clear()
+    def _get_position(self, unique_key: str) -> tuple[bool, int] | None:
+        """Get the position `(is_forefront, sequence)` of a request in the state, if it is queued."""
         state = self._state.current_value
 
-        forefront_requests = list[tuple[Request, int]]()  # (request, sequence)
-        regular_requests = list[tuple[Request, int]]()  # (request, sequence)
+        if (sequence := state.forefront_requests.get(unique_key)) is not None:
+            return True, sequence
 
-        request_files = await self._get_request_files(self.path_to_rq)
+        if (sequence := state.regular_requests.get(unique_key)) is not None:
+            return False, sequence
 
-        for request_file in request_files:
-            request = await self._parse_request_file(request_file)
+        return None
 
-            if request is None:
-                continue
+    def _is_cached_request_current(self, request: Request) -> bool:
+        """Check whether a cached request is pending and still at the position it was cached at.
 
-            # Skip handled requests
-            if request.unique_key in state.handled_requests:
-                continue
+        A request moved since it was cached, e.g. reclaimed to the back of the queue, is served from its new position
+        and its cache entry is stale, just like the entries in the index.
+        """
+        position = self._cached_positions.get(request.unique_key)
+        return (
+            position is not None
+            and position == self._get_position(request.unique_key)
+            and self._is_pending(request.unique_key)
+        )
 
-            # Skip in-progress requests
-            if request.unique_key in state.in_progress_requests:
+    def _add_to_cache(self, requests: Sequence[Request], *, forefront: bool = False) -> None:
+        """Put requests to the cache, remembering their current positions in the state."""
+        for request in requests:
+            if (position := self._get_position(request.unique_key)) is None:
                 continue
 
-            # Determine if request is forefront or regular based on state
-            if request.unique_key in state.forefront_requests:
-                sequence = state.forefront_requests[request.unique_key]
-                forefront_requests.append((request, sequence))
-            elif request.unique_key in state.regular_requests:
-                sequence = state.regular_requests[request.unique_key]
-                regular_requests.append((request, sequence))
+            self._cached_positions[request.unique_key] = position
+            if forefront:
+                self._request_cache.appendleft(request)
             else:
-                # Request not in state, skip it (might be orphaned)
-                logger.warning(f'Request {request.unique_key} not found in state, skipping.')
-                continue
-
-        # Sort forefront requests by sequence (newest first for LIFO behavior).
-        forefront_requests.sort(key=lambda item: item[1], reverse=True)
+                self._request_cache.append(request)
 
-        # Sort regular requests by sequence (oldest first for FIFO behavior).
-        regular_requests.sort(key=lambda item: item[1], reverse=False)
+    def _rebuild_pending_index(self) -> None:
+        """Rebuild the index of pending requests from the state and clear the cache.
 
-        # Add forefront requests to the beginning of the cache (left side). Since forefront_requests are sorted
-        # by sequence (newest first), we need to add them in reverse order to maintain correct priority.
-        for request, _ in reversed(forefront_requests):
-            if len(self._request_cache) >= self._MAX_REQUESTS_IN_CACHE:
-                break
-            self._request_cache.appendleft(request)
+        This sorts all pending requests once, subsequent changes are applied to the index incrementally.
+        """
+        state = self._state.current_value
+        self._request_cache.clear()
+        self._cached_positions.clear()
 
-        # Add regular requests to the end of the cache (right side).
-        for request, _ in regular_requests:
-            if len(self._request_cache) >= self._MAX_REQUESTS_IN_CACHE:
-                break
-            self._request_cache.append(request)
+        self._forefront_index = sorted(
+            (sequence, unique_key)
+            for unique_key, sequence in state.forefront_requests.items()
+            if self._is_pending(unique_key)
+        )
+        self._regular_index = deque(
+            sorted(
+                (sequence, unique_key)
+                for unique_key, sequence in state.regular_requests.items()
+                if self._is_pending(unique_key)
+            )
+        )
 
         self._request_cache_needs_refresh = False
 
+    def _pop_pending_keys(self, limit: int) -> list[str]:
+        """Take up to `limit` unique keys of pending requests from the index, in the order they should be served.
+
+        Forefront requests go first (newest first), then regular requests (oldest first). Index entries whose
+        sequence number no longer matches the state are stale leftovers of moved requests and are dropped.
+        """
+        state = self._state.current_value
+        unique_keys = list[str]()
+
+        while len(unique_keys) < limit and self._forefront_index:
+            sequence, unique_key = self._forefront_index.pop()
+            if state.forefront_requests.get(unique_key) == sequence and self._is_pending(unique_key):
+                unique_keys.append(unique_key)
+
+        while len(unique_keys) < limit and self._regular_index:
+            sequence, unique_key = self._regular_index.popleft()
+            if state.regular_requests.get(unique_key) == sequence and self._is_pending(unique_key):
+                unique_keys.append(unique_key)
+
+        return unique_keys
+
+    def _has_pending_in_index(self) -> bool:
+        """Check whether the index holds any pending request, dropping the stale entries at its head."""
+        state = self._state.current_value
+
+        while self._forefront_index:
+            sequence, unique_key = self._forefront_index[-1]
+            if state.forefront_requests.get(unique_key) == sequence and self._is_pending(unique_key):
+                return True
+            self._forefront_index.pop()
+
+        while self._regular_index:
+            sequence, unique_key = self._regular_index[0]
+            if state.regular_requests.get(unique_key) == sequence and self._is_pending(unique_key):
+                return True
+            self._regular_index.popleft()
+
+        return False
+
+    async def _refill_cache(self) -> None:
+        """Load the bodies of the next batch of pending requests into the cache.
+
+        Only `_CACHE_REFILL_BATCH_SIZE` requests are read from the storage, so the cost does not depend on the size
+        of the whole queue.
+        """
+        unique_keys = self._pop_pending_keys(self._CACHE_REFILL_BATCH_SIZE)
+        self._add_to_cache(await self._read_requests(unique_keys))
+
+    def _splice_into_cache(self, requests: Sequence[Request]) -> None:
+        """Put forefront requests to the front of the cache, the last one given ends up first.
+
+        If the cache grows over `_MAX_REQUESTS_IN_CACHE`, the requests at its back are returned to the index.
+        """
+        if self._request_cache_needs_refresh:
+            return
+
+        state = self._state.current_value
+        self._add_to_cache(requests, forefront=True)
+
+        while len(self._request_cache) > self._MAX_REQUESTS_IN_CACHE:
+            unique_key = self._request_cache.pop_last().unique_key
+            if unique_key in state.forefront_requests:
+                self._forefront_index.append((state.forefront_requests[unique_key], unique_key))
+            elif unique_key in state.regular_requests:
+                self._regular_index.appendleft((state.regular_requests[unique_key], unique_key))
+
     @classmethod
     async def _get_request_files(cls, path_to_rq: Path) -> list[Path]:
         """Get all request files from the RQ.
@@ -779,6 +1123,10 @@ class FileSystemRequestQueueClient(RequestQueueClient):
 
     async def _discover_existing_requests(self) -> None:
         """Discover and load existing requests into the state when opening an existing request queue."""
+        if self._request_log is not None:
+            await self._discover_existing_requests_in_log()
+            return
+
         request_files = await self._get_request_files(self.path_to_rq)
         state = self._state.current_value
 
@@ -797,6 +1145,40 @@ class FileSystemRequestQueueClient(RequestQueueClient):
                 if request.handled_at is not None:
                     state.handled_requests.add(request.unique_key)
 
+    async def _discover_existing_requests_in_log(self) -> None:
+        """Import request files into the request log and load the requests from the log into the state."""
+        if self._request_log is None:
+            raise RuntimeError('Request log is not enabled')
+
+        request_files = await self._get_request_files(self.path_to_rq)
+        if request_files:
+            logger.info(f'Importing {len(request_files)} request files into the request log at {self.path_to_rq}.')
+
+        pending_requests = list[Request]()
+        handled_requests = list[Request]()
+
+        for request_file in request_files:
+            request = await self._parse_request_file(request_file)
+            if request is not None and request.unique_key not in self._request_log:
+                (handled_requests if request.handled_at is not None else pending_requests).append(request)
+
+        await self._request_log.append('handled', handled_requests)
+        await self._request_log.append('add', pending_requests)
+
+        # Remove the imported files only after all of them are safely in the log.
+        for request_file in request_files:
+            await asyncio.to_thread(request_file.unlink, missing_ok=True)
+
+        state = self._state.current_value
+
+        for unique_key, entry in self._request_log.iter_entries():
+            if unique_key not in state.regular_requests and unique_key not in state.forefront_requests:
+                state.regular_requests[unique_key] = state.sequence_counter
+                state.sequence_counter += 1
+
+                if entry.handled:
+                    state.handled_requests.add(unique_key)
+
     @staticmethod
     def _get_file_base_name_from_unique_key(unique_key: str) -> str:
         """Generate a deterministic file name for a unique_key.
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from datetime import timedelta
+from typing import TYPE_CHECKING, Literal
+
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
@@ -10,6 +13,9 @@ from ._dataset_client import FileSystemDatasetClient
 from ._key_value_store_client import FileSystemKeyValueStoreClient
 from ._request_queue_client import FileSystemRequestQueueClient
 
+if TYPE_CHECKING:
+    from crawlee.storage_clients._fair_queue import FairSchedulingPolicy
+
 
 @docs_group('Storage clients')
 class FileSystemStorageClient(StorageClient):
@@ -29,6 +35,38 @@ class FileSystemStorageClient(StorageClient):
     Use it only when running a single crawler process at a time.
     """
 
+    def __init__(
+        self,
+        *,
+        dataset_layout: Literal['files', 'chunks'] = 'files',
+        request_queue_layout: Literal['files', 'log'] = 'files',
+        request_queue_metadata_write_delay: timedelta = timedelta(0),
+        request_queue_scheduling: FairSchedulingPolicy | None = None,
+    ) -> None:
+        """Initialize a new instance.
+
+        Args:
+            dataset_layout: How the datasets store their items. The default `'files'` layout keeps each item in its
+                own JSON file. The `'chunks'` layout appends items to size-capped JSON Lines files with a small
+                offset index, so pushing a list of items is a single write and pages are read without listing the
+                whole dataset. Existing item files are imported into the chunks when a dataset is opened with the
+                `'chunks'` layout.
+            request_queue_layout: How the request queues store their requests. The default `'files'` layout keeps
+                each request in its own JSON file. The `'log'` layout appends requests to rolling segment files with
+                a compact index, which scales to queues with millions of requests. Existing request files are
+                imported into the log when a queue is opened with the `'log'` layout.
+            request_queue_metadata_write_delay: The durability window of request queue metadata. Metadata updates
+                made within this time after a write are committed together in a single delayed write instead of
+                rewriting the metadata file on every operation. The default of zero writes it on every update.
+            request_queue_scheduling: The policy for serving requests of the request queues fairly across hosts,
+                e.g. to avoid sending all requests to a single host that dominates the queue. By default, requests
+                are served in the order they were added.
+        """
+        self._dataset_layout = dataset_layout
+        self._request_queue_layout = request_queue_layout
+        self._request_queue_metadata_write_delay = request_queue_metadata_write_delay
+        self._request_queue_scheduling = request_queue_scheduling
+
     @override
     async def create_dataset_client(
         self,
@@ -38,7 +76,12 @@ class FileSystemStorageClient(StorageClient):
         configuration: Configuration | None = None,
     ) -> FileSystemDatasetClient:
         configuration = configuration or Configuration.get_global_configuration()
-        client = await FileSystemDatasetClient.open(id=id, name=name, configuration=configuration)
+        client = await FileSystemDatasetClient.open(
+            id=id,
+            name=name,
+            configuration=configuration,
+            layout=self._dataset_layout,
+        )
         await self._purge_if_needed(client, configuration)
         return client
 
@@ -64,6 +107,13 @@ class FileSystemStorageClient(StorageClient):
         configuration: Configuration | None = None,
     ) -> FileSystemRequestQueueClient:
         configuration = configuration or Configuration.get_global_configuration()
-        client = await FileSystemRequestQueueClient.open(id=id, name=name, configuration=configuration)
+        client = await FileSystemRequestQueueClient.open(
+            id=id,
+            name=name,
+            configuration=configuration,
+            layout=self._request_queue_layout,
+            metadata_write_delay=self._request_queue_metadata_write_delay,
+            scheduling_policy=self._request_queue_scheduling,
+        )
         await self._purge_if_needed(client, configuration)
         return client
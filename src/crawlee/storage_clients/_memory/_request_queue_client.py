@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from collections import deque
 from contextlib import suppress
 from datetime import datetime, timezone
 from logging import getLogger
@@ -11,11 +10,14 @@ from typing_extensions import override
 from crawlee import Request
 from crawlee._utils.crypto import crypto_random_object_id
 from crawlee.storage_clients._base import RequestQueueClient
+from crawlee.storage_clients._fair_queue import FairRequestQueue
 from crawlee.storage_clients.models import AddRequestsResponse, ProcessedRequest, RequestQueueMetadata
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
+    from crawlee.storage_clients._fair_queue import FairSchedulingPolicy
+
 logger = getLogger(__name__)
 
 
@@ -28,12 +30,16 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
     This client provides fast access to request data but is limited by available memory and does not support
     data sharing across different processes.
+
+    With a `FairSchedulingPolicy`, requests are served in turns across their hosts instead of in the order they
+    were added, optionally with a limit on the number of in-progress requests of each host.
     """
 
     def __init__(
         self,
         *,
         metadata: RequestQueueMetadata,
+        scheduling_policy: FairSchedulingPolicy | None = None,
     ) -> None:
         """Initialize a new instance.
 
@@ -41,7 +47,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
         """
         self._metadata = metadata
 
-        self._pending_requests = deque[Request]()
+        self._pending_requests = FairRequestQueue(scheduling_policy)
         """Pending requests are those that have been added to the queue but not yet fetched for processing."""
 
         self._handled_requests = dict[str, Request]()
@@ -63,6 +69,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
         *,
         id: str | None,
         name: str | None,
+        scheduling_policy: FairSchedulingPolicy | None = None,
     ) -> MemoryRequestQueueClient:
         """Open or create a new memory request queue client.
 
@@ -73,6 +80,8 @@ class MemoryRequestQueueClient(RequestQueueClient):
         Args:
             id: The ID of the request queue. If not provided, a random ID will be generated.
             name: The name of the request queue. If not provided, the queue will be unnamed.
+            scheduling_policy: The policy for serving requests fairly across hosts. If not provided, requests
+                are served in the order they were added.
 
         Returns:
             An instance for the opened or created storage client.
@@ -93,7 +102,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
             total_request_count=0,
         )
 
-        return cls(metadata=metadata)
+        return cls(metadata=metadata, scheduling_policy=scheduling_policy)
 
     @override
     async def drop(self) -> None:
@@ -216,9 +225,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
     @override
     async def fetch_next_request(self) -> Request | None:
-        while self._pending_requests:
-            request = self._pending_requests.popleft()
-
+        while (request := self._pending_requests.pop()) is not None:
             # Skip if already handled (shouldn't happen, but safety check).
             if request.was_already_handled:
                 continue
@@ -229,6 +236,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
             # Mark as in progress.
             self._in_progress_requests[request.unique_key] = request
+            self._pending_requests.start(request)
             return request
 
         return None
@@ -238,6 +246,10 @@ class MemoryRequestQueueClient(RequestQueueClient):
         await self._update_metadata(update_accessed_at=True)
         return self._requests_by_unique_key.get(unique_key)
 
+    @override
+    async def get_unique_keys(self) -> list[str]:
+        return list(self._requests_by_unique_key)
+
     @override
     async def mark_request_as_handled(self, request: Request) -> ProcessedRequest | None:
         # Check if the request is in progress.
@@ -256,6 +268,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
         # Remove from in-progress.
         del self._in_progress_requests[request.unique_key]
+        self._pending_requests.finish(request)
 
         # Update metadata.
         await self._update_metadata(
@@ -270,6 +283,36 @@ class MemoryRequestQueueClient(RequestQueueClient):
             was_already_handled=True,
         )
 
+    @override
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        handled_at = datetime.now(timezone.utc)
+        handled = list[Request]()
+
+        for request in requests:
+            if request.unique_key not in self._in_progress_requests:
+                continue
+
+            if not request.was_already_handled:
+                request.handled_at = handled_at
+
+            self._handled_requests[request.unique_key] = request
+            self._requests_by_unique_key[request.unique_key] = request
+            del self._in_progress_requests[request.unique_key]
+            self._pending_requests.finish(request)
+            handled.append(request)
+
+        if handled:
+            await self._update_metadata(
+                new_handled_request_count=self._metadata.handled_request_count + len(handled),
+                new_pending_request_count=self._metadata.pending_request_count - len(handled),
+                update_modified_at=True,
+            )
+
+        return [
+            ProcessedRequest(unique_key=request.unique_key, was_already_present=True, was_already_handled=True)
+            for request in handled
+        ]
+
     @override
     async def reclaim_request(
         self,
@@ -283,6 +326,7 @@ class MemoryRequestQueueClient(RequestQueueClient):
 
         # Remove from in-progress.
         del self._in_progress_requests[request.unique_key]
+        self._pending_requests.finish(request)
 
         # Add request back to pending queue.
         if forefront:
@@ -311,6 +355,10 @@ class MemoryRequestQueueClient(RequestQueueClient):
         # Queue is empty if there are no pending requests and no requests in progress.
         return len(self._pending_requests) == 0 and len(self._in_progress_requests) == 0
 
+    @override
+    async def has_next_request(self) -> bool:
+        return self._pending_requests.has_available()
+
     async def _update_metadata(
         self,
         *,
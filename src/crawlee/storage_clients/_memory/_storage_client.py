@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from typing_extensions import override
 
 from crawlee._utils.docs import docs_group
@@ -10,6 +12,9 @@ from ._dataset_client import MemoryDatasetClient
 from ._key_value_store_client import MemoryKeyValueStoreClient
 from ._request_queue_client import MemoryRequestQueueClient
 
+if TYPE_CHECKING:
+    from crawlee.storage_clients._fair_queue import FairSchedulingPolicy
+
 
 @docs_group('Storage clients')
 class MemoryStorageClient(StorageClient):
@@ -27,6 +32,16 @@ class MemoryStorageClient(StorageClient):
     operations where persistence is not required.
     """
 
+    def __init__(self, *, request_queue_scheduling: FairSchedulingPolicy | None = None) -> None:
+        """Initialize a new instance.
+
+        Args:
+            request_queue_scheduling: The policy for serving requests of the request queues fairly across hosts,
+                e.g. to avoid sending all requests to a single host that dominates the queue. By default, requests
+                are served in the order they were added.
+        """
+        self._request_queue_scheduling = request_queue_scheduling
+
     @override
     async def create_dataset_client(
         self,
@@ -62,6 +77,10 @@ class MemoryStorageClient(StorageClient):
         configuration: Configuration | None = None,
     ) -> MemoryRequestQueueClient:
         configuration = configuration or Configuration.get_global_configuration()
-        client = await MemoryRequestQueueClient.open(id=id, name=name)
+        client = await MemoryRequestQueueClient.open(
+            id=id,
+            name=name,
+            scheduling_policy=self._request_queue_scheduling,
+        )
         await self._purge_if_needed(client, configuration)
         return client
@@ -1,9 +1,10 @@
 from ._dataset import Dataset
 from ._key_value_store import KeyValueStore
-from ._request_queue import RequestQueue
+from ._request_queue import DuplicateFilterStatistics, RequestQueue
 
 __all__ = [
     'Dataset',
+    'DuplicateFilterStatistics',
     'KeyValueStore',
     'RequestQueue',
 ]
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import logging
-from io import StringIO
 from typing import TYPE_CHECKING, overload
 
 from typing_extensions import override
 
 from crawlee import service_locator
 from crawlee._utils.docs import docs_group
-from crawlee._utils.file import export_csv_to_stream, export_json_to_stream
+from crawlee._utils.file import (
+    encode_export_stream,
+    iterate_csv_export,
+    iterate_json_export,
+    iterate_json_lines_export,
+)
 
 from ._base import Storage
 from ._key_value_store import KeyValueStore
@@ -27,6 +31,19 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_EXPORT_CONTENT_TYPES = {
+    'json': 'application/json',
+    'jsonl': 'application/x-ndjson',
+    'csv': 'text/csv',
+}
+"""MIME types of the supported export formats."""
+
+_COMPRESSED_CONTENT_TYPES = {
+    'gzip': 'application/gzip',
+    'zstd': 'application/zstd',
+}
+"""MIME types of the supported export compressions."""
+
 
 @docs_group('Storages')
 class Dataset(Storage):
@@ -290,11 +307,12 @@ class Dataset(Storage):
     async def export_to(
         self,
         key: str,
-        content_type: Literal['json'],
+        content_type: Literal['json', 'jsonl'],
         to_kvs_id: str | None = None,
         to_kvs_name: str | None = None,
         to_kvs_storage_client: StorageClient | None = None,
         to_kvs_configuration: Configuration | None = None,
+        compression: Literal['gzip', 'zstd'] | None = None,
         **kwargs: Unpack[ExportDataJsonKwargs],
     ) -> None: ...
 
@@ -307,17 +325,19 @@ class Dataset(Storage):
         to_kvs_name: str | None = None,
         to_kvs_storage_client: StorageClient | None = None,
         to_kvs_configuration: Configuration | None = None,
+        compression: Literal['gzip', 'zstd'] | None = None,
         **kwargs: Unpack[ExportDataCsvKwargs],
     ) -> None: ...
 
     async def export_to(
         self,
         key: str,
-        content_type: Literal['json', 'csv'] = 'json',
+        content_type: Literal['json', 'jsonl', 'csv'] = 'json',
         to_kvs_id: str | None = None,
         to_kvs_name: str | None = None,
         to_kvs_storage_client: StorageClient | None = None,
         to_kvs_configuration: Configuration | None = None,
+        compression: Literal['gzip', 'zstd'] | None = None,
         **kwargs: Any,
     ) -> None:
         """Export the entire dataset into a specified file stored under a key in a key-value store.
@@ -327,30 +347,43 @@ class Dataset(Storage):
         Either the dataset's ID or name should be specified, and similarly, either the target key-value store's ID or
         name should be used.
 
+        The items are serialized and written to the key-value store as a stream, so storage clients that support
+        streamed writes (such as the file system one) never hold the whole export in memory.
+
         Args:
             key: The key under which to save the data in the key-value store.
-            content_type: The format in which to export the data.
+            content_type: The format in which to export the data, JSON, JSON Lines or CSV.
             to_kvs_id: ID of the key-value store to save the exported file.
                 Specify only one of ID or name.
             to_kvs_name: Name of the key-value store to save the exported file.
                 Specify only one of ID or name.
             to_kvs_storage_client: Storage client to use for the key-value store.
             to_kvs_configuration: Configuration for the key-value store.
+            compression: Compression to apply to the exported file. The record is then stored as binary data.
             kwargs: Additional parameters for the export operation, specific to the chosen content type.
         """
+        if content_type not in _EXPORT_CONTENT_TYPES:
+            raise ValueError('Unsupported content type, expecting CSV, JSON or JSON Lines')
+
+        if compression is not None and compression not in _COMPRESSED_CONTENT_TYPES:
+            raise ValueError('Unsupported compression, expecting gzip or zstd')
+
         kvs = await KeyValueStore.open(
             id=to_kvs_id,
             name=to_kvs_name,
             configuration=to_kvs_configuration,
             storage_client=to_kvs_storage_client,
         )
-        dst = StringIO()
 
         if content_type == 'csv':
-            await export_csv_to_stream(self.iterate_items(), dst, **kwargs)
-            await kvs.set_value(key, dst.getvalue(), 'text/csv')
-        elif content_type == 'json':
-            await export_json_to_stream(self.iterate_items(), dst, **kwargs)
-            await kvs.set_value(key, dst.getvalue(), 'application/json')
+            pieces = iterate_csv_export(self.iterate_items(), **kwargs)
+        elif content_type == 'jsonl':
+            pieces = iterate_json_lines_export(self.iterate_items(), **kwargs)
         else:
-            raise ValueError('Unsupported content type, expecting CSV or JSON')
+            pieces = iterate_json_export(self.iterate_items(), **kwargs)
+
+        await kvs.set_value_stream(
+            key,
+            encode_export_stream(pieces, compression=compression),
+            _COMPRESSED_CONTENT_TYPES[compression] if compression else _EXPORT_CONTENT_TYPES[content_type],
+        )
@@ -17,7 +17,7 @@ from crawlee.storage_clients.models import KeyValueStoreMetadata
 from ._base import Storage
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterable, AsyncIterator
 
     from crawlee.configuration import Configuration
     from crawlee.storage_clients import StorageClient
@@ -175,6 +175,24 @@ class KeyValueStore(Storage):
         """
         await self._client.set_value(key=key, value=value, content_type=content_type)
 
+    async def set_value_stream(
+        self,
+        key: str,
+        stream: AsyncIterable[bytes],
+        content_type: str | None = None,
+    ) -> None:
+        """Set a value in the KVS from a stream of its serialized bytes.
+
+        Storage clients which support it write the chunks as they arrive, so the whole value never has to be held
+        in memory. Reading the record back yields the value decoded according to its content type.
+
+        Args:
+            key: Key of the record to set.
+            stream: The chunks of the serialized value.
+            content_type: The MIME content type string.
+        """
+        await self._client.set_value_stream(key=key, stream=stream, content_type=content_type)
+
     async def delete_value(self, key: str) -> None:
         """Delete a value from the KVS.
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import struct
+from dataclasses import dataclass
 from datetime import timedelta
 from logging import getLogger
 from typing import TYPE_CHECKING, TypeVar
@@ -8,8 +10,11 @@ from typing import TYPE_CHECKING, TypeVar
 from typing_extensions import override
 
 from crawlee import Request, service_locator
+from crawlee._utils.bloom_filter import ScalableBloomFilter
 from crawlee._utils.docs import docs_group
-from crawlee._utils.wait import wait_for_all_tasks_for_finish
+from crawlee._utils.requests import compute_unique_key
+from crawlee._utils.wait import ChangeNotifier, wait_for_all_tasks_for_finish
+from crawlee.events._types import Event, EventPersistStateData
 from crawlee.request_loaders import RequestManager
 
 from ._base import Storage
@@ -22,11 +27,41 @@ if TYPE_CHECKING:
     from crawlee.storage_clients import StorageClient
     from crawlee.storage_clients._base import RequestQueueClient
     from crawlee.storage_clients.models import ProcessedRequest, RequestQueueMetadata
+    from crawlee.storages._key_value_store import KeyValueStore
 
 logger = getLogger(__name__)
 
 T = TypeVar('T')
 
+_DUPLICATE_FILTER_KEY = 'CRAWLEE_REQUEST_QUEUE_DUPLICATE_FILTER_{id}'
+"""Key of the persisted duplicate filter in the default key-value store."""
+
+_DUPLICATE_FILTER_HEADER = struct.Struct('<Q')
+"""Total request count of the queue at the time the duplicate filter was persisted."""
+
+
+@docs_group('Statistics')
+@dataclass(frozen=True)
+class DuplicateFilterStatistics:
+    """Statistics of the duplicate filter of a `RequestQueue`."""
+
+    checked_request_count: int
+    """The number of requests checked by the filter."""
+
+    dropped_request_count: int
+    """The number of requests dropped by the filter as duplicates, without being passed to the storage client."""
+
+    unique_key_count: int
+    """The number of unique keys known to the filter."""
+
+    size: int
+    """The size of the filter in bytes."""
+
+    @property
+    def hit_rate(self) -> float:
+        """The ratio of checked requests dropped as duplicates."""
+        return self.dropped_request_count / self.checked_request_count if self.checked_request_count else 0.0
+
 
 @docs_group('Storages')
 class RequestQueue(Storage, RequestManager):
@@ -87,6 +122,16 @@ class RequestQueue(Storage, RequestManager):
         self._add_requests_tasks = list[asyncio.Task]()
         """A list of tasks for adding requests to the queue."""
 
+        self._change_notifier = ChangeNotifier()
+        """Wakes up the `wait_for_change` callers when requests are added, reclaimed or handled."""
+
+        self._duplicate_filter: ScalableBloomFilter | None = None
+        """Probabilistic set of the unique keys in the queue, see `enable_duplicate_filter`."""
+
+        self._duplicate_filter_persistence_enabled = False
+        self._duplicate_filter_checked_count = 0
+        self._duplicate_filter_dropped_count = 0
+
     @property
     @override
     def id(self) -> str:
@@ -140,9 +185,22 @@ class RequestQueue(Storage, RequestManager):
 
         await self._client.drop()
 
+        if self._duplicate_filter_persistence_enabled:
+            service_locator.get_event_manager().off(event=Event.PERSIST_STATE, listener=self.persist_duplicate_filter)
+            self._duplicate_filter_persistence_enabled = False
+            await self._delete_persisted_duplicate_filter()
+
+        self._duplicate_filter = None
+
     @override
     async def purge(self) -> None:
         await self._client.purge()
+        self._change_notifier.notify()
+
+        if self._duplicate_filter is not None:
+            self._duplicate_filter.clear()
+            if self._duplicate_filter_persistence_enabled:
+                await self._delete_persisted_duplicate_filter()
 
     @override
     async def add_request(
@@ -153,6 +211,8 @@ class RequestQueue(Storage, RequestManager):
     ) -> ProcessedRequest:
         request = self._transform_request(request)
         response = await self._client.add_batch_of_requests([request], forefront=forefront)
+        self._learn_unique_keys(response.processed_requests)
+        self._change_notifier.notify()
         return response.processed_requests[0]
 
     @override
@@ -166,6 +226,10 @@ class RequestQueue(Storage, RequestManager):
         wait_for_all_requests_to_be_added: bool = False,
         wait_for_all_requests_to_be_added_timeout: timedelta | None = None,
     ) -> None:
+        # Forefront requests are passed on, so that already present ones are moved to the head of the queue.
+        if self._duplicate_filter is not None and not forefront:
+            requests = self._drop_duplicate_requests(requests)
+
         transformed_requests = self._transform_requests(requests)
         wait_time_secs = wait_time_between_batches.total_seconds()
 
@@ -195,8 +259,12 @@ class RequestQueue(Storage, RequestManager):
             name='request_queue_process_remaining_batches_task',
         )
 
+        def _remove_finished_task(_: asyncio.Task) -> None:
+            self._add_requests_tasks.remove(remaining_batches_task)
+            self._change_notifier.notify()
+
         self._add_requests_tasks.append(remaining_batches_task)
-        remaining_batches_task.add_done_callback(lambda _: self._add_requests_tasks.remove(remaining_batches_task))
+        remaining_batches_task.add_done_callback(_remove_finished_task)
 
         # Wait for all tasks to finish if requested
         if wait_for_all_requests_to_be_added:
@@ -206,6 +274,84 @@ class RequestQueue(Storage, RequestManager):
                 timeout=wait_for_all_requests_to_be_added_timeout,
             )
 
+    async def enable_duplicate_filter(
+        self,
+        *,
+        error_rate: float = 1e-6,
+        initial_capacity: int = 100_000,
+        persistence_enabled: bool = True,
+    ) -> None:
+        """Enable a probabilistic filter of duplicate requests in front of the storage client.
+
+        The filter is a scalable Bloom filter of the unique keys added to the queue. Requests passed to `add_requests`
+        whose unique key the filter already knows are dropped without reaching the storage client, which saves its
+        lookups on link-dense sites, where most of the discovered links are already in the queue.
+
+        A Bloom filter may mistake a new unique key for a known one, so a new request is dropped with a probability
+        of at most `error_rate`. Dropped requests do not update the requests already in the queue, and requests added
+        with `forefront=True` always reach the storage client.
+
+        The filter is persisted in the default key-value store on the `PERSIST_STATE` event. If the persisted filter
+        does not match the queue, e.g. after the queue was purged by another process, it is rebuilt from the unique
+        keys in the queue, if the storage client can list them.
+
+        Args:
+            error_rate: The maximum probability of dropping a request that is not in the queue.
+            initial_capacity: The number of unique keys the filter is initially sized for. It grows as needed.
+            persistence_enabled: Whether to persist the filter, so that it survives a restart of the crawler.
+        """
+        if self._duplicate_filter is not None:
+            raise RuntimeError('The duplicate filter is already enabled.')
+
+        metadata = await self._client.get_metadata()
+        duplicate_filter = None
+
+        if persistence_enabled:
+            duplicate_filter = await self._load_duplicate_filter(metadata.total_request_count)
+
+        if duplicate_filter is None:
+            duplicate_filter = ScalableBloomFilter(initial_capacity=initial_capacity, error_rate=error_rate)
+            await self._rebuild_duplicate_filter(duplicate_filter, metadata.total_request_count)
+
+        self._duplicate_filter = duplicate_filter
+
+        if persistence_enabled:
+            self._duplicate_filter_persistence_enabled = True
+            service_locator.get_event_manager().on(event=Event.PERSIST_STATE, listener=self.persist_duplicate_filter)
+
+    @property
+    def duplicate_filter_statistics(self) -> DuplicateFilterStatistics | None:
+        """Statistics of the duplicate filter, or `None` if it is not enabled."""
+        if self._duplicate_filter is None:
+            return None
+
+        return DuplicateFilterStatistics(
+            checked_request_count=self._duplicate_filter_checked_count,
+            dropped_request_count=self._duplicate_filter_dropped_count,
+            unique_key_count=len(self._duplicate_filter),
+            size=self._duplicate_filter.size,
+        )
+
+    async def persist_duplicate_filter(self, event_data: EventPersistStateData | None = None) -> None:
+        """Persist the duplicate filter to the default key-value store.
+
+        This method is called on the `PERSIST_STATE` event, but can also be called directly when needed.
+
+        Args:
+            event_data: Optional data associated with a `PERSIST_STATE` event.
+        """
+        logger.debug(f'Persisting the duplicate filter of the request queue {self.id} (event_data={event_data}).')
+
+        if self._duplicate_filter is None:
+            return
+
+        # The total count is read before serializing, so it never covers keys the persisted filter is missing.
+        metadata = await self._client.get_metadata()
+        data = _DUPLICATE_FILTER_HEADER.pack(metadata.total_request_count) + self._duplicate_filter.to_bytes()
+
+        kvs = await self._open_duplicate_filter_kvs()
+        await kvs.set_value(self._duplicate_filter_key, data, 'application/octet-stream')
+
     async def fetch_next_request(self) -> Request | None:
         """Return the next request in the queue to be processed.
 
@@ -247,7 +393,22 @@ class RequestQueue(Storage, RequestManager):
         Returns:
             Information about the queue operation.
         """
-        return await self._client.mark_request_as_handled(request)
+        processed_request = await self._client.mark_request_as_handled(request)
+        self._change_notifier.notify()
+        return processed_request
+
+    async def mark_requests_as_handled(self, requests: Sequence[Request]) -> list[ProcessedRequest]:
+        """Mark multiple requests as handled after successful processing, in a single storage operation.
+
+        Args:
+            requests: The requests to mark as handled.
+
+        Returns:
+            Information about the queue operation for each request that was in progress.
+        """
+        processed_requests = await self._client.mark_requests_as_handled(requests)
+        self._change_notifier.notify()
+        return processed_requests
 
     async def reclaim_request(
         self,
@@ -269,7 +430,9 @@ class RequestQueue(Storage, RequestManager):
         Returns:
             Information about the queue operation.
         """
-        return await self._client.reclaim_request(request, forefront=forefront)
+        processed_request = await self._client.reclaim_request(request, forefront=forefront)
+        self._change_notifier.notify()
+        return processed_request
 
     async def is_empty(self) -> bool:
         """Check if the request queue is empty.
@@ -283,6 +446,29 @@ class RequestQueue(Storage, RequestManager):
         """
         return await self._client.is_empty()
 
+    async def has_next_request(self) -> bool:
+        """Check if `fetch_next_request` would currently return a request.
+
+        The queue may be non-empty while none of its pending requests can be fetched, e.g. when all their hosts are
+        at the `max_in_progress_per_host` limit of the scheduling policy of the storage client.
+
+        Returns:
+            True if a request can be fetched right now, False otherwise.
+        """
+        return await self._client.has_next_request()
+
+    @property
+    def notifies_changes(self) -> bool:
+        return True
+
+    async def wait_for_change(self) -> None:
+        """Wait until requests are added to the queue, reclaimed, or marked as handled through this instance.
+
+        Changes made by other processes sharing the same storage are not noticed, so long-running consumers
+        should still check the queue from time to time.
+        """
+        await self._change_notifier.wait()
+
     async def is_finished(self) -> bool:
         """Check if the request queue is finished.
 
@@ -329,9 +515,93 @@ class RequestQueue(Storage, RequestManager):
                 await asyncio.sleep((base_retry_wait * attempt).total_seconds())
                 await self._process_batch(retry_batch, base_retry_wait=base_retry_wait, attempt=attempt + 1)
 
+        self._learn_unique_keys(response.processed_requests)
+
         request_count = len(batch) - len(response.unprocessed_requests)
 
         if request_count:
+            self._change_notifier.notify()
             logger.debug(
                 f'Added {request_count} requests to the queue. Processed requests: {response.processed_requests}'
             )
+
+    @property
+    def _duplicate_filter_key(self) -> str:
+        return _DUPLICATE_FILTER_KEY.format(id=self.id)
+
+    def _drop_duplicate_requests(self, requests: Sequence[str | Request]) -> Sequence[str | Request]:
+        """Drop the requests whose unique key is known to the duplicate filter.
+
+        URLs are checked by their unique key before being transformed, so that no `Request` is built for dropped ones.
+        """
+        if self._duplicate_filter is None:
+            return requests
+
+        duplicate_filter = self._duplicate_filter
+        new_requests = [
+            request
+            for request in requests
+            if (compute_unique_key(request) if isinstance(request, str) else request.unique_key) not in duplicate_filter
+        ]
+
+        self._duplicate_filter_checked_count += len(requests)
+        self._duplicate_filter_dropped_count += len(requests) - len(new_requests)
+
+        if len(new_requests) < len(requests):
+            logger.debug(f'Dropped {len(requests) - len(new_requests)} duplicate requests before adding them.')
+
+        return new_requests
+
+    def _learn_unique_keys(self, processed_requests: Sequence[ProcessedRequest]) -> None:
+        if self._duplicate_filter is None:
+            return
+
+        for processed_request in processed_requests:
+            self._duplicate_filter.add(processed_request.unique_key)
+
+    async def _load_duplicate_filter(self, total_request_count: int) -> ScalableBloomFilter | None:
+        """Load the persisted duplicate filter, unless it is missing, invalid or ahead of the queue."""
+        kvs = await self._open_duplicate_filter_kvs()
+        data = await kvs.get_value(self._duplicate_filter_key)
+
+        if not isinstance(data, bytes) or len(data) < _DUPLICATE_FILTER_HEADER.size:
+            return None
+
+        # A filter persisted with fewer requests only misses some keys, which just lets their duplicates through.
+        # A filter persisted with more requests may know keys which are not in the queue anymore, so it is discarded.
+        (persisted_request_count,) = _DUPLICATE_FILTER_HEADER.unpack_from(data)
+        if persisted_request_count > total_request_count:
+            logger.info(f'The persisted duplicate filter does not match the request queue {self.id}, rebuilding it.')
+            return None
+
+        try:
+            return ScalableBloomFilter.from_bytes(data[_DUPLICATE_FILTER_HEADER.size :])
+        except ValueError:
+            logger.warning(f'The persisted duplicate filter of the request queue {self.id} is invalid, rebuilding it.')
+            return None
+
+    async def _rebuild_duplicate_filter(self, duplicate_filter: ScalableBloomFilter, total_request_count: int) -> None:
+        if not total_request_count:
+            return
+
+        try:
+            unique_keys = await self._client.get_unique_keys()
+        except NotImplementedError:
+            logger.info(
+                f'The storage client cannot list the unique keys of the request queue {self.id}, the duplicate filter '
+                'will only know of requests added from now on.'
+            )
+            return
+
+        for unique_key in unique_keys:
+            duplicate_filter.add(unique_key)
+
+    async def _delete_persisted_duplicate_filter(self) -> None:
+        kvs = await self._open_duplicate_filter_kvs()
+        await kvs.delete_value(self._duplicate_filter_key)
+
+    async def _open_duplicate_filter_kvs(self) -> KeyValueStore:
+        # Import here to avoid circular imports.
+        from crawlee.storages._key_value_store import KeyValueStore  # noqa: PLC0415
+
+        return await KeyValueStore.open()
@@ -1,14 +1,33 @@
 """Tests for CRA scraper components."""
 
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+import threading
+from collections.abc import Callable
+from datetime import datetime, timezone
+from itertools import pairwise
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
+from parsel import Selector
+
+from crawlee import Request
 
 # Import only the components that don't depend on optional extras
-from crawlee.cra_scraper._config import CRAConfig
+from crawlee.cra_scraper._config import CRAConfig, ScrapingLimits
+from crawlee.cra_scraper._cra_crawler import CRACrawler
 from crawlee.cra_scraper._data_validator import CRADataValidator
+from crawlee.cra_scraper._embedding_cache import CRAEmbeddingCache
+from crawlee.cra_scraper._embedding_service import CRAEmbeddingService
+from crawlee.cra_scraper._fingerprint_store import CRAFingerprintStore, compute_point_id
+from crawlee.cra_scraper._local_vector_index import CRALocalVectorIndex
+from crawlee.cra_scraper._qdrant_client import CRAQdrantClient
+from crawlee.cra_scraper._qdrant_writer import CRAQdrantWriter
 from crawlee.cra_scraper._rate_limiter import CRARateLimiter
+from crawlee.cra_scraper._request_scheduler import CRARequestScheduler
+from crawlee.cra_scraper._text_chunker import CRATextChunker, tokenize_words
+from crawlee.cra_scraper._vectorizer import CRAVectorizer
+from crawlee.crawlers._adaptive_playwright._adaptive_playwright_crawling_context import AdaptiveContextError
 
 
 class TestCRAConfig:
@@ -72,6 +91,25 @@ class TestCRADataValidator:
         assert validator.is_relevant_content('Revenue Agency', 'CRA services')
         assert not validator.is_relevant_content('Weather Report', 'Sunny day today')
 
+    def test_classify(self, validator: CRADataValidator) -> None:
+        """Test that a single classification finds all page metadata."""
+        classification = validator.classify(
+            'Self-employed income',
+            'Report it on form T2125 or T1 for 2022 and 2024, but not 12025. Contact RC4 about the 2019 changes.',
+        )
+
+        assert classification.page_type == 'forms'
+        assert classification.is_relevant
+        assert classification.tax_year == '2024'
+        assert classification.form_number == 'T1'
+
+        # Keywords count towards relevance even inside other words, but only whole words decide the page type
+        classification = validator.classify('Syntax guide', 'Formatting rules for taxonomies of documents.')
+        assert classification.page_type == 'general'
+        assert classification.is_relevant
+        assert classification.tax_year is None
+        assert classification.form_number is None
+
     def test_validate_data_success(self, validator: CRADataValidator) -> None:
         """Test successful data validation."""
         data = {
@@ -124,6 +162,126 @@ class TestCRARateLimiter:
         assert 'max_per_minute' in stats
         assert stats['max_per_minute'] == 5
 
+    @pytest.mark.asyncio
+    async def test_limits_allow_bursts_then_space_requests(self) -> None:
+        """Test that a full window of requests is allowed at once, and further requests are spaced evenly."""
+        rate_limiter = CRARateLimiter(
+            max_requests_per_minute=3, max_requests_per_hour=100, max_requests_per_day=1000, request_delay=0
+        )
+        await rate_limiter.initialize()
+
+        assert [rate_limiter._reserve('canada.ca', 1000.0) for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert rate_limiter._reserve('canada.ca', 1000.0) == pytest.approx(20.0)
+        assert rate_limiter._reserve('canada.ca', 1000.0) == pytest.approx(40.0)
+
+        # Other hosts have their own limits
+        assert rate_limiter._reserve('apps.canada.ca', 1000.0) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_request_delay_spaces_requests(self) -> None:
+        """Test that the minimum delay applies between consecutive requests of a host."""
+        rate_limiter = CRARateLimiter(request_delay=2.0)
+        await rate_limiter.initialize()
+
+        assert rate_limiter._reserve('canada.ca', 1000.0) == 0.0
+        assert rate_limiter._reserve('canada.ca', 1000.5) == pytest.approx(1.5)
+        assert rate_limiter._reserve('canada.ca', 1010.0) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_buckets_of_idle_hosts_are_evicted(self) -> None:
+        """Test that buckets whose theoretical arrival times are in the past are dropped from the state."""
+        rate_limiter = CRARateLimiter(max_requests_per_minute=3, max_requests_per_hour=0, max_requests_per_day=0)
+        await rate_limiter.initialize()
+
+        rate_limiter._reserve('canada.ca', 1000.0)
+        rate_limiter._reserve('apps.canada.ca', 1045.0)
+        assert rate_limiter.get_stats()['hosts'] == 2
+
+        # The bucket of `canada.ca` is idle a minute later, the other one still limits requests.
+        rate_limiter._reserve('www.canada.ca', 1061.0)
+        assert set(rate_limiter._state.current_value.buckets) == {'apps.canada.ca', 'www.canada.ca'}
+
+    @pytest.mark.asyncio
+    async def test_scheduler_postpones_requests_beyond_max_wait(self) -> None:
+        """Test that the scheduler hands out requests within their limits and returns the others to the queue."""
+        rate_limiter = CRARateLimiter(max_requests_per_minute=1, request_delay=0)
+        request_manager = MagicMock()
+        request_manager.fetch_next_request = AsyncMock(
+            side_effect=[Request.from_url('https://www.canada.ca/a'), Request.from_url('https://www.canada.ca/b')]
+        )
+        request_manager.reclaim_request = AsyncMock()
+        scheduler = CRARequestScheduler(request_manager, rate_limiter, max_wait=0.01)
+
+        request = await scheduler.fetch_next_request()
+        assert request is not None
+        assert scheduler.consume_reservation(request)
+        assert not scheduler.consume_reservation(request)
+
+        assert await scheduler.fetch_next_request() is None
+        request_manager.reclaim_request.assert_awaited_once()
+        assert rate_limiter.get_stats()['requests'] == 1
+
+        # The postponed request is not reported as ready until its slot.
+        request_manager.has_next_request = AsyncMock(return_value=True)
+        assert await scheduler.has_next_request() is False
+        request_manager.has_next_request.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_scheduler_wakes_up_waiters_at_the_slot_of_postponed_requests(self) -> None:
+        """Test that `wait_for_change` returns once the slot of a postponed request comes."""
+        rate_limiter = CRARateLimiter(request_delay=0.2)
+        await rate_limiter.acquire('https://www.canada.ca/a')
+
+        request_manager = MagicMock()
+        request_manager.notifies_changes = True
+        request_manager.fetch_next_request = AsyncMock(return_value=Request.from_url('https://www.canada.ca/b'))
+        request_manager.reclaim_request = AsyncMock()
+        request_manager.has_next_request = AsyncMock(return_value=True)
+        request_manager.wait_for_change = AsyncMock(side_effect=asyncio.Event().wait)
+        scheduler = CRARequestScheduler(request_manager, rate_limiter, max_wait=0.01)
+
+        assert await scheduler.fetch_next_request() is None
+        assert scheduler.notifies_changes
+        assert await scheduler.has_next_request() is False
+
+        await asyncio.wait_for(scheduler.wait_for_change(), timeout=1)
+        assert await scheduler.has_next_request() is True
+
+    @pytest.mark.asyncio
+    async def test_scheduler_marks_requests_as_handled_in_a_batch(self) -> None:
+        """Test that marking requests as handled is delegated to the wrapped manager as a single call."""
+        rate_limiter = CRARateLimiter(request_delay=0)
+        requests = [Request.from_url(f'https://www.canada.ca/{i}') for i in range(2)]
+        request_manager = MagicMock()
+        request_manager.fetch_next_request = AsyncMock(side_effect=requests)
+        request_manager.mark_requests_as_handled = AsyncMock(return_value=[])
+        scheduler = CRARequestScheduler(request_manager, rate_limiter)
+
+        for _ in requests:
+            await scheduler.fetch_next_request()
+        await scheduler.mark_requests_as_handled(requests)
+
+        request_manager.mark_requests_as_handled.assert_awaited_once_with(requests)
+        assert not any(scheduler.consume_reservation(request) for request in requests)
+
+    @pytest.mark.asyncio
+    async def test_scheduler_reclaims_request_of_cancelled_fetch(self) -> None:
+        """Test that a request is returned to the queue when its fetch is cancelled while waiting for its slot."""
+        rate_limiter = CRARateLimiter(max_requests_per_minute=1, request_delay=0)
+        await rate_limiter.acquire('https://www.canada.ca/a')
+
+        request = Request.from_url('https://www.canada.ca/b')
+        request_manager = MagicMock()
+        request_manager.fetch_next_request = AsyncMock(return_value=request)
+        request_manager.reclaim_request = AsyncMock()
+        scheduler = CRARequestScheduler(request_manager, rate_limiter, max_wait=120)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(scheduler.fetch_next_request(), timeout=0.05)
+
+        request_manager.reclaim_request.assert_awaited_once_with(request, forefront=True)
+        assert not scheduler.consume_reservation(request)
+
 
 class TestCRAVectorizer:
     """Test CRA vectorizer functionality (mocked)."""
@@ -132,40 +290,32 @@ class TestCRAVectorizer:
         """Test text chunking functionality without dependencies."""
         # Mock the vectorizer to avoid dependency issues
         with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'):
-            from crawlee.cra_scraper._vectorizer import CRAVectorizer
-
-            vectorizer = CRAVectorizer(chunk_size=100, overlap_size=20)
+            vectorizer = CRAVectorizer(chunk_tokens=20, overlap_tokens=4, max_chunks_per_page=3)
 
             # Test short text (no chunking)
             short_text = 'This is a short document.'
             chunks = vectorizer._split_text_into_chunks(short_text)
-            assert len(chunks) == 1
-            assert chunks[0] == short_text
+            assert chunks == [short_text]
 
-            # Test long text (chunking needed)
-            long_text = 'This is a sentence. ' * 20  # ~400 chars
+            # Test long text (chunking needed), chunks end at sentence boundaries
+            long_text = 'This is a sentence. ' * 20  # 100 tokens
             chunks = vectorizer._split_text_into_chunks(long_text)
-            assert len(chunks) > 1
-            assert len(chunks) <= vectorizer._max_chunks_per_page
-
-            # Verify chunks have appropriate sizes
-            for chunk in chunks[:-1]:  # All chunks except last
-                assert len(chunk) >= vectorizer._overlap_size
-
-            # Test overlap exists between consecutive chunks
-            if len(chunks) > 1:
-                for i in range(len(chunks) - 1):
-                    # Overlap should exist - verify chunks have some common content
-                    chunk1_end = chunks[i][-vectorizer._overlap_size // 2 :]
-                    chunk2_start = chunks[i + 1][: vectorizer._overlap_size // 2]
-                    # This is a simple check - in practice, overlap is more sophisticated
-                    assert len(chunk1_end) > 0 and len(chunk2_start) > 0
+            assert len(chunks) == vectorizer._max_chunks_per_page
+            assert all(chunk.endswith('sentence.') for chunk in chunks)
+            assert all(len(tokenize_words(chunk)) <= 20 for chunk in chunks)
+
+    def test_deprecated_chunk_size_arguments(self) -> None:
+        """Test that the deprecated character sizes are converted to model tokens with a warning."""
+        with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'):
+            with pytest.warns(DeprecationWarning, match='chunk_size'):
+                vectorizer = CRAVectorizer(chunk_size=3000, overlap_size=500)
+
+            assert vectorizer._chunk_tokens == 750
+            assert vectorizer._overlap_tokens == 125
 
     def test_chunk_metadata_creation(self) -> None:
         """Test chunk metadata creation."""
         with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'):
-            from crawlee.cra_scraper._vectorizer import CRAVectorizer
-
             vectorizer = CRAVectorizer()
 
             base_data = {
@@ -192,8 +342,6 @@ class TestCRAVectorizer:
     def test_combined_text_creation(self) -> None:
         """Test combined text creation for vectorization."""
         with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'):
-            from crawlee.cra_scraper._vectorizer import CRAVectorizer
-
             vectorizer = CRAVectorizer()
 
             data = {
@@ -220,14 +368,12 @@ class TestCRAVectorizer:
     async def test_vectorize_tax_data_mocked(self) -> None:
         """Test tax data vectorization with mocked dependencies."""
         with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer') as mock_transformer:
-            from crawlee.cra_scraper._vectorizer import CRAVectorizer
-
             # Mock the sentence transformer
             mock_model = MagicMock()
             mock_model.encode = MagicMock(return_value=[[0.1, 0.2, 0.3]])
             mock_transformer.return_value = mock_model
 
-            vectorizer = CRAVectorizer(chunk_size=50, overlap_size=10)
+            vectorizer = CRAVectorizer(chunk_tokens=40, overlap_tokens=4)
             vectorizer._model = mock_model  # Bypass initialization
 
             # Mock the vectorize_batch method
@@ -240,7 +386,7 @@ class TestCRAVectorizer:
                 'extracted_at': datetime.now(),
             }
 
-            # This should return multiple chunks due to small chunk_size
+            # This should return multiple chunks due to small chunk_tokens
             result = await vectorizer.vectorize_tax_data(data)
 
             # Verify result structure
@@ -255,3 +401,653 @@ class TestCRAVectorizer:
                 assert 'total_chunks' in chunk
                 assert 'chunk_text' in chunk
                 assert 'is_chunked' in chunk
+
+
+class TestCRATextChunker:
+    """Test the token-aware text chunker."""
+
+    def test_spans_respect_token_limit_and_overlap(self) -> None:
+        """Test that chunks fit the token limit, overlap, and cover the whole text."""
+        chunker = CRATextChunker(max_tokens=10, overlap_tokens=2)
+        text = ' '.join(f'word{i}' for i in range(35))
+
+        spans = list(chunker.iter_spans(text))
+
+        assert [len(tokenize_words(text[start:end])) for start, end in spans] == [10, 10, 10, 10, 3]
+        assert spans[0][0] == 0
+        assert spans[-1][1] == len(text)
+        for (_, previous_end), (start, _) in pairwise(spans):
+            assert text[start:previous_end].split() == text[:previous_end].split()[-2:]
+
+    def test_spans_end_at_sentence_boundaries(self) -> None:
+        """Test that chunks end after the last sentence that fits, unless it would make them too short."""
+        chunker = CRATextChunker(max_tokens=12, overlap_tokens=0)
+        text = 'One two three four five six seven. Eight nine ten eleven twelve thirteen fourteen fifteen.'
+
+        spans = list(chunker.iter_spans(text))
+        assert text[spans[0][0] : spans[0][1]] == 'One two three four five six seven.'
+
+        # The only sentence boundary is too early for a chunk of 20 tokens
+        chunker = CRATextChunker(max_tokens=20, overlap_tokens=0)
+        text = 'One two. ' + ' '.join(['word'] * 30)
+        spans = list(chunker.iter_spans(text))
+        assert len(tokenize_words(text[spans[0][0] : spans[0][1]])) == 20
+
+    def test_spans_are_lazy(self) -> None:
+        """Test that spans are produced on demand, so callers can stop early."""
+        tokenize = MagicMock(side_effect=tokenize_words)
+        chunker = CRATextChunker(tokenize, max_tokens=5)
+
+        spans = chunker.iter_spans('a b c d e f g h i j k l')
+        tokenize.assert_not_called()
+
+        assert next(spans) == (0, 9)
+        tokenize.assert_called_once()
+
+
+class TestCRAEmbeddingService:
+    """Test CRA embedding service micro-batching."""
+
+    @pytest.mark.asyncio
+    async def test_batches_texts_of_concurrent_callers(self) -> None:
+        """Test that texts from concurrent pages are encoded in shared batches."""
+        batch_sizes: list[int] = []
+
+        def encode(texts: list[str]) -> list[list[float]]:
+            batch_sizes.append(len(texts))
+            return [[float(len(text))] for text in texts]
+
+        service = CRAEmbeddingService(encode, max_batch_size=8, max_batch_delay=0.05)
+
+        pages = [[f'page {page} chunk ' + 'x' * chunk for chunk in range(3)] for page in range(5)]
+        results = await asyncio.gather(*(service.embed(texts) for texts in pages))
+
+        # Every page gets its own vectors back, in order
+        for texts, vectors in zip(pages, results, strict=True):
+            assert vectors == [[float(len(text))] for text in texts]
+
+        # 15 texts are encoded in two batches instead of five
+        assert batch_sizes == [8, 7]
+
+        stats = service.get_stats()
+        assert stats['texts_embedded'] == 15
+        assert stats['batches_encoded'] == 2
+        assert stats['queue_depth'] == 0
+
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_bounded_queue_applies_backpressure(self) -> None:
+        """Test that callers wait while the queue is full."""
+        release = threading.Event()
+
+        def encode(texts: list[str]) -> list[list[float]]:
+            release.wait(timeout=5)
+            return [[0.0] for _ in texts]
+
+        service = CRAEmbeddingService(encode, max_batch_size=2, max_batch_delay=0, max_queue_size=2)
+
+        first = asyncio.create_task(service.embed(['a', 'b']))
+        await asyncio.sleep(0.05)
+
+        # The first batch is being encoded, the queue fills up and the next caller is blocked
+        second = asyncio.create_task(service.embed(['c', 'd', 'e']))
+        await asyncio.sleep(0.05)
+        assert service.get_stats()['queue_depth'] == 2
+        assert service.get_stats()['max_queue_depth'] == 2
+        assert not second.done()
+
+        release.set()
+        assert await first == [[0.0], [0.0]]
+        assert await second == [[0.0], [0.0], [0.0]]
+
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_encode_failure_is_propagated(self) -> None:
+        """Test that a failing batch fails the pages waiting for it."""
+
+        def encode(_texts: list[str]) -> list[list[float]]:
+            raise RuntimeError('model crashed')
+
+        service = CRAEmbeddingService(encode)
+
+        with pytest.raises(RuntimeError, match='model crashed'):
+            await service.embed(['a'])
+
+        assert service.get_stats()['failed_batches'] == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_wrong_vector_count_fails_the_batch(self) -> None:
+        """Test that an encoder returning fewer vectors than texts fails the pages instead of leaving them waiting."""
+
+        def encode(texts: list[str]) -> list[list[float]]:
+            return [[0.0] for _ in texts[1:]]
+
+        service = CRAEmbeddingService(encode)
+
+        with pytest.raises(ValueError, match='1 vectors for 2 texts'):
+            await asyncio.wait_for(service.embed(['a', 'b']), timeout=5)
+
+        assert service.get_stats()['failed_batches'] == 1
+        await service.close()
+
+    @pytest.mark.asyncio
+    async def test_vectorizer_uses_embedding_service(self) -> None:
+        """Test that the vectorizer encodes batches through the embedding service."""
+        with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'):
+            mock_model = MagicMock()
+            mock_model.encode = MagicMock(side_effect=lambda texts, **_: [[0.5, 0.5] for _ in texts])
+
+            vectorizer = CRAVectorizer(batch_size=16)
+            vectorizer._model = mock_model  # Bypass initialization
+
+            vectors = await vectorizer.vectorize_batch(['first', 'second'])
+
+            assert vectors == [[0.5, 0.5], [0.5, 0.5]]
+            mock_model.encode.assert_called_once_with(['first', 'second'], batch_size=16, show_progress_bar=False)
+            assert vectorizer.get_stats()['texts_embedded'] == 2
+
+            await vectorizer.close()
+
+
+class TestCRAEmbeddingCache:
+    """Test CRA embedding cache."""
+
+    def test_memory_cache(self) -> None:
+        """Test caching embeddings in memory only."""
+        cache = CRAEmbeddingCache(model_name='model', max_size=2)
+
+        assert cache.get_many(['a', 'b']) == [None, None]
+        cache.put_many(['a', 'b'], [[1.0, 2.0], [3.0, 4.0]])
+        assert cache.get_many(['a', 'b', 'c']) == [[1.0, 2.0], [3.0, 4.0], None]
+
+        stats = cache.get_stats()
+        assert stats['hits'] == 2
+        assert stats['misses'] == 3
+        assert stats['disk_entries'] == 0
+
+    def test_persistent_cache(self, tmp_path: Path) -> None:
+        """Test that embeddings are reused across cache instances through the on-disk store."""
+        cache = CRAEmbeddingCache(model_name='model', path=tmp_path)
+        cache.put_many(['a', 'b', 'a'], [[0.5, 1.5], [2.5, 3.5], [0.5, 1.5]])
+        cache.close()
+
+        reopened = CRAEmbeddingCache(model_name='model', path=tmp_path)
+        assert reopened.get_many(['b', 'a', 'c']) == [[2.5, 3.5], [0.5, 1.5], None]
+        assert reopened.get_stats()['disk_hits'] == 2
+        assert reopened.get_stats()['disk_entries'] == 2
+
+        # Rows appended after the store was memory-mapped are readable as well
+        reopened.put_many(['c'], [[4.5, 5.5]])
+        reopened._memory.clear()
+        assert reopened.get_many(['c']) == [[4.5, 5.5]]
+        reopened.close()
+
+        # A different model does not reuse the embeddings
+        other_model = CRAEmbeddingCache(model_name='other-model', path=tmp_path)
+        assert other_model.get_many(['a']) == [None]
+        other_model.close()
+
+    def test_persistent_cache_recovers_from_torn_write(self, tmp_path: Path) -> None:
+        """Test that a partially written row is dropped when the store is opened."""
+        cache = CRAEmbeddingCache(model_name='model', path=tmp_path)
+        cache.put_many(['a'], [[1.0, 2.0]])
+        cache.close()
+
+        with (tmp_path / 'vectors.f32').open('ab') as file:
+            file.write(b'\x00\x01\x02')
+
+        reopened = CRAEmbeddingCache(model_name='model', path=tmp_path)
+        assert reopened.get_many(['a']) == [[1.0, 2.0]]
+        reopened.put_many(['b'], [[3.0, 4.0]])
+        reopened._memory.clear()
+        assert reopened.get_many(['b', 'a']) == [[3.0, 4.0], [1.0, 2.0]]
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_vectorizer_skips_encode_for_cached_texts(self, tmp_path: Path) -> None:
+        """Test that cached texts are not encoded again, even by a new vectorizer."""
+        with patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'):
+            mock_model = MagicMock()
+            mock_model.encode = MagicMock(side_effect=lambda texts, **_: [[float(len(text))] for text in texts])
+
+            vectorizer = CRAVectorizer(cache_dir=tmp_path)
+            vectorizer._model = mock_model  # Bypass initialization
+            assert await vectorizer.vectorize_batch(['one', 'three']) == [[3.0], [5.0]]
+            await vectorizer.close()
+
+            # A new vectorizer never loads the model when everything is cached
+            vectorizer = CRAVectorizer(cache_dir=tmp_path)
+            assert await vectorizer.vectorize_batch(['three', 'one']) == [[5.0], [3.0]]
+            assert vectorizer._model is None
+            assert vectorizer.get_cache_stats()['disk_hits'] == 2
+
+            # Only the new text is encoded
+            vectorizer._model = mock_model
+            assert await vectorizer.vectorize_batch(['one', 'eleven']) == [[3.0], [6.0]]
+            assert mock_model.encode.call_args_list[-1].args == (['eleven'],)
+            await vectorizer.close()
+
+
+class TestCRAQdrantWriter:
+    """Test the background Qdrant writer against a stub upsert."""
+
+    @pytest.mark.asyncio
+    async def test_batches_points_across_pages(self) -> None:
+        """Test that points of several pages are upserted in full batches."""
+        batches: list[list[int]] = []
+        writer = CRAQdrantWriter(batches.append, batch_size=4, flush_interval=10)
+
+        for page in range(3):
+            await writer.write([page * 10 + chunk for chunk in range(3)])
+
+        # Full batches are written right away, the rest waits for more points, the interval or a flush
+        await asyncio.sleep(0.05)
+        assert batches == [[0, 1, 2, 10], [11, 12, 20, 21]]
+
+        await writer.flush()
+        assert batches == [[0, 1, 2, 10], [11, 12, 20, 21], [22]]
+        assert writer.get_stats()['points_written'] == 9
+        assert writer.get_stats()['points_pending'] == 0
+
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_interval(self) -> None:
+        """Test that pending points are written after the flush interval."""
+        batches: list[list[int]] = []
+        writer = CRAQdrantWriter(batches.append, batch_size=100, flush_interval=0.05)
+
+        await writer.write([1, 2])
+        await asyncio.sleep(0.2)
+        assert batches == [[1, 2]]
+
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_upsert_runs_off_the_event_loop(self) -> None:
+        """Test that the blocking upsert call runs on the writer thread."""
+        threads: list[str] = []
+        writer = CRAQdrantWriter(lambda _: threads.append(threading.current_thread().name))
+
+        await writer.write([1])
+        await writer.flush()
+
+        assert len(threads) == 1
+        assert threads[0].startswith('cra-qdrant-writer')
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_retries_with_backoff(self) -> None:
+        """Test that failed upserts are retried and eventually dropped."""
+        attempts: list[list[int]] = []
+
+        def flaky_upsert(points: list[int]) -> None:
+            attempts.append(points)
+            if len(attempts) < 3 or points == [2]:
+                raise ConnectionError('Qdrant unavailable')
+
+        writer = CRAQdrantWriter(flaky_upsert, max_retries=2, retry_delay=0.01)
+
+        await writer.write([1])
+        await writer.flush()
+        assert writer.get_stats()['points_written'] == 1
+        assert writer.get_stats()['retries'] == 2
+
+        await writer.write([2])
+        await writer.flush()
+        assert writer.get_stats()['points_failed'] == 1
+
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_write_futures_report_dropped_points(self) -> None:
+        """Test that the future of a write is resolved only once all its points are stored or any is dropped."""
+
+        def upsert(points: list[int]) -> None:
+            if 3 in points:
+                raise ConnectionError('Qdrant unavailable')
+
+        writer = CRAQdrantWriter(upsert, batch_size=2, flush_interval=10, max_retries=0)
+
+        stored = await writer.write([1])
+        assert not stored.done()
+
+        dropped = await writer.write([2, 3, 4])
+        await writer.flush()
+
+        assert await stored is True
+        assert await dropped is False
+        await writer.close()
+
+    @pytest.mark.asyncio
+    async def test_qdrant_client_writes_through_writer(self) -> None:
+        """Test that the Qdrant client queues points and writes them on flush."""
+        with (
+            patch('crawlee.cra_scraper._qdrant_client.QdrantClient') as mock_qdrant,
+            patch('crawlee.cra_scraper._qdrant_client.PointStruct', side_effect=lambda **kwargs: kwargs),
+        ):
+            client = CRAQdrantClient(endpoint='http://localhost:6333', write_flush_interval=10)
+            await client.initialize()
+
+            point_ids = await client.store_batch(
+                [
+                    {'url': f'https://canada.ca/{i}', 'vector': [0.1], 'extracted_at': datetime.now(timezone.utc)}
+                    for i in range(3)
+                ]
+            )
+            assert len(point_ids) == 3
+
+            await client.close()
+
+            upsert = mock_qdrant.return_value.upsert
+            upsert.assert_called_once()
+            assert [point['id'] for point in upsert.call_args.kwargs['points']] == point_ids
+
+
+class TestCRALocalVectorIndex:
+    """Test the local NumPy vector index."""
+
+    @pytest.mark.asyncio
+    async def test_store_search_and_delete(self) -> None:
+        """Test that points are found by cosine similarity, overwritten by ID, and deleted."""
+        index = CRALocalVectorIndex(vector_size=3)
+        url = 'https://www.canada.ca/en/revenue-agency/services/forms-publications.html'
+
+        point_ids = await index.store_batch(
+            [
+                {
+                    'vector': [1.0, 0.0, 0.0],
+                    'url': url,
+                    'chunk_index': 0,
+                    'extracted_at': datetime(2024, 1, 1, tzinfo=timezone.utc),
+                },
+                {'vector': [0.0, 2.0, 0.0], 'url': url, 'chunk_index': 1},
+                {'vector': [0.0, 0.0, 1.0], 'url': url, 'chunk_index': 2},
+            ]
+        )
+        assert point_ids == [compute_point_id(url, chunk_index) for chunk_index in range(3)]
+
+        results = await index.search_similar([0.0, 1.0, 0.1], limit=2, score_threshold=0.0)
+        assert [result['id'] for result in results] == [point_ids[1], point_ids[2]]
+        assert results[0]['score'] == pytest.approx(0.995, abs=1e-3)
+        assert results[0]['chunk_index'] == 1
+
+        # Re-storing a chunk overwrites it, deleting one moves the last point into its place
+        await index.store_data({'vector': [1.0, 1.0, 0.0], 'url': url, 'chunk_index': 1})
+        await index.delete_points([point_ids[0], 'unknown'])
+        assert await index.count_points() == 2
+
+        results = await index.search_similar([1.0, 0.0, 0.0], limit=10)
+        assert [result['id'] for result in results] == [point_ids[1]]
+
+    @pytest.mark.asyncio
+    async def test_persists_to_directory(self, tmp_path: Path) -> None:
+        """Test that the index is written on flush and loaded memory-mapped."""
+        index = CRALocalVectorIndex(directory=tmp_path, vector_size=2)
+        await index.store_batch([{'vector': [1.0, 0.0], 'url': 'https://www.canada.ca/a', 'title': 'A'}])
+        await index.close()
+
+        loaded = CRALocalVectorIndex(directory=tmp_path, vector_size=2)
+        results = await loaded.search_similar([1.0, 0.0])
+        assert [result['title'] for result in results] == ['A']
+        assert not loaded._vectors.flags.writeable
+
+        await loaded.store_batch([{'vector': [0.0, 1.0], 'url': 'https://www.canada.ca/b', 'title': 'B'}])
+        assert await loaded.count_points() == 2
+
+    @pytest.mark.asyncio
+    async def test_partitioned_search(self) -> None:
+        """Test that a partitioned index finds the same nearest points as a full scan for clustered data."""
+        np = pytest.importorskip('numpy')
+        rng = np.random.default_rng(1)
+        centers = rng.normal(size=(8, 16))
+        vectors = [(centers[i % 8] + rng.normal(scale=0.05, size=16)).tolist() for i in range(400)]
+        data = [{'vector': vector, 'url': f'https://www.canada.ca/{i}'} for i, vector in enumerate(vectors)]
+
+        full = CRALocalVectorIndex(vector_size=16)
+        partitioned = CRALocalVectorIndex(vector_size=16, n_partitions=8, n_probe=2)
+        await full.store_batch(data)
+        await partitioned.store_batch(data)
+
+        for query in vectors[:8]:
+            expected = await full.search_similar(query, limit=5)
+            results = await partitioned.search_similar(query, limit=5)
+            assert [result['id'] for result in results] == [result['id'] for result in expected]
+
+        assert partitioned._centroids is not None
+
+    @pytest.mark.asyncio
+    async def test_partitioned_search_skips_emptied_partitions(self) -> None:
+        """Test that deleting the points of the partition closest to the query does not empty the results."""
+        np = pytest.importorskip('numpy')
+        rng = np.random.default_rng(1)
+        centers = np.eye(4, 16)
+        vectors = [(centers[i % 4] + rng.normal(scale=0.05, size=16)).tolist() for i in range(1000)]
+        index = CRALocalVectorIndex(vector_size=16, n_partitions=4, n_probe=1)
+        point_ids = await index.store_batch(
+            [{'vector': vector, 'url': f'https://www.canada.ca/{i}'} for i, vector in enumerate(vectors)]
+        )
+        await index.search_similar(vectors[0], limit=1)
+
+        nearest = index._assignments[0]
+        await index.delete_points([point_ids[row] for row in np.flatnonzero(index._assignments[:1000] == nearest)])
+
+        results = await index.search_similar(vectors[0], limit=10, score_threshold=-1)
+        assert len(results) == 10
+
+    @pytest.mark.asyncio
+    async def test_ignores_vectors_without_sidecar(self, tmp_path: Path) -> None:
+        """Test that vectors written by a flush that crashed before writing their sidecar are ignored."""
+        np = pytest.importorskip('numpy')
+        index = CRALocalVectorIndex(directory=tmp_path, vector_size=2)
+        await index.store_batch([{'vector': [1.0, 0.0], 'url': 'https://www.canada.ca/a', 'title': 'A'}])
+        await index.close()
+        np.save(tmp_path / 'vectors.2.npy', np.zeros((2, 2), dtype=np.float32))
+
+        loaded = CRALocalVectorIndex(directory=tmp_path, vector_size=2)
+        assert await loaded.count_points() == 1
+
+        await loaded.store_batch([{'vector': [0.0, 1.0], 'url': 'https://www.canada.ca/b', 'title': 'B'}])
+        await loaded.close()
+        assert sorted(path.name for path in tmp_path.glob('vectors*')) == ['vectors.2.npy']
+        assert await CRALocalVectorIndex(directory=tmp_path, vector_size=2).count_points() == 2
+
+
+class TestCRAFingerprintStore:
+    """Test the content fingerprints used for incremental re-crawls."""
+
+    def test_point_ids_are_deterministic(self) -> None:
+        """Test that point IDs depend only on the URL and the chunk index."""
+        url = 'https://www.canada.ca/en/revenue-agency.html'
+
+        assert compute_point_id(url, 0) == compute_point_id(url, 0)
+        assert compute_point_id(url, 0) != compute_point_id(url, 1)
+        assert compute_point_id(url, 0) != compute_point_id(f'{url}?page=2', 0)
+
+    def test_hash_ignores_whitespace(self) -> None:
+        """Test that the content hash ignores whitespace differences but not content or model changes."""
+        store = CRAFingerprintStore(persistence_enabled=False, salt='model-a')
+        data = {'title': 'Income tax', 'content': 'File your  return\nby April 30.'}
+
+        assert store.compute_hash(data) == store.compute_hash(
+            {'title': ' Income tax ', 'content': 'File your return by\tApril 30.'}
+        )
+        assert store.compute_hash(data) != store.compute_hash({**data, 'content': 'File your return by May 1.'})
+        assert store.compute_hash(data) != CRAFingerprintStore(persistence_enabled=False, salt='model-b').compute_hash(
+            data
+        )
+
+    @pytest.mark.asyncio
+    async def test_unchanged_pages_are_skipped(self) -> None:
+        """Test that unchanged pages are not vectorized again and surplus chunks of changed pages are deleted."""
+        with (
+            patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'),
+            patch('crawlee.cra_scraper._qdrant_client.QdrantClient'),
+        ):
+            crawler = CRACrawler(config=CRAConfig(limits=ScrapingLimits(request_delay=0)))
+            crawler._fingerprints = CRAFingerprintStore(persistence_enabled=False)
+            await crawler._fingerprints.initialize()
+
+            url = 'https://www.canada.ca/en/services/taxes/income-tax.html'
+            page = {
+                'url': url,
+                'title': 'Income tax',
+                'content': 'Tax return content',
+                'extracted_at': datetime.now(timezone.utc),
+            }
+            chunks = [{'url': url, 'chunk_index': i, 'vector': [0.1]} for i in range(3)]
+
+            crawler._extract_page_data = AsyncMock(return_value=page)  # type: ignore[method-assign]
+            crawler._validator.validate_data = MagicMock(side_effect=lambda data: data)  # type: ignore[method-assign]
+            crawler._vectorizer.vectorize_tax_data = AsyncMock(return_value=chunks)  # type: ignore[method-assign]
+
+            async def store_batch(chunks: list[dict], *, on_stored: Callable[[bool], None]) -> list[str]:
+                on_stored(True)  # noqa: FBT003
+                return [compute_point_id(url, chunk['chunk_index']) for chunk in chunks]
+
+            crawler._vector_store.store_batch = AsyncMock(side_effect=store_batch)  # type: ignore[method-assign]
+            crawler._vector_store.delete_points = AsyncMock()  # type: ignore[method-assign]
+
+            context = MagicMock()
+            context.request.url = url
+
+            # Each call stands for a separate crawl of the page
+            await crawler._handle_page(context)
+            crawler._processed_requests.clear()
+            await crawler._handle_page(context)
+            crawler._processed_requests.clear()
+            assert crawler._vectorizer.vectorize_tax_data.await_count == 1
+            assert crawler._stats['pages_unchanged'] == 1
+
+            # The changed page is split into fewer chunks, so the last old chunk has to go
+            page['content'] = 'Updated tax return content'
+            crawler._vectorizer.vectorize_tax_data.return_value = chunks[:2]
+            await crawler._handle_page(context)
+
+            assert crawler._vectorizer.vectorize_tax_data.await_count == 2
+            crawler._vector_store.delete_points.assert_awaited_once_with([compute_point_id(url, 2)])
+            assert crawler._stats['chunks_deleted'] == 1
+
+    @pytest.mark.asyncio
+    async def test_pages_with_dropped_points_are_not_skipped(self) -> None:
+        """Test that a page is fingerprinted only once its points are stored, and forgotten if they are dropped."""
+        with (
+            patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'),
+            patch('crawlee.cra_scraper._qdrant_client.QdrantClient'),
+        ):
+            crawler = CRACrawler(config=CRAConfig(limits=ScrapingLimits(request_delay=0)))
+            crawler._fingerprints = CRAFingerprintStore(persistence_enabled=False)
+            await crawler._fingerprints.initialize()
+
+            url = 'https://www.canada.ca/en/services/taxes/income-tax.html'
+            page = {
+                'url': url,
+                'title': 'Income tax',
+                'content': 'Tax return content',
+                'extracted_at': datetime.now(timezone.utc),
+            }
+            crawler._fingerprints.set(url, content_hash='outdated', chunk_count=1)
+
+            stored_callbacks = []
+            crawler._extract_page_data = AsyncMock(return_value=page)  # type: ignore[method-assign]
+            crawler._validator.validate_data = MagicMock(side_effect=lambda data: data)  # type: ignore[method-assign]
+            crawler._vectorizer.vectorize_tax_data = AsyncMock(  # type: ignore[method-assign]
+                return_value=[{'url': url, 'chunk_index': 0, 'vector': [0.1]}]
+            )
+            crawler._vector_store.store_data = AsyncMock(  # type: ignore[method-assign]
+                side_effect=lambda _, on_stored: stored_callbacks.append(on_stored)
+            )
+
+            context = MagicMock()
+            context.request.url = url
+            await crawler._handle_page(context)
+
+            # The write is only queued, so the old fingerprint stays until it is confirmed
+            assert crawler._fingerprints.get(url).content_hash == 'outdated'  # type: ignore[union-attr]
+
+            stored_callbacks[0](stored=False)
+            assert crawler._fingerprints.get(url) is None
+
+            crawler._processed_requests.clear()
+            await crawler._handle_page(context)
+            stored_callbacks[1](stored=True)
+            assert crawler._fingerprints.get(url).content_hash == crawler._fingerprints.compute_hash(page)  # type: ignore[union-attr]
+
+    @pytest.mark.asyncio
+    async def test_qdrant_client_uses_deterministic_point_ids(self) -> None:
+        """Test that chunks stored again get the same point IDs."""
+        with (
+            patch('crawlee.cra_scraper._qdrant_client.QdrantClient'),
+            patch('crawlee.cra_scraper._qdrant_client.PointStruct', side_effect=lambda **kwargs: kwargs),
+        ):
+            client = CRAQdrantClient(endpoint='http://localhost:6333', write_flush_interval=10)
+            await client.initialize()
+
+            chunks = [
+                {
+                    'url': 'https://canada.ca/a',
+                    'chunk_index': i,
+                    'vector': [0.1],
+                    'extracted_at': datetime.now(timezone.utc),
+                }
+                for i in range(2)
+            ]
+            assert await client.store_batch(chunks) == await client.store_batch(chunks)
+            assert await client.store_batch(chunks) == [compute_point_id('https://canada.ca/a', i) for i in range(2)]
+
+            await client.close()
+
+
+class TestCRACrawlerStaticExtraction:
+    """Test the extraction of page data from HTML fetched without a browser."""
+
+    @staticmethod
+    def _create_static_context(url: str, html: str) -> MagicMock:
+        context = MagicMock()
+        context.request.url = url
+        context.request.unique_key = url
+        context.parse_with_static_parser = AsyncMock(return_value=Selector(text=html))
+        type(context).page = PropertyMock(side_effect=AdaptiveContextError('Page was not crawled with Playwright.'))
+        return context
+
+    @pytest.mark.asyncio
+    async def test_extracts_data_from_static_html(self) -> None:
+        """Test that the title and the main content are extracted from parsed HTML."""
+        with (
+            patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'),
+            patch('crawlee.cra_scraper._qdrant_client.QdrantClient'),
+        ):
+            crawler = CRACrawler()
+            content = 'You must file your income tax and benefit return by April 30. ' * 3
+            context = self._create_static_context(
+                'https://www.canada.ca/en/services/taxes.html',
+                f'<html><head><title> Taxes </title></head><body><nav>Menu</nav><main><p>{content}</p></main></body>'
+                '</html>',
+            )
+
+            data = await crawler._extract_page_data(context)
+
+            assert data is not None
+            assert data['title'] == 'Taxes'
+            assert data['content'] == content.strip()
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_browser_without_static_content(self) -> None:
+        """Test that pages without enough content in their static HTML fail the static run."""
+        with (
+            patch('crawlee.cra_scraper._vectorizer.SentenceTransformer'),
+            patch('crawlee.cra_scraper._qdrant_client.QdrantClient'),
+        ):
+            crawler = CRACrawler()
+            context = self._create_static_context(
+                'https://www.canada.ca/en/services/taxes.html',
+                '<html><head><title>Taxes</title></head><body><div id="app"></div></body></html>',
+            )
+
+            with pytest.raises(AdaptiveContextError):
+                await crawler._handle_page(context)
+
+            assert crawler._stats['pages_crawled'] == 0
@@ -12,7 +12,8 @@ from unittest.mock import Mock
 import pytest
 
 from crawlee._autoscaling import AutoscaledPool, SystemStatus
-from crawlee._autoscaling._types import LoadRatioInfo, SystemInfo
+from crawlee._autoscaling._types import ConcurrencySample, LoadRatioInfo, SystemInfo
+from crawlee._autoscaling.concurrency_controller import ConcurrencyController
 from crawlee._types import ConcurrencySettings
 from crawlee._utils.time import measure_time
 
@@ -274,6 +275,101 @@ async def test_autoscales_uses_desired_concurrency_ratio(
             await pool_run_task
 
 
+async def test_uses_concurrency_controller(
+    monkeypatch: pytest.MonkeyPatch,
+    system_status: SystemStatus | Mock,
+) -> None:
+    samples = list[ConcurrencySample]()
+
+    class FixedConcurrencyController(ConcurrencyController):
+        def get_desired_concurrency(self, sample: ConcurrencySample) -> int:
+            samples.append(sample)
+            return 10
+
+    async def run() -> None:
+        await asyncio.sleep(0.05)
+
+    monkeypatch.setattr(AutoscaledPool, '_AUTOSCALE_INTERVAL', timedelta(seconds=0.1))
+
+    pool = AutoscaledPool(
+        system_status=system_status,
+        run_task_function=run,
+        is_task_ready_function=lambda: future(True),
+        is_finished_function=lambda: future(False),
+        concurrency_settings=ConcurrencySettings(
+            min_concurrency=1,
+            desired_concurrency=1,
+            max_concurrency=4,
+            concurrency_controller=FixedConcurrencyController(),
+        ),
+    )
+
+    pool_run_task = asyncio.create_task(pool.run(), name='pool run task')
+    try:
+        await asyncio.sleep(0.35)
+
+        # The desired concurrency is clamped to the max concurrency
+        assert pool.desired_concurrency == 4
+
+        assert len(samples) >= 2
+        assert samples[-1].finished_tasks > samples[0].finished_tasks
+        assert samples[-1].finished_tasks_duration > samples[0].finished_tasks_duration
+    finally:
+        pool_run_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await pool_run_task
+
+
+async def test_wakes_up_on_task_ready_notification(
+    monkeypatch: pytest.MonkeyPatch,
+    system_status: SystemStatus | Mock,
+) -> None:
+    task_ready = asyncio.Event()
+    started_count = 0
+
+    async def run() -> None:
+        nonlocal started_count
+        started_count += 1
+        await asyncio.sleep(60)
+
+    async def is_task_ready_function() -> bool:
+        return task_ready.is_set()
+
+    async def wait_for_task_ready_function() -> None:
+        await task_ready.wait()
+
+    # Make sure that the pool does not notice the ready tasks by polling.
+    monkeypatch.setattr(AutoscaledPool, '_TASK_READY_POLL_INTERVAL', timedelta(seconds=60))
+    monkeypatch.setattr(AutoscaledPool, '_TASK_READY_NOTIFIED_POLL_INTERVAL', timedelta(seconds=60))
+
+    pool = AutoscaledPool(
+        system_status=system_status,
+        run_task_function=run,
+        is_task_ready_function=is_task_ready_function,
+        is_finished_function=lambda: future(False),
+        wait_for_task_ready_function=wait_for_task_ready_function,
+        concurrency_settings=ConcurrencySettings(
+            min_concurrency=50,
+            max_concurrency=50,
+        ),
+    )
+
+    pool_run_task = asyncio.create_task(pool.run(), name='pool run task')
+    try:
+        await asyncio.sleep(0.1)
+        assert pool.current_concurrency == 0
+
+        task_ready.set()
+        await asyncio.sleep(0.1)
+
+        # All the workers are started at once
+        assert pool.current_concurrency == 50
+        assert started_count == 50
+    finally:
+        await pool.abort()
+        await pool_run_task
+
+
 async def test_max_tasks_per_minute_works(system_status: SystemStatus | Mock) -> None:
     done_count = 0
 
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from crawlee._autoscaling import AimdConcurrencyController, SystemStatusConcurrencyController
+from crawlee._autoscaling._simulation import SyntheticWorkload, compare_controllers
+from crawlee._autoscaling._types import ConcurrencySample, LoadRatioInfo, SystemInfo
+
+
+def create_sample(
+    *,
+    desired_concurrency: int,
+    finished_tasks: int,
+    finished_tasks_duration: timedelta,
+    created_at: datetime,
+    is_overloaded: bool = False,
+) -> ConcurrencySample:
+    load = LoadRatioInfo(limit_ratio=0.4, actual_ratio=1.0 if is_overloaded else 0.0)
+    return ConcurrencySample(
+        system_info=SystemInfo(cpu_info=load, memory_info=load, event_loop_info=load, client_info=load),
+        desired_concurrency=desired_concurrency,
+        current_concurrency=desired_concurrency,
+        min_concurrency=1,
+        max_concurrency=100,
+        finished_tasks=finished_tasks,
+        finished_tasks_duration=finished_tasks_duration,
+        created_at=created_at,
+    )
+
+
+def test_system_status_controller_steps() -> None:
+    controller = SystemStatusConcurrencyController()
+    now = datetime.now(timezone.utc)
+
+    idle = create_sample(desired_concurrency=40, finished_tasks=0, finished_tasks_duration=timedelta(), created_at=now)
+    assert controller.get_desired_concurrency(idle) == 42
+
+    overloaded = create_sample(
+        desired_concurrency=40,
+        finished_tasks=0,
+        finished_tasks_duration=timedelta(),
+        created_at=now,
+        is_overloaded=True,
+    )
+    assert controller.get_desired_concurrency(overloaded) == 38
+
+
+def test_aimd_controller_reverts_scale_up_without_throughput_gain() -> None:
+    controller = AimdConcurrencyController()
+    now = datetime.now(timezone.utc)
+    finished_tasks = 0
+    duration = timedelta()
+
+    def sample(concurrency: int, throughput: int) -> ConcurrencySample:
+        nonlocal now, finished_tasks, duration
+        now += timedelta(seconds=10)
+        finished_tasks += throughput * 10
+        duration += timedelta(seconds=throughput * 10)
+        return create_sample(
+            desired_concurrency=concurrency,
+            finished_tasks=finished_tasks,
+            finished_tasks_duration=duration,
+            created_at=now,
+        )
+
+    assert controller.get_desired_concurrency(sample(10, 10)) == 11  # No measurement yet
+    assert controller.get_desired_concurrency(sample(11, 11)) == 12
+    assert controller.get_desired_concurrency(sample(12, 12)) == 13
+    assert controller.get_desired_concurrency(sample(13, 12)) == 12  # No throughput gain
+    assert controller.get_desired_concurrency(sample(12, 12)) == 12
+
+
+def test_aimd_controller_backs_off_on_overload() -> None:
+    controller = AimdConcurrencyController(backoff_ratio=0.5)
+    now = datetime.now(timezone.utc)
+
+    sample = create_sample(
+        desired_concurrency=40,
+        finished_tasks=0,
+        finished_tasks_duration=timedelta(),
+        created_at=now,
+        is_overloaded=True,
+    )
+    assert controller.get_desired_concurrency(sample) == 20
+
+
+def test_aimd_controller_backs_off_on_slow_tasks() -> None:
+    controller = AimdConcurrencyController(backoff_ratio=0.5)
+    now = datetime.now(timezone.utc)
+
+    for i, (finished_tasks, duration) in enumerate([(0, 0), (100, 100), (200, 200), (210, 500)]):
+        sample = create_sample(
+            desired_concurrency=40,
+            finished_tasks=finished_tasks,
+            finished_tasks_duration=timedelta(seconds=duration),
+            created_at=now + timedelta(seconds=10 * i),
+        )
+        desired_concurrency = controller.get_desired_concurrency(sample)
+
+    # The average task duration grew from 1 second to 30 seconds
+    assert desired_concurrency == 20
+
+
+def test_aimd_controller_validates_arguments() -> None:
+    with pytest.raises(ValueError, match='backoff_ratio'):
+        AimdConcurrencyController(backoff_ratio=1.5)
+
+    with pytest.raises(ValueError, match='max_latency_ratio'):
+        AimdConcurrencyController(max_latency_ratio=1)
+
+
+@pytest.mark.parametrize(
+    ('workload', 'max_aimd_concurrency'),
+    [
+        pytest.param(
+            SyntheticWorkload(
+                duration=timedelta(minutes=30),
+                base_latency=timedelta(seconds=1),
+                max_throughput=20,
+                latency_jitter=0.02,
+            ),
+            30,
+            id='remote bottleneck',
+        ),
+        pytest.param(
+            SyntheticWorkload(duration=timedelta(minutes=30), base_latency=timedelta(seconds=1), latency_jitter=0.02),
+            200,
+            id='no bottleneck',
+        ),
+    ],
+)
+def test_simulated_throughput(workload: SyntheticWorkload, max_aimd_concurrency: int) -> None:
+    results = compare_controllers(
+        {'system_status': SystemStatusConcurrencyController, 'aimd': AimdConcurrencyController},
+        [workload],
+    )
+
+    # The AIMD controller finishes about as many tasks, without scaling past the point where it stops paying off
+    assert results['aimd'].finished_tasks >= 0.9 * results['system_status'].finished_tasks
+    assert results['aimd'].steps[-1].desired_concurrency <= max_aimd_concurrency
+    assert results['aimd'].mean_latency <= results['system_status'].mean_latency
@@ -2,14 +2,13 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 from logging import getLogger
-from typing import cast
 from unittest.mock import MagicMock
 
 import pytest
 
 from crawlee import service_locator
 from crawlee._autoscaling import Snapshotter
-from crawlee._autoscaling._types import ClientSnapshot, CpuSnapshot, EventLoopSnapshot, Snapshot
+from crawlee._autoscaling._types import ClientSnapshot, CpuSnapshot, EventLoopSnapshot
 from crawlee._autoscaling.snapshotter import SortedSnapshotList
 from crawlee._utils.byte_size import ByteSize
 from crawlee._utils.system import CpuInfo, MemoryInfo
@@ -179,8 +178,7 @@ def test_snapshot_pruning_removes_outdated_records(snapshotter: Snapshotter) ->
     snapshotter._cpu_snapshots = snapshots
 
     # Prune snapshots older than 2 hours
-    snapshots_casted = cast('list[Snapshot]', snapshotter._cpu_snapshots)
-    snapshotter._prune_snapshots(snapshots_casted, now)
+    snapshotter._prune_snapshots(snapshotter._cpu_snapshots, now)
 
     # Check that only the last two snapshots remain
     assert len(snapshotter._cpu_snapshots) == 2
@@ -191,8 +189,7 @@ def test_snapshot_pruning_removes_outdated_records(snapshotter: Snapshotter) ->
 def test_pruning_empty_snapshot_list_remains_empty(snapshotter: Snapshotter) -> None:
     now = datetime.now(timezone.utc)
     snapshotter._cpu_snapshots = Snapshotter._get_sorted_list_by_created_at(list[CpuSnapshot]())
-    snapshots_casted = cast('list[Snapshot]', snapshotter._cpu_snapshots)
-    snapshotter._prune_snapshots(snapshots_casted, now)
+    snapshotter._prune_snapshots(snapshotter._cpu_snapshots, now)
     assert snapshotter._cpu_snapshots == []
 
 
@@ -215,8 +212,7 @@ def test_snapshot_pruning_keeps_recent_records_unaffected(snapshotter: Snapshott
     snapshotter._cpu_snapshots = snapshots
 
     # Prune snapshots older than 2 hours
-    snapshots_casted = cast('list[Snapshot]', snapshotter._cpu_snapshots)
-    snapshotter._prune_snapshots(snapshots_casted, now)
+    snapshotter._prune_snapshots(snapshotter._cpu_snapshots, now)
 
     # Check that only the last two snapshots remain
     assert len(snapshotter._cpu_snapshots) == 2
@@ -331,3 +327,37 @@ def test_sorted_snapshot_list_add_maintains_order() -> None:
             prev_time = sorted_list[i - 1].created_at
             curr_time = snapshot.created_at
             assert prev_time <= curr_time, f'Items at indices {i - 1} and {i} are not in chronological order'
+
+
+def test_sorted_snapshot_list_drops_oldest_when_full() -> None:
+    sorted_list = SortedSnapshotList[CpuSnapshot](capacity=3)
+    now = datetime.now(timezone.utc)
+    snapshots = [
+        CpuSnapshot(used_ratio=0.5, max_used_ratio=0.95, created_at=now - timedelta(seconds=delta))
+        for delta in range(4, -1, -1)
+    ]
+
+    for snapshot in snapshots:
+        sorted_list.add(snapshot)
+
+    assert list(sorted_list) == snapshots[-3:]
+    assert sorted_list.get_sample(timedelta(seconds=1)) == snapshots[-2:]
+
+
+def test_sorted_snapshot_list_overloaded_ratio() -> None:
+    sorted_list = SortedSnapshotList[CpuSnapshot]()
+    now = datetime.now(timezone.utc)
+    assert sorted_list.get_overloaded_ratio() == 0
+
+    # The time between two snapshots counts as overloaded if the later snapshot is overloaded
+    for delta, used_ratio in [(30, 0.1), (20, 0.99), (10, 0.1), (0, 0.99)]:
+        created_at = now - timedelta(seconds=delta)
+        sorted_list.add(CpuSnapshot(used_ratio=used_ratio, max_used_ratio=0.95, created_at=created_at))
+
+    assert sorted_list.get_overloaded_ratio() == pytest.approx(2 / 3)
+    assert sorted_list.get_overloaded_ratio(timedelta(seconds=10)) == 1.0
+    assert sorted_list.get_overloaded_ratio(timedelta(seconds=20)) == 0.5
+    assert sorted_list.get_overloaded_ratio(timedelta(seconds=0)) == 1.0
+
+    sorted_list.prune(now - timedelta(seconds=15))
+    assert sorted_list.get_overloaded_ratio() == 1.0
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+from crawlee._utils.bloom_filter import ScalableBloomFilter
+
+
+def _filter_with_items() -> ScalableBloomFilter:
+    bloom_filter = ScalableBloomFilter(initial_capacity=10)
+    bloom_filter.add('https://example.com/')
+    return bloom_filter
+
+
+def test_add_and_contains() -> None:
+    bloom_filter = ScalableBloomFilter(initial_capacity=100)
+
+    assert bloom_filter.add('https://example.com/1')
+    assert not bloom_filter.add('https://example.com/1')
+    assert 'https://example.com/1' in bloom_filter
+    assert 'https://example.com/2' not in bloom_filter
+    assert len(bloom_filter) == 1
+
+
+def test_grows_beyond_initial_capacity() -> None:
+    bloom_filter = ScalableBloomFilter(initial_capacity=100, error_rate=1e-3)
+    keys = [f'https://example.com/{i}' for i in range(5_000)]
+
+    for key in keys:
+        bloom_filter.add(key)
+
+    # Items are never forgotten, and the false positive rate stays bounded as the filter grows.
+    assert all(key in bloom_filter for key in keys)
+    false_positives = sum(f'https://other.com/{i}' in bloom_filter for i in range(10_000))
+    assert false_positives <= 10 * 1e-3 * 10_000
+
+
+def test_serialization_roundtrip() -> None:
+    bloom_filter = ScalableBloomFilter(initial_capacity=10)
+    for i in range(100):
+        bloom_filter.add(f'https://example.com/{i}')
+
+    restored = ScalableBloomFilter.from_bytes(bloom_filter.to_bytes())
+
+    assert len(restored) == len(bloom_filter)
+    assert all(f'https://example.com/{i}' in restored for i in range(100))
+    assert restored.add('https://example.com/new')
+
+
+@pytest.mark.parametrize(
+    'data',
+    [
+        pytest.param(b'', id='empty'),
+        pytest.param(b'not a serialized bloom filter at all', id='garbage'),
+        pytest.param(_filter_with_items().to_bytes()[:-4], id='truncated'),
+    ],
+)
+def test_from_invalid_bytes(data: bytes) -> None:
+    with pytest.raises(ValueError, match=r'Bloom filter|layer'):
+        ScalableBloomFilter.from_bytes(data)
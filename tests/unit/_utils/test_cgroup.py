@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import pytest
+
+from crawlee._utils import system
+from crawlee._utils.byte_size import ByteSize
+from crawlee._utils.cgroup import CgroupProbe
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def write_files(root: Path, files: dict[str, str]) -> None:
+    for name, content in files.items():
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+
+@pytest.fixture
+def cgroup_v2(tmp_path: Path) -> Path:
+    write_files(
+        tmp_path,
+        {
+            'cgroup.controllers': 'cpuset cpu io memory pids\n',
+            'cpu.max': '200000 100000\n',
+            'cpu.stat': 'usage_usec 5000000\nuser_usec 4000000\nnr_periods 100\nnr_throttled 10\n',
+            'memory.current': str(600 * 1024**2),
+            'memory.max': str(1024**3),
+            'memory.stat': f'anon {400 * 1024**2}\ninactive_file {100 * 1024**2}\n',
+        },
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def cgroup_v1(tmp_path: Path) -> Path:
+    write_files(
+        tmp_path,
+        {
+            'cpu,cpuacct/cpu.cfs_quota_us': '50000\n',
+            'cpu,cpuacct/cpu.cfs_period_us': '100000\n',
+            'cpu,cpuacct/cpu.stat': 'nr_periods 20\nnr_throttled 0\nthrottled_time 0\n',
+            'cpu,cpuacct/cpuacct.usage': '3000000000\n',
+            'memory/memory.usage_in_bytes': str(300 * 1024**2),
+            'memory/memory.limit_in_bytes': '9223372036854771712\n',
+            'memory/memory.stat': f'total_inactive_file {100 * 1024**2}\n',
+        },
+    )
+    return tmp_path
+
+
+def test_detect(tmp_path: Path, cgroup_v2: Path) -> None:
+    probe = CgroupProbe.detect(cgroup_v2)
+    assert probe is not None
+    assert probe.version == 2
+
+    assert CgroupProbe.detect(tmp_path / 'missing') is None
+
+
+def test_read_v2_stats(cgroup_v2: Path) -> None:
+    probe = CgroupProbe(cgroup_v2, version=2)
+
+    cpu_stats = probe.read_cpu_stats()
+    assert cpu_stats is not None
+    assert cpu_stats.usage_seconds == 5
+    assert cpu_stats.quota_cpus == 2
+    assert (cpu_stats.periods, cpu_stats.throttled_periods) == (100, 10)
+
+    memory_stats = probe.read_memory_stats()
+    assert memory_stats is not None
+    assert memory_stats.used_size == ByteSize.from_mb(500)
+    assert memory_stats.limit_size == ByteSize.from_gb(1)
+
+
+def test_read_v1_stats(cgroup_v1: Path) -> None:
+    probe = CgroupProbe.detect(cgroup_v1)
+    assert probe is not None
+    assert probe.version == 1
+
+    cpu_stats = probe.read_cpu_stats()
+    assert cpu_stats is not None
+    assert cpu_stats.usage_seconds == 3
+    assert cpu_stats.quota_cpus == 0.5
+
+    memory_stats = probe.read_memory_stats()
+    assert memory_stats is not None
+    assert memory_stats.used_size == ByteSize.from_mb(200)
+
+
+def test_unlimited_v2_cgroup(cgroup_v2: Path) -> None:
+    write_files(cgroup_v2, {'cpu.max': 'max 100000\n', 'memory.max': 'max\n'})
+    probe = CgroupProbe(cgroup_v2, version=2)
+
+    assert probe.get_cpu_used_ratio() is None
+
+    memory_stats = probe.read_memory_stats()
+    assert memory_stats is not None
+    assert memory_stats.limit_size is None
+
+
+def test_malformed_files_are_ignored(cgroup_v2: Path) -> None:
+    write_files(cgroup_v2, {'cpu.stat': 'garbage\n', 'memory.current': 'garbage\n'})
+    probe = CgroupProbe(cgroup_v2, version=2)
+
+    assert probe.read_cpu_stats() is None
+    assert probe.read_memory_stats() is None
+    assert probe.get_cpu_used_ratio() is None
+
+
+def test_cpu_used_ratio(cgroup_v2: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = CgroupProbe(cgroup_v2, version=2)
+    clock = iter([12.0, 14.0])
+    monkeypatch.setattr('crawlee._utils.cgroup.time.monotonic', lambda: next(clock))
+
+    # The first call only records the counters without blocking
+    assert probe.get_cpu_used_ratio() == 0
+
+    # 2 seconds of CPU time in 2 seconds with a quota of 2 CPUs
+    write_files(cgroup_v2, {'cpu.stat': 'usage_usec 7000000\nnr_periods 120\nnr_throttled 10\n'})
+    assert probe.get_cpu_used_ratio() == 0.5
+
+
+def test_cpu_used_ratio_counts_throttling(cgroup_v2: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    probe = CgroupProbe(cgroup_v2, version=2)
+    clock = iter([12.0, 14.0])
+    monkeypatch.setattr('crawlee._utils.cgroup.time.monotonic', lambda: next(clock))
+    probe.get_cpu_used_ratio()
+
+    # Little CPU time on average, but throttled in 16 of 20 periods
+    write_files(cgroup_v2, {'cpu.stat': 'usage_usec 5400000\nnr_periods 120\nnr_throttled 26\n'})
+    assert probe.get_cpu_used_ratio() == 0.8
+
+
+def test_memory_info_uses_cgroup_limit(cgroup_v2: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(system, '_get_cgroup_probe', lambda: CgroupProbe(cgroup_v2, version=2))
+
+    memory_info = system.get_memory_info()
+    assert memory_info.total_size == ByteSize.from_gb(1)
+    assert memory_info.system_wide_used_size == ByteSize.from_mb(500)
+
+
+def test_memory_info_falls_back_without_cgroup_limit(cgroup_v1: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(system, '_get_cgroup_probe', lambda: CgroupProbe(cgroup_v1, version=1))
+
+    memory_info = system.get_memory_info()
+    assert memory_info.total_size < ByteSize(9223372036854771712)
+
+
+def test_cgroup_is_detected_once_on_first_use(cgroup_v2: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    detect = Mock(return_value=CgroupProbe(cgroup_v2, version=2))
+    monkeypatch.setattr(CgroupProbe, 'detect', detect)
+    system._get_cgroup_probe.cache_clear()
+
+    try:
+        detect.assert_not_called()
+        system.get_memory_info()
+        system.get_cpu_info()
+        detect.assert_called_once()
+    finally:
+        system._get_cgroup_probe.cache_clear()
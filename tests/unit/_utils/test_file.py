@@ -1,8 +1,16 @@
 from __future__ import annotations
 
+import gzip
+import json
 from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
 
-from crawlee._utils.file import json_dumps
+import pytest
+
+from crawlee._utils.file import encode_export_stream, iterate_json_export, json_dumps
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
 
 
 async def test_json_dumps() -> None:
@@ -11,3 +19,28 @@ async def test_json_dumps() -> None:
     assert await json_dumps('string') == '"string"'
     assert await json_dumps(123) == '123'
     assert await json_dumps(datetime(2022, 1, 1, tzinfo=timezone.utc)) == '"2022-01-01 00:00:00+00:00"'
+
+
+async def _iterate(items: list[dict[str, Any]]) -> AsyncIterator[dict[str, Any]]:
+    for item in items:
+        yield item
+
+
+@pytest.mark.parametrize(
+    'kwargs',
+    [{}, {'indent': 2}, {'indent': 0}, {'separators': (',', ':')}, {'indent': 4, 'sort_keys': True}],
+)
+@pytest.mark.parametrize('items', [[], [{'a': 1}], [{'a': 1, 'b': {'c': [1, 2]}}, {'text': 'line\nbreak'}]])
+async def test_iterate_json_export_matches_json_dump(items: list[dict[str, Any]], kwargs: dict[str, Any]) -> None:
+    pieces = [piece async for piece in iterate_json_export(_iterate(items), **kwargs)]
+    assert ''.join(pieces) == json.dumps(items, **kwargs)
+
+
+async def test_encode_export_stream_chunks_and_compresses() -> None:
+    items = [{'id': i} for i in range(1000)]
+    pieces = iterate_json_export(_iterate(items))
+
+    chunks = [chunk async for chunk in encode_export_stream(pieces, compression='gzip', chunk_size=1000)]
+
+    assert len(chunks) > 1
+    assert json.loads(gzip.decompress(b''.join(chunks))) == items
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+
+from crawlee._utils.byte_size import ByteSize
+from crawlee._utils.process_tree import ProcessTreeSampler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def add_process(proc_root: Path, pid: int, parent_pid: int, *, pss_kb: int, resident_pages: int = 100) -> None:
+    process_dir = proc_root / str(pid)
+    (process_dir / 'task' / str(pid)).mkdir(parents=True, exist_ok=True)
+    (process_dir / 'stat').write_text(f'{pid} (renderer (x)) S {parent_pid} 1 1 0\n')
+    (process_dir / 'statm').write_text(f'1000 {resident_pages} 50 1 0 80 0\n')
+    (process_dir / 'smaps_rollup').write_text(f'Rss: {resident_pages * 4} kB\nPss: {pss_kb} kB\n')
+    (process_dir / 'task' / str(pid) / 'children').write_text('')
+
+    if (parent_children := proc_root / str(parent_pid) / 'task' / str(parent_pid) / 'children').exists():
+        parent_children.write_text(f'{parent_children.read_text()}{pid} ')
+
+
+@pytest.fixture
+def proc_root(tmp_path: Path) -> Path:
+    add_process(tmp_path, 10, 1, pss_kb=1000)
+    add_process(tmp_path, 11, 10, pss_kb=2000)
+    add_process(tmp_path, 12, 11, pss_kb=3000)
+    add_process(tmp_path, 20, 1, pss_kb=5000)  # Not a descendant of the root
+    return tmp_path
+
+
+def create_sampler(proc_root: Path) -> ProcessTreeSampler:
+    return ProcessTreeSampler(
+        10,
+        proc_root=proc_root,
+        rescan_interval=timedelta(hours=1),
+        max_size_age=timedelta(hours=1),
+    )
+
+
+def test_sample_sums_process_tree(proc_root: Path) -> None:
+    sampler = create_sampler(proc_root)
+    assert sampler.sample() == ByteSize.from_kb(6000)
+
+
+def test_size_is_cached_while_resident_size_is_unchanged(proc_root: Path) -> None:
+    sampler = create_sampler(proc_root)
+    sampler.sample()
+
+    (proc_root / '12' / 'smaps_rollup').write_text('Pss: 9000 kB\n')
+    assert sampler.sample() == ByteSize.from_kb(6000)
+
+    (proc_root / '12' / 'statm').write_text('1000 200 50 1 0 80 0\n')
+    assert sampler.sample() == ByteSize.from_kb(12000)
+
+
+def test_new_processes_are_found(proc_root: Path) -> None:
+    sampler = create_sampler(proc_root)
+    sampler.sample()
+
+    # A grandchild of the root is only found after invalidation
+    add_process(proc_root, 13, 11, pss_kb=500)
+    assert sampler.sample() == ByteSize.from_kb(6000)
+    sampler.invalidate()
+    assert sampler.sample() == ByteSize.from_kb(6500)
+
+    # A change in the direct children of the root is noticed right away
+    add_process(proc_root, 14, 10, pss_kb=100)
+    assert sampler.sample() == ByteSize.from_kb(6600)
+
+
+def test_ended_processes_are_dropped(proc_root: Path) -> None:
+    sampler = create_sampler(proc_root)
+    sampler.sample()
+
+    (proc_root / '12' / 'statm').unlink()
+    assert sampler.sample() == ByteSize.from_kb(3000)
+
+
+def test_falls_back_to_resident_size(proc_root: Path) -> None:
+    (proc_root / '12' / 'smaps_rollup').unlink()
+    sampler = create_sampler(proc_root)
+
+    page_size = ByteSize(sampler._page_size)
+    assert sampler.sample() == ByteSize.from_kb(3000) + page_size * 100
+
+
+def test_owner_sizes(proc_root: Path) -> None:
+    sampler = create_sampler(proc_root)
+    sampler.track('browser', 11)
+    sampler.track('unknown', 20)
+    sampler.sample()
+
+    assert sampler.get_owner_size('browser') == ByteSize.from_kb(5000)
+    assert sampler.get_owner_size('unknown') is None
+
+    sampler.untrack('browser')
+    assert sampler.get_owner_size('browser') is None
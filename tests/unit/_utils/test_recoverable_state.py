@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import logging
+
+from pydantic import BaseModel
+
+from crawlee._utils.recoverable_state import RecoverableState
+from crawlee.storages import KeyValueStore
+
+
+class _State(BaseModel):
+    counter: int = 0
+    mapping: dict[str, int] = {}
+    members: set[str] = set()
+
+
+def _create_state(journal_max_length: int = 100) -> RecoverableState[_State]:
+    return RecoverableState(
+        default_state=_State(),
+        persist_state_key='test_state',
+        persistence_enabled='explicit_only',
+        persistence_mode='journal',
+        journal_max_length=journal_max_length,
+        logger=logging.getLogger(__name__),
+    )
+
+
+async def test_journal_persists_only_changes() -> None:
+    state = _create_state()
+    value = await state.initialize()
+    value.members.update(f'key-{i}' for i in range(100))
+    await state.persist_state()
+
+    kvs = await KeyValueStore.open()
+    assert await kvs.get_value('test_state__JOURNAL_1_0') is None
+
+    value.counter = 5
+    value.mapping['a'] = 1
+    value.members.discard('key-0')
+    value.members.add('key-100')
+    await state.persist_state()
+
+    assert await kvs.get_value('test_state__JOURNAL_1_0') == {
+        'counter': {'set': 5},
+        'mapping': {'update': {'a': 1}, 'remove': []},
+        'members': {'add': ['key-100'], 'remove': ['key-0']},
+    }
+
+    # Unchanged state does not produce a journal record.
+    await state.persist_state()
+    assert await kvs.get_value('test_state__JOURNAL_1_1') is None
+
+    del value.mapping['a']
+    await state.persist_state()
+
+    restored = await _create_state().initialize()
+    assert restored == value
+
+
+async def test_journal_is_compacted_into_snapshot() -> None:
+    state = _create_state(journal_max_length=2)
+    value = await state.initialize()
+    await state.persist_state()
+
+    for i in range(3):
+        value.counter = i + 1
+        await state.persist_state()
+
+    # The compaction runs in the background, the records written in the meantime follow the snapshot.
+    await state.teardown()
+
+    kvs = await KeyValueStore.open()
+    assert (await kvs.get_value('test_state'))['counter'] == 2
+    assert await kvs.get_value('test_state__JOURNAL_1_0') is None
+    assert await kvs.get_value('test_state__JOURNAL_1_1') is None
+    assert await kvs.get_value('test_state__JOURNAL_1_2') == {'counter': {'set': 3}}
+
+    restored = await _create_state().initialize()
+    assert restored.counter == 3
+
+    await state.reset()
+    assert (await _create_state().initialize()).counter == 0
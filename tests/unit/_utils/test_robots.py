@@ -1,8 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+from datetime import timedelta
+from functools import partial
 from typing import TYPE_CHECKING
+from unittest.mock import AsyncMock
 
-from crawlee._utils.robots import RobotsTxtFile
+import pytest
+from protego import Protego
+
+from crawlee._utils.robots import RobotsTxtCache, RobotsTxtFile
 
 if TYPE_CHECKING:
     from yarl import URL
@@ -47,3 +54,101 @@ async def test_bind_robots_txt_url() -> None:
     robots = await RobotsTxtFile.from_content('http://check.com/robots.txt', content)
     assert not robots.is_allowed('http://check.com/test.html')
     assert robots.is_allowed('http://othercheck.com/robots.txt')
+
+
+async def test_cache_fetches_each_origin_once_without_blocking_others() -> None:
+    slow_origin_started = asyncio.Event()
+    release_slow_origin = asyncio.Event()
+    fetched_urls = list[str]()
+
+    async def fetch(url: str) -> RobotsTxtFile:
+        fetched_urls.append(url)
+        if url.startswith('http://slow.com'):
+            slow_origin_started.set()
+            await release_slow_origin.wait()
+        return await RobotsTxtFile.from_content(url, 'User-agent: *\nDisallow: /private')
+
+    cache = RobotsTxtCache(fetch)
+    slow_lookups = [asyncio.create_task(cache.get(f'http://slow.com/page_{i}')) for i in range(5)]
+    await slow_origin_started.wait()
+
+    # Another origin is served while the robots.txt of the slow one is still loading.
+    fast_file = await cache.get('http://fast.com/page')
+    assert fast_file is not None
+    assert not fast_file.is_allowed('http://fast.com/private/page')
+
+    release_slow_origin.set()
+    slow_files = await asyncio.gather(*slow_lookups)
+    assert all(robots_file is slow_files[0] for robots_file in slow_files)
+    assert fetched_urls == ['http://slow.com/page_0', 'http://fast.com/page']
+
+
+async def test_cache_expires_missing_robots_txt_files() -> None:
+    responses = iter([None, 'User-agent: *\nDisallow: /'])
+
+    async def fetch(url: str) -> RobotsTxtFile:
+        response = next(responses)
+        if response is None:
+            return RobotsTxtFile(url, Protego.parse(''))
+        return await RobotsTxtFile.from_content(url, response)
+
+    cache = RobotsTxtCache(fetch, negative_ttl=timedelta(milliseconds=50))
+
+    # Missing robots.txt files allow everything, but only until the negative TTL passes.
+    assert await cache.get('http://example.com/page') is None
+    assert await cache.get('http://example.com/other') is None
+    await asyncio.sleep(0.06)
+
+    robots_file = await cache.get('http://example.com/page')
+    assert robots_file is not None
+    assert not robots_file.is_allowed('http://example.com/page')
+
+
+async def test_cache_raises_errors_of_failed_fetches_until_error_ttl() -> None:
+    fetch = AsyncMock(side_effect=[TimeoutError('timed out'), RobotsTxtFile('http://example.com', Protego.parse(''))])
+    cache = RobotsTxtCache(fetch, error_ttl=timedelta(milliseconds=50))
+
+    # A robots.txt that could not be fetched does not allow anything, the error is raised to every lookup.
+    with pytest.raises(TimeoutError):
+        await cache.get('http://example.com/page')
+    with pytest.raises(TimeoutError):
+        await cache.get('http://example.com/other')
+    assert fetch.await_count == 1
+
+    # Prefetching does not raise, but does not fetch again either.
+    await cache.prefetch(['http://example.com/page'])
+    assert fetch.await_count == 1
+
+    await asyncio.sleep(0.06)
+    assert await cache.get('http://example.com/page') is None
+    assert fetch.await_count == 2
+
+
+async def test_cache_evicts_least_recently_used_origins() -> None:
+    fetch = AsyncMock(side_effect=partial(RobotsTxtFile.from_content, content='User-agent: *\nAllow: /'))
+    cache = RobotsTxtCache(fetch, max_size=2)
+
+    await cache.prefetch(['http://a.com/1', 'http://b.com/1', 'http://a.com/2'])
+    assert fetch.await_count == 2
+
+    await cache.get('http://a.com/3')
+    await cache.get('http://c.com/1')
+    await cache.get('http://a.com/4')
+    assert fetch.await_count == 3
+
+    await cache.get('http://b.com/2')
+    assert fetch.await_count == 4
+
+
+async def test_cache_is_persisted_across_runs() -> None:
+    fetch = AsyncMock(side_effect=partial(RobotsTxtFile.from_content, content='User-agent: *\nDisallow: /private'))
+
+    async with RobotsTxtCache(fetch, persistence_enabled=True) as cache:
+        await cache.get('http://example.com/page')
+
+    async with RobotsTxtCache(fetch, persistence_enabled=True) as cache:
+        robots_file = await cache.get('http://example.com/other')
+
+    assert fetch.await_count == 1
+    assert robots_file is not None
+    assert not robots_file.is_allowed('http://example.com/private/page')
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from crawlee._utils.globs import Glob
+from crawlee._utils.url_patterns import UrlPatternFilter
+
+
+def test_without_patterns() -> None:
+    url_filter = UrlPatternFilter()
+    assert url_filter.matches('https://example.com/')
+
+
+def test_include_and_exclude() -> None:
+    url_filter = UrlPatternFilter(
+        include=[Glob('https://example.com/**'), re.compile(r'https://other\.com/blog/')],
+        exclude=[Glob('https://example.com/private/**'), re.compile(r'.*\.pdf$')],
+    )
+
+    assert url_filter.matches('https://example.com/page')
+    assert url_filter.matches('https://other.com/blog/post')
+    assert not url_filter.matches('https://other.com/shop')
+    assert not url_filter.matches('https://example.com/private/page')
+    assert not url_filter.matches('https://example.com/file.pdf')
+
+
+def test_empty_include_rejects_everything() -> None:
+    assert not UrlPatternFilter(include=[]).matches('https://example.com/')
+
+
+def test_patterns_keep_their_flags() -> None:
+    url_filter = UrlPatternFilter(include=[re.compile(r'https://example\.com/A', re.IGNORECASE), re.compile(r'.*/b')])
+
+    assert url_filter.matches('https://EXAMPLE.com/a')
+    assert url_filter.matches('https://example.com/b')
+    assert not url_filter.matches('https://example.com/B')
+
+
+@pytest.mark.parametrize(
+    'pattern',
+    [
+        pytest.param(re.compile(r'https://(\w+)\.com/\1'), id='backreference'),
+        pytest.param(re.compile(r'https://(?P<host>\w+)\.com/(?P=host)'), id='named backreference'),
+        pytest.param(re.compile(r'https://(\w+)\.com/(?(1)foo|bar)'), id='conditional group'),
+    ],
+)
+def test_unmergeable_patterns(pattern: re.Pattern[str]) -> None:
+    url_filter = UrlPatternFilter(include=[re.compile(r'https://other\.com/'), pattern])
+
+    assert url_filter.matches('https://foo.com/foo')
+    assert url_filter.matches('https://other.com/')
+    assert not url_filter.matches('https://foo.com/bar')
+
+
+def test_patterns_with_same_group_names() -> None:
+    url_filter = UrlPatternFilter(include=[re.compile(r'https://(?P<a>a)\.com'), re.compile(r'https://(?P<a>b)\.com')])
+
+    assert url_filter.matches('https://a.com')
+    assert url_filter.matches('https://b.com')
+    assert not url_filter.matches('https://c.com')
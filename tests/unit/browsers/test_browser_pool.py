@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+import sys
 from typing import TYPE_CHECKING
 
 import pytest
 
+from crawlee import service_locator
+from crawlee._utils.byte_size import ByteSize
+from crawlee._utils.system import CpuInfo, get_memory_info, get_process_tree_sampler
 from crawlee.browsers import BrowserPool, PlaywrightBrowserPlugin
+from crawlee.configuration import Configuration
+from crawlee.events import EventSystemInfoData
 
 if TYPE_CHECKING:
     from yarl import URL
@@ -186,3 +192,27 @@ async def test_browser_pool_retire_browser_after_page_count(
             assert first_browser is second_browser
         else:
             assert first_browser is not second_browser
+
+
+@pytest.mark.skipif(sys.platform != 'linux', reason='Browser memory is measured only on Linux')
+async def test_retire_heaviest_browser_on_memory_overload() -> None:
+    # Any crawl is over 1 MB of memory
+    service_locator.set_configuration(Configuration(memory_mbytes=1))
+
+    async with BrowserPool(retire_browsers_on_memory_overload=True) as browser_pool:
+        page = await browser_pool.new_page()
+        browser = browser_pool.active_browsers[0]
+
+        memory_info = get_memory_info()
+        process_tree_sampler = get_process_tree_sampler()
+        assert process_tree_sampler is not None
+        browser_size = process_tree_sampler.get_owner_size(browser)
+        assert browser_size is not None
+        assert ByteSize(0) < browser_size < memory_info.current_size
+
+        await browser_pool._retire_browser_on_memory_overload(
+            EventSystemInfoData(cpu_info=CpuInfo(used_ratio=0), memory_info=memory_info)
+        )
+        assert browser in browser_pool.inactive_browsers
+
+        await page.page.close()
@@ -21,13 +21,14 @@ from crawlee._types import BasicCrawlingContext, EnqueueLinksKwargs, HttpMethod
 from crawlee._utils.robots import RobotsTxtFile
 from crawlee.configuration import Configuration
 from crawlee.crawlers import BasicCrawler
+from crawlee.crawlers._basic._request_prefetcher import PrefetchedRequest, RequestPrefetcher
 from crawlee.errors import RequestCollisionError, SessionError, UserDefinedErrorHandlerError
 from crawlee.events import Event, EventCrawlerStatusData
 from crawlee.events._local_event_manager import LocalEventManager
 from crawlee.request_loaders import RequestList, RequestManagerTandem
 from crawlee.sessions import Session, SessionPool
 from crawlee.statistics import FinalStatistics
-from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storage_clients import FairSchedulingPolicy, MemoryStorageClient
 from crawlee.storages import Dataset, KeyValueStore, RequestQueue
 
 if TYPE_CHECKING:
@@ -38,6 +39,7 @@ if TYPE_CHECKING:
 
     from crawlee._types import JsonSerializable
     from crawlee.statistics import StatisticsState
+    from crawlee.storage_clients.models import ProcessedRequest
 
 
 async def test_processes_requests_from_explicit_queue() -> None:
@@ -1006,6 +1008,218 @@ async def test_crawler_manual_stop() -> None:
     assert stats.requests_finished == 2
 
 
+async def test_processes_prefetched_requests() -> None:
+    start_urls = [f'http://test.io/{i}' for i in range(10)]
+    processed = list[tuple[str, str | None]]()
+
+    crawler = BasicCrawler(request_prefetch_size=3, concurrency_settings=ConcurrencySettings(max_concurrency=2))
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        processed.append((context.request.url, context.session.id if context.session else None))
+
+    stats = await crawler.run(start_urls)
+
+    assert sorted(url for url, _ in processed) == sorted(start_urls)
+    assert all(session_id is not None for _, session_id in processed)
+    assert stats.requests_finished == len(start_urls)
+
+
+async def test_reclaims_prefetched_requests_on_stop() -> None:
+    start_urls = [f'http://test.io/{i}' for i in range(10)]
+    processed_urls = list[str]()
+
+    request_queue = await RequestQueue.open(name='prefetch-test')
+    crawler = BasicCrawler(
+        request_manager=request_queue,
+        request_prefetch_size=5,
+        concurrency_settings=ConcurrencySettings(max_concurrency=1),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        processed_urls.append(context.request.url)
+        # Let the prefetcher fill its buffer before stopping.
+        await asyncio.sleep(0.1)
+        if len(processed_urls) == 2:
+            crawler.stop()
+
+    await crawler.run(start_urls)
+
+    assert processed_urls == start_urls[:2]
+
+    # The buffered requests are back in the queue and are fetched in their original order.
+    assert await request_queue.get_handled_count() == 2
+    remaining_urls = list[str]()
+    while request := await request_queue.fetch_next_request():
+        remaining_urls.append(request.url)
+    assert remaining_urls == start_urls[2:]
+
+    await request_queue.drop()
+
+
+async def test_prefetcher_wakes_up_waiters_when_a_request_is_buffered() -> None:
+    request = Request.from_url('http://test.io/')
+    request_available = asyncio.Event()
+
+    async def fetch() -> PrefetchedRequest | None:
+        await request_available.wait()
+        request_available.clear()
+        return PrefetchedRequest(request=request, session=None, proxy_info=None)
+
+    reclaim = AsyncMock()
+
+    async with RequestPrefetcher(fetch, reclaim, size=1) as prefetcher:
+        waiter = asyncio.create_task(prefetcher.wait_for_change())
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+
+        request_available.set()
+        await asyncio.wait_for(waiter, timeout=1)
+        assert len(prefetcher) == 1
+
+    reclaim.assert_awaited_once_with(request)
+
+
+async def test_commits_results_in_batches() -> None:
+    start_urls = [f'http://test.io/{i}' for i in range(8)]
+
+    request_queue = await RequestQueue.open(name='commit-batch-test')
+    crawler = BasicCrawler(
+        request_manager=request_queue,
+        commit_batch_size=4,
+        concurrency_settings=ConcurrencySettings(min_concurrency=4, desired_concurrency=4, max_concurrency=4),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        await context.push_data({'url': context.request.url})
+        if context.request.crawl_depth == 0:
+            await context.add_requests([f'{context.request.url}/child'])
+
+    batch_sizes = list[int]()
+    mark_requests_as_handled = request_queue.mark_requests_as_handled
+
+    async def spy(requests: Sequence[Request]) -> list[ProcessedRequest]:
+        batch_sizes.append(len(requests))
+        return await mark_requests_as_handled(requests)
+
+    with patch.object(request_queue, 'mark_requests_as_handled', side_effect=spy):
+        stats = await crawler.run(start_urls)
+
+    assert stats.requests_finished == 16
+    assert sum(batch_sizes) == 16
+    assert max(batch_sizes) > 1
+    assert await request_queue.get_handled_count() == 16
+
+    dataset = await crawler.get_dataset()
+    items = (await dataset.get_data()).items
+    assert sorted(item['url'] for item in items) == sorted([*start_urls, *(f'{url}/child' for url in start_urls)])
+
+    await request_queue.drop()
+
+
+async def test_commits_results_one_by_one_when_batch_fails() -> None:
+    start_urls = [f'http://test.io/{i}' for i in range(4)]
+
+    request_queue = await RequestQueue.open(name='commit-batch-failure-test')
+    crawler = BasicCrawler(
+        request_manager=request_queue,
+        commit_batch_size=4,
+        concurrency_settings=ConcurrencySettings(min_concurrency=4, desired_concurrency=4, max_concurrency=4),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        await context.push_data({'url': context.request.url})
+
+    with patch.object(request_queue, 'mark_requests_as_handled', side_effect=RuntimeError('Batch failed')):
+        stats = await crawler.run(start_urls)
+
+    assert stats.requests_finished == len(start_urls)
+    assert stats.requests_failed == 0
+    assert await request_queue.get_handled_count() == len(start_urls)
+
+    # The results of the failed batch are committed exactly once.
+    dataset = await crawler.get_dataset()
+    assert sorted(item['url'] for item in (await dataset.get_data()).items) == sorted(start_urls)
+
+    await request_queue.drop()
+
+
+async def test_failed_batch_commit_does_not_push_data_twice() -> None:
+    start_urls = [f'http://test.io/{i}' for i in range(5)]
+
+    request_queue = await RequestQueue.open(name='commit-batch-partial-failure-test')
+    crawler = BasicCrawler(
+        request_manager=request_queue,
+        commit_batch_size=5,
+        concurrency_settings=ConcurrencySettings(min_concurrency=5, desired_concurrency=5, max_concurrency=5),
+    )
+
+    @crawler.router.default_handler
+    async def handler(context: BasicCrawlingContext) -> None:
+        await context.push_data({'url': context.request.url})
+        await context.add_requests([f'{context.request.url}/child'] if context.request.crawl_depth == 0 else [])
+        kvs = await context.get_key_value_store()
+        await kvs.set_value(context.request.unique_key.replace('/', '_').replace(':', '_'), 'value')
+
+    kvs = await crawler.get_key_value_store()
+    set_value = kvs.set_value
+    failures = 0
+
+    async def fail_once(*args: Any, **kwargs: Any) -> None:
+        nonlocal failures
+        if failures == 0:
+            failures += 1
+            raise RuntimeError('Transient error')
+        await set_value(*args, **kwargs)
+
+    # The key-value store changes are committed after the data is pushed, so the first batch fails after that.
+    with patch.object(kvs, 'set_value', side_effect=fail_once):
+        stats = await crawler.run(start_urls)
+
+    assert failures == 1
+    assert stats.requests_finished == 10
+    assert await request_queue.get_handled_count() == 10
+
+    dataset = await crawler.get_dataset()
+    urls = [item['url'] for item in (await dataset.get_data()).items]
+    assert sorted(urls) == sorted([*start_urls, *(f'{url}/child' for url in start_urls)])
+
+    await request_queue.drop()
+
+
+async def test_does_not_spin_while_hosts_are_at_their_limit() -> None:
+    storage_client = MemoryStorageClient(request_queue_scheduling=FairSchedulingPolicy(max_in_progress_per_host=1))
+    request_queue = await RequestQueue.open(name='host-limit-test', storage_client=storage_client)
+    crawler = BasicCrawler(
+        request_manager=request_queue,
+        concurrency_settings=ConcurrencySettings(min_concurrency=4, desired_concurrency=4, max_concurrency=4),
+    )
+
+    @crawler.router.default_handler
+    async def handler(_: BasicCrawlingContext) -> None:
+        await asyncio.sleep(0.1)
+
+    fetch_next_request = request_queue.fetch_next_request
+    fetch_count = 0
+
+    async def spy() -> Request | None:
+        nonlocal fetch_count
+        fetch_count += 1
+        return await fetch_next_request()
+
+    # Only one request of the host can be in progress at a time, the other workers have nothing to fetch.
+    with patch.object(request_queue, 'fetch_next_request', side_effect=spy):
+        stats = await crawler.run([f'http://test.io/{i}' for i in range(6)])
+
+    assert stats.requests_finished == 6
+    assert fetch_count < 30
+
+    await request_queue.drop()
+
+
 @pytest.mark.skipif(sys.version_info[:3] < (3, 11), reason='asyncio.Barrier was introduced in Python 3.11.')
 async def test_crawler_multiple_stops_in_parallel() -> None:
     """Test that no new requests are handled after crawler.stop() is called, but ongoing requests can still finish."""
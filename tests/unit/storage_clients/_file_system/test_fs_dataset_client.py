@@ -10,6 +10,7 @@ import pytest
 from crawlee._consts import METADATA_FILENAME
 from crawlee.configuration import Configuration
 from crawlee.storage_clients import FileSystemStorageClient
+from crawlee.storage_clients._file_system._dataset_chunks import DatasetChunks
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -163,3 +164,77 @@ async def test_data_persistence_across_reopens(configuration: Configuration) ->
     assert data.items[0] == test_data
 
     await reopened_client.drop()
+
+
+async def test_chunks_layout_pagination(tmp_path: Path) -> None:
+    """Test that pages spanning several chunks and checkpoints are read correctly in both directions."""
+    chunks = DatasetChunks(tmp_path / 'chunks', max_chunk_size=100, checkpoint_interval=3)
+    await chunks.open()
+    await chunks.append([{'id': i} for i in range(50)])
+
+    assert chunks.item_count == 50
+    assert len(list((tmp_path / 'chunks').glob('*.jsonl'))) > 1
+
+    assert [item['id'] for item in await chunks.read(7, 31)] == list(range(7, 31))
+    assert [item['id'] for item in await chunks.read(45, 100)] == list(range(45, 50))
+
+    # Lines appended after the last index write are recovered and a torn line is truncated.
+    last_chunk = sorted((tmp_path / 'chunks').glob('*.jsonl'))[-1]
+    with last_chunk.open('ab') as f:
+        f.write(b'{"id":50}\n{"id":5')
+
+    reopened = DatasetChunks(tmp_path / 'chunks', max_chunk_size=100, checkpoint_interval=3)
+    await reopened.open()
+    assert reopened.item_count == 51
+
+    await reopened.append([{'id': 51}])
+    assert [item['id'] for item in await reopened.read(48, 52)] == [48, 49, 50, 51]
+
+
+async def test_chunks_layout_imports_item_files(configuration: Configuration) -> None:
+    """Test that opening a dataset with the chunks layout imports the one-file-per-item layout."""
+    files_client = await FileSystemStorageClient().create_dataset_client(name='import', configuration=configuration)
+    await files_client.push_data([{'id': i} for i in range(5)])
+
+    chunks_client = await FileSystemStorageClient(dataset_layout='chunks').create_dataset_client(
+        name='import',
+        configuration=configuration,
+    )
+
+    assert list(chunks_client.path_to_dataset.glob('*.json')) == [chunks_client.path_to_metadata]
+    assert (await chunks_client.get_metadata()).item_count == 5
+
+    await chunks_client.push_data({'id': 5})
+    page = await chunks_client.get_data(offset=1, limit=3, desc=True)
+    assert [item['id'] for item in page.items] == [4, 3, 2]
+    assert page.total == 6
+
+    assert [item['id'] async for item in chunks_client.iterate_items(offset=4)] == [4, 5]
+
+    await chunks_client.drop()
+
+
+async def test_chunks_layout_resumes_interrupted_import(configuration: Configuration) -> None:
+    """Test that an import of item files interrupted before their removal does not duplicate any item."""
+    files_client = await FileSystemStorageClient().create_dataset_client(name='resume', configuration=configuration)
+    await files_client.push_data([{'id': i} for i in range(5)])
+
+    # Simulate a crash after the first two files were imported and the third one was appended without an index write.
+    chunks = DatasetChunks(files_client.path_to_dataset / '__chunks__')
+    await chunks.open()
+    await chunks.start_import()
+    await chunks.append([{'id': 0}, {'id': 1}], imported_file=2)
+    with next((files_client.path_to_dataset / '__chunks__').glob('*.jsonl')).open('ab') as f:
+        f.write(b'{"id":2}\n')
+
+    chunks_client = await FileSystemStorageClient(dataset_layout='chunks').create_dataset_client(
+        name='resume',
+        configuration=configuration,
+    )
+
+    assert list(chunks_client.path_to_dataset.glob('*.json')) == [chunks_client.path_to_metadata]
+    assert [item['id'] for item in (await chunks_client.get_data()).items] == [0, 1, 2, 3, 4]
+    assert chunks_client._chunks is not None
+    assert chunks_client._chunks.import_progress is None
+
+    await chunks_client.drop()
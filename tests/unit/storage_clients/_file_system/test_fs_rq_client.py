@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import json
+from datetime import timedelta
 from typing import TYPE_CHECKING
 
 import pytest
 
-from crawlee import Request
+from crawlee import Request, service_locator
 from crawlee.configuration import Configuration
-from crawlee.storage_clients import FileSystemStorageClient
+from crawlee.events import Event, EventPersistStateData
+from crawlee.storage_clients import FairSchedulingPolicy, FileSystemStorageClient
+from crawlee.storage_clients._file_system._request_log import RequestLog
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -171,3 +174,218 @@ async def test_data_persistence_across_reopens(configuration: Configuration) ->
     assert {request1.url, request2.url} == {'https://example.com/1', 'https://example.com/2'}
 
     await reopened_client.drop()
+
+
+async def test_log_layout_persistence_across_reopens(configuration: Configuration) -> None:
+    """Test that the log layout stores requests in segments and restores them when reopening the RQ."""
+    storage_client = FileSystemStorageClient(request_queue_layout='log')
+
+    original_client = await storage_client.create_rq_client(name='log-test', configuration=configuration)
+    await original_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(5)])
+
+    request = await original_client.fetch_next_request()
+    assert request is not None
+    assert request.url == 'https://example.com/0'
+    await original_client.mark_request_as_handled(request)
+
+    # No per-request files are written, the requests live in the log segments.
+    assert list(original_client.path_to_rq.glob('*.json')) == [original_client.path_to_metadata]
+    assert list((original_client.path_to_rq / '__log__').glob('*.log'))
+
+    # Drop the persisted state to force the queue to be reconstructed from the log.
+    await original_client._state.reset()
+    reopened_client = await storage_client.create_rq_client(name='log-test', configuration=configuration)
+
+    handled_request = await reopened_client.get_request(request.unique_key)
+    assert handled_request is not None
+    assert handled_request.handled_at is not None
+
+    fetched_urls = []
+    while next_request := await reopened_client.fetch_next_request():
+        fetched_urls.append(next_request.url)
+
+    assert fetched_urls == [f'https://example.com/{i}' for i in range(1, 5)]
+
+    await reopened_client.drop()
+
+
+async def test_log_layout_imports_request_files(configuration: Configuration) -> None:
+    """Test that opening a queue with the log layout imports the one-file-per-request layout."""
+    files_client = await FileSystemStorageClient().create_rq_client(name='import-test', configuration=configuration)
+    await files_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(3)])
+    assert len(list(files_client.path_to_rq.glob('*.json'))) == 4
+
+    log_client = await FileSystemStorageClient(request_queue_layout='log').create_rq_client(
+        name='import-test',
+        configuration=configuration,
+    )
+
+    assert list(log_client.path_to_rq.glob('*.json')) == [log_client.path_to_metadata]
+
+    fetched_urls = set()
+    while next_request := await log_client.fetch_next_request():
+        fetched_urls.add(next_request.url)
+
+    assert fetched_urls == {f'https://example.com/{i}' for i in range(3)}
+
+    await log_client.drop()
+
+
+async def test_request_log_compaction(tmp_path: Path) -> None:
+    """Test that compaction drops superseded records and keeps the latest version of each request."""
+    request_log = RequestLog(tmp_path / 'log', max_segment_size=1024)
+    await request_log.open()
+
+    requests = [Request.from_url(f'https://example.com/{i}') for i in range(10)]
+    await request_log.append('add', requests)
+
+    # Reclaiming the requests over and over produces superseded records, which eventually trigger compaction.
+    for _ in range(10):
+        await request_log.append('reclaim', requests)
+
+    await request_log.append('handled', requests[:1])
+    await request_log.compact()
+    await request_log.close()
+
+    segments_size = sum(file.stat().st_size for file in (tmp_path / 'log').glob('*.log'))
+    assert segments_size < 2 * sum(len(request.model_dump_json()) for request in requests)
+
+    reopened_log = RequestLog(tmp_path / 'log', max_segment_size=1024)
+    await reopened_log.open()
+
+    assert len(reopened_log) == 10
+    assert [request.url for request in await reopened_log.read_many([r.unique_key for r in requests])] == [
+        request.url for request in requests
+    ]
+
+    entry = reopened_log.get_entry(requests[0].unique_key)
+    assert entry is not None
+    assert entry.handled
+
+
+async def test_cache_is_refilled_in_bounded_batches(
+    rq_client: FileSystemRequestQueueClient,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the cache loads only a batch of requests and forefront requests are spliced into it."""
+    monkeypatch.setattr(rq_client, '_CACHE_REFILL_BATCH_SIZE', 2)
+    monkeypatch.setattr(rq_client, '_MAX_REQUESTS_IN_CACHE', 3)
+
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(5)])
+
+    first = await rq_client.fetch_next_request()
+    assert first is not None
+    assert first.url == 'https://example.com/0'
+    assert len(rq_client._request_cache) == 1
+
+    # Forefront requests go to the front of the cache without reloading it, overflow returns to the index.
+    await rq_client.add_batch_of_requests(
+        [Request.from_url('https://example.com/ff1'), Request.from_url('https://example.com/ff2')],
+        forefront=True,
+    )
+    await rq_client.add_batch_of_requests([Request.from_url('https://example.com/3')], forefront=True)
+    assert len(rq_client._request_cache) == 3
+
+    fetched_urls = []
+    while request := await rq_client.fetch_next_request():
+        fetched_urls.append(request.url)
+
+    assert fetched_urls == [
+        'https://example.com/3',
+        'https://example.com/ff2',
+        'https://example.com/ff1',
+        'https://example.com/1',
+        'https://example.com/2',
+        'https://example.com/4',
+    ]
+    assert not await rq_client.is_empty()
+
+
+async def test_stale_cache_entries_of_moved_requests_are_skipped(rq_client: FileSystemRequestQueueClient) -> None:
+    """Test that a cached request moved to the forefront and then reclaimed to the back is served from the back."""
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}') for i in range(4)])
+    first = await rq_client.fetch_next_request()
+    assert first is not None
+
+    # The request stays in the cache at its old position as well.
+    await rq_client.add_batch_of_requests([Request.from_url('https://example.com/2')], forefront=True)
+    moved = await rq_client.fetch_next_request()
+    assert moved is not None
+    assert moved.url == 'https://example.com/2'
+
+    moved.user_data['attempt'] = 1
+    await rq_client.reclaim_request(moved)
+
+    fetched = []
+    while request := await rq_client.fetch_next_request():
+        fetched.append(request)
+
+    assert [request.url for request in fetched] == [
+        'https://example.com/1',
+        'https://example.com/3',
+        'https://example.com/2',
+    ]
+    assert fetched[-1].user_data['attempt'] == 1
+
+
+async def test_fair_scheduling_loads_requests_of_hosts_with_capacity(
+    configuration: Configuration,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that requests beyond the cached batch are loaded when all cached hosts are at their limit."""
+    policy = FairSchedulingPolicy(max_in_progress_per_host=1)
+    rq_client = await FileSystemStorageClient(request_queue_scheduling=policy).create_rq_client(
+        name='fair-test',
+        configuration=configuration,
+    )
+    monkeypatch.setattr(rq_client, '_CACHE_REFILL_BATCH_SIZE', 2)
+
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://a.com/{i}') for i in range(4)])
+    await rq_client.add_batch_of_requests([Request.from_url('https://b.com/0')])
+
+    first = await rq_client.fetch_next_request()
+    second = await rq_client.fetch_next_request()
+    assert first is not None
+    assert second is not None
+    assert [first.url, second.url] == ['https://a.com/0', 'https://b.com/0']
+    assert await rq_client.fetch_next_request() is None
+    assert await rq_client.has_next_request() is False
+
+    # A reclaimed request releases the slot of its host.
+    await rq_client.reclaim_request(first)
+    assert await rq_client.has_next_request() is True
+    third = await rq_client.fetch_next_request()
+    assert third is not None
+    assert third.url == 'https://a.com/1'
+
+    await rq_client.drop()
+
+
+async def test_metadata_writes_are_coalesced(configuration: Configuration) -> None:
+    """Test that metadata updates within the write delay are committed together in a single delayed write."""
+    async with service_locator.get_event_manager() as event_manager:
+        client = await FileSystemStorageClient(
+            request_queue_metadata_write_delay=timedelta(hours=1),
+        ).create_rq_client(name='group-commit-test', configuration=configuration)
+
+        for i in range(5):
+            await client.add_batch_of_requests([Request.from_url(f'https://example.com/{i}')])
+
+        # The updates are held back within the durability window...
+        assert (await client.get_metadata()).total_request_count == 5
+        with client.path_to_metadata.open() as f:
+            assert json.load(f)['total_request_count'] == 0
+
+        # ...and committed together when the state is persisted.
+        event_manager.emit(event=Event.PERSIST_STATE, event_data=EventPersistStateData(is_migrating=False))
+        await event_manager.wait_for_all_listeners_to_complete()
+        with client.path_to_metadata.open() as f:
+            assert json.load(f)['total_request_count'] == 5
+
+        # Purging commits the metadata right away as well.
+        await client.add_batch_of_requests([Request.from_url('https://example.com/5')])
+        await client.purge()
+        with client.path_to_metadata.open() as f:
+            assert json.load(f)['pending_request_count'] == 0
+
+        await client.drop()
@@ -7,7 +7,7 @@ import pytest
 
 from crawlee import Request
 from crawlee.configuration import Configuration
-from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storage_clients import FairSchedulingPolicy, MemoryStorageClient
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -81,3 +81,63 @@ async def test_memory_metadata_updates(rq_client: MemoryRequestQueueClient) -> N
     assert metadata.created_at == initial_created
     assert metadata.modified_at > initial_modified
     assert metadata.accessed_at > accessed_after_read
+
+
+async def test_fair_scheduling_across_hosts() -> None:
+    """Test that requests are served in weighted turns across hosts, keeping the order within each host."""
+    policy = FairSchedulingPolicy(host_weights={'b.com': 2})
+    rq_client = await MemoryStorageClient(request_queue_scheduling=policy).create_rq_client(name='fair_rq')
+
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://a.com/{i}') for i in range(6)])
+    await rq_client.add_batch_of_requests([Request.from_url(f'https://b.com/{i}') for i in range(4)])
+    await rq_client.add_batch_of_requests([Request.from_url('https://b.com/first')], forefront=True)
+
+    fetched_urls = []
+    while request := await rq_client.fetch_next_request():
+        fetched_urls.append(request.url)
+
+    # Host `b.com` joins after `a.com` has been served once, then gets two turns for each turn of `a.com`.
+    assert fetched_urls == [
+        'https://a.com/0',
+        'https://b.com/first',
+        'https://b.com/0',
+        'https://a.com/1',
+        'https://b.com/1',
+        'https://b.com/2',
+        'https://a.com/2',
+        'https://b.com/3',
+        'https://a.com/3',
+        'https://a.com/4',
+        'https://a.com/5',
+    ]
+
+    await rq_client.drop()
+
+
+async def test_fair_scheduling_limits_in_progress_per_host() -> None:
+    """Test that hosts at their in-progress limit are skipped until one of their requests is finished."""
+    policy = FairSchedulingPolicy(max_in_progress_per_host=1)
+    rq_client = await MemoryStorageClient(request_queue_scheduling=policy).create_rq_client(name='capped_rq')
+
+    await rq_client.add_batch_of_requests(
+        [Request.from_url(url) for url in ('https://a.com/0', 'https://a.com/1', 'https://b.com/0')]
+    )
+
+    first = await rq_client.fetch_next_request()
+    second = await rq_client.fetch_next_request()
+    assert first is not None
+    assert second is not None
+    assert [first.url, second.url] == ['https://a.com/0', 'https://b.com/0']
+
+    # Both hosts are busy, the pending request of `a.com` waits for its slot.
+    assert await rq_client.fetch_next_request() is None
+    assert await rq_client.is_empty() is False
+    assert await rq_client.has_next_request() is False
+
+    await rq_client.mark_request_as_handled(first)
+    assert await rq_client.has_next_request() is True
+    third = await rq_client.fetch_next_request()
+    assert third is not None
+    assert third.url == 'https://a.com/1'
+
+    await rq_client.drop()
@@ -3,7 +3,9 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import gzip
+import json
+from typing import TYPE_CHECKING, Literal
 
 import pytest
 
@@ -19,12 +21,15 @@ if TYPE_CHECKING:
     from crawlee.storage_clients import StorageClient
 
 
-@pytest.fixture(params=['memory', 'file_system'])
+@pytest.fixture(params=['memory', 'file_system', 'file_system_chunks'])
 def storage_client(request: pytest.FixtureRequest) -> StorageClient:
     """Parameterized fixture to test with different storage clients."""
     if request.param == 'memory':
         return MemoryStorageClient()
 
+    if request.param == 'file_system_chunks':
+        return FileSystemStorageClient(dataset_layout='chunks')
+
     return FileSystemStorageClient()
 
 
@@ -449,14 +454,9 @@ async def test_export_to_json(
         to_kvs_storage_client=storage_client,
     )
 
-    # Retrieve the exported file
+    # Retrieve the exported file, it is stored as a JSON document and read back parsed
     record = await kvs.get_value(key='dataset_export.json')
-    assert record is not None
-
-    # Verify content has all the items
-    assert '"id": 1' in record
-    assert '"id": 2' in record
-    assert '"id": 3' in record
+    assert record == items
 
     await kvs.drop()
 
@@ -501,6 +501,72 @@ async def test_export_to_csv(
     await kvs.drop()
 
 
+async def test_export_to_json_lines(
+    dataset: Dataset,
+    storage_client: StorageClient,
+) -> None:
+    """Test exporting dataset to JSON Lines format."""
+    kvs = await KeyValueStore.open(
+        name='export_kvs',
+        storage_client=storage_client,
+    )
+
+    items = [{'id': i, 'name': f'Item {i}'} for i in range(3)]
+    await dataset.push_data(items)
+
+    await dataset.export_to(
+        key='dataset_export.jsonl',
+        content_type='jsonl',
+        to_kvs_name='export_kvs',
+        to_kvs_storage_client=storage_client,
+    )
+
+    record = await kvs.get_value(key='dataset_export.jsonl')
+    assert isinstance(record, bytes)
+    assert [json.loads(line) for line in record.splitlines()] == items
+
+    await kvs.drop()
+
+
+@pytest.mark.parametrize('compression', ['gzip', 'zstd'])
+async def test_export_to_compressed(
+    dataset: Dataset,
+    storage_client: StorageClient,
+    compression: Literal['gzip', 'zstd'],
+) -> None:
+    """Test exporting dataset with compression."""
+    if compression == 'gzip':
+        decompress = gzip.decompress
+    else:
+        zstandard = pytest.importorskip('zstandard')
+        decompress = zstandard.ZstdDecompressor().decompressobj().decompress
+
+    kvs = await KeyValueStore.open(
+        name='export_kvs',
+        storage_client=storage_client,
+    )
+
+    items = [{'id': i, 'name': f'Item {i}'} for i in range(2000)]
+    await dataset.push_data(items)
+
+    await dataset.export_to(
+        key='dataset_export.csv',
+        content_type='csv',
+        to_kvs_name='export_kvs',
+        to_kvs_storage_client=storage_client,
+        compression=compression,
+    )
+
+    record = await kvs.get_value(key='dataset_export.csv')
+    assert isinstance(record, bytes)
+
+    lines = decompress(record).decode().splitlines()
+    assert lines[0] == 'id,name'
+    assert lines[1:] == [f'{i},Item {i}' for i in range(2000)]
+
+    await kvs.drop()
+
+
 async def test_export_to_invalid_content_type(dataset: Dataset) -> None:
     """Test exporting dataset with invalid content type raises error."""
     with pytest.raises(ValueError, match='Unsupported content type'):
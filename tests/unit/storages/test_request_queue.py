@@ -11,7 +11,7 @@ import pytest
 from crawlee import Request, service_locator
 from crawlee.configuration import Configuration
 from crawlee.storage_clients import FileSystemStorageClient, MemoryStorageClient, StorageClient
-from crawlee.storages import RequestQueue
+from crawlee.storages import KeyValueStore, RequestQueue
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator
@@ -20,12 +20,15 @@ if TYPE_CHECKING:
     from crawlee.storage_clients import StorageClient
 
 
-@pytest.fixture(params=['memory', 'file_system'])
+@pytest.fixture(params=['memory', 'file_system', 'file_system_log'])
 def storage_client(request: pytest.FixtureRequest) -> StorageClient:
     """Parameterized fixture to test with different storage clients."""
     if request.param == 'memory':
         return MemoryStorageClient()
 
+    if request.param == 'file_system_log':
+        return FileSystemStorageClient(request_queue_layout='log')
+
     return FileSystemStorageClient()
 
 
@@ -365,6 +368,78 @@ async def test_fetch_next_request_and_mark_handled(rq: RequestQueue) -> None:
     assert empty_request is None
 
 
+async def test_mark_requests_as_handled(rq: RequestQueue) -> None:
+    """Test marking multiple requests as handled at once."""
+    await rq.add_requests([f'https://example.com/page{i}' for i in range(4)])
+
+    fetched = [await rq.fetch_next_request() for _ in range(3)]
+    requests = [request for request in fetched if request is not None]
+    assert len(requests) == 3
+
+    # Only the first two are marked, a request that is not in progress is skipped.
+    unfetched = Request.from_url('https://example.com/page3')
+    results = await rq.mark_requests_as_handled([*requests[:2], unfetched])
+    assert [result.unique_key for result in results] == [request.unique_key for request in requests[:2]]
+    assert all(request.handled_at is not None for request in requests[:2])
+
+    metadata = await rq.get_metadata()
+    assert metadata.handled_request_count == 2
+    assert metadata.pending_request_count == 2
+
+    await rq.mark_request_as_handled(requests[2])
+    last = await rq.fetch_next_request()
+    assert last is not None
+    assert last.url == 'https://example.com/page3'
+    await rq.mark_requests_as_handled([last])
+
+    assert await rq.is_empty()
+    assert (await rq.get_metadata()).handled_request_count == 4
+
+
+async def test_duplicate_filter_drops_known_requests(rq: RequestQueue) -> None:
+    """Test that the duplicate filter drops requests already added to the queue."""
+    await rq.add_request('https://example.com/existing')
+    await rq.enable_duplicate_filter(persistence_enabled=False)
+
+    # The request added before enabling the filter is known from the queue state.
+    await rq.add_requests(['https://example.com/existing', 'https://example.com/1', 'https://example.com/2'])
+    await rq.add_requests(['https://example.com/1', 'https://example.com/2', 'https://example.com/3'])
+
+    statistics = rq.duplicate_filter_statistics
+    assert statistics is not None
+    assert statistics.checked_request_count == 6
+    assert statistics.dropped_request_count == 3
+    assert statistics.hit_rate == 0.5
+    assert statistics.unique_key_count == 4
+    assert (await rq.get_metadata()).total_request_count == 4
+
+    # Forefront requests bypass the filter, so that they are moved to the head of the queue.
+    await rq.add_requests(['https://example.com/3'], forefront=True)
+    next_request = await rq.fetch_next_request()
+    assert next_request is not None
+    assert next_request.url == 'https://example.com/3'
+    assert rq.duplicate_filter_statistics == statistics
+
+
+async def test_duplicate_filter_persistence(rq: RequestQueue) -> None:
+    """Test that the duplicate filter is persisted and cleared along with the queue."""
+    await rq.enable_duplicate_filter()
+    await rq.add_requests(['https://example.com/1', 'https://example.com/2'])
+    await rq.persist_duplicate_filter()
+
+    kvs = await KeyValueStore.open()
+    key = f'CRAWLEE_REQUEST_QUEUE_DUPLICATE_FILTER_{rq.id}'
+    assert isinstance(await kvs.get_value(key), bytes)
+
+    await rq.purge()
+    assert await kvs.get_value(key) is None
+
+    await rq.add_requests(['https://example.com/1'])
+    assert rq.duplicate_filter_statistics is not None
+    assert rq.duplicate_filter_statistics.dropped_request_count == 0
+    assert (await rq.get_metadata()).pending_request_count == 1
+
+
 async def test_get_request_by_id(rq: RequestQueue) -> None:
     """Test retrieving a request by its ID."""
     # Add a request
@@ -476,6 +551,31 @@ async def test_is_finished(rq: RequestQueue) -> None:
     assert await rq.is_finished() is True
 
 
+async def test_wait_for_change(rq: RequestQueue) -> None:
+    """Test that waiters are notified when requests are added and handled."""
+    assert rq.notifies_changes is True
+
+    waiter = asyncio.create_task(rq.wait_for_change())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    # Adding a request makes work available
+    await rq.add_request('https://example.com')
+    await asyncio.wait_for(waiter, timeout=1)
+
+    request = await rq.fetch_next_request()
+    assert request is not None
+
+    waiter = asyncio.create_task(rq.wait_for_change())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    # Handling the last request drains the queue
+    await rq.mark_request_as_handled(request)
+    await asyncio.wait_for(waiter, timeout=1)
+    assert await rq.is_finished() is True
+
+
 async def test_mark_non_existent_request_as_handled(rq: RequestQueue) -> None:
     """Test marking a non-existent request as handled."""
     # Create a request that hasn't been added to the queue